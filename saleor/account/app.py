@@ -1,16 +1,55 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 
 
 class AccountAppConfig(AppConfig):
     name = "saleor.account"
 
     def ready(self):
+        from django.contrib.auth.models import Group
+
         from .models import User
-        from .signals import delete_avatar
+        from .signals import (
+            delete_avatar,
+            invalidate_group_permissions_principals,
+            invalidate_group_principals,
+            invalidate_user_principal,
+            invalidate_user_relations_principals,
+        )
 
         post_delete.connect(
             delete_avatar,
             sender=User,
             dispatch_uid="delete_user_avatar",
         )
+        # cached principals must not outlive changes of users and their permissions
+        post_save.connect(
+            invalidate_user_principal,
+            sender=User,
+            dispatch_uid="invalidate_saved_user_principal",
+        )
+        post_delete.connect(
+            invalidate_user_principal,
+            sender=User,
+            dispatch_uid="invalidate_deleted_user_principal",
+        )
+        pre_delete.connect(
+            invalidate_group_principals,
+            sender=Group,
+            dispatch_uid="invalidate_deleted_group_principals",
+        )
+        m2m_changed.connect(
+            invalidate_user_relations_principals,
+            sender=User.groups.through,
+            dispatch_uid="invalidate_user_groups_principals",
+        )
+        m2m_changed.connect(
+            invalidate_user_relations_principals,
+            sender=User.user_permissions.through,
+            dispatch_uid="invalidate_user_permissions_principals",
+        )
+        m2m_changed.connect(
+            invalidate_group_permissions_principals,
+            sender=Group.permissions.through,
+            dispatch_uid="invalidate_group_permissions_principals",
+        )
@@ -0,0 +1,64 @@
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+
+from .models import User
+
+PRINCIPAL_CACHE_KEY = "principal:{user_id}"
+
+
+def _principal_key(user_id: int) -> str:
+    return PRINCIPAL_CACHE_KEY.format(user_id=user_id)
+
+
+def get_cached_principal(user_id: int, jwt_token_key: str) -> Optional[User]:
+    """Return the active user with preloaded permissions from the principal cache.
+
+    The entry is ignored when the token was issued for a different
+    `jwt_token_key`, e.g. after all user tokens were deactivated.
+    """
+    data = cache.get(_principal_key(user_id))
+    if not data:
+        return None
+    user, permission_ids, permission_names = data
+    if user.jwt_token_key != jwt_token_key:
+        return None
+    if permission_ids is not None:
+        user.effective_permissions = Permission.objects.filter(pk__in=permission_ids)
+        # Fill the authentication backend cache so `has_perm` doesn't hit the db.
+        user._effective_permissions_cache = permission_names
+    return user
+
+
+def cache_principal(user: User):
+    """Store the user row and its flattened permission set in the cache.
+
+    Permissions of superusers are not stored as they are granted all permissions
+    without checking the permission set.
+    """
+    permission_ids = permission_names = None
+    if not user.is_superuser:
+        permissions = list(
+            user.effective_permissions.values_list(
+                "pk", "content_type__app_label", "codename"
+            ).order_by()
+        )
+        permission_ids = [pk for pk, _, _ in permissions]
+        permission_names = {
+            "%s.%s" % (app_label, codename) for _, app_label, codename in permissions
+        }
+    user._effective_permissions = None
+    cache.set(
+        _principal_key(user.pk),
+        (user, permission_ids, permission_names),
+        timeout=settings.PRINCIPAL_CACHE_TIMEOUT,
+    )
+    if permission_ids is not None:
+        user.effective_permissions = Permission.objects.filter(pk__in=permission_ids)
+        user._effective_permissions_cache = permission_names
+
+
+def invalidate_principals(user_ids: Iterable[int]):
+    cache.delete_many([_principal_key(user_id) for user_id in user_ids])
@@ -170,6 +170,8 @@ class User(PermissionsMixin, ModelWithMetadata, AbstractBaseUser):
     language_code = models.CharField(
         max_length=35, choices=settings.LANGUAGES, default=settings.LANGUAGE_CODE
     )
+    # Overrides `GRAPHQL_QUERY_MAX_COST` for queries sent by the user.
+    max_query_cost = models.PositiveIntegerField(blank=True, null=True)
 
     USERNAME_FIELD = "email"
 
@@ -1,6 +1,47 @@
 from ..core.utils import delete_versatile_image
+from .cache import invalidate_principals
+from .models import User
 
 
 def delete_avatar(sender, instance, **kwargs):
     if avatar := instance.avatar:
         delete_versatile_image(avatar)
+
+
+def invalidate_user_principal(sender, instance, **kwargs):
+    invalidate_principals([instance.pk])
+
+
+def invalidate_group_principals(sender, instance, **kwargs):
+    invalidate_principals(instance.user_set.values_list("pk", flat=True))
+
+
+def invalidate_user_relations_principals(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """Drop cached principals of users whose groups or own permissions changed."""
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        invalidate_principals([instance.pk])
+    elif pk_set:
+        invalidate_principals(pk_set)
+    else:
+        invalidate_principals(instance.user_set.values_list("pk", flat=True))
+
+
+def invalidate_group_permissions_principals(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """Drop cached principals of members of groups whose permissions changed."""
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        groups = [instance.pk]
+    elif pk_set:
+        groups = pk_set
+    else:
+        groups = instance.group_set.values_list("pk", flat=True)
+    invalidate_principals(
+        User.objects.filter(groups__in=groups).values_list("pk", flat=True)
+    )
@@ -0,0 +1,94 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ...core.auth_backend import JSONWebTokenBackend
+from ...core.jwt import create_access_token
+from ..cache import get_cached_principal
+
+
+def _authenticate(rf, user):
+    access_token = create_access_token(user)
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+    return JSONWebTokenBackend().authenticate(request)
+
+
+def test_authenticated_user_is_cached(
+    rf, staff_user, permission_manage_products, permission_group_manage_users
+):
+    # given
+    cache.clear()
+    staff_user.user_permissions.add(permission_manage_products)
+    permission_group_manage_users.user_set.add(staff_user)
+    _authenticate(rf, staff_user)
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        user = _authenticate(rf, staff_user)
+        has_products_perm = user.has_perm("product.manage_products")
+        has_users_perm = user.has_perm("account.manage_users")
+
+    # then
+    assert user == staff_user
+    assert has_products_perm
+    assert has_users_perm
+    assert len(ctx.captured_queries) == 0
+
+
+def test_cached_principal_ignored_for_other_jwt_token_key(rf, staff_user):
+    # given
+    cache.clear()
+    _authenticate(rf, staff_user)
+
+    # when
+    user = get_cached_principal(staff_user.pk, "other-key")
+
+    # then
+    assert user is None
+
+
+def test_principal_invalidated_on_password_change(rf, staff_user):
+    # given
+    cache.clear()
+    _authenticate(rf, staff_user)
+
+    # when
+    staff_user.set_password("new-password")
+    staff_user.save()
+
+    # then
+    assert get_cached_principal(staff_user.pk, staff_user.jwt_token_key) is None
+
+
+def test_principal_invalidated_on_group_permissions_change(
+    rf, staff_user, permission_group_manage_users, permission_manage_orders
+):
+    # given
+    cache.clear()
+    permission_group_manage_users.user_set.add(staff_user)
+    _authenticate(rf, staff_user)
+
+    # when
+    permission_group_manage_users.permissions.add(permission_manage_orders)
+
+    # then
+    assert get_cached_principal(staff_user.pk, staff_user.jwt_token_key) is None
+    user = _authenticate(rf, staff_user)
+    assert user.has_perm("order.manage_orders")
+
+
+def test_principal_invalidated_on_removal_from_group(
+    rf, staff_user, permission_group_manage_users
+):
+    # given
+    cache.clear()
+    permission_group_manage_users.user_set.add(staff_user)
+    _authenticate(rf, staff_user)
+
+    # when
+    staff_user.groups.remove(permission_group_manage_users)
+
+    # then
+    assert get_cached_principal(staff_user.pk, staff_user.jwt_token_key) is None
+    user = _authenticate(rf, staff_user)
+    assert not user.has_perm("account.manage_users")
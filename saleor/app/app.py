@@ -0,0 +1,41 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_save, pre_delete
+
+
+class AppAppConfig(AppConfig):
+    name = "saleor.app"
+
+    def ready(self):
+        from .models import App, AppToken
+        from .signals import (
+            invalidate_app_cache,
+            invalidate_app_permissions_cache,
+            invalidate_app_token_cache,
+        )
+
+        # cached token authentication must not outlive changes of apps and tokens
+        post_save.connect(
+            invalidate_app_cache,
+            sender=App,
+            dispatch_uid="invalidate_saved_app_cache",
+        )
+        pre_delete.connect(
+            invalidate_app_cache,
+            sender=App,
+            dispatch_uid="invalidate_deleted_app_cache",
+        )
+        post_save.connect(
+            invalidate_app_token_cache,
+            sender=AppToken,
+            dispatch_uid="invalidate_saved_app_token_cache",
+        )
+        pre_delete.connect(
+            invalidate_app_token_cache,
+            sender=AppToken,
+            dispatch_uid="invalidate_deleted_app_token_cache",
+        )
+        m2m_changed.connect(
+            invalidate_app_permissions_cache,
+            sender=App.permissions.through,
+            dispatch_uid="invalidate_app_permissions_cache",
+        )
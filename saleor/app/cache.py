@@ -0,0 +1,35 @@
+import hashlib
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import App, AppToken
+
+APP_TOKEN_CACHE_KEY = "app-token:{token_hash}"
+
+
+def _app_token_key(auth_token: str) -> str:
+    token_hash = hashlib.sha256(auth_token.encode()).hexdigest()
+    return APP_TOKEN_CACHE_KEY.format(token_hash=token_hash)
+
+
+def get_cached_app(auth_token: str) -> Optional[App]:
+    """Return the active app owning the token, with its permissions preloaded."""
+    return cache.get(_app_token_key(auth_token))
+
+
+def cache_app(auth_token: str, app: App):
+    # Fill the permission cache of the app so it's stored with the app.
+    app.get_permissions()
+    cache.set(_app_token_key(auth_token), app, timeout=settings.APP_TOKEN_CACHE_TIMEOUT)
+
+
+def invalidate_app_tokens(auth_tokens: Iterable[str]):
+    cache.delete_many([_app_token_key(auth_token) for auth_token in auth_tokens])
+
+
+def invalidate_apps(app_ids: Iterable[int]):
+    invalidate_app_tokens(
+        AppToken.objects.filter(app_id__in=app_ids).values_list("auth_token", flat=True)
+    )
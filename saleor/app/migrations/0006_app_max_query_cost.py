@@ -0,0 +1,18 @@
+# Generated by Django 3.2.6 on 2021-09-24 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0005_appextension"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="app",
+            name="max_query_cost",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -49,6 +49,8 @@ class App(ModelWithMetadata):
     configuration_url = models.URLField(blank=True, null=True)
     app_url = models.URLField(blank=True, null=True)
     version = models.CharField(max_length=60, blank=True, null=True)
+    # Overrides `GRAPHQL_QUERY_MAX_COST` for queries sent by the app.
+    max_query_cost = models.PositiveIntegerField(blank=True, null=True)
 
     objects = models.Manager.from_queryset(AppQueryset)()
 
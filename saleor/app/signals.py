@@ -0,0 +1,22 @@
+from .cache import invalidate_app_tokens, invalidate_apps
+
+
+def invalidate_app_cache(sender, instance, **kwargs):
+    invalidate_apps([instance.pk])
+
+
+def invalidate_app_token_cache(sender, instance, **kwargs):
+    invalidate_app_tokens([instance.auth_token])
+
+
+def invalidate_app_permissions_cache(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        invalidate_apps([instance.pk])
+    elif pk_set:
+        invalidate_apps(pk_set)
+    else:
+        invalidate_apps(instance.app_set.values_list("pk", flat=True))
@@ -1,16 +1,32 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save
 
 
 class AttributeAppConfig(AppConfig):
     name = "saleor.attribute"
 
     def ready(self):
-        from .models import AttributeValue
-        from .signals import delete_attribute_value_file
+        from .models import AssignedProductAttributeValue, AttributeValue
+        from .signals import (
+            delete_attribute_value_file,
+            index_added_product_attribute_values,
+            index_assigned_product_attribute_value,
+        )
 
         post_delete.connect(
             delete_attribute_value_file,
             sender=AttributeValue,
             dispatch_uid="delete_attribute_value_file",
         )
+        post_save.connect(
+            index_assigned_product_attribute_value,
+            sender=AssignedProductAttributeValue,
+            dispatch_uid="index_assigned_product_attribute_value",
+        )
+        # Values assigned with `AssignedProductAttribute.values` are bulk created
+        # without the `post_save` signal.
+        m2m_changed.connect(
+            index_added_product_attribute_values,
+            sender=AssignedProductAttributeValue,
+            dispatch_uid="index_added_product_attribute_values",
+        )
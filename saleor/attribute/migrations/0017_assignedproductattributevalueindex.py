@@ -0,0 +1,76 @@
+# Generated by Django 3.2.6 on 2021-09-28 10:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+POPULATE_ASSIGNED_PRODUCT_ATTRIBUTE_VALUE_INDEX = """
+    INSERT INTO attribute_assignedproductattributevalueindex (
+        assigned_value_id, product_id, attribute_id, value_id
+    )
+    SELECT assigned_value.id, assignment.product_id, value.attribute_id, value.id
+    FROM attribute_assignedproductattributevalue AS assigned_value
+    INNER JOIN attribute_assignedproductattribute AS assignment
+        ON assignment.id = assigned_value.assignment_id
+    INNER JOIN attribute_attributevalue AS value
+        ON value.id = assigned_value.value_id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0147_auto_20210817_1015"),
+        ("attribute", "0016_auto_20210827_0938"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AssignedProductAttributeValueIndex",
+            fields=[
+                (
+                    "assigned_value",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="index",
+                        serialize=False,
+                        to="attribute.assignedproductattributevalue",
+                    ),
+                ),
+                (
+                    "attribute",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="attribute.attribute",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="product.product",
+                    ),
+                ),
+                (
+                    "value",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="attribute.attributevalue",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="assignedproductattributevalueindex",
+            index=models.Index(
+                fields=["product", "attribute", "value"],
+                name="product_attribute_value_idx",
+            ),
+        ),
+        migrations.RunSQL(
+            POPULATE_ASSIGNED_PRODUCT_ATTRIBUTE_VALUE_INDEX, migrations.RunSQL.noop
+        ),
+    ]
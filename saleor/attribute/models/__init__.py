@@ -8,6 +8,7 @@ from .page import AssignedPageAttribute, AssignedPageAttributeValue, AttributePa
 from .product import (
     AssignedProductAttribute,
     AssignedProductAttributeValue,
+    AssignedProductAttributeValueIndex,
     AttributeProduct,
 )
 from .product_variant import (
@@ -26,6 +27,7 @@ __all__ = [
     "AttributePage",
     "AssignedProductAttribute",
     "AssignedProductAttributeValue",
+    "AssignedProductAttributeValueIndex",
     "AttributeProduct",
     "AssignedVariantAttribute",
     "AssignedVariantAttributeValue",
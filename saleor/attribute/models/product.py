@@ -25,6 +25,36 @@ class AssignedProductAttributeValue(SortableModel):
         return self.assignment.productvalueassignment.all()
 
 
+class AssignedProductAttributeValueIndex(models.Model):
+    """Product, attribute and value of an assigned product attribute value.
+
+    Denormalized copy of the assignments used to count products per attribute
+    value without joining the assignment tables.
+    """
+
+    assigned_value = models.OneToOneField(
+        AssignedProductAttributeValue,
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="index",
+    )
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="+")
+    attribute = models.ForeignKey(
+        "Attribute", on_delete=models.CASCADE, related_name="+"
+    )
+    value = models.ForeignKey(
+        "AttributeValue", on_delete=models.CASCADE, related_name="+"
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["product", "attribute", "value"],
+                name="product_attribute_value_idx",
+            )
+        ]
+
+
 class AssignedProductAttribute(BaseAssignedAttribute):
     """Associate a product type attribute and selected values to a given product."""
 
@@ -1,6 +1,36 @@
 from ..core.tasks import delete_from_storage_task
+from .models import AssignedProductAttributeValue, AssignedProductAttributeValueIndex
+from .utils import index_product_attribute_values
 
 
 def delete_attribute_value_file(sender, instance, **kwargs):
     if file_url := instance.file_url:
         delete_from_storage_task.delay(file_url)
+
+
+def index_assigned_product_attribute_value(
+    sender, instance, created, update_fields, **kwargs
+):
+    if not created:
+        if update_fields and "value" not in update_fields:
+            return
+        AssignedProductAttributeValueIndex.objects.filter(
+            assigned_value=instance
+        ).delete()
+    index_product_attribute_values([instance.pk])
+
+
+def index_added_product_attribute_values(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action != "post_add" or not pk_set:
+        return
+    if reverse:
+        lookup = {"value_id": instance.pk, "assignment_id__in": pk_set}
+    else:
+        lookup = {"assignment_id": instance.pk, "value_id__in": pk_set}
+    index_product_attribute_values(
+        AssignedProductAttributeValue.objects.filter(**lookup).values_list(
+            "pk", flat=True
+        )
+    )
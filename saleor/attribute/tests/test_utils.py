@@ -1,6 +1,7 @@
 import pytest
 
 from ...product.models import ProductType
+from ..models import AssignedProductAttributeValueIndex
 from ..utils import associate_attribute_values_to_instance
 
 
@@ -106,3 +107,34 @@ def test_associate_attribute_to_variant_instance_multiple_values(variant):
     assert list(
         new_assignment.variantvalueassignment.values_list("value__pk", "sort_order")
     ) == [(values[0].pk, 0), (values[1].pk, 1)]
+
+
+def test_associate_attribute_values_to_product_indexes_values(product, color_attribute):
+    # given
+    values = list(color_attribute.values.all())
+
+    # when
+    associate_attribute_values_to_instance(product, color_attribute, *values)
+
+    # then
+    index = AssignedProductAttributeValueIndex.objects.filter(product=product)
+    assert {(row.attribute_id, row.value_id) for row in index} == {
+        (color_attribute.pk, value.pk) for value in values
+    }
+
+
+def test_associate_attribute_values_to_product_removes_index_of_old_values(
+    product, color_attribute
+):
+    # given
+    old_value, new_value = color_attribute.values.all()
+    associate_attribute_values_to_instance(product, color_attribute, old_value)
+
+    # when
+    associate_attribute_values_to_instance(product, color_attribute, new_value)
+
+    # then
+    index = AssignedProductAttributeValueIndex.objects.filter(
+        product=product, attribute=color_attribute
+    )
+    assert [row.value_id for row in index] == [new_value.pk]
@@ -7,6 +7,7 @@ from .models import (
     AssignedPageAttributeValue,
     AssignedProductAttribute,
     AssignedProductAttributeValue,
+    AssignedProductAttributeValueIndex,
     AssignedVariantAttribute,
     AssignedVariantAttributeValue,
     Attribute,
@@ -115,3 +116,24 @@ def sort_assigned_attribute_values(
         value_assignment.sort_order = index
 
     assignment_model.objects.bulk_update(values_assignment, ["sort_order"])
+
+
+def index_product_attribute_values(assigned_value_ids: Iterable[int]) -> None:
+    """Index product, attribute and value of new assigned product attribute values.
+
+    Already indexed values are skipped. Index rows are deleted along with their
+    assigned values.
+    """
+    assigned_values = AssignedProductAttributeValue.objects.filter(
+        pk__in=assigned_value_ids
+    ).values_list("pk", "assignment__product_id", "value__attribute_id", "value_id")
+    index = [
+        AssignedProductAttributeValueIndex(
+            assigned_value_id=assigned_value_id,
+            product_id=product_id,
+            attribute_id=attribute_id,
+            value_id=value_id,
+        )
+        for assigned_value_id, product_id, attribute_id, value_id in assigned_values
+    ]
+    AssignedProductAttributeValueIndex.objects.bulk_create(index, ignore_conflicts=True)
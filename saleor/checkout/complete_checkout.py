@@ -1,6 +1,7 @@
 from datetime import date
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
+from django.conf import settings
 from django.contrib.sites.models import Site
 from django.core.exceptions import ValidationError
 from django.db import transaction
@@ -441,9 +442,13 @@ def _create_order(
     order.update_total_paid()
     order.save()
 
-    transaction.on_commit(
-        lambda: order_created(order=order, user=user, app=app, manager=manager)
-    )
+    if settings.ORDER_OUTBOX_ENABLED:
+        # the outbox row must be stored in the transaction creating the order
+        order_created(order=order, user=user, app=app, manager=manager)
+    else:
+        transaction.on_commit(
+            lambda: order_created(order=order, user=user, app=app, manager=manager)
+        )
 
     # Send the order confirmation email
     transaction.on_commit(
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.6 on 2021-09-27 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("checkout", "0038_merge_20210903_1048"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="checkout",
+            index=models.Index(fields=["last_change"], name="checkout_last_change_idx"),
+        ),
+    ]
@@ -108,6 +108,10 @@ class Checkout(ModelWithMetadata):
 
     class Meta(ModelWithMetadata.Meta):
         ordering = ("-last_change", "pk")
+        indexes = [
+            *ModelWithMetadata.Meta.indexes,
+            models.Index(fields=["last_change"], name="checkout_last_change_idx"),
+        ]
         permissions = (
             (CheckoutPermissions.MANAGE_CHECKOUTS.codename, "Manage checkouts"),
         )
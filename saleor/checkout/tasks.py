@@ -0,0 +1,71 @@
+from collections import Counter
+from typing import Dict, Optional
+
+from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from ..celeryconf import app
+from ..payment.models import Payment, Transaction
+from .models import Checkout
+
+task_logger = get_task_logger(__name__)
+
+
+def get_expired_checkouts(now=None):
+    """Return checkouts not changed for longer than their TTL.
+
+    Checkouts with active payments or with captured funds are never expired.
+    """
+    now = now or timezone.now()
+    payments = Payment.objects.filter(
+        Q(is_active=True) | Q(captured_amount__gt=0), checkout_id=OuterRef("pk")
+    )
+    return Checkout.objects.filter(
+        Q(user_id__isnull=True, last_change__lt=now - settings.ANONYMOUS_CHECKOUT_TTL)
+        | Q(user_id__isnull=False, last_change__lt=now - settings.USER_CHECKOUT_TTL),
+        ~Exists(payments),
+    )
+
+
+def delete_expired_checkouts(chunk_size: Optional[int] = None) -> Dict[str, int]:
+    """Delete expired checkouts in chunks, each chunk in a separate transaction.
+
+    Inactive payments of the deleted checkouts which did not create an order are
+    deleted along with them. Return the number of deleted rows of each model.
+    """
+    chunk_size = chunk_size or settings.CHECKOUT_DELETE_CHUNK_SIZE
+    now = timezone.now()
+    deleted: Counter = Counter()
+    while True:
+        with transaction.atomic():
+            tokens = list(
+                get_expired_checkouts(now)
+                .select_for_update(skip_locked=True)
+                .order_by("last_change")
+                .values_list("pk", flat=True)[:chunk_size]
+            )
+            if not tokens:
+                break
+            payments = Payment.objects.filter(
+                checkout_id__in=tokens, order_id__isnull=True
+            )
+            for queryset in [
+                Transaction.objects.filter(payment__in=payments),
+                payments,
+                Checkout.objects.filter(pk__in=tokens),
+            ]:
+                _, deleted_per_model = queryset.delete()
+                deleted.update(deleted_per_model)
+        if len(tokens) < chunk_size:
+            break
+    return dict(deleted)
+
+
+@app.task
+def delete_expired_checkouts_task():
+    deleted = delete_expired_checkouts()
+    if deleted:
+        task_logger.info("Removed expired checkouts: %s", deleted)
@@ -0,0 +1,76 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.utils import timezone
+
+from ...payment.models import Payment
+from ..models import Checkout, CheckoutLine
+from ..tasks import delete_expired_checkouts
+
+
+def test_delete_expired_checkouts(
+    settings, checkout_with_item, checkouts_list, customer_user
+):
+    # given
+    settings.ANONYMOUS_CHECKOUT_TTL = timedelta(days=30)
+    settings.USER_CHECKOUT_TTL = timedelta(days=90)
+    user_checkout, other_user_checkout = checkouts_list[:2]
+    Checkout.objects.filter(pk__in=[user_checkout.pk, other_user_checkout.pk]).update(
+        user=customer_user
+    )
+    now = timezone.now()
+    Checkout.objects.filter(pk=checkout_with_item.pk).update(
+        last_change=now - timedelta(days=31)
+    )
+    Checkout.objects.filter(pk=user_checkout.pk).update(
+        last_change=now - timedelta(days=31)
+    )
+    Checkout.objects.filter(pk=other_user_checkout.pk).update(
+        last_change=now - timedelta(days=91)
+    )
+
+    # when
+    deleted = delete_expired_checkouts(chunk_size=1)
+
+    # then
+    assert deleted["checkout.Checkout"] == 2
+    assert deleted["checkout.CheckoutLine"] == 1
+    assert not Checkout.objects.filter(
+        pk__in=[checkout_with_item.pk, other_user_checkout.pk]
+    ).exists()
+    assert Checkout.objects.filter(pk=user_checkout.pk).exists()
+    assert not CheckoutLine.objects.filter(checkout=checkout_with_item).exists()
+
+
+def test_delete_expired_checkouts_skips_checkouts_with_active_payments(
+    settings, checkout_with_item
+):
+    # given
+    settings.ANONYMOUS_CHECKOUT_TTL = timedelta(days=30)
+    Checkout.objects.filter(pk=checkout_with_item.pk).update(
+        last_change=timezone.now() - timedelta(days=31)
+    )
+    payment = Payment.objects.create(
+        gateway="mirumee.payments.dummy",
+        checkout=checkout_with_item,
+        is_active=True,
+        total=Decimal("10"),
+        currency=checkout_with_item.currency,
+    )
+
+    # when
+    deleted = delete_expired_checkouts()
+
+    # then
+    assert deleted == {}
+    assert Checkout.objects.filter(pk=checkout_with_item.pk).exists()
+
+    # when
+    payment.is_active = False
+    payment.save(update_fields=["is_active"])
+    deleted = delete_expired_checkouts()
+
+    # then
+    assert deleted["checkout.Checkout"] == 1
+    assert deleted["payment.Payment"] == 1
+    assert not Payment.objects.filter(pk=payment.pk).exists()
@@ -1,5 +1,6 @@
-from django.apps import AppConfig
+from django.apps import AppConfig, apps
 from django.db.models import Field
+from django.db.models.signals import m2m_changed, post_delete, post_save
 
 from .db.filters import PostgresILike
 
@@ -8,4 +9,33 @@ class CoreAppConfig(AppConfig):
     name = "saleor.core"
 
     def ready(self):
+        from .loader_cache import (
+            CACHED_MODELS,
+            invalidate_cached_m2m,
+            invalidate_cached_object,
+        )
+
         Field.register_lookup(PostgresILike)
+
+        # cached objects must not outlive their changes
+        for label in CACHED_MODELS:
+            model = apps.get_model(label)
+            post_save.connect(
+                invalidate_cached_object,
+                sender=model,
+                dispatch_uid=f"invalidate_cached_object_saved_{label}",
+            )
+            post_delete.connect(
+                invalidate_cached_object,
+                sender=model,
+                dispatch_uid=f"invalidate_cached_object_deleted_{label}",
+            )
+            for field in model._meta.local_many_to_many:
+                through = field.remote_field.through
+                if through._meta.label_lower not in CACHED_MODELS:
+                    continue
+                m2m_changed.connect(
+                    invalidate_cached_m2m,
+                    sender=through,
+                    dispatch_uid=f"invalidate_cached_m2m_{through._meta.label_lower}",
+                )
@@ -0,0 +1,13 @@
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+
+def is_cache_shared() -> bool:
+    """Return whether the default cache is shared between processes.
+
+    With the local memory cache every process has its own cache, so values
+    stored in it, e.g. versions of cached data, don't reach other workers and
+    are lost when the process exits.
+    """
+    return not isinstance(caches["default"], (LocMemCache, DummyCache))
@@ -1,3 +1,4 @@
+import binascii
 from datetime import datetime, timedelta
 from typing import Any, Dict, Iterable, Optional
 
@@ -6,6 +7,7 @@ import jwt
 from django.conf import settings
 from django.contrib.auth.models import Permission
 
+from ..account.cache import cache_principal, get_cached_principal
 from ..account.models import User
 from ..app.models import App, AppExtension
 from .permissions import (
@@ -111,7 +113,26 @@ def create_refresh_token(
     return jwt_encode(payload)
 
 
+def _get_cached_user_from_payload(payload: Dict[str, Any]) -> Optional[User]:
+    user_jwt_token = payload.get("token")
+    global_user_id = payload.get("user_id")
+    if not user_jwt_token or not global_user_id:
+        return None
+    try:
+        _, user_id = graphene.Node.from_global_id(global_user_id)
+        user_pk = int(user_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+    user = get_cached_principal(user_pk, user_jwt_token)
+    if user and user.email == payload["email"]:
+        return user
+    return None
+
+
 def get_user_from_payload(payload: Dict[str, Any]) -> Optional[User]:
+    user = _get_cached_user_from_payload(payload)
+    if user:
+        return user
     user = User.objects.filter(email=payload["email"], is_active=True).first()
     user_jwt_token = payload.get("token")
     if not user_jwt_token or not user:
@@ -122,6 +143,7 @@ def get_user_from_payload(payload: Dict[str, Any]) -> Optional[User]:
         raise jwt.InvalidTokenError(
             "Invalid token. Create new one by using tokenCreate mutation."
         )
+    cache_principal(user)
     return user
 
 
@@ -138,9 +160,16 @@ def is_saleor_token(token: str) -> bool:
 
 
 def get_user_from_access_token(token: str) -> Optional[User]:
-    if not is_saleor_token(token):
+    try:
+        payload = jwt_decode(token)
+    except jwt.PyJWTError:
+        # Tokens issued by plugins can't be verified with Saleor's secret key,
+        # they are handled by the plugin authentication backend.
+        if is_saleor_token(token):
+            raise
+        return None
+    if payload.get(JWT_OWNER_FIELD) != JWT_SALEOR_OWNER_NAME:
         return None
-    payload = jwt_decode(token)
     return get_user_from_access_payload(payload)
 
 
@@ -0,0 +1,314 @@
+"""Cache of dataloader results shared between requests.
+
+Results are stored in a small in-process LRU cache and in the shared cache.
+Every entry is tagged, e.g. with the model and the primary key of the object it
+was loaded from, and keeps the versions its tags had before the database was
+queried. Invalidating a tag stores a new version for it, so entries tagged with
+it are ignored by all workers from then on. Versions start with the time of the
+invalidation, so results can be checked for changes made while resolving them.
+"""
+import pickle
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Type
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models, transaction
+from django.utils.crypto import get_random_string
+
+LOADER_CACHE_KEY = "loader:{context_key}:{key}"
+LOADER_CACHE_TAG_KEY = "loader-tag:{tag}"
+
+# Models which objects are cached, mapped to the paths of the foreign keys to
+# the objects cached along with them, e.g. a cached product holds its variants.
+# Saving or deleting an object invalidates its tag and the tags of its parents.
+CACHED_MODELS = {
+    "attribute.assignedproductattribute": ["product"],
+    "attribute.assignedvariantattribute": ["variant", "variant__product"],
+    "attribute.attribute": [],
+    "attribute.attributetranslation": ["attribute"],
+    "attribute.attributevalue": ["attribute"],
+    "attribute.attributevaluetranslation": [
+        "attribute_value",
+        "attribute_value__attribute",
+    ],
+    "channel.channel": [],
+    "menu.menu": [],
+    "menu.menuitem": ["menu"],
+    "menu.menuitemtranslation": ["menu_item", "menu_item__menu"],
+    "product.category": [],
+    "product.categorytranslation": ["category"],
+    "product.collection": [],
+    "product.collectionchannellisting": ["collection"],
+    "product.collectionproduct": ["collection", "product"],
+    "product.collectiontranslation": ["collection"],
+    "product.product": [],
+    "product.productchannellisting": ["product"],
+    "product.productmedia": ["product"],
+    "product.producttranslation": ["product"],
+    "product.producttype": [],
+    "product.productvariant": ["product"],
+    "product.productvariantchannellisting": ["variant", "variant__product"],
+    "product.productvarianttranslation": [
+        "product_variant",
+        "product_variant__product",
+    ],
+    "product.variantmedia": ["variant", "variant__product"],
+}
+
+lock = threading.Lock()
+with lock:
+    LOCAL_LOADER_CACHES: Dict[str, "OrderedDict[str, Tuple[Tuple, bytes]]"] = {}
+    LOADER_CACHE_STATS: Dict[str, Counter] = defaultdict(Counter)
+
+
+def get_model_tag(model: Type[models.Model], pk: Optional[Hashable] = None) -> str:
+    """Return the tag of all objects of the model or of the object with the pk."""
+    label = model._meta.label_lower
+    return label if pk is None else f"{label}:{pk}"
+
+
+def get_list_tag(model: Type[models.Model]) -> str:
+    """Return the tag of lists of the model objects.
+
+    It is invalidated whenever any object of the model, or of a model cached along
+    with it, is saved or deleted, as the change may add it to or remove it from
+    filtered and sorted lists.
+    """
+    return f"{model._meta.label_lower}:list"
+
+
+def _get_parent(instance: models.Model, path: str):
+    """Return the model and the primary key of the object at the foreign key path."""
+    *names, field_name = path.split("__")
+    try:
+        for name in names:
+            instance = getattr(instance, name)
+    except ObjectDoesNotExist:
+        # The parent was deleted before its child, e.g. by a cascade.
+        return None, None
+    field = instance._meta.get_field(field_name)
+    return field.related_model, getattr(instance, field.attname)
+
+
+def get_object_tags(instance: models.Model) -> List[str]:
+    """Return tags invalidated by a change of the object."""
+    model = type(instance)
+    tags = [get_model_tag(model, instance.pk), get_list_tag(model)]
+    for path in CACHED_MODELS.get(model._meta.label_lower, []):
+        parent_model, parent_pk = _get_parent(instance, path)
+        if parent_pk is not None:
+            tags += [get_model_tag(parent_model, parent_pk), get_list_tag(parent_model)]
+    return tags
+
+
+def _get_entry_key(context_key: str, key: Hashable) -> str:
+    if isinstance(key, tuple):
+        key = ":".join(str(part) for part in key)
+    return LOADER_CACHE_KEY.format(context_key=context_key, key=key)
+
+
+def _get_new_version(invalidated_at: float) -> str:
+    return f"{invalidated_at:.6f}:{get_random_string(12)}"
+
+
+def get_version_time(version: str) -> float:
+    """Return the time the tag was invalidated at; 0 if it never was."""
+    return float(version.split(":", 1)[0])
+
+
+def _get_tag_key(tag: str) -> str:
+    return LOADER_CACHE_TAG_KEY.format(tag=tag)
+
+
+def get_tag_versions(tags: Iterable[str]) -> Dict[str, str]:
+    """Return current versions of the tags; tags without a version get one."""
+    tag_keys = {tag: _get_tag_key(tag) for tag in set(tags)}
+    stored_versions = cache.get_many(tag_keys.values())
+    versions = {}
+    missing_versions = {}
+    for tag, tag_key in tag_keys.items():
+        version = stored_versions.get(tag_key)
+        if version is None:
+            # The version expired or the tag was never invalidated.
+            version = _get_new_version(0)
+            missing_versions[tag_key] = version
+        versions[tag] = version
+    if missing_versions:
+        cache.set_many(missing_versions, timeout=settings.LOADER_CACHE_TIMEOUT)
+    return versions
+
+
+def _get_local_cache(context_key: str) -> "OrderedDict[str, Tuple[Tuple, bytes]]":
+    if context_key not in LOCAL_LOADER_CACHES:
+        with lock:
+            LOCAL_LOADER_CACHES.setdefault(context_key, OrderedDict())
+    return LOCAL_LOADER_CACHES[context_key]
+
+
+def get_cached_results(
+    context_key: str,
+    tags_by_key: Dict[Hashable, List[str]],
+    tag_versions: Dict[str, str],
+) -> Dict[Hashable, Any]:
+    """Return cached results of the keys which tags were not invalidated.
+
+    Each request gets its own copy of the cached objects.
+    """
+    local_cache = _get_local_cache(context_key)
+    entries = {}
+    missing_entry_keys = {}
+    for key, tags in tags_by_key.items():
+        entry_key = _get_entry_key(context_key, key)
+        entry = local_cache.get(entry_key)
+        if entry is None:
+            missing_entry_keys[entry_key] = key
+        else:
+            entries[key] = entry
+    if missing_entry_keys:
+        for entry_key, entry in cache.get_many(missing_entry_keys).items():
+            entries[missing_entry_keys[entry_key]] = entry
+            _store_locally(local_cache, entry_key, entry)
+
+    results = {}
+    for key, (versions, data) in entries.items():
+        current_versions = tuple(tag_versions[tag] for tag in tags_by_key[key])
+        if versions == current_versions:
+            results[key] = pickle.loads(data)
+
+    stats = LOADER_CACHE_STATS[context_key]
+    stats["hits"] += len(results)
+    stats["misses"] += len(tags_by_key) - len(results)
+    return results
+
+
+def cache_results(
+    context_key: str,
+    results: Dict[Hashable, Any],
+    tags_by_key: Dict[Hashable, List[str]],
+    tag_versions: Dict[str, str],
+):
+    """Store the results with versions of their tags read before loading them."""
+    local_cache = _get_local_cache(context_key)
+    entries = {}
+    for key, result in results.items():
+        versions = tuple(tag_versions[tag] for tag in tags_by_key[key])
+        entry_key = _get_entry_key(context_key, key)
+        entries[entry_key] = (versions, pickle.dumps(result))
+        _store_locally(local_cache, entry_key, entries[entry_key])
+    cache.set_many(entries, timeout=settings.LOADER_CACHE_TIMEOUT)
+
+
+def _store_locally(local_cache, entry_key, entry):
+    with lock:
+        local_cache[entry_key] = entry
+        local_cache.move_to_end(entry_key)
+        while len(local_cache) > settings.LOADER_CACHE_LOCAL_SIZE:
+            local_cache.popitem(last=False)
+
+
+def _set_new_tag_versions(tags: Iterable[str]):
+    cache.set_many(
+        {_get_tag_key(tag): _get_new_version(time.time()) for tag in set(tags)},
+        timeout=settings.LOADER_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_tags(tags: Iterable[str]):
+    """Invalidate cached results tagged with any of the tags.
+
+    The tags are invalidated again after the current transaction commits, so
+    results loaded in the meantime from not yet committed data are not reused.
+    """
+    if not (settings.LOADER_CACHE_ENABLED or settings.RESPONSE_CACHE_ENABLED):
+        return
+    tags = list(tags)
+    if not tags:
+        return
+    _set_new_tag_versions(tags)
+    transaction.on_commit(lambda: _set_new_tag_versions(tags))
+
+
+def _get_path_model(model: Type[models.Model], path: str) -> Type[models.Model]:
+    for name in path.split("__"):
+        model = model._meta.get_field(name).related_model
+    return model
+
+
+def invalidate_objects(model: Type[models.Model], pks: Iterable[Hashable]):
+    """Invalidate cached results of objects changed without sending signals.
+
+    Like on a change of a single object, lists of the objects and the objects
+    cached along with them, and lists of these, are invalidated as well.
+    """
+    if not (settings.LOADER_CACHE_ENABLED or settings.RESPONSE_CACHE_ENABLED):
+        return
+    pks = list(pks)
+    if not pks:
+        return
+    tags = [get_model_tag(model, pk) for pk in pks] + [get_list_tag(model)]
+    for path in CACHED_MODELS.get(model._meta.label_lower, []):
+        parent_model = _get_path_model(model, path)
+        parent_pks = (
+            model.objects.filter(pk__in=pks)
+            .order_by()
+            .values_list(path, flat=True)
+            .distinct()
+        )
+        tags += [get_model_tag(parent_model, pk) for pk in parent_pks if pk is not None]
+        tags.append(get_list_tag(parent_model))
+    invalidate_tags(tags)
+
+
+def invalidate_cached_object(sender, instance, **kwargs):
+    """Invalidate cached results of the saved or deleted object."""
+    invalidate_tags(get_object_tags(instance))
+
+
+def invalidate_cached_m2m(sender, instance, action, model, pk_set, **kwargs):
+    """Invalidate cached results of objects added to or removed from the relation.
+
+    Changes of many-to-many relations don't send the signals of their through
+    model, e.g. `collection.products.add()` bulk creates the rows.
+    """
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if pk_set is None:
+        source_field = next(
+            field
+            for field in sender._meta.fields
+            if field.is_relation and field.related_model is type(instance)
+        )
+        target_field = next(
+            field
+            for field in sender._meta.fields
+            if field.is_relation
+            and field.related_model is model
+            and field is not source_field
+        )
+        pk_set = sender.objects.filter(
+            **{source_field.attname: instance.pk}
+        ).values_list(target_field.attname, flat=True)
+    tags = [
+        get_model_tag(type(instance), instance.pk),
+        get_list_tag(type(instance)),
+        get_list_tag(sender),
+        get_list_tag(model),
+    ]
+    invalidate_tags(tags + [get_model_tag(model, pk) for pk in pk_set])
+
+
+def get_loader_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Return numbers of hits and misses and the hit rate of each loader."""
+    stats = {}
+    for context_key, counter in LOADER_CACHE_STATS.items():
+        total = counter["hits"] + counter["misses"]
+        stats[context_key] = {
+            "hits": counter["hits"],
+            "misses": counter["misses"],
+            "hit_rate": counter["hits"] / total if total else None,
+        }
+    return stats
@@ -1,29 +1,152 @@
 import logging
+import time
+from multiprocessing import Pool
 
 from django.core.management.base import BaseCommand
-from versatileimagefield.image_warmer import VersatileImageFieldWarmer
+from django.db import connections
 
-from ....product.models import ProductMedia
+from ...cache import is_cache_shared
+from ...tasks import warm_thumbnails_task
+from ...utils.thumbnails import (
+    THUMBNAIL_TARGETS,
+    WarmResult,
+    clear_checkpoint,
+    get_checkpoint,
+    get_rendition_signature,
+    iterate_pk_chunks,
+    set_checkpoint,
+    warm_thumbnails,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _warm_chunk(args):
+    target_name, pks, force = args
+    return pks[-1], warm_thumbnails(THUMBNAIL_TARGETS[target_name], pks, force)
+
+
 class Command(BaseCommand):
-    help = "Generate thumbnails for all images"
+    help = (
+        "Generate thumbnails for all images. With a shared cache, already "
+        "generated renditions are skipped and the progress is checkpointed, so "
+        "an interrupted run can be resumed by running the command again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target",
+            action="append",
+            choices=list(THUMBNAIL_TARGETS),
+            help="Images to warm; can be passed multiple times. Defaults to all.",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=1,
+            help="Number of worker processes used to generate thumbnails.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=200,
+            help="Number of instances processed by a single worker call.",
+        )
+        parser.add_argument(
+            "--celery",
+            action="store_true",
+            help="Schedule chunks as Celery tasks instead of processing them locally.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate thumbnails that are already present in the manifest.",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore the saved checkpoint and start from the beginning.",
+        )
 
     def handle(self, *args, **options):
-        self.warm_products()
-
-    def warm_products(self):
-        self.stdout.write("Products thumbnails generation:")
-        warmer = VersatileImageFieldWarmer(
-            instance_or_queryset=ProductMedia.objects.all(),
-            rendition_key_set="products",
-            image_attr="image",
-            verbose=True,
-        )
-        num_created, failed_to_create = warmer.warm()
-        self.log_failed_images(failed_to_create)
+        self.keep_progress = is_cache_shared()
+        if not self.keep_progress:
+            # The manifest and the checkpoints would live only in this process.
+            self.stderr.write(
+                "No shared cache is configured (CACHE_URL), so thumbnails are "
+                "generated in a single process and an interrupted run starts "
+                "from the beginning."
+            )
+            options = {**options, "processes": 1, "celery": False, "force": True}
+        for target_name in options["target"] or list(THUMBNAIL_TARGETS):
+            self.warm_target(target_name, options)
+
+    def warm_target(self, target_name, options):
+        target = THUMBNAIL_TARGETS[target_name]
+        signature = get_rendition_signature(target.size_set)
+        start_after = None
+        if self.keep_progress:
+            if options["restart"] or options["force"]:
+                clear_checkpoint(target_name, signature)
+            start_after = get_checkpoint(target_name, signature)
+        if start_after is not None:
+            self.stdout.write(
+                f"Resuming {target_name} thumbnails generation after pk {start_after}"
+            )
+        else:
+            self.stdout.write(f"{target_name.capitalize()} thumbnails generation:")
+
+        chunks = (
+            (target_name, pks, options["force"])
+            for pks in iterate_pk_chunks(target, options["chunk_size"], start_after)
+        )
+        if options["celery"]:
+            self.schedule_chunks(target_name, chunks)
+            return
+
+        start = time.monotonic()
+        total = WarmResult()
+        if options["processes"] > 1:
+            # Forked workers must not share the parent's database connections.
+            connections.close_all()
+            with Pool(options["processes"]) as pool:
+                # `imap` preserves ordering, so a checkpoint always means
+                # that every instance up to it has been processed.
+                for last_pk, result in pool.imap(_warm_chunk, chunks):
+                    self.save_progress(target_name, signature, last_pk, result, total)
+                    self.report_throughput(total, start)
+        else:
+            for chunk in chunks:
+                last_pk, result = _warm_chunk(chunk)
+                self.save_progress(target_name, signature, last_pk, result, total)
+                self.report_throughput(total, start)
+
+        if self.keep_progress:
+            clear_checkpoint(target_name, signature)
+        self.log_failed_images(total.failed)
+
+    def schedule_chunks(self, target_name, chunks):
+        # Scheduled tasks are kept by the broker, so no checkpoint is needed;
+        # an interrupted run is resumed by the manifest.
+        scheduled = 0
+        for _, pks, force in chunks:
+            warm_thumbnails_task.delay(target_name, pks, force)
+            scheduled += 1
+        self.stdout.write(f"Scheduled {scheduled} thumbnail generation tasks.")
+
+    def save_progress(self, target_name, signature, last_pk, result, total):
+        total.merge(result)
+        if self.keep_progress:
+            set_checkpoint(target_name, signature, last_pk)
+
+    def report_throughput(self, total, start):
+        elapsed = time.monotonic() - start
+        rate = total.processed / elapsed if elapsed else 0.0
+        self.stdout.write(
+            f"Processed {total.processed} images ({total.skipped} skipped, "
+            f"{total.created} renditions created) in {elapsed:.1f}s, "
+            f"{rate:.2f} images/s"
+        )
 
     def log_failed_images(self, failed_to_create):
         if failed_to_create:
@@ -0,0 +1,77 @@
+import csv
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ....plugins.manager import get_plugins_manager
+from ....product.models import ProductVariant
+from ....warehouse.management import update_stocks_quantities
+from ....warehouse.models import Warehouse
+
+
+class Command(BaseCommand):
+    help = (
+        "Set stock quantities from a CSV file with `sku`, `warehouse` (slug) and "
+        "`quantity` columns. Missing stocks are created. Pass `-` to read the file "
+        "from the standard input."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("file", help="Path to the CSV file.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of rows updated in a single transaction.",
+        )
+
+    def handle(self, *args, **options):
+        if options["file"] == "-":
+            self.import_rows(csv.DictReader(sys.stdin), options["chunk_size"])
+            return
+        with open(options["file"], newline="") as csv_file:
+            self.import_rows(csv.DictReader(csv_file), options["chunk_size"])
+
+    def import_rows(self, reader, chunk_size):
+        missing_columns = {"sku", "warehouse", "quantity"} - set(
+            reader.fieldnames or []
+        )
+        if missing_columns:
+            raise CommandError(
+                f"Missing columns: {', '.join(sorted(missing_columns))}."
+            )
+        manager = get_plugins_manager()
+        warehouses = dict(Warehouse.objects.values_list("slug", "pk"))
+        updated = skipped = 0
+        chunk = []
+        for row in reader:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                count, missing = self.import_chunk(chunk, warehouses, manager)
+                updated += count
+                skipped += missing
+                chunk = []
+        if chunk:
+            count, missing = self.import_chunk(chunk, warehouses, manager)
+            updated += count
+            skipped += missing
+        self.stdout.write(f"Updated {updated} stocks, skipped {skipped} rows.")
+
+    def import_chunk(self, rows, warehouses, manager):
+        variants = dict(
+            ProductVariant.objects.filter(
+                sku__in={row["sku"] for row in rows}
+            ).values_list("sku", "pk")
+        )
+        stocks_data = []
+        for row in rows:
+            variant_pk = variants.get(row["sku"])
+            warehouse_pk = warehouses.get(row["warehouse"])
+            quantity = (row["quantity"] or "").strip()
+            quantity = int(quantity) if quantity.isdigit() else None
+            if variant_pk is None or warehouse_pk is None or quantity is None:
+                self.stderr.write(f"Skipping row {row}.")
+                continue
+            stocks_data.append((variant_pk, warehouse_pk, quantity))
+        count = update_stocks_quantities(stocks_data, manager)
+        return count, len(rows) - len(stocks_data)
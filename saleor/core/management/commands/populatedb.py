@@ -24,6 +24,7 @@ from ...utils.random_data import (
     create_vouchers,
     create_warehouses,
 )
+from ...utils.scale_data import ScaleConfig, create_scale_data, parse_range
 
 
 class Command(BaseCommand):
@@ -55,6 +56,43 @@ class Command(BaseCommand):
             default=False,
             help="Don't reset SQL sequences that are out of sync.",
         )
+        parser.add_argument(
+            "--scale",
+            type=int,
+            default=0,
+            help=(
+                "Generate a synthetic dataset with the given number of products, "
+                "along with their variants, stocks, customers and orders, instead "
+                "of the demo data."
+            ),
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Seed of the synthetic dataset."
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes generating the synthetic dataset.",
+        )
+        parser.add_argument(
+            "--variants-per-product",
+            type=parse_range,
+            default="1-5",
+            help="Range of numbers of variants of a product, e.g. 1-5.",
+        )
+        parser.add_argument(
+            "--attributes-per-product-type",
+            type=parse_range,
+            default="2-8",
+            help="Range of numbers of attributes of a product type, e.g. 2-8.",
+        )
+        parser.add_argument(
+            "--lines-per-order",
+            type=parse_range,
+            default="1-5",
+            help="Range of numbers of lines of an order, e.g. 1-5.",
+        )
 
     def sequence_reset(self):
         """Run a SQL sequence reset on all saleor.* apps.
@@ -72,6 +110,24 @@ class Command(BaseCommand):
         with connection.cursor() as cursor:
             cursor.execute(commands.getvalue())
 
+    def populate_scale(self, options):
+        config = ScaleConfig(
+            products=options["scale"],
+            seed=options["seed"],
+            workers=options["workers"],
+            variants_per_product=options["variants_per_product"],
+            attributes_per_product_type=options["attributes_per_product_type"],
+            lines_per_order=options["lines_per_order"],
+        )
+        for msg in create_channels():
+            self.stdout.write(msg)
+        for msg in create_shipping_zones():
+            self.stdout.write(msg)
+        create_warehouses()
+        self.stdout.write("Created warehouses")
+        for msg in create_scale_data(config, options["user_password"]):
+            self.stdout.write(msg)
+
     def handle(self, *args, **options):
         # set only our custom plugin to not call external API when preparing
         # example database
@@ -83,6 +139,10 @@ class Command(BaseCommand):
             "saleor.payment.gateways.dummy_credit_card.plugin."
             "DummyCreditCardGatewayPlugin",
         ]
+        if options["scale"]:
+            self.populate_scale(options)
+            return
+
         create_images = not options["withoutimages"]
         for msg in create_channels():
             self.stdout.write(msg)
@@ -0,0 +1,37 @@
+"""Store translations of the given languages in the shared cache of dataloaders.
+
+Translations of objects cached by dataloaders, e.g. products or categories, are
+loaded in bulk per language, so the first requests after a deployment or a cache
+flush don't query translations of every listed object.
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ....graphql.translations.dataloaders import warm_translations_cache
+from ...cache import is_cache_shared
+
+
+class Command(BaseCommand):
+    help = "Stores translations of the languages in the shared dataloader cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--language",
+            action="append",
+            dest="languages",
+            required=True,
+            help="Code of the language to warm, e.g. fr. Can be passed many times.",
+        )
+
+    def handle(self, **options):
+        if not settings.LOADER_CACHE_ENABLED:
+            raise CommandError("The dataloader cache is disabled.")
+        if not is_cache_shared():
+            # Translations would be stored only in the memory of this process.
+            self.stderr.write(
+                "The cache isn't shared between processes, translations are not "
+                "cached for other workers."
+            )
+        for language_code in options["languages"]:
+            stored = warm_translations_cache(language_code.lower())
+            self.stdout.write(f"Cached {stored} translations to {language_code}")
@@ -1,3 +1,4 @@
+import copy
 import logging
 from datetime import datetime
 
@@ -11,6 +12,7 @@ from django.utils.translation import get_language
 from ..discount.utils import fetch_discounts
 from ..plugins.manager import get_plugins_manager
 from . import analytics
+from .cache import is_cache_shared
 from .jwt import JWT_REFRESH_TOKEN_COOKIE_NAME, jwt_decode_with_exception_handler
 
 logger = logging.getLogger(__name__)
@@ -59,17 +61,22 @@ def discounts(get_response):
 
 
 def site(get_response):
-    """Clear the Sites cache and assign the current site to `request.site`.
+    """Assign the current site to `request.site`.
 
     By default django.contrib.sites caches Site instances at the module
     level. This leads to problems when updating Site instances, as it's
     required to restart all application servers in order to invalidate
-    the cache. Using this middleware solves this problem.
+    the cache. Sites are served from a versioned shared cache instead (see
+    `saleor.site.patch_sites`), so no queries are made unless the site or its
+    settings were changed. Without a shared cache the cache is cleared on every
+    request. Each request gets its own copy of the cached site, so changes made
+    by a failed mutation don't leak to other requests.
     """
 
     def _get_site():
-        Site.objects.clear_cache()
-        return Site.objects.get_current()
+        if not is_cache_shared():
+            Site.objects.clear_cache()
+        return copy.deepcopy(Site.objects.get_current())
 
     def _site_middleware(request):
         request.site = SimpleLazyObject(_get_site)
@@ -0,0 +1,92 @@
+"""Cache of whole responses to anonymous storefront queries.
+
+Entries are keyed by the hash of the query document, the variables serialized
+in canonical form, the operation name and the active language; channel and
+language codes of storefront queries are passed as arguments, so they are part
+of the document or of the variables. Every entry keeps the tags collected while
+resolving the response (see `saleor.core.loader_cache`) together with their
+versions, and is ignored once any of them is invalidated.
+
+Availability of products and collections depends on publication dates compared
+with the current date and prices depend on sales active at the time of the
+request, so entries expire at the end of the day or when the next sale starts
+or ends, whichever comes first.
+"""
+import datetime
+import hashlib
+import json
+from typing import Any, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Min, Q
+from django.utils import timezone
+from django.utils.translation import get_language
+
+from .. import __version__ as saleor_version
+from ..discount.models import Sale
+from .loader_cache import get_tag_versions, get_version_time
+
+RESPONSE_CACHE_KEY = "response:{key}"
+
+
+def get_response_cache_key(
+    query: str, variables: Optional[dict], operation_name: Optional[str]
+) -> str:
+    data = json.dumps(
+        [saleor_version, query, variables or {}, operation_name, get_language()],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    hashed_data = hashlib.sha256(data.encode("utf-8")).hexdigest()
+    return RESPONSE_CACHE_KEY.format(key=hashed_data)
+
+
+def get_cached_response(key: str) -> Optional[Any]:
+    """Return the cached response data if none of its tags was invalidated."""
+    entry: Optional[Tuple[Tuple[str, ...], Tuple[str, ...], Any]] = cache.get(key)
+    if entry is None:
+        return None
+    tags, versions, data = entry
+    tag_versions = get_tag_versions(tags)
+    if versions != tuple(tag_versions[tag] for tag in tags):
+        return None
+    return data
+
+
+def get_response_timeout(now: datetime.datetime) -> int:
+    """Return the number of seconds the response resolved at the time is valid."""
+    # Publication dates are compared with `datetime.date.today()`.
+    local_now = datetime.datetime.now()
+    next_day = datetime.datetime.combine(
+        local_now.date() + datetime.timedelta(days=1), datetime.time.min
+    )
+    timeout = min(settings.RESPONSE_CACHE_TIMEOUT, (next_day - local_now).seconds)
+
+    boundaries = Sale.objects.aggregate(
+        next_start=Min("start_date", filter=Q(start_date__gt=now)),
+        next_end=Min("end_date", filter=Q(end_date__gt=now)),
+    )
+    for boundary in boundaries.values():
+        if boundary is not None:
+            timeout = min(timeout, int((boundary - now).total_seconds()))
+    return max(timeout, 0)
+
+
+def cache_response(key: str, data: Any, tags: Iterable[str], started_at: float):
+    """Store the response data resolved since the time with versions of its tags.
+
+    Tags are collected while the response is resolved, after the objects are
+    loaded, so the response is not stored when any of them was invalidated since
+    the time resolving started; it may hold data from before the change.
+    """
+    timeout = get_response_timeout(timezone.now())
+    if not timeout:
+        return
+    tags = tuple(sorted(tags))
+    tag_versions = get_tag_versions(tags)
+    versions = tuple(tag_versions[tag] for tag in tags)
+    if any(get_version_time(version) >= started_at for version in versions):
+        return
+    cache.set(key, (tags, versions, data), timeout=timeout)
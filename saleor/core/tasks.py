@@ -1,8 +1,21 @@
+from celery.utils.log import get_task_logger
 from django.core.files.storage import default_storage
 
 from ..celeryconf import app
+from .utils.thumbnails import THUMBNAIL_TARGETS, warm_thumbnails
+
+task_logger = get_task_logger(__name__)
 
 
 @app.task
 def delete_from_storage_task(path):
     default_storage.delete(path)
+
+
+@app.task
+def warm_thumbnails_task(target_name, pks, force=False):
+    result = warm_thumbnails(THUMBNAIL_TARGETS[target_name], pks, force)
+    if result.failed:
+        task_logger.error(
+            "Failed to generate thumbnails", extra={"paths": result.failed}
+        )
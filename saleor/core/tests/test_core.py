@@ -16,9 +16,10 @@ from ...account.utils import create_superuser
 from ...channel.models import Channel
 from ...discount.models import Sale, SaleChannelListing, Voucher, VoucherChannelListing
 from ...giftcard.models import GiftCard
-from ...order.models import Order
-from ...product.models import ProductMedia, ProductType
+from ...order.models import Order, OrderLine
+from ...product.models import Product, ProductMedia, ProductType, ProductVariant
 from ...shipping.models import ShippingZone
+from ...warehouse.models import Stock
 from ..storages import S3MediaStorage
 from ..templatetags.placeholder import placeholder
 from ..utils import (
@@ -30,6 +31,7 @@ from ..utils import (
     get_currency_for_country,
     random_data,
 )
+from ..utils.scale_data import ScaleConfig, create_scale_data, parse_range
 
 type_schema = {
     "Vegetable": {
@@ -128,6 +130,44 @@ def test_create_fake_users(db):
     assert User.objects.all().count() == 5
 
 
+def test_create_scale_data(channel_USD, warehouse):
+    # given
+    config = ScaleConfig(
+        products=10,
+        chunk_size=4,
+        product_types=2,
+        categories=3,
+        attributes=4,
+        variants_per_product=(2, 2),
+        customers_per_product=0.5,
+        orders_per_product=1,
+        lines_per_order=(1, 3),
+    )
+
+    # when
+    for _ in create_scale_data(config, "password"):
+        pass
+
+    # then
+    products = Product.objects.filter(slug__startswith="scale-0-")
+    assert products.count() == 10
+    assert ProductVariant.objects.filter(product__in=products).count() == 20
+    assert not products.filter(default_variant__isnull=True).exists()
+    assert Stock.objects.filter(product_variant__product__in=products).count() == 20
+    assert User.objects.filter(email__startswith="customer-0-").count() == 5
+    orders = Order.objects.all()
+    assert orders.count() == 10
+    assert all(1 <= order.lines.count() <= 3 for order in orders)
+    assert not OrderLine.objects.exclude(product_sku__startswith="scale-0-").exists()
+
+
+def test_parse_range():
+    assert parse_range("1-5") == (1, 5)
+    assert parse_range("3") == (3, 3)
+    with pytest.raises(ValueError):
+        parse_range("5-1")
+
+
 def test_create_address(db):
     assert not Address.objects.exists()
     random_data.create_address()
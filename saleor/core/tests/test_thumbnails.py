@@ -0,0 +1,129 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+
+from ...product.models import ProductMedia
+from ..utils.thumbnails import (
+    THUMBNAIL_TARGETS,
+    WarmResult,
+    get_checkpoint,
+    get_rendition_signature,
+    get_warmed_image_names,
+    iterate_pk_chunks,
+    set_checkpoint,
+    warm_thumbnails,
+)
+
+
+def test_get_rendition_signature_changes_with_key_set(settings):
+    # given
+    signature = get_rendition_signature("products")
+
+    # when
+    settings.VERSATILEIMAGEFIELD_RENDITION_KEY_SETS = {
+        **settings.VERSATILEIMAGEFIELD_RENDITION_KEY_SETS,
+        "products": [("product_tiny", "thumbnail__30x30")],
+    }
+
+    # then
+    assert get_rendition_signature("products") != signature
+
+
+def test_iterate_pk_chunks(product_with_images):
+    # given
+    target = THUMBNAIL_TARGETS["products"]
+    pks = list(ProductMedia.objects.order_by("pk").values_list("pk", flat=True))
+
+    # when
+    chunks = list(iterate_pk_chunks(target, chunk_size=1, start_after=pks[0]))
+
+    # then
+    assert chunks == [[pk] for pk in pks[1:]]
+
+
+@patch("saleor.core.utils.thumbnails.VersatileImageFieldWarmer")
+def test_warm_thumbnails_skips_images_from_manifest(warmer_mock, product_with_image):
+    # given
+    cache.clear()
+    warmer_mock.return_value.warm.return_value = (6, [])
+    target = THUMBNAIL_TARGETS["products"]
+    media = product_with_image.media.first()
+    signature = get_rendition_signature(target.size_set)
+
+    # when
+    first_result = warm_thumbnails(target, [media.pk])
+    second_result = warm_thumbnails(target, [media.pk])
+
+    # then
+    assert first_result.processed == 1
+    assert first_result.created == 6
+    assert second_result.processed == 0
+    assert second_result.skipped == 1
+    assert warmer_mock.call_count == 1
+    assert get_warmed_image_names([media.image.name], signature) == {media.image.name}
+
+
+@patch("saleor.core.utils.thumbnails.VersatileImageFieldWarmer")
+def test_warm_thumbnails_does_not_mark_failed_images(warmer_mock, product_with_image):
+    # given
+    cache.clear()
+    media = product_with_image.media.first()
+    warmer_mock.return_value.warm.return_value = (0, [media.image.name])
+    target = THUMBNAIL_TARGETS["products"]
+
+    # when
+    result = warm_thumbnails(target, [media.pk])
+
+    # then
+    assert result.failed == [media.image.name]
+    signature = get_rendition_signature(target.size_set)
+    assert not get_warmed_image_names([media.image.name], signature)
+
+
+@patch(
+    "saleor.core.management.commands.create_thumbnails.is_cache_shared",
+    return_value=True,
+)
+@patch("saleor.core.management.commands.create_thumbnails.warm_thumbnails")
+def test_create_thumbnails_command_resumes_from_checkpoint(
+    warm_thumbnails_mock, _is_cache_shared_mock, product_with_images
+):
+    # given
+    cache.clear()
+    warm_thumbnails_mock.return_value = WarmResult()
+    pks = list(ProductMedia.objects.order_by("pk").values_list("pk", flat=True))
+    signature = get_rendition_signature("products")
+    set_checkpoint("products", signature, pks[0])
+
+    # when
+    call_command("create_thumbnails", target=["products"], chunk_size=100)
+
+    # then
+    warm_thumbnails_mock.assert_called_once_with(
+        THUMBNAIL_TARGETS["products"], pks[1:], False
+    )
+    assert get_checkpoint("products", signature) is None
+
+
+@patch("saleor.core.management.commands.create_thumbnails.warm_thumbnails")
+def test_create_thumbnails_command_without_shared_cache(
+    warm_thumbnails_mock, settings, product_with_images
+):
+    # given
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    warm_thumbnails_mock.return_value = WarmResult()
+    pks = list(ProductMedia.objects.order_by("pk").values_list("pk", flat=True))
+    signature = get_rendition_signature("products")
+    set_checkpoint("products", signature, pks[0])
+
+    # when
+    call_command("create_thumbnails", target=["products"], processes=2)
+
+    # then
+    warm_thumbnails_mock.assert_called_once_with(
+        THUMBNAIL_TARGETS["products"], pks, True
+    )
+    assert get_checkpoint("products", signature) == pks[0]
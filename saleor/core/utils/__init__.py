@@ -14,6 +14,8 @@ from django_prices_openexchangerates import exchange_currency
 from prices import MoneyRange
 from versatileimagefield.image_warmer import VersatileImageFieldWarmer
 
+from .thumbnails import get_rendition_signature, mark_images_as_warmed
+
 task_logger = get_task_logger(__name__)
 
 
@@ -113,6 +115,8 @@ def create_thumbnails(pk, model, size_set, image_attr=None):
         task_logger.error(
             "Failed to generate thumbnails", extra={"paths": failed_to_create}
         )
+    else:
+        mark_images_as_warmed([image_instance.name], get_rendition_signature(size_set))
 
 
 def generate_unique_slug(
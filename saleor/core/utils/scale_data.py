@@ -0,0 +1,501 @@
+"""Generate large synthetic datasets to reproduce production query plans.
+
+Objects are generated in chunks of consecutive indexes. Each chunk has its own
+random generator seeded with the seed of the dataset, the kind of the objects
+and the index of the chunk. Related objects are referenced by their indexes
+rather than by IDs, so apart from the IDs the generated data does not depend on
+the number of workers or on the order in which chunks are processed. Chunks are
+inserted with `bulk_create`, each in a separate transaction, and can be
+processed by parallel worker processes.
+
+Generated slugs, SKUs and emails contain the seed, so datasets with different
+seeds can be generated into the same database.
+"""
+import multiprocessing
+import random
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from django.contrib.auth.hashers import make_password
+from django.db import connections, transaction
+from django.utils import timezone
+
+from ...account.models import User
+from ...attribute import AttributeInputType, AttributeType
+from ...attribute.models import (
+    AssignedProductAttribute,
+    AssignedProductAttributeValue,
+    Attribute,
+    AttributeProduct,
+    AttributeValue,
+)
+from ...attribute.utils import index_product_attribute_values
+from ...channel.models import Channel
+from ...order import OrderOrigin, OrderStatus
+from ...order.models import Order, OrderLine
+from ...product.models import (
+    Category,
+    Product,
+    ProductChannelListing,
+    ProductType,
+    ProductVariant,
+    ProductVariantChannelListing,
+)
+from ...warehouse.availability import update_variants_channel_availability
+from ...warehouse.models import Stock, Warehouse
+
+Range = Tuple[int, int]
+
+ORDER_STATUSES = [
+    OrderStatus.UNFULFILLED,
+    OrderStatus.PARTIALLY_FULFILLED,
+    OrderStatus.FULFILLED,
+    OrderStatus.CANCELED,
+]
+
+
+@dataclass
+class ScaleConfig:
+    """Size and shape of the generated dataset.
+
+    Ranges are inclusive; numbers of related objects are drawn uniformly from
+    them.
+    """
+
+    products: int
+    seed: int = 0
+    workers: int = 1
+    chunk_size: int = 5000
+    product_types: int = 50
+    categories: int = 200
+    attributes: int = 200
+    attributes_per_product_type: Range = (2, 8)
+    values_per_attribute: Range = (5, 50)
+    variants_per_product: Range = (1, 5)
+    warehouses_per_variant: Range = (1, 3)
+    customers_per_product: float = 0.5
+    orders_per_product: float = 1.0
+    lines_per_order: Range = (1, 5)
+    guest_orders_ratio: float = 0.3
+
+    @property
+    def customers(self) -> int:
+        return int(self.products * self.customers_per_product)
+
+    @property
+    def orders(self) -> int:
+        return int(self.products * self.orders_per_product)
+
+
+def parse_range(value: str) -> Range:
+    """Parse a range given as `MIN-MAX` or a single number."""
+    low, _, high = value.partition("-")
+    low_value = int(low)
+    high_value = int(high) if high else low_value
+    if low_value < 0 or high_value < low_value:
+        raise ValueError(f"Invalid range: {value}.")
+    return low_value, high_value
+
+
+def _get_random(config: ScaleConfig, kind: str, chunk: int = 0) -> random.Random:
+    return random.Random(f"{config.seed}:{kind}:{chunk}")
+
+
+def _get_price(rng: random.Random) -> Decimal:
+    return Decimal(rng.randint(100, 100000)) / 100
+
+
+def create_catalog_structure(config: ScaleConfig) -> Dict[str, Any]:
+    """Create attributes, product types and categories shared by the products.
+
+    Return IDs of the created objects needed to generate the products.
+    """
+    rng = _get_random(config, "catalog")
+    prefix = f"scale-{config.seed}"
+    attributes = Attribute.objects.bulk_create(
+        [
+            Attribute(
+                name=f"Attribute {index}",
+                slug=f"{prefix}-attribute-{index}",
+                type=AttributeType.PRODUCT_TYPE,
+                input_type=AttributeInputType.DROPDOWN,
+                filterable_in_storefront=True,
+                filterable_in_dashboard=True,
+            )
+            for index in range(config.attributes)
+        ]
+    )
+    values = AttributeValue.objects.bulk_create(
+        [
+            AttributeValue(
+                attribute=attribute,
+                name=f"Value {index}",
+                slug=f"value-{index}",
+                sort_order=index,
+            )
+            for attribute in attributes
+            for index in range(rng.randint(*config.values_per_attribute))
+        ],
+        batch_size=config.chunk_size,
+    )
+    value_ids_by_attribute: Dict[int, List[int]] = {}
+    for value in values:
+        value_ids_by_attribute.setdefault(value.attribute_id, []).append(value.pk)
+
+    product_types = ProductType.objects.bulk_create(
+        [
+            ProductType(name=f"Product type {index}", slug=f"{prefix}-type-{index}")
+            for index in range(config.product_types)
+        ]
+    )
+    attribute_products = AttributeProduct.objects.bulk_create(
+        [
+            AttributeProduct(
+                attribute=attribute, product_type=product_type, sort_order=sort_order
+            )
+            for product_type in product_types
+            for sort_order, attribute in enumerate(
+                rng.sample(
+                    attributes,
+                    min(
+                        rng.randint(*config.attributes_per_product_type),
+                        len(attributes),
+                    ),
+                )
+            )
+        ]
+    )
+    assignments_by_product_type: Dict[int, List[Tuple[int, List[int]]]] = {
+        product_type.pk: [] for product_type in product_types
+    }
+    for attribute_product in attribute_products:
+        assignments_by_product_type[attribute_product.product_type_id].append(
+            (
+                attribute_product.pk,
+                value_ids_by_attribute[attribute_product.attribute_id],
+            )
+        )
+
+    # Categories are created one by one, as the tree structure is set on save.
+    categories: List[Category] = []
+    for index in range(config.categories):
+        parent = rng.choice(categories) if categories and rng.random() < 0.7 else None
+        categories.append(
+            Category.objects.create(
+                name=f"Category {index}",
+                slug=f"{prefix}-category-{index}",
+                parent=parent,
+            )
+        )
+
+    return {
+        "assignments_by_product_type": assignments_by_product_type,
+        "category_ids": [category.pk for category in categories],
+        "channels": list(Channel.objects.values_list("pk", "currency_code")),
+        "warehouse_ids": list(Warehouse.objects.values_list("pk", flat=True)),
+    }
+
+
+def create_products_chunk(
+    config: ScaleConfig, context: Dict[str, Any], chunk: int, start: int, end: int
+):
+    rng = _get_random(config, "products", chunk)
+    prefix = f"scale-{config.seed}"
+    product_type_ids = list(context["assignments_by_product_type"])
+    today = date.today()
+
+    products = Product.objects.bulk_create(
+        [
+            Product(
+                name=f"Product {index}",
+                slug=f"{prefix}-product-{index}",
+                product_type_id=rng.choice(product_type_ids),
+                category_id=rng.choice(context["category_ids"]),
+                rating=rng.randint(0, 50) / 10,
+            )
+            for index in range(start, end)
+        ]
+    )
+
+    variants = []
+    product_attributes = []
+    for index, product in zip(range(start, end), products):
+        variants += [
+            ProductVariant(
+                product=product,
+                name=f"Variant {variant_index}",
+                sku=f"{prefix}-{index}-{variant_index}",
+                sort_order=variant_index,
+            )
+            for variant_index in range(rng.randint(*config.variants_per_product))
+        ]
+        for assignment_id, value_ids in context["assignments_by_product_type"][
+            product.product_type_id
+        ]:
+            product_attributes.append(
+                (
+                    AssignedProductAttribute(
+                        product=product, assignment_id=assignment_id
+                    ),
+                    rng.choice(value_ids),
+                )
+            )
+    variants = ProductVariant.objects.bulk_create(variants)
+
+    assigned_attributes = AssignedProductAttribute.objects.bulk_create(
+        [assigned_attribute for assigned_attribute, _ in product_attributes]
+    )
+    assigned_values = AssignedProductAttributeValue.objects.bulk_create(
+        [
+            AssignedProductAttributeValue(
+                assignment=assigned_attribute, value_id=value_id, sort_order=0
+            )
+            for assigned_attribute, (_, value_id) in zip(
+                assigned_attributes, product_attributes
+            )
+        ]
+    )
+    index_product_attribute_values([value.pk for value in assigned_values])
+
+    variant_listings = []
+    min_prices: Dict[Tuple[int, int], Decimal] = {}
+    for variant in variants:
+        for channel_id, currency in context["channels"]:
+            price = _get_price(rng)
+            key = (variant.product_id, channel_id)
+            min_prices[key] = min(price, min_prices.get(key, price))
+            variant_listings.append(
+                ProductVariantChannelListing(
+                    variant=variant,
+                    channel_id=channel_id,
+                    currency=currency,
+                    price_amount=price,
+                    cost_price_amount=price / 2,
+                )
+            )
+    ProductVariantChannelListing.objects.bulk_create(variant_listings)
+    ProductChannelListing.objects.bulk_create(
+        [
+            ProductChannelListing(
+                product=product,
+                channel_id=channel_id,
+                currency=currency,
+                is_published=True,
+                publication_date=today,
+                visible_in_listings=True,
+                available_for_purchase=today,
+                discounted_price_amount=min_prices.get((product.pk, channel_id)),
+            )
+            for product in products
+            for channel_id, currency in context["channels"]
+        ]
+    )
+
+    warehouse_ids = context["warehouse_ids"]
+    stocks = []
+    for variant in variants:
+        count = min(rng.randint(*config.warehouses_per_variant), len(warehouse_ids))
+        stocks += [
+            Stock(
+                warehouse_id=warehouse_id,
+                product_variant=variant,
+                quantity=rng.randint(0, 1000),
+            )
+            for warehouse_id in rng.sample(warehouse_ids, count)
+        ]
+    Stock.objects.bulk_create(stocks)
+    update_variants_channel_availability([variant.pk for variant in variants])
+
+    default_variants = {}
+    for variant in variants:
+        default_variants.setdefault(variant.product_id, variant.pk)
+    for product in products:
+        product.default_variant_id = default_variants.get(product.pk)
+    Product.objects.bulk_update(products, ["default_variant"])
+
+
+def create_customers_chunk(
+    config: ScaleConfig, context: Dict[str, Any], chunk: int, start: int, end: int
+):
+    User.objects.bulk_create(
+        [
+            User(
+                email=f"customer-{config.seed}-{index}@example.com",
+                first_name="Customer",
+                last_name=str(index),
+                password=context["password"],
+                is_active=True,
+            )
+            for index in range(start, end)
+        ]
+    )
+
+
+def create_orders_chunk(
+    config: ScaleConfig, context: Dict[str, Any], chunk: int, start: int, end: int
+):
+    """Create orders of random customers with lines of random variants.
+
+    Customers and products are drawn by their indexes and found by their emails
+    and slugs, as their IDs depend on the order in which chunks were inserted.
+    Variants are drawn from the variants of the product ordered by SKU.
+    """
+    rng = _get_random(config, "orders", chunk)
+    now = timezone.now()
+    prefix = f"scale-{config.seed}"
+
+    drafts = []
+    for _ in range(start, end):
+        email = None
+        if config.customers and rng.random() >= config.guest_orders_ratio:
+            customer_index = rng.randrange(config.customers)
+            email = f"customer-{config.seed}-{customer_index}@example.com"
+        variant_picks = [
+            (f"{prefix}-product-{rng.randrange(config.products)}", rng.getrandbits(32))
+            for _ in range(rng.randint(*config.lines_per_order))
+        ]
+        drafts.append((email, variant_picks))
+
+    user_ids = dict(
+        User.objects.filter(
+            email__in={email for email, _ in drafts if email}
+        ).values_list("email", "pk")
+    )
+    variants_by_product: Dict[str, List[Dict[str, Any]]] = {}
+    for variant in (
+        ProductVariant.objects.filter(
+            product__slug__in={
+                slug for _, variant_picks in drafts for slug, _ in variant_picks
+            }
+        )
+        .order_by("sku")
+        .values("pk", "name", "sku", "product__name", "product__slug")
+    ):
+        variants_by_product.setdefault(variant["product__slug"], []).append(variant)
+
+    orders = []
+    lines_by_order = []
+    for index, (email, variant_picks) in zip(range(start, end), drafts):
+        channel_id, currency = rng.choice(context["channels"])
+        user_id = user_ids.get(email)
+        order = Order(
+            token=str(uuid.UUID(int=rng.getrandbits(128))),
+            created=now - timedelta(seconds=rng.randint(0, 365 * 24 * 3600)),
+            status=rng.choice(ORDER_STATUSES),
+            origin=OrderOrigin.CHECKOUT,
+            channel_id=channel_id,
+            currency=currency,
+            user_id=user_id,
+            user_email=email if user_id else f"guest-{config.seed}-{index}@example.com",
+        )
+        lines = []
+        total = Decimal(0)
+        for slug, pick in variant_picks:
+            product_variants = variants_by_product.get(slug)
+            if not product_variants:
+                continue
+            variant = product_variants[pick % len(product_variants)]
+            quantity = rng.randint(1, 5)
+            unit_price = _get_price(rng)
+            total += unit_price * quantity
+            lines.append(
+                OrderLine(
+                    variant_id=variant["pk"],
+                    product_name=variant["product__name"],
+                    variant_name=variant["name"],
+                    product_sku=variant["sku"],
+                    is_shipping_required=True,
+                    quantity=quantity,
+                    currency=currency,
+                    unit_price_net_amount=unit_price,
+                    unit_price_gross_amount=unit_price,
+                    total_price_net_amount=unit_price * quantity,
+                    total_price_gross_amount=unit_price * quantity,
+                    undiscounted_unit_price_net_amount=unit_price,
+                    undiscounted_unit_price_gross_amount=unit_price,
+                    undiscounted_total_price_net_amount=unit_price * quantity,
+                    undiscounted_total_price_gross_amount=unit_price * quantity,
+                )
+            )
+        order.total_net_amount = order.total_gross_amount = total
+        order.undiscounted_total_net_amount = total
+        order.undiscounted_total_gross_amount = total
+        orders.append(order)
+        lines_by_order.append(lines)
+
+    orders = Order.objects.bulk_create(orders)
+    for order, lines in zip(orders, lines_by_order):
+        for line in lines:
+            line.order = order
+    OrderLine.objects.bulk_create([line for lines in lines_by_order for line in lines])
+
+
+ChunkFunction = Callable[[ScaleConfig, Dict[str, Any], int, int, int], None]
+
+
+def _run_chunk(
+    function: ChunkFunction,
+    config: ScaleConfig,
+    context: Dict[str, Any],
+    chunk: int,
+    start: int,
+    end: int,
+):
+    with transaction.atomic():
+        function(config, context, chunk, start, end)
+    return end - start
+
+
+def run_in_chunks(
+    function: ChunkFunction,
+    config: ScaleConfig,
+    context: Dict[str, Any],
+    total: int,
+):
+    """Run the function for chunks of indexes, in parallel if configured."""
+    chunks = [
+        (chunk, start, min(start + config.chunk_size, total))
+        for chunk, start in enumerate(range(0, total, config.chunk_size))
+    ]
+    if config.workers <= 1:
+        for chunk, start, end in chunks:
+            _run_chunk(function, config, context, chunk, start, end)
+        return
+
+    # Forked workers must not share the database connection of the parent.
+    connections.close_all()
+    with ProcessPoolExecutor(
+        max_workers=config.workers, mp_context=multiprocessing.get_context("fork")
+    ) as executor:
+        futures = [
+            executor.submit(_run_chunk, function, config, context, *chunk)
+            for chunk in chunks
+        ]
+        for future in futures:
+            future.result()
+
+
+def create_scale_data(config: ScaleConfig, password: str) -> Iterator[str]:
+    started = time.monotonic()
+
+    def elapsed():
+        return f"{time.monotonic() - started:.1f}s"
+
+    context = create_catalog_structure(config)
+    yield f"Created attributes, product types and categories ({elapsed()})"
+
+    run_in_chunks(create_products_chunk, config, context, config.products)
+    yield f"Created {config.products} products ({elapsed()})"
+
+    # Hashing is slow, so all customers get the same password hash.
+    context["password"] = make_password(password)
+    run_in_chunks(create_customers_chunk, config, context, config.customers)
+    yield f"Created {config.customers} customers ({elapsed()})"
+
+    run_in_chunks(create_orders_chunk, config, context, config.orders)
+    yield f"Created {config.orders} orders ({elapsed()})"
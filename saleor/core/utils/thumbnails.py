@@ -0,0 +1,156 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Set
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from versatileimagefield.image_warmer import VersatileImageFieldWarmer
+
+MANIFEST_CACHE_KEY = "thumbnail-manifest:{signature}:{name}"
+CHECKPOINT_CACHE_KEY = "thumbnail-checkpoint:{target}:{signature}"
+
+
+@dataclass(frozen=True)
+class ThumbnailTarget:
+    model: str
+    size_set: str
+    image_attr: str
+
+
+THUMBNAIL_TARGETS = {
+    "products": ThumbnailTarget("product.ProductMedia", "products", "image"),
+    "categories": ThumbnailTarget(
+        "product.Category", "background_images", "background_image"
+    ),
+    "collections": ThumbnailTarget(
+        "product.Collection", "background_images", "background_image"
+    ),
+    "avatars": ThumbnailTarget("account.User", "user_avatars", "avatar"),
+}
+
+
+@dataclass
+class WarmResult:
+    processed: int = 0
+    skipped: int = 0
+    created: int = 0
+    failed: List[str] = field(default_factory=list)
+
+    def merge(self, other: "WarmResult"):
+        self.processed += other.processed
+        self.skipped += other.skipped
+        self.created += other.created
+        self.failed.extend(other.failed)
+
+
+def get_rendition_signature(size_set: str) -> str:
+    """Return a hash identifying the current renditions of the given key set.
+
+    Adding, removing or changing a size in `VERSATILEIMAGEFIELD_RENDITION_KEY_SETS`
+    changes the signature, so previously warmed images are warmed again.
+    """
+    key_set = settings.VERSATILEIMAGEFIELD_RENDITION_KEY_SETS[size_set]
+    payload = json.dumps([size_set, key_set], sort_keys=True).encode()
+    return hashlib.md5(payload).hexdigest()
+
+
+def _manifest_key(signature: str, name: str) -> str:
+    return MANIFEST_CACHE_KEY.format(signature=signature, name=name)
+
+
+def get_warmed_image_names(names: Iterable[str], signature: str) -> Set[str]:
+    """Return these of the given image names that have all renditions created."""
+    keys = {_manifest_key(signature, name): name for name in names}
+    found = cache.get_many(list(keys))
+    return {keys[key] for key in found}
+
+
+def mark_images_as_warmed(names: Iterable[str], signature: str):
+    cache.set_many(
+        {_manifest_key(signature, name): True for name in names}, timeout=None
+    )
+
+
+def get_checkpoint(target: str, signature: str) -> Optional[int]:
+    return cache.get(CHECKPOINT_CACHE_KEY.format(target=target, signature=signature))
+
+
+def set_checkpoint(target: str, signature: str, pk: int):
+    cache.set(
+        CHECKPOINT_CACHE_KEY.format(target=target, signature=signature),
+        pk,
+        timeout=None,
+    )
+
+
+def clear_checkpoint(target: str, signature: str):
+    cache.delete(CHECKPOINT_CACHE_KEY.format(target=target, signature=signature))
+
+
+def get_queryset_with_images(target: ThumbnailTarget):
+    model = apps.get_model(target.model)
+    lookup = Q(**{f"{target.image_attr}__isnull": True}) | Q(**{target.image_attr: ""})
+    return model.objects.exclude(lookup)
+
+
+def iterate_pk_chunks(
+    target: ThumbnailTarget, chunk_size: int, start_after: Optional[int] = None
+) -> Iterator[List[int]]:
+    """Yield ascending chunks of primary keys of instances that have an image.
+
+    Keyset pagination is used so that each chunk costs a single index scan
+    regardless of how far into the table the iteration is.
+    """
+    queryset = get_queryset_with_images(target).order_by("pk")
+    last_pk = start_after
+    while True:
+        chunk_qs = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        pks = list(chunk_qs.values_list("pk", flat=True)[:chunk_size])
+        if not pks:
+            return
+        yield pks
+        last_pk = pks[-1]
+
+
+def warm_thumbnails(
+    target: ThumbnailTarget, pks: List[int], force: bool = False
+) -> WarmResult:
+    """Create renditions for a chunk of instances with a single warmer run.
+
+    The instances are loaded to skip images already listed in the manifest,
+    unless `force` is set; the warmer loads the remaining ones again.
+    """
+    signature = get_rendition_signature(target.size_set)
+    instances = list(get_queryset_with_images(target).filter(pk__in=pks))
+    names_by_pk = {
+        instance.pk: getattr(instance, target.image_attr).name for instance in instances
+    }
+    warmed = set() if force else get_warmed_image_names(names_by_pk.values(), signature)
+    pending = [
+        instance for instance in instances if names_by_pk[instance.pk] not in warmed
+    ]
+    result = WarmResult(processed=len(pending), skipped=len(instances) - len(pending))
+    if not pending:
+        return result
+
+    warmer = VersatileImageFieldWarmer(
+        instance_or_queryset=get_queryset_with_images(target).filter(
+            pk__in=[instance.pk for instance in pending]
+        ),
+        rendition_key_set=target.size_set,
+        image_attr=target.image_attr,
+    )
+    result.created, result.failed = warmer.warm()
+    failed = set(result.failed)
+    mark_images_as_warmed(
+        [
+            names_by_pk[instance.pk]
+            for instance in pending
+            if names_by_pk[instance.pk] not in failed
+        ],
+        signature,
+    )
+    return result
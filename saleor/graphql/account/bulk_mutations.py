@@ -4,6 +4,7 @@ import graphene
 from django.core.exceptions import ValidationError
 
 from ...account import models
+from ...account.cache import invalidate_principals
 from ...account.error_codes import AccountErrorCode
 from ...core.permissions import AccountPermissions
 from ..core.mutations import BaseBulkMutation, ModelBulkDeleteMutation
@@ -110,3 +111,6 @@ class UserBulkSetActive(BaseBulkMutation):
     @classmethod
     def bulk_action(cls, info, queryset, is_active):
         queryset.update(is_active=is_active)
+        # updating the queryset doesn't send the signals which invalidate
+        # the cached principals
+        invalidate_principals(list(queryset.values_list("pk", flat=True)))
@@ -14,13 +14,14 @@ from django.core.exceptions import ValidationError
 from django.core.files import File
 from django.test import override_settings
 from freezegun import freeze_time
+from jwt import InvalidTokenError
 
 from ....account import events as account_events
 from ....account.error_codes import AccountErrorCode
 from ....account.models import Address, User
 from ....account.notifications import get_default_user_payload
 from ....checkout import AddressType
-from ....core.jwt import create_token
+from ....core.jwt import create_access_token, create_token, get_user_from_access_token
 from ....core.notify_events import NotifyEventType
 from ....core.permissions import AccountPermissions, OrderPermissions
 from ....core.utils.url import prepare_url
@@ -4725,6 +4726,31 @@ def test_staff_bulk_set_not_active(
     assert not any(user.is_active for user in users)
 
 
+def test_staff_bulk_set_not_active_invalidates_cached_principals(
+    staff_api_client, user_list, permission_manage_users
+):
+    # given
+    user = user_list[0]
+    access_token = create_access_token(user)
+    assert get_user_from_access_token(access_token) == user
+    variables = {
+        "ids": [graphene.Node.to_global_id("User", user.id)],
+        "is_active": False,
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        USER_CHANGE_ACTIVE_STATUS_MUTATION,
+        variables,
+        permissions=[permission_manage_users],
+    )
+
+    # then
+    get_graphql_content(response)
+    with pytest.raises(InvalidTokenError):
+        get_user_from_access_token(access_token)
+
+
 def test_change_active_status_for_superuser(
     staff_api_client, superuser, permission_manage_users
 ):
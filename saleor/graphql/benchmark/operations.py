@@ -0,0 +1,319 @@
+"""Storefront and dashboard operations replayed by the benchmark runner.
+
+Variables in curly braces are replaced with objects of the benchmarked
+database; see `get_benchmark_context`.
+"""
+from .runner import BenchmarkOperation
+
+PRICE_FRAGMENT = """
+    fragment Price on TaxedMoney {
+        gross {
+            amount
+            currency
+        }
+        net {
+            amount
+            currency
+        }
+    }
+"""
+
+STOREFRONT_OPERATIONS = [
+    BenchmarkOperation(
+        name="storefront:home_page",
+        query="""
+            query HomePage {
+                shop {
+                    description
+                    name
+                }
+                categories(level: 0, first: 4) {
+                    edges {
+                        node {
+                            id
+                            name
+                            backgroundImage {
+                                url
+                            }
+                        }
+                    }
+                }
+            }
+        """,
+    ),
+    BenchmarkOperation(
+        name="storefront:navigation",
+        query="""
+            query Navigation($channel: String!) {
+                menu(slug: "navbar", channel: $channel) {
+                    items {
+                        name
+                        url
+                        category {
+                            slug
+                        }
+                        collection {
+                            slug
+                        }
+                        children {
+                            name
+                            url
+                            children {
+                                name
+                                url
+                            }
+                        }
+                    }
+                }
+            }
+        """,
+        variables={"channel": "{channel}"},
+    ),
+    BenchmarkOperation(
+        name="storefront:product_list",
+        query=PRICE_FRAGMENT
+        + """
+            query ProductList($channel: String!, $categories: [ID]) {
+                products(
+                    first: 20, channel: $channel, filter: {categories: $categories}
+                ) {
+                    edges {
+                        node {
+                            id
+                            name
+                            slug
+                            thumbnail {
+                                url
+                            }
+                            category {
+                                name
+                            }
+                            isAvailable
+                            pricing {
+                                onSale
+                                priceRange {
+                                    start {
+                                        ...Price
+                                    }
+                                    stop {
+                                        ...Price
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        """,
+        variables={"channel": "{channel}", "categories": ["{category_id}"]},
+    ),
+    BenchmarkOperation(
+        name="storefront:product_facets",
+        query="""
+            query ProductFacets($channel: String!, $categories: [ID]) {
+                productFacets(channel: $channel, filter: {categories: $categories}) {
+                    attribute {
+                        name
+                        slug
+                    }
+                    values {
+                        value {
+                            name
+                            slug
+                        }
+                        count
+                    }
+                }
+            }
+        """,
+        variables={"channel": "{channel}", "categories": ["{category_id}"]},
+    ),
+    BenchmarkOperation(
+        name="storefront:product_details",
+        query=PRICE_FRAGMENT
+        + """
+            query ProductDetails($slug: String!, $channel: String!) {
+                product(slug: $slug, channel: $channel) {
+                    id
+                    name
+                    description
+                    seoTitle
+                    seoDescription
+                    media {
+                        url
+                        alt
+                    }
+                    attributes {
+                        attribute {
+                            name
+                        }
+                        values {
+                            name
+                        }
+                    }
+                    pricing {
+                        priceRange {
+                            start {
+                                ...Price
+                            }
+                        }
+                    }
+                    variants {
+                        id
+                        name
+                        sku
+                        quantityAvailable
+                        attributes {
+                            attribute {
+                                name
+                            }
+                            values {
+                                name
+                            }
+                        }
+                        pricing {
+                            onSale
+                            price {
+                                ...Price
+                            }
+                        }
+                    }
+                }
+            }
+        """,
+        variables={"slug": "{product_slug}", "channel": "{channel}"},
+    ),
+]
+
+DASHBOARD_OPERATIONS = [
+    BenchmarkOperation(
+        name="dashboard:product_list",
+        query="""
+            query ProductList {
+                products(first: 20) {
+                    edges {
+                        node {
+                            id
+                            name
+                            thumbnail {
+                                url
+                            }
+                            productType {
+                                name
+                                hasVariants
+                            }
+                            channelListings {
+                                channel {
+                                    slug
+                                    currencyCode
+                                }
+                                isPublished
+                                publicationDate
+                                isAvailableForPurchase
+                                visibleInListings
+                            }
+                        }
+                    }
+                }
+            }
+        """,
+        staff=True,
+    ),
+    BenchmarkOperation(
+        name="dashboard:order_list",
+        query="""
+            query OrderList {
+                orders(first: 20) {
+                    edges {
+                        node {
+                            id
+                            number
+                            created
+                            status
+                            paymentStatus
+                            userEmail
+                            billingAddress {
+                                firstName
+                                lastName
+                            }
+                            total {
+                                gross {
+                                    amount
+                                    currency
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        """,
+        staff=True,
+    ),
+    BenchmarkOperation(
+        name="dashboard:order_details",
+        query=PRICE_FRAGMENT
+        + """
+            query OrderDetails($id: ID!) {
+                order(id: $id) {
+                    id
+                    number
+                    status
+                    userEmail
+                    lines {
+                        id
+                        productName
+                        variantName
+                        productSku
+                        quantity
+                        quantityFulfilled
+                        unitPrice {
+                            ...Price
+                        }
+                        totalPrice {
+                            ...Price
+                        }
+                        thumbnail {
+                            url
+                        }
+                    }
+                    subtotal {
+                        ...Price
+                    }
+                    total {
+                        ...Price
+                    }
+                    events {
+                        type
+                        date
+                    }
+                }
+            }
+        """,
+        variables={"id": "{order_id}"},
+        staff=True,
+    ),
+    BenchmarkOperation(
+        name="dashboard:report_product_sales",
+        query="""
+            query TopProducts($channel: String!) {
+                reportProductSales(period: THIS_MONTH, first: 20, channel: $channel) {
+                    edges {
+                        node {
+                            revenue(period: THIS_MONTH) {
+                                gross {
+                                    amount
+                                }
+                            }
+                            quantityOrdered
+                            sku
+                        }
+                    }
+                }
+            }
+        """,
+        variables={"channel": "{channel}"},
+        staff=True,
+    ),
+]
+
+OPERATIONS = STOREFRONT_OPERATIONS + DASHBOARD_OPERATIONS
@@ -0,0 +1,201 @@
+"""Measure latency, memory and database queries of GraphQL operations.
+
+Operations are sent through the whole Django stack, as the API receives them.
+Each operation is sent a few times to warm up caches and then repeatedly to
+measure its latency. Peak memory is measured in a separate run, as tracing
+allocations slows the operation down.
+"""
+import json
+import math
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from graphene import Node
+
+from ...account.models import User
+from ...core.jwt import create_access_token
+from ...order.models import Order
+from ...product.models import Product
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+@dataclass
+class BenchmarkOperation:
+    name: str
+    query: str
+    variables: Dict[str, Any] = field(default_factory=dict)
+    # Whether the operation is sent by a staff user instead of an anonymous one
+    staff: bool = False
+
+    def get_variables(self, context: Dict[str, str]) -> Dict[str, Any]:
+        return _format_variables(self.variables, context)
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    iterations: int
+    p50: float
+    p95: float
+    p99: float
+    cpu_p50: float
+    peak_memory: int
+    queries: int
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _format_variables(value, context: Dict[str, str]):
+    if isinstance(value, str):
+        return value.format(**context)
+    if isinstance(value, list):
+        return [_format_variables(item, context) for item in value]
+    if isinstance(value, dict):
+        return {key: _format_variables(item, context) for key, item in value.items()}
+    return value
+
+
+def get_percentile(values: List[float], percentile: float) -> float:
+    """Return the percentile of the values using the nearest-rank method."""
+    values = sorted(values)
+    rank = math.ceil(percentile / 100 * len(values))
+    return values[max(rank, 1) - 1]
+
+
+def get_benchmark_context() -> Dict[str, str]:
+    """Return objects of the database referenced by variables of operations."""
+    product = (
+        Product.objects.filter(channel_listings__is_published=True)
+        .exclude(category=None)
+        .select_related("category")
+        .prefetch_related("channel_listings__channel")
+        .order_by("pk")
+        .first()
+    )
+    if product is None:
+        raise BenchmarkError("Benchmark requires a published product.")
+    order = Order.objects.order_by("pk").first()
+    return {
+        "channel": product.channel_listings.all()[0].channel.slug,
+        "product_slug": product.slug,
+        "product_id": Node.to_global_id("Product", product.pk),
+        "category_id": Node.to_global_id("Category", product.category_id),
+        "order_id": Node.to_global_id("Order", order.pk) if order else "",
+    }
+
+
+def _get_client() -> Client:
+    host = settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else "localhost"
+    return Client(SERVER_NAME="localhost" if host == "*" else host.lstrip("."))
+
+
+class BenchmarkRunner:
+    def __init__(
+        self,
+        iterations: int = 50,
+        warmup: int = 5,
+        staff_user: Optional[User] = None,
+        context: Optional[Dict[str, str]] = None,
+    ):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.client = _get_client()
+        self.staff_token = create_access_token(staff_user) if staff_user else None
+        self.context = context if context is not None else get_benchmark_context()
+
+    def send(self, operation: BenchmarkOperation):
+        extra = {}
+        if operation.staff:
+            if not self.staff_token:
+                raise BenchmarkError(f"{operation.name} requires a staff user.")
+            extra["HTTP_AUTHORIZATION"] = f"JWT {self.staff_token}"
+        data = {
+            "query": operation.query,
+            "variables": operation.get_variables(self.context),
+        }
+        response = self.client.post(
+            reverse("api"), json.dumps(data), content_type="application/json", **extra
+        )
+        content = json.loads(response.content)
+        errors = content.get("errors")
+        if response.status_code != 200 or errors:
+            raise BenchmarkError(
+                f"{operation.name} failed: {errors or response.status_code}"
+            )
+
+    def run_operation(self, operation: BenchmarkOperation) -> BenchmarkResult:
+        for _ in range(self.warmup):
+            self.send(operation)
+
+        latencies = []
+        cpu_times = []
+        queries = []
+        for _ in range(self.iterations):
+            with CaptureQueriesContext(connection) as ctx:
+                started = time.perf_counter()
+                cpu_started = time.process_time()
+                self.send(operation)
+                cpu_times.append((time.process_time() - cpu_started) * 1000)
+                latencies.append((time.perf_counter() - started) * 1000)
+            queries.append(len(ctx.captured_queries))
+
+        tracemalloc.start()
+        try:
+            self.send(operation)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return BenchmarkResult(
+            name=operation.name,
+            iterations=self.iterations,
+            p50=get_percentile(latencies, 50),
+            p95=get_percentile(latencies, 95),
+            p99=get_percentile(latencies, 99),
+            cpu_p50=get_percentile(cpu_times, 50),
+            peak_memory=peak_memory,
+            queries=int(statistics.median_low(queries)),
+        )
+
+
+def compare_with_baseline(
+    results: Iterable[BenchmarkResult],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float = 0.1,
+) -> List[str]:
+    """Return descriptions of regressions against the baseline results.
+
+    Latency and memory regress when they exceed the baseline by more than the
+    tolerance; any additional database query is a regression.
+    """
+    regressions = []
+    for result in results:
+        expected = baseline.get(result.name)
+        if expected is None:
+            continue
+        for metric in ["p95", "p99", "peak_memory"]:
+            limit = expected[metric] * (1 + tolerance)
+            value = getattr(result, metric)
+            if value > limit:
+                regressions.append(
+                    f"{result.name}: {metric} {value:.1f} exceeds "
+                    f"{expected[metric]:.1f} by more than {tolerance:.0%}"
+                )
+        if result.queries > expected["queries"]:
+            regressions.append(
+                f"{result.name}: {result.queries} queries instead of "
+                f"{expected['queries']}"
+            )
+    return regressions
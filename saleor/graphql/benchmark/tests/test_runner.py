@@ -0,0 +1,60 @@
+import pytest
+
+from ..operations import STOREFRONT_OPERATIONS
+from ..runner import (
+    BenchmarkResult,
+    BenchmarkRunner,
+    compare_with_baseline,
+    get_percentile,
+)
+
+
+def test_get_percentile():
+    values = [float(value) for value in range(100, 0, -1)]
+
+    assert get_percentile(values, 50) == 50
+    assert get_percentile(values, 95) == 95
+    assert get_percentile(values, 99) == 99
+    assert get_percentile([3.0], 99) == 3
+
+
+def test_compare_with_baseline():
+    # given
+    result = BenchmarkResult(
+        name="storefront:product_list",
+        iterations=10,
+        p50=10,
+        p95=12,
+        p99=20,
+        cpu_p50=8,
+        peak_memory=1000,
+        queries=6,
+    )
+    baseline = {
+        result.name: {**result.as_dict(), "p99": 15, "queries": 5},
+        "storefront:removed": result.as_dict(),
+    }
+
+    # when
+    regressions = compare_with_baseline([result], baseline, tolerance=0.1)
+
+    # then
+    assert regressions == [
+        "storefront:product_list: p99 20.0 exceeds 15.0 by more than 10%",
+        "storefront:product_list: 6 queries instead of 5",
+    ]
+
+
+@pytest.mark.parametrize("operation", STOREFRONT_OPERATIONS, ids=lambda op: op.name)
+def test_run_storefront_operation(operation, settings, product, site_settings):
+    # given
+    settings.ALLOWED_HOSTS = ["localhost"]
+    runner = BenchmarkRunner(iterations=3, warmup=1)
+
+    # when
+    result = runner.run_operation(operation)
+
+    # then
+    assert result.iterations == 3
+    assert 0 < result.p50 <= result.p95 <= result.p99
+    assert result.peak_memory > 0
@@ -91,7 +91,9 @@ class CheckoutLine(CountableDjangoObjectType):
 
     @staticmethod
     def resolve_variant(root: models.CheckoutLine, info):
-        variant = ProductVariantByIdLoader(info.context).load(root.variant_id)
+        variant = ProductVariantByIdLoader(info.context).load_selected(
+            root.variant_id, info
+        )
         channel = ChannelByCheckoutLineIDLoader(info.context).load(root.id)
 
         return Promise.all([variant, channel]).then(
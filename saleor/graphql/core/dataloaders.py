@@ -1,11 +1,22 @@
-from typing import Generic, Iterable, List, TypeVar, Union
+from contextlib import nullcontext
+from typing import Dict, Generic, Iterable, List, Optional, Set, Type, TypeVar, Union
 
 import opentracing
 import opentracing.tags
+from django.conf import settings
+from django.db.models import Model
 from django.http import HttpRequest
 from promise import Promise
 from promise.dataloader import DataLoader as BaseLoader
 
+from ...core.loader_cache import (
+    cache_results,
+    get_cached_results,
+    get_model_tag,
+    get_tag_versions,
+)
+from .utils import get_selected_field_names
+
 K = TypeVar("K")
 R = TypeVar("R")
 
@@ -13,6 +24,13 @@ R = TypeVar("R")
 class DataLoader(BaseLoader, Generic[K, R]):
     context_key = None
     context = None
+    # Model fields that can be skipped when fetching objects, mapped to names of
+    # the GraphQL fields resolved from them. A field is skipped only if no load
+    # of the batch needs it; see `load_selected`.
+    deferrable_fields: Dict[str, Iterable[str]] = {}
+    # Model of the loaded objects. Results of loaders that set it are cached across
+    # requests when `LOADER_CACHE_ENABLED` is set; see `get_shared_cache_tags`.
+    shared_cache_model: Optional[Type[Model]] = None
 
     def __new__(cls, context: HttpRequest):
         key = cls.context_key
@@ -30,18 +48,104 @@ class DataLoader(BaseLoader, Generic[K, R]):
         if self.context != context:
             self.context = context
             self.user = context.user
+            self.deferred_fields: Set[str] = set()
+            self._batch_deferred_fields: Optional[Set[str]] = None
+            self._deferred_fields_by_key: Dict[K, Set[str]] = {}
             super().__init__()
 
+    def load(self, key: K) -> Promise[R]:
+        return self._load(key, set())
+
+    def load_selected(self, key: K, info) -> Promise[R]:
+        """Load the key skipping deferrable fields not selected in the query."""
+        selected_fields = get_selected_field_names(info)
+        deferred_fields = {
+            field
+            for field, graphql_fields in self.deferrable_fields.items()
+            if selected_fields.isdisjoint(graphql_fields)
+        }
+        return self._load(key, deferred_fields)
+
+    def _load(self, key: K, deferred_fields: Set[str]) -> Promise[R]:
+        query_debugger = getattr(self.context, "query_debugger", None)
+        if query_debugger:
+            query_debugger.record_load(self.__class__.__name__)
+        if key in self._deferred_fields_by_key:
+            if self._deferred_fields_by_key[key] <= deferred_fields:
+                return super().load(key)
+            # The key was fetched without fields that are needed now.
+            self.clear(key)
+            del self._deferred_fields_by_key[key]
+        if self._batch_deferred_fields is None:
+            self._batch_deferred_fields = set(deferred_fields)
+        else:
+            self._batch_deferred_fields &= deferred_fields
+        return super().load(key)
+
     def batch_load_fn(self, keys: Iterable[K]) -> Promise[List[R]]:
         with opentracing.global_tracer().start_active_span(
             self.__class__.__name__
         ) as scope:
             span = scope.span
             span.set_tag(opentracing.tags.COMPONENT, "dataloaders")
-            results = self.batch_load(keys)
+            use_shared_cache = bool(
+                self.shared_cache_model and settings.LOADER_CACHE_ENABLED
+            )
+            # Objects shared between requests are always loaded with all fields.
+            self.deferred_fields = (
+                set() if use_shared_cache else self._batch_deferred_fields or set()
+            )
+            self._batch_deferred_fields = None
+            for key in keys:
+                self._deferred_fields_by_key[key] = self.deferred_fields
+            query_debugger = getattr(self.context, "query_debugger", None)
+            loading = (
+                query_debugger.loading(self.__class__.__name__, len(keys))
+                if query_debugger
+                else nullcontext()
+            )
+            with loading:
+                if use_shared_cache:
+                    results = self.batch_load_with_shared_cache(keys, span)
+                else:
+                    results = self.batch_load(keys)
             if not isinstance(results, Promise):
                 return Promise.resolve(results)
             return results
 
     def batch_load(self, keys: Iterable[K]) -> Union[Promise[List[R]], List[R]]:
         raise NotImplementedError()
+
+    def get_shared_cache_tags(self, key: K) -> List[str]:
+        """Return tags which invalidation drops the cached result of the key."""
+        return [
+            get_model_tag(self.shared_cache_model),
+            get_model_tag(self.shared_cache_model, key),
+        ]
+
+    def batch_load_with_shared_cache(
+        self, keys: Iterable[K], span
+    ) -> Union[Promise[List[R]], List[R]]:
+        tags_by_key = {key: self.get_shared_cache_tags(key) for key in keys}
+        # Versions are read before querying the database, so results loaded
+        # concurrently with an invalidation are stored under outdated versions.
+        tag_versions = get_tag_versions(
+            tag for tags in tags_by_key.values() for tag in tags
+        )
+        cached_results = get_cached_results(self.context_key, tags_by_key, tag_versions)
+        missing_keys = [key for key in keys if key not in cached_results]
+        span.set_tag("cache.hits", len(cached_results))
+        span.set_tag("cache.misses", len(missing_keys))
+        if not missing_keys:
+            return [cached_results[key] for key in keys]
+
+        def merge_results(loaded_results):
+            results = dict(zip(missing_keys, loaded_results))
+            cache_results(self.context_key, results, tags_by_key, tag_versions)
+            results.update(cached_results)
+            return [results[key] for key in keys]
+
+        loaded_results = self.batch_load(missing_keys)
+        if isinstance(loaded_results, Promise):
+            return loaded_results.then(merge_results)
+        return merge_results(loaded_results)
@@ -0,0 +1,217 @@
+from decimal import Decimal
+
+import graphene
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ....core.loader_cache import (
+    LOADER_CACHE_STATS,
+    LOCAL_LOADER_CACHES,
+    get_loader_cache_stats,
+    get_model_tag,
+    get_tag_versions,
+)
+from ....product.models import Collection, Product
+from ....product.utils.variant_prices import update_variants_prices
+from ...product.dataloaders import (
+    ProductByIdLoader,
+    ProductChannelListingByProductIdAndChannelSlugLoader,
+    VariantChannelListingByVariantIdAndChannelSlugLoader,
+)
+from ...tests.utils import get_graphql_content
+
+QUERY_VARIANT_PRODUCT = """
+    query ProductVariant($id: ID!, $channel: String) {
+        productVariant(id: $id, channel: $channel) {
+            product {
+                name
+                ...ProductDetails
+            }
+        }
+    }
+    fragment ProductDetails on Product {
+        slug
+        %s
+    }
+"""
+
+
+def _get_product_queries(captured_queries):
+    return [
+        query["sql"]
+        for query in captured_queries
+        if query["sql"].startswith("SELECT")
+        and 'FROM "product_product" WHERE "product_product"."id" IN' in query["sql"]
+    ]
+
+
+def test_loader_skips_fields_not_selected(api_client, variant, channel_USD):
+    # given
+    variables = {
+        "id": graphene.Node.to_global_id("ProductVariant", variant.pk),
+        "channel": channel_USD.slug,
+    }
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.post_graphql(QUERY_VARIANT_PRODUCT % "", variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productVariant"]["product"]["name"] == (
+        variant.product.name
+    )
+    [product_query] = _get_product_queries(ctx.captured_queries)
+    assert '"product_product"."name"' in product_query
+    assert '"product_product"."description"' not in product_query
+    assert '"product_product"."metadata"' not in product_query
+
+
+def test_loader_fetches_fields_selected_in_fragment(api_client, variant, channel_USD):
+    # given
+    variables = {
+        "id": graphene.Node.to_global_id("ProductVariant", variant.pk),
+        "channel": channel_USD.slug,
+    }
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.post_graphql(
+            QUERY_VARIANT_PRODUCT % "description metadata { key }", variables
+        )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productVariant"]["product"]["slug"] == (
+        variant.product.slug
+    )
+    [product_query] = _get_product_queries(ctx.captured_queries)
+    assert '"product_product"."description"' in product_query
+    assert '"product_product"."metadata"' in product_query
+    assert '"product_product"."private_metadata"' not in product_query
+
+
+@pytest.fixture
+def loader_cache(settings):
+    settings.LOADER_CACHE_ENABLED = True
+    cache.clear()
+    LOCAL_LOADER_CACHES.clear()
+    LOADER_CACHE_STATS.clear()
+
+
+def _get_context(rf):
+    request = rf.get(reverse("api"))
+    request.user = None
+    return request
+
+
+def test_loader_shares_results_between_requests(loader_cache, rf, product):
+    # given
+    ProductByIdLoader(_get_context(rf)).load(product.pk).get()
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        cached_product = ProductByIdLoader(_get_context(rf)).load(product.pk).get()
+
+    # then
+    assert cached_product == product
+    assert cached_product.name == product.name
+    assert len(ctx.captured_queries) == 0
+    assert get_loader_cache_stats()["product_by_id"] == {
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+    }
+
+
+def test_loader_cache_invalidated_on_save(loader_cache, rf, product):
+    # given
+    ProductByIdLoader(_get_context(rf)).load(product.pk).get()
+
+    # when
+    product.name = "New name"
+    product.save(update_fields=["name"])
+
+    # then
+    cached_product = ProductByIdLoader(_get_context(rf)).load(product.pk).get()
+    assert cached_product.name == "New name"
+
+
+def test_loader_cache_of_listings_invalidated_by_product_tag(
+    loader_cache, rf, product, channel_USD
+):
+    # given
+    key = (product.pk, channel_USD.slug)
+    listing = (
+        ProductChannelListingByProductIdAndChannelSlugLoader(_get_context(rf))
+        .load(key)
+        .get()
+    )
+
+    # when
+    listing.delete()
+
+    # then
+    assert (
+        ProductChannelListingByProductIdAndChannelSlugLoader(_get_context(rf))
+        .load(key)
+        .get()
+        is None
+    )
+
+
+def test_loader_cache_invalidated_by_variant_prices_update(
+    loader_cache, rf, variant, channel_USD
+):
+    # given
+    key = (variant.pk, channel_USD.slug)
+    VariantChannelListingByVariantIdAndChannelSlugLoader(_get_context(rf)).load(
+        key
+    ).get()
+
+    # when
+    update_variants_prices([(variant.pk, channel_USD, Decimal("99"), None)])
+
+    # then
+    listing = (
+        VariantChannelListingByVariantIdAndChannelSlugLoader(_get_context(rf))
+        .load(key)
+        .get()
+    )
+    assert listing.price_amount == Decimal("99")
+
+
+def test_loader_cache_invalidated_on_collection_products_add(
+    loader_cache, product, collection
+):
+    # given
+    tags = [
+        get_model_tag(Product, product.pk),
+        get_model_tag(Collection, collection.pk),
+    ]
+    versions = get_tag_versions(tags)
+
+    # when
+    collection.products.add(product)
+
+    # then
+    new_versions = get_tag_versions(tags)
+    assert all(new_versions[tag] != versions[tag] for tag in tags)
+
+
+def test_loader_cache_invalidated_on_collection_products_clear(
+    loader_cache, product, collection
+):
+    # given
+    collection.products.add(product)
+    tag = get_model_tag(Product, product.pk)
+    versions = get_tag_versions([tag])
+
+    # when
+    collection.products.clear()
+
+    # then
+    assert get_tag_versions([tag])[tag] != versions[tag]
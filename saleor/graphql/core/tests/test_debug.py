@@ -0,0 +1,51 @@
+from ...tests.utils import get_graphql_content
+
+QUERY_PRODUCTS = """
+    query Products($channel: String) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    name
+                    category {
+                        name
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def test_debug_extension_for_staff(staff_api_client, product_list, channel_USD):
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_PRODUCTS, {"channel": channel_USD.slug}, HTTP_X_SALEOR_DEBUG="1"
+    )
+
+    # then
+    content = get_graphql_content(response)
+    debug = content["extensions"]["debug"]
+    assert debug["fields"]["products"]["calls"] == 1
+    assert debug["fields"]["products"]["queries"] > 0
+    assert debug["fields"]["products.edges.*.node.category"]["calls"] == len(
+        product_list
+    )
+    category_loader = debug["dataloaders"]["CategoryByIdLoader"]
+    assert category_loader["batches"] == [1]
+    assert category_loader["queries"] == 1
+    assert category_loader["paths"] == ["products.edges.*.node.category"]
+    assert debug["totalQueries"] == len(debug["queries"])
+    assert debug["duplicateQueries"] == []
+
+
+def test_debug_extension_not_returned_to_customers(
+    user_api_client, product_list, channel_USD
+):
+    # when
+    response = user_api_client.post_graphql(
+        QUERY_PRODUCTS, {"channel": channel_USD.slug}, HTTP_X_SALEOR_DEBUG="1"
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert "debug" not in content["extensions"]
@@ -1,8 +1,12 @@
 from unittest.mock import Mock
 
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
-from ...middleware import app_middleware
+from ....app.cache import get_cached_app
+from ...middleware import app_middleware, get_app
 
 
 def test_app_middleware_accepts_app_requests(app, rf):
@@ -42,3 +46,66 @@ def test_app_middleware_skips_when_token_length_is_different_than_30(app, rf):
 
     # then
     assert not request.app
+
+
+def test_get_app_uses_cache(app, permission_manage_products):
+    # given
+    cache.clear()
+    app.permissions.add(permission_manage_products)
+    token = app.tokens.first().auth_token
+    get_app(token)
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        cached_app = get_app(token)
+        has_perm = cached_app.has_perm("product.manage_products")
+
+    # then
+    assert cached_app == app
+    assert has_perm
+    assert len(ctx.captured_queries) == 0
+
+
+def test_get_app_cache_invalidated_on_deactivation(app):
+    # given
+    cache.clear()
+    token = app.tokens.first().auth_token
+    get_app(token)
+
+    # when
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    # then
+    assert get_cached_app(token) is None
+    assert get_app(token) is None
+
+
+def test_get_app_cache_invalidated_on_permissions_change(
+    app, permission_manage_products
+):
+    # given
+    cache.clear()
+    token = app.tokens.first().auth_token
+    get_app(token)
+
+    # when
+    app.permissions.add(permission_manage_products)
+
+    # then
+    assert get_cached_app(token) is None
+    assert get_app(token).has_perm("product.manage_products")
+
+
+def test_get_app_cache_invalidated_on_token_delete(app):
+    # given
+    cache.clear()
+    app_token = app.tokens.first()
+    get_app(app_token.auth_token)
+
+    # when
+    app_token.delete()
+
+    # then
+    assert get_cached_app(app_token.auth_token) is None
+    assert get_app(app_token.auth_token) is None
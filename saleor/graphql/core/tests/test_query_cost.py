@@ -0,0 +1,118 @@
+import json
+
+from ...tests.utils import get_graphql_content
+
+QUERY_PRODUCTS = """
+    query Products($first: Int, $channel: String) {
+        products(first: $first, channel: $channel) {
+            edges {
+                ...ProductFragment
+            }
+        }
+    }
+    fragment ProductFragment on ProductCountableEdge {
+        node {
+            name
+            variants {
+                sku
+            }
+        }
+    }
+"""
+
+
+def test_query_cost_in_extensions(settings, api_client, product, channel_USD):
+    # given
+    settings.GRAPHQL_QUERY_COST_IN_EXTENSIONS = True
+    variables = {"first": 10, "channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["extensions"]["cost"] == {
+        "requestedQueryCost": 241,
+        "maximumAvailable": 50000,
+    }
+
+
+def test_query_cost_not_in_extensions_by_default(api_client, product, channel_USD):
+    # given
+    variables = {"first": 10, "channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert "extensions" not in content
+
+
+def test_query_over_cost_limit_rejected(settings, api_client, channel_USD):
+    # given
+    settings.GRAPHQL_QUERY_MAX_COST = 240
+    variables = {"first": 10, "channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert response.status_code == 400
+    content = json.loads(response.content)
+    assert "data" not in content
+    assert content["errors"][0]["message"] == (
+        "The query cost of 241 exceeds the maximum of 240. Request fewer objects."
+    )
+
+
+def test_query_cost_limit_of_app(settings, app_api_client, app, channel_USD):
+    # given
+    settings.GRAPHQL_QUERY_MAX_COST = 10
+    settings.GRAPHQL_QUERY_COST_IN_EXTENSIONS = True
+    app.max_query_cost = 1000
+    app.save(update_fields=["max_query_cost"])
+    variables = {"first": 10, "channel": channel_USD.slug}
+
+    # when
+    response = app_api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["extensions"]["cost"]["maximumAvailable"] == 1000
+
+
+def test_query_cost_limit_of_user(settings, user_api_client, customer_user):
+    # given
+    customer_user.max_query_cost = 1
+    customer_user.save(update_fields=["max_query_cost"])
+
+    # when
+    response = user_api_client.post_graphql(
+        QUERY_PRODUCTS, {"first": 1, "channel": "main"}
+    )
+
+    # then
+    assert response.status_code == 400
+    content = json.loads(response.content)
+    assert content["extensions"]["cost"] == {
+        "requestedQueryCost": 25,
+        "maximumAvailable": 1,
+    }
+
+
+def test_query_cost_limit_of_user_disabled_with_zero(
+    settings, user_api_client, customer_user, channel_USD
+):
+    # given
+    settings.GRAPHQL_QUERY_MAX_COST = 10
+    customer_user.max_query_cost = 0
+    customer_user.save(update_fields=["max_query_cost"])
+    variables = {"first": 10, "channel": channel_USD.slug}
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert "errors" not in content
@@ -0,0 +1,225 @@
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from ....core.loader_cache import get_model_tag, invalidate_objects
+from ....core.response_cache import (
+    cache_response,
+    get_cached_response,
+    get_response_timeout,
+)
+from ....discount.models import Sale
+from ....product.models import Product
+from ....product.utils.variant_prices import update_variants_prices
+from ...tests.utils import get_graphql_content
+
+
+@pytest.fixture
+def response_cache(settings):
+    settings.RESPONSE_CACHE_ENABLED = True
+    cache.clear()
+
+
+QUERY_PRODUCT = """
+    query Product($slug: String, $channel: String) {
+        product(slug: $slug, channel: $channel) {
+            name
+            variants {
+                sku
+            }
+        }
+    }
+"""
+
+
+def test_anonymous_query_response_is_cached(
+    response_cache, api_client, product, channel_USD
+):
+    # given
+    variables = {"slug": product.slug, "channel": channel_USD.slug}
+    content = get_graphql_content(api_client.post_graphql(QUERY_PRODUCT, variables))
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.post_graphql(
+            QUERY_PRODUCT, {"channel": channel_USD.slug, "slug": product.slug}
+        )
+
+    # then
+    assert get_graphql_content(response) == content
+    assert content["data"]["product"]["name"] == product.name
+    assert len(ctx.captured_queries) == 0
+
+
+def test_cached_response_purged_on_product_change(
+    response_cache, api_client, product, channel_USD
+):
+    # given
+    variables = {"slug": product.slug, "channel": channel_USD.slug}
+    api_client.post_graphql(QUERY_PRODUCT, variables)
+
+    # when
+    variant = product.variants.get()
+    variant.sku = "new-sku"
+    variant.save(update_fields=["sku"])
+
+    # then
+    content = get_graphql_content(api_client.post_graphql(QUERY_PRODUCT, variables))
+    assert content["data"]["product"]["variants"] == [{"sku": "new-sku"}]
+
+
+def test_cached_missing_object_purged_on_create(
+    response_cache, api_client, product, channel_USD
+):
+    # given
+    slug = product.slug
+    product.slug = "old-slug"
+    product.save(update_fields=["slug"])
+    variables = {"slug": slug, "channel": channel_USD.slug}
+    content = get_graphql_content(api_client.post_graphql(QUERY_PRODUCT, variables))
+    assert content["data"]["product"] is None
+
+    # when
+    product.slug = slug
+    product.save(update_fields=["slug"])
+
+    # then
+    content = get_graphql_content(api_client.post_graphql(QUERY_PRODUCT, variables))
+    assert content["data"]["product"]["name"] == product.name
+
+
+def test_authenticated_query_response_is_not_cached(
+    response_cache, staff_api_client, product, channel_USD
+):
+    # given
+    variables = {"slug": product.slug, "channel": channel_USD.slug}
+    staff_api_client.post_graphql(QUERY_PRODUCT, variables)
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        response = staff_api_client.post_graphql(QUERY_PRODUCT, variables)
+
+    # then
+    get_graphql_content(response)
+    assert len(ctx.captured_queries) > 0
+
+
+QUERY_PRODUCTS = """
+    query Products($channel: String) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    variants {
+                        sku
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def test_cached_list_response_purged_on_variant_prices_update(
+    response_cache, api_client, product, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    api_client.post_graphql(QUERY_PRODUCTS, variables)
+    variant = product.variants.get()
+
+    # when
+    update_variants_prices([(variant.pk, channel_USD, Decimal("1.23"), None)])
+
+    # then
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+    get_graphql_content(response)
+    assert len(ctx.captured_queries) > 0
+
+
+QUERY_PRODUCT_QUANTITY_AVAILABLE = """
+    query Product($slug: String, $channel: String) {
+        product(slug: $slug, channel: $channel) {
+            variants {
+                quantityAvailable
+            }
+        }
+    }
+"""
+
+
+def test_response_with_stock_quantities_is_not_cached(
+    response_cache, api_client, product, channel_USD
+):
+    # given
+    variables = {"slug": product.slug, "channel": channel_USD.slug}
+    api_client.post_graphql(QUERY_PRODUCT_QUANTITY_AVAILABLE, variables)
+
+    # when
+    stock = product.variants.get().stocks.get()
+    stock.quantity = 1
+    stock.save(update_fields=["quantity"])
+
+    # then
+    content = get_graphql_content(
+        api_client.post_graphql(QUERY_PRODUCT_QUANTITY_AVAILABLE, variables)
+    )
+    assert content["data"]["product"]["variants"] == [{"quantityAvailable": 1}]
+
+
+def test_response_not_cached_when_tag_invalidated_while_resolving(
+    response_cache, product
+):
+    # given
+    started_at = time.time()
+    invalidate_objects(Product, [product.pk])
+    tags = [get_model_tag(Product, product.pk)]
+
+    # when
+    cache_response("response:key", {"product": None}, tags, started_at)
+
+    # then
+    assert get_cached_response("response:key") is None
+
+
+QUERY_SHOP = """
+    query {
+        shop {
+            name
+        }
+    }
+"""
+
+
+def test_response_with_not_cached_objects_is_not_cached(
+    response_cache, api_client, site_settings
+):
+    # given
+    api_client.post_graphql(QUERY_SHOP)
+
+    # when
+    site_settings.site.name = "New name"
+    site_settings.site.save(update_fields=["name"])
+
+    # then
+    content = get_graphql_content(api_client.post_graphql(QUERY_SHOP))
+    assert content["data"]["shop"]["name"] == "New name"
+
+
+def test_response_timeout_ends_at_sale_start(settings):
+    # given
+    settings.RESPONSE_CACHE_TIMEOUT = 300
+    now = timezone.now()
+    Sale.objects.create(name="Sale", start_date=now + timedelta(seconds=60))
+
+    # when
+    timeout = get_response_timeout(now)
+
+    # then
+    assert timeout == 60
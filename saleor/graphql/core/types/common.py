@@ -200,6 +200,12 @@ class OrderError(Error):
     )
 
 
+class BulkOrderError(OrderError):
+    index = graphene.Int(
+        description="Index of an input list item that caused the error."
+    )
+
+
 class InvoiceError(Error):
     code = InvoiceErrorCode(description="The error code.", required=True)
 
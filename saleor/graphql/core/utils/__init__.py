@@ -1,13 +1,14 @@
 import binascii
 import os
 import secrets
-from typing import TYPE_CHECKING, Type, Union
+from typing import TYPE_CHECKING, Set, Type, Union
 
 import graphene
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
 from graphene import ObjectType
 from graphql.error import GraphQLError
+from graphql.language import ast
 from PIL import Image
 
 from ....core.utils import generate_unique_slug
@@ -165,3 +166,27 @@ def add_hash_to_file_name(file):
     hash = secrets.token_hex(nbytes=4)
     new_name = f"{file_name}_{hash}{format}"
     file._name = new_name
+
+
+def get_selected_field_names(info) -> Set[str]:
+    """Return names of the fields selected on the object resolved by the field.
+
+    Fragments are expanded; fields of nested objects are not included.
+    """
+    selections = [
+        selection
+        for field in info.field_asts
+        if field.selection_set
+        for selection in field.selection_set.selections
+    ]
+    field_names = set()
+    while selections:
+        selection = selections.pop()
+        if isinstance(selection, ast.Field):
+            field_names.add(selection.name.value)
+        elif isinstance(selection, ast.FragmentSpread):
+            fragment = info.fragments[selection.name.value]
+            selections.extend(fragment.selection_set.selections)
+        elif isinstance(selection, ast.InlineFragment):
+            selections.extend(selection.selection_set.selections)
+    return field_names
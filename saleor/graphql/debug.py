@@ -0,0 +1,153 @@
+"""Per-field breakdown of the execution of a query, returned to staff users.
+
+Staff users send the `X-Saleor-Debug` header to get the `debug` entry in the
+`extensions` of the response. It lists, per field path with list indexes
+replaced by `*`, the number of resolver calls, the time spent in resolvers and
+the SQL queries executed by them. Queries executed by dataloader batches are
+attributed to the dataloader, which lists the fields that loaded its keys.
+Queries executed more than once with the same parameters are reported as
+duplicates.
+"""
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from django.db import connection
+from jwt.exceptions import PyJWTError
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+DEBUG_HEADER = "HTTP_X_SALEOR_DEBUG"
+ROOT_PATH = "(root)"
+
+
+def is_debug_requested(request: "HttpRequest") -> bool:
+    """Return whether the request asks for the debug entry and comes from staff."""
+    if request.META.get(DEBUG_HEADER, "").lower() not in ("1", "true"):
+        return False
+
+    # Imported here as the middleware module imports the views.
+    from .middleware import get_user
+
+    try:
+        user = get_user(request)
+    except PyJWTError:
+        return False
+    return bool(user and user.is_active and user.is_staff)
+
+
+def get_field_path(path: List[Any]) -> str:
+    return ".".join("*" if isinstance(key, int) else str(key) for key in path)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+class QueryDebugger:
+    def __init__(self):
+        self.sources: List[str] = []
+        self.fields: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {"calls": 0, "time": 0.0, "queries": 0}
+        )
+        self.dataloaders: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {"batches": [], "time": 0.0, "queries": 0, "paths": set()}
+        )
+        self.queries: List[Tuple[str, str, Any, float]] = []
+
+    @property
+    def current_source(self) -> Optional[str]:
+        return self.sources[-1] if self.sources else None
+
+    @contextmanager
+    def resolving(self, path: List[Any]):
+        field_path = get_field_path(path)
+        self.sources.append(field_path)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            field = self.fields[field_path]
+            field["calls"] += 1
+            field["time"] += time.perf_counter() - started
+            self.sources.pop()
+
+    @contextmanager
+    def loading(self, loader_name: str, batch_size: int):
+        dataloader = self.dataloaders[loader_name]
+        self.sources.append(loader_name)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            dataloader["batches"].append(batch_size)
+            dataloader["time"] += time.perf_counter() - started
+            self.sources.pop()
+
+    def record_load(self, loader_name: str):
+        """Record the field which loads a key of the dataloader."""
+        source = self.current_source
+        if source is not None:
+            self.dataloaders[loader_name]["paths"].add(source)
+
+    @contextmanager
+    def capturing_queries(self):
+        with connection.execute_wrapper(self.sql_wrapper):
+            yield
+
+    def sql_wrapper(self, execute, sql, params, many, context):
+        source = self.current_source or ROOT_PATH
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((source, sql, params, time.perf_counter() - started))
+            if source in self.dataloaders:
+                self.dataloaders[source]["queries"] += 1
+            else:
+                self.fields[source]["queries"] += 1
+
+    def get_duplicates(self) -> List[Dict[str, Any]]:
+        counts: Counter = Counter()
+        sources: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
+        for source, sql, params, _ in self.queries:
+            key = (sql, repr(params))
+            counts[key] += 1
+            sources[key].add(source)
+        return [
+            {"sql": sql, "count": count, "sources": sorted(sources[(sql, params)])}
+            for (sql, params), count in counts.most_common()
+            if count > 1
+        ]
+
+    def get_extension(self) -> Dict[str, Any]:
+        return {
+            "fields": {
+                path: {**field, "time": _ms(field["time"])}
+                for path, field in self.fields.items()
+            },
+            "dataloaders": {
+                name: {
+                    **dataloader,
+                    "time": _ms(dataloader["time"]),
+                    "paths": sorted(dataloader["paths"]),
+                }
+                for name, dataloader in self.dataloaders.items()
+            },
+            "queries": [
+                {"source": source, "sql": sql, "time": _ms(duration)}
+                for source, sql, _, duration in self.queries
+            ],
+            "duplicateQueries": self.get_duplicates(),
+            "totalQueries": len(self.queries),
+        }
+
+
+def debug_middleware(next, root, info, **kwargs):
+    debugger = getattr(info.context, "query_debugger", None)
+    if debugger is None:
+        return next(root, info, **kwargs)
+    with debugger.resolving(info.path):
+        return next(root, info, **kwargs)
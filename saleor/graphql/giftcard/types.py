@@ -408,7 +408,7 @@ class GiftCard(CountableDjangoObjectType):
     def resolve_product(root: models.GiftCard, info):
         if root.product_id is None:
             return None
-        return ProductByIdLoader(info.context).load(root.product_id)
+        return ProductByIdLoader(info.context).load_selected(root.product_id, info)
 
     @staticmethod
     @permission_required(GiftcardPermissions.MANAGE_GIFT_CARD)
@@ -0,0 +1,91 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ....account.models import User
+from ...benchmark.operations import OPERATIONS
+from ...benchmark.runner import BenchmarkError, BenchmarkRunner, compare_with_baseline
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures latency percentiles, peak memory and database queries of "
+        "storefront and dashboard GraphQL operations."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--warmup", type=int, default=5)
+        parser.add_argument(
+            "--operation",
+            action="append",
+            dest="operations",
+            help="Name of the operation to run; all operations run by default.",
+        )
+        parser.add_argument(
+            "--staff-email",
+            help=(
+                "Email of the staff user sending dashboard operations; the first "
+                "superuser by default."
+            ),
+        )
+        parser.add_argument(
+            "--baseline", help="Path of the baseline JSON to compare results with."
+        )
+        parser.add_argument(
+            "--save-baseline", help="Path of the JSON file to store results in."
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.1,
+            help="Allowed relative increase of latency and memory.",
+        )
+
+    def get_staff_user(self, email):
+        staff_users = User.objects.filter(is_active=True, is_staff=True)
+        if email:
+            return staff_users.filter(email=email).first()
+        return staff_users.filter(is_superuser=True).order_by("pk").first()
+
+    def handle(self, *args, **options):
+        operations = OPERATIONS
+        if options["operations"]:
+            operations = [
+                operation
+                for operation in OPERATIONS
+                if operation.name in options["operations"]
+            ]
+
+        try:
+            runner = BenchmarkRunner(
+                iterations=options["iterations"],
+                warmup=options["warmup"],
+                staff_user=self.get_staff_user(options["staff_email"]),
+            )
+            results = []
+            for operation in operations:
+                result = runner.run_operation(operation)
+                results.append(result)
+                self.stdout.write(
+                    f"{result.name:<40} p50 {result.p50:8.1f} ms  "
+                    f"p95 {result.p95:8.1f} ms  p99 {result.p99:8.1f} ms  "
+                    f"cpu {result.cpu_p50:8.1f} ms  "
+                    f"memory {result.peak_memory / 1024:8.0f} KiB  "
+                    f"queries {result.queries:4}"
+                )
+        except BenchmarkError as e:
+            raise CommandError(str(e))
+
+        if options["save_baseline"]:
+            with open(options["save_baseline"], "w") as f:
+                json.dump({result.name: result.as_dict() for result in results}, f)
+            self.stdout.write(f"Saved results to {options['save_baseline']}")
+
+        if options["baseline"]:
+            with open(options["baseline"]) as f:
+                baseline = json.load(f)
+            regressions = compare_with_baseline(results, baseline, options["tolerance"])
+            if regressions:
+                raise CommandError("\n".join(["Regressions found:", *regressions]))
+            self.stdout.write(self.style.SUCCESS("No regressions found."))
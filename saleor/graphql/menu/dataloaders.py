@@ -1,5 +1,6 @@
 from collections import defaultdict
 
+from ...core.loader_cache import get_model_tag
 from ...menu.models import Menu, MenuItem
 from ..core.dataloaders import DataLoader
 
@@ -20,23 +21,23 @@ class MenuItemByIdLoader(DataLoader):
         return [menu_items.get(menu_item_id) for menu_item_id in keys]
 
 
-class MenuItemsByParentMenuLoader(DataLoader):
-    context_key = "menuitems_by_parent_menu"
+class MenuItemTreeByMenuIdLoader(DataLoader):
+    """Load all items of the menu in one query, including the nested ones.
 
-    def batch_load(self, keys):
-        menu_items = MenuItem.objects.filter(menu_id__in=keys, level=0)
-        items_map = defaultdict(list)
-        for menu_item in menu_items:
-            items_map[menu_item.menu_id].append(menu_item)
-        return [items_map[menu_id] for menu_id in keys]
+    Returns the items of the menu mapped to the ID of their parent; items on the
+    first level of the menu are mapped to `None`.
+    """
 
+    context_key = "menuitem_tree_by_menu_id"
+    shared_cache_model = MenuItem
 
-class MenuItemChildrenLoader(DataLoader):
-    context_key = "menuitem_children"
+    def get_shared_cache_tags(self, key):
+        # Saving or deleting a menu item invalidates the tag of its menu.
+        return [get_model_tag(MenuItem), get_model_tag(Menu, key)]
 
     def batch_load(self, keys):
-        menu_items = MenuItem.objects.filter(parent_id__in=keys)
-        items_map = defaultdict(list)
-        for menu_item in menu_items:
-            items_map[menu_item.parent_id].append(menu_item)
-        return [items_map[menu_item_id] for menu_item_id in keys]
+        trees = {menu_id: defaultdict(list) for menu_id in keys}
+        # Default ordering keeps siblings sorted by their `sort_order`.
+        for menu_item in MenuItem.objects.filter(menu_id__in=keys):
+            trees[menu_item.menu_id][menu_item.parent_id].append(menu_item)
+        return [dict(trees[menu_id]) for menu_id in keys]
@@ -6,6 +6,7 @@ import graphene
 from django.core.exceptions import ValidationError
 from django.db.models import Model, QuerySet
 
+from ...core.loader_cache import get_list_tag, get_model_tag, invalidate_tags
 from ...core.permissions import MenuPermissions, SitePermissions
 from ...core.tracing import traced_atomic_transaction
 from ...menu import models
@@ -428,6 +429,10 @@ class MenuItemMove(BaseMutation):
         for parent_pk, operations in sort_operations.items():
             ordering_qs = sort_querysets[parent_pk]
             perform_reordering(ordering_qs, operations)
+        # Reordering updates the items in bulk, without sending the model signals.
+        invalidate_tags(
+            [get_model_tag(models.Menu, menu.pk), get_list_tag(models.MenuItem)]
+        )
 
         menu = qs.get(pk=menu.pk)
         return MenuItemMove(menu=ChannelContext(node=menu, channel_slug=None))
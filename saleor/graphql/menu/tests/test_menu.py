@@ -2,7 +2,10 @@ import json
 
 import graphene
 import pytest
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from ....menu.error_codes import MenuErrorCode
 from ....menu.models import Menu, MenuItem
@@ -153,6 +156,69 @@ def test_menu_query(user_api_client, menu):
     assert not content["data"]["menu"]
 
 
+QUERY_MENU_TREE = """
+    query menu($id: ID) {
+        menu(id: $id) {
+            items {
+                name
+                children {
+                    name
+                    children {
+                        name
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def test_menu_query_loads_tree_in_single_query(user_api_client, menu):
+    # given
+    root = MenuItem.objects.create(menu=menu, name="Root", sort_order=1)
+    first_root = MenuItem.objects.create(menu=menu, name="First root", sort_order=0)
+    child = MenuItem.objects.create(menu=menu, name="Child", parent=root)
+    MenuItem.objects.create(menu=menu, name="Grandchild", parent=child)
+    variables = {"id": graphene.Node.to_global_id("Menu", menu.pk)}
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        response = user_api_client.post_graphql(QUERY_MENU_TREE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["menu"]["items"] == [
+        {"name": first_root.name, "children": []},
+        {
+            "name": root.name,
+            "children": [{"name": "Child", "children": [{"name": "Grandchild"}]}],
+        },
+    ]
+    menu_item_queries = [
+        query for query in ctx.captured_queries if "menu_menuitem" in query["sql"]
+    ]
+    assert len(menu_item_queries) == 1
+
+
+def test_cached_menu_tree_invalidated_on_item_change(
+    settings, user_api_client, menu_item
+):
+    # given
+    settings.LOADER_CACHE_ENABLED = True
+    cache.clear()
+    variables = {"id": graphene.Node.to_global_id("Menu", menu_item.menu_id)}
+    user_api_client.post_graphql(QUERY_MENU_TREE, variables)
+
+    # when
+    menu_item.name = "New name"
+    menu_item.save(update_fields=["name"])
+
+    # then
+    response = user_api_client.post_graphql(QUERY_MENU_TREE, variables)
+    content = get_graphql_content(response)
+    assert content["data"]["menu"]["items"][0]["name"] == "New name"
+
+
 QUERY_MENU_WITH_FILTER = """
     query ($filter: MenuFilterInput) {
         menus(first: 5, filter:$filter) {
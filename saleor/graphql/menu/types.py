@@ -21,12 +21,7 @@ from ..product.dataloaders import (
 from ..translations.fields import TranslationField
 from ..translations.types import MenuItemTranslation
 from ..utils import get_user_or_app_from_context
-from .dataloaders import (
-    MenuByIdLoader,
-    MenuItemByIdLoader,
-    MenuItemChildrenLoader,
-    MenuItemsByParentMenuLoader,
-)
+from .dataloaders import MenuByIdLoader, MenuItemByIdLoader, MenuItemTreeByMenuIdLoader
 
 
 class Menu(ChannelContextTypeWithMetadata, CountableDjangoObjectType):
@@ -44,11 +39,11 @@ class Menu(ChannelContextTypeWithMetadata, CountableDjangoObjectType):
 
     @staticmethod
     def resolve_items(root: ChannelContext[models.Menu], info, **_kwargs):
-        menu_items = MenuItemsByParentMenuLoader(info.context).load(root.node.id)
-        return menu_items.then(
-            lambda menu_items: [
+        tree = MenuItemTreeByMenuIdLoader(info.context).load(root.node.id)
+        return tree.then(
+            lambda tree: [
                 ChannelContext(node=menu_item, channel_slug=root.channel_slug)
-                for menu_item in menu_items
+                for menu_item in tree.get(None, [])
             ]
         )
 
@@ -90,11 +85,11 @@ class MenuItem(ChannelContextTypeWithMetadata, CountableDjangoObjectType):
 
     @staticmethod
     def resolve_children(root: ChannelContext[models.MenuItem], info, **_kwargs):
-        menus = MenuItemChildrenLoader(info.context).load(root.node.id)
-        return menus.then(
-            lambda menus: [
-                ChannelContext(node=menu, channel_slug=root.channel_slug)
-                for menu in menus
+        tree = MenuItemTreeByMenuIdLoader(info.context).load(root.node.menu_id)
+        return tree.then(
+            lambda tree: [
+                ChannelContext(node=menu_item, channel_slug=root.channel_slug)
+                for menu_item in tree.get(root.node.id, [])
             ]
         )
 
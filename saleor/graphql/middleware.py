@@ -1,14 +1,20 @@
-from typing import Optional
+from typing import Optional, Tuple, Type
 
 from django.conf import settings
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import AnonymousUser
-from django.db.models import Exists, OuterRef
+from django.db.models import Exists, Model, OuterRef
 from django.utils.functional import SimpleLazyObject
+from graphql import GraphQLList
+from graphql.type.definition import get_named_type, get_nullable_type
+from promise import Promise
 
+from ..app.cache import cache_app, get_cached_app
 from ..app.models import App, AppToken
 from ..core.auth import get_token_from_request
 from ..core.exceptions import ReadOnlyException
+from ..core.loader_cache import CACHED_MODELS, get_list_tag, get_model_tag
+from .channel import ChannelContext
 from .views import API_PATH, GraphQLView
 
 
@@ -30,10 +36,16 @@ class JWTMiddleware:
 
 
 def get_app(auth_token) -> Optional[App]:
+    app = get_cached_app(auth_token)
+    if app:
+        return app
     tokens = AppToken.objects.filter(auth_token=auth_token).values("pk")
-    return App.objects.filter(
+    app = App.objects.filter(
         Exists(tokens.filter(app_id=OuterRef("pk"))), is_active=True
     ).first()
+    if app:
+        cache_app(auth_token, app)
+    return app
 
 
 def app_middleware(next, root, info, **kwargs):
@@ -48,6 +60,85 @@ def app_middleware(next, root, info, **kwargs):
     return next(root, info, **kwargs)
 
 
+# Fields resolved from objects which changes don't invalidate cached responses,
+# like stocks, allocations, orders and sales, by type name.
+UNCACHEABLE_FIELDS = {
+    "Product": {"isAvailable", "pricing"},
+    "ProductChannelListing": {"pricing"},
+    "ProductVariant": {
+        "pricing",
+        "quantityAvailable",
+        "quantityOrdered",
+        "revenue",
+        "stocks",
+    },
+}
+
+
+def get_cached_model(graphql_type) -> Tuple[Optional[Type[Model]], bool]:
+    """Return the cached model of the GraphQL type and whether it is a list of them.
+
+    Connections are lists of the model of their nodes.
+    """
+    graphene_type = getattr(get_named_type(graphql_type), "graphene_type", None)
+    meta = getattr(graphene_type, "_meta", None)
+    is_list = isinstance(get_nullable_type(graphql_type), GraphQLList)
+    if getattr(meta, "node", None) is not None:
+        meta = meta.node._meta
+        is_list = True
+    model = getattr(meta, "model", None)
+    if model is None or model._meta.label_lower not in CACHED_MODELS:
+        return None, is_list
+    return model, is_list
+
+
+def response_cache_middleware(next, root, info, **kwargs):
+    """Collect tags of the objects the cached response is resolved from.
+
+    The response is not cached when it exposes objects which changes do not
+    invalidate cached responses, or fields resolved from them.
+    """
+    request = info.context
+    tags = getattr(request, "response_cache_tags", None)
+    if tags is None:
+        return next(root, info, **kwargs)
+
+    if info.field_name in UNCACHEABLE_FIELDS.get(info.parent_type.name, ()):
+        request.response_cache_tags = None
+        return next(root, info, **kwargs)
+
+    if len(info.path) == 1:
+        model, is_list = get_cached_model(info.return_type)
+        if model is None:
+            request.response_cache_tags = None
+            return next(root, info, **kwargs)
+        if is_list:
+            tags.add(get_list_tag(model))
+        else:
+            # Object missing now may be created or published later.
+            def tag_missing(value):
+                if value is None:
+                    tags.add(get_list_tag(model))
+                return value
+
+            result = next(root, info, **kwargs)
+            if isinstance(result, Promise):
+                return result.then(tag_missing)
+            return tag_missing(result)
+
+    node = root.node if isinstance(root, ChannelContext) else root
+    if isinstance(node, Model):
+        model = type(node)
+        if model._meta.label_lower not in CACHED_MODELS:
+            request.response_cache_tags = None
+        elif any(isinstance(key, int) for key in info.path):
+            # Items of lists depend on all objects that could be listed.
+            tags.add(get_list_tag(model))
+        else:
+            tags.add(get_model_tag(model, node.pk))
+    return next(root, info, **kwargs)
+
+
 class ReadOnlyMiddleware:
     ALLOWED_MUTATIONS = [
         "checkoutAddPromoCode",
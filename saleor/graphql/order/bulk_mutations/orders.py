@@ -1,11 +1,43 @@
+from decimal import Decimal
+
 import graphene
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from prices import Money, TaxedMoney
 
+from ....account import models as account_models
+from ....channel import models as channel_models
+from ....checkout import AddressType
 from ....core.permissions import OrderPermissions
-from ....order import models
-from ....order.actions import cancel_order
-from ...core.mutations import BaseBulkMutation
-from ...core.types.common import OrderError
+from ....order import OrderStatus, models
+from ....order.actions import cancel_order, create_fulfillments_for_orders
+from ....order.bulk_create import (
+    OrderBulkData,
+    OrderLineBulkData,
+    PaymentBulkData,
+    create_orders_in_bulk,
+)
+from ....order.error_codes import OrderErrorCode
+from ....payment import ChargeStatus
+from ....product import models as product_models
+from ...account.i18n import I18nMixin
+from ...account.types import AddressInput
+from ...core.descriptions import ADDED_IN_32
+from ...core.enums import LanguageCodeEnum
+from ...core.mutations import (
+    BaseBulkMutation,
+    BaseMutation,
+    validation_error_to_error_type,
+)
+from ...core.scalars import PositiveDecimal
+from ...core.types.common import BulkOrderError, OrderError
+from ...meta.mutations import MetadataInput
+from ...payment.enums import PaymentChargeStatusEnum
+from ..enums import OrderBulkCreateStatusEnum
+from ..mutations.fulfillments import OrderFulfill, OrderFulfillLineInput
 from ..mutations.orders import clean_order_cancel
+from ..types import Fulfillment, Order, OrderLine
+from ..utils import prepare_insufficient_stock_order_validation_errors
 
 
 class OrderBulkCancel(BaseBulkMutation):
@@ -34,3 +66,627 @@ class OrderBulkCancel(BaseBulkMutation):
                 app=info.context.app,
                 manager=info.context.plugins,
             )
+
+
+class OrderBulkFulfillInput(graphene.InputObjectType):
+    order = graphene.ID(description="ID of the order to be fulfilled.", required=True)
+    lines = graphene.List(
+        graphene.NonNull(OrderFulfillLineInput),
+        required=True,
+        description="List of items informing how to fulfill the order.",
+    )
+
+
+class OrderBulkFulfill(BaseMutation):
+    count = graphene.Int(
+        required=True, description="Returns how many orders were fulfilled."
+    )
+    fulfillments = graphene.List(
+        graphene.NonNull(Fulfillment),
+        required=True,
+        description="List of created fulfillments.",
+    )
+    orders = graphene.List(
+        graphene.NonNull(Order), required=True, description="List of fulfilled orders."
+    )
+
+    class Arguments:
+        input = graphene.List(
+            graphene.NonNull(OrderBulkFulfillInput),
+            required=True,
+            description="Orders with fields required to create fulfillments.",
+        )
+        notify_customer = graphene.Boolean(
+            description="If true, send email notifications to the customers."
+        )
+
+    class Meta:
+        description = (
+            f"{ADDED_IN_32} Creates new fulfillments for many orders. Orders that "
+            "can't be fulfilled are returned in errors with the index of the input "
+            "item and don't prevent fulfilling the remaining orders."
+        )
+        permissions = (OrderPermissions.MANAGE_ORDERS,)
+        error_type_class = BulkOrderError
+
+    @classmethod
+    def add_errors(cls, errors, error: ValidationError, index: int):
+        for error_type in validation_error_to_error_type(
+            error, cls._meta.error_type_class
+        ):
+            error_type.index = index
+            errors.append(error_type)
+
+    @classmethod
+    def get_instances(cls, input_data, errors):
+        """Fetch orders and order lines of all input items at once."""
+        order_pks = {}
+        line_pks = {}
+        for index, order_data in enumerate(input_data):
+            try:
+                order_pks[index] = cls.get_global_id_or_error(
+                    order_data["order"], only_type=Order, field="order"
+                )
+                line_pks[index] = [
+                    cls.get_global_id_or_error(
+                        line["order_line_id"], only_type=OrderLine, field="lines"
+                    )
+                    for line in order_data["lines"]
+                ]
+            except ValidationError as error:
+                cls.add_errors(errors, error, index)
+                order_pks.pop(index, None)
+
+        orders = {
+            str(pk): order
+            for pk, order in models.Order.objects.select_related("channel")
+            .in_bulk([pk for pk in order_pks.values() if pk.isdigit()])
+            .items()
+        }
+        order_lines = {
+            str(pk): line
+            for pk, line in models.OrderLine.objects.select_related(
+                "variant__product__product_type", "variant__digital_content"
+            )
+            .prefetch_related("fulfillment_lines__fulfillment")
+            .in_bulk([pk for pks in line_pks.values() for pk in pks if pk.isdigit()])
+            .items()
+        }
+        instances = {}
+        for index, order_pk in order_pks.items():
+            order = orders.get(order_pk)
+            if order is None:
+                error = ValidationError(
+                    {
+                        "order": ValidationError(
+                            "Couldn't resolve to a node: %s"
+                            % input_data[index]["order"],
+                            code=OrderErrorCode.NOT_FOUND,
+                        )
+                    }
+                )
+                cls.add_errors(errors, error, index)
+                continue
+            lines = [order_lines.get(pk) for pk in line_pks[index]]
+            missing_lines = [
+                input_data[index]["lines"][line_index]["order_line_id"]
+                for line_index, line in enumerate(lines)
+                if line is None or line.order_id != order.pk
+            ]
+            if missing_lines:
+                error = ValidationError(
+                    {
+                        "lines": ValidationError(
+                            "Order lines don't belong to the order.",
+                            code=OrderErrorCode.NOT_FOUND,
+                            params={"order_lines": missing_lines},
+                        )
+                    }
+                )
+                cls.add_errors(errors, error, index)
+                continue
+            instances[index] = (order, lines)
+        return instances
+
+    @classmethod
+    def clean_order_input(cls, info, order, order_lines, data):
+        OrderFulfill.check_order_is_paid(info, order)
+        lines = data["lines"]
+        OrderFulfill.check_warehouses_for_duplicates(
+            [[stock["warehouse"] for stock in line["stocks"]] for line in lines]
+        )
+        OrderFulfill.check_lines_for_duplicates(
+            [line["order_line_id"] for line in lines]
+        )
+        quantities_for_lines = [
+            [stock["quantity"] for stock in line["stocks"]] for line in lines
+        ]
+        OrderFulfill.clean_lines(order_lines, quantities_for_lines)
+        OrderFulfill.check_total_quantity_of_items(quantities_for_lines)
+        return dict(OrderFulfill.get_lines_for_warehouses(lines, order_lines))
+
+    @classmethod
+    def perform_mutation(cls, _root, info, **data):
+        input_data = data["input"]
+        notify_customer = data.get("notify_customer", True)
+        errors: list = []
+
+        instances = cls.get_instances(input_data, errors)
+        fulfillment_lines_for_orders = []
+        indexes = {}
+        for index, (order, order_lines) in instances.items():
+            if order.pk in indexes:
+                error = ValidationError(
+                    {
+                        "order": ValidationError(
+                            "Duplicated order ID.",
+                            code=OrderErrorCode.DUPLICATED_INPUT_ITEM,
+                        )
+                    }
+                )
+                cls.add_errors(errors, error, index)
+                continue
+            indexes[order.pk] = index
+            try:
+                lines_for_warehouses = cls.clean_order_input(
+                    info, order, order_lines, input_data[index]
+                )
+            except ValidationError as error:
+                cls.add_errors(errors, error, index)
+                continue
+            fulfillment_lines_for_orders.append((order, lines_for_warehouses))
+
+        fulfillments, stock_errors = create_fulfillments_for_orders(
+            info.context.user,
+            info.context.app,
+            fulfillment_lines_for_orders,
+            info.context.plugins,
+            notify_customer,
+            approved=info.context.site.settings.fulfillment_auto_approve,
+        )
+        for order_pk, exc in stock_errors.items():
+            error = ValidationError(
+                {"stocks": prepare_insufficient_stock_order_validation_errors(exc)}
+            )
+            cls.add_errors(errors, error, indexes[order_pk])
+
+        errors.sort(key=lambda error: error.index)
+        orders = [
+            order
+            for order, _ in fulfillment_lines_for_orders
+            if order.pk in fulfillments
+        ]
+        return cls(
+            count=len(orders),
+            fulfillments=[
+                fulfillment
+                for order in orders
+                for fulfillment in fulfillments[order.pk]
+            ],
+            orders=orders,
+            errors=errors,
+        )
+
+
+class OrderBulkCreateLineInput(graphene.InputObjectType):
+    variant_id = graphene.ID(
+        description=(
+            "ID of the product variant. Lines without a variant describe products "
+            "that are no longer available in the catalogue."
+        )
+    )
+    variant_sku = graphene.String(
+        description="SKU of the product variant, used when `variantId` is not given."
+    )
+    product_name = graphene.String(
+        description="Product name. Defaults to the name of the variant's product."
+    )
+    variant_name = graphene.String(
+        description="Variant name. Defaults to the name of the variant."
+    )
+    product_sku = graphene.String(
+        description="Product SKU. Defaults to the SKU of the variant."
+    )
+    is_shipping_required = graphene.Boolean(
+        description="Determine if the line requires shipping. Defaults to the "
+        "variant's product type setting."
+    )
+    quantity = graphene.Int(required=True, description="Number of items ordered.")
+    unit_price_net = PositiveDecimal(
+        required=True, description="Net price of a single item."
+    )
+    unit_price_gross = PositiveDecimal(
+        required=True, description="Gross price of a single item."
+    )
+    undiscounted_unit_price_net = PositiveDecimal(
+        description="Net price of a single item before discounts. Defaults to "
+        "`unitPriceNet`."
+    )
+    undiscounted_unit_price_gross = PositiveDecimal(
+        description="Gross price of a single item before discounts. Defaults to "
+        "`unitPriceGross`."
+    )
+    tax_rate = PositiveDecimal(description="Tax rate of the line.")
+
+
+class OrderBulkCreatePaymentInput(graphene.InputObjectType):
+    gateway = graphene.String(
+        required=True, description="Payment gateway used for this payment."
+    )
+    psp_reference = graphene.String(description="PSP reference of the payment.")
+    total = PositiveDecimal(required=True, description="Total amount of the payment.")
+    captured_amount = PositiveDecimal(
+        description="Amount captured by the payment. Defaults to 0."
+    )
+    charge_status = PaymentChargeStatusEnum(
+        description="Charge status of the payment. Defaults to the status matching "
+        "the captured amount."
+    )
+
+
+class OrderBulkCreateInput(graphene.InputObjectType):
+    channel = graphene.String(
+        required=True, description="Slug of the channel the order was placed in."
+    )
+    status = OrderBulkCreateStatusEnum(
+        description="Status of the order. Defaults to UNFULFILLED."
+    )
+    created = graphene.DateTime(
+        description="Date the order was placed. Defaults to the current date."
+    )
+    user = graphene.ID(description="ID of the customer who placed the order.")
+    user_email = graphene.String(description="Email address of the customer.")
+    billing_address = AddressInput(
+        required=True, description="Billing address of the customer."
+    )
+    shipping_address = AddressInput(description="Shipping address of the customer.")
+    shipping_method_name = graphene.String(description="Name of the shipping method.")
+    shipping_price_net = PositiveDecimal(description="Net price of the shipping.")
+    shipping_price_gross = PositiveDecimal(description="Gross price of the shipping.")
+    shipping_tax_rate = PositiveDecimal(description="Tax rate of the shipping.")
+    customer_note = graphene.String(description="A note from the customer.")
+    language_code = LanguageCodeEnum(description="Order language code.")
+    metadata = graphene.List(
+        graphene.NonNull(MetadataInput), description="Public metadata of the order."
+    )
+    lines = graphene.List(
+        graphene.NonNull(OrderBulkCreateLineInput),
+        required=True,
+        description="Lines of the order.",
+    )
+    payments = graphene.List(
+        graphene.NonNull(OrderBulkCreatePaymentInput),
+        description="Payments of the order.",
+    )
+
+
+class OrderBulkCreate(BaseMutation, I18nMixin):
+    count = graphene.Int(
+        required=True, description="Returns how many orders were created."
+    )
+    orders = graphene.List(
+        graphene.NonNull(Order), required=True, description="List of created orders."
+    )
+
+    class Arguments:
+        orders = graphene.List(
+            graphene.NonNull(OrderBulkCreateInput),
+            required=True,
+            description="Input list of already priced orders to create.",
+        )
+        skip_stock_allocation = graphene.Boolean(
+            default_value=False,
+            description="If true, stocks won't be allocated for created orders.",
+        )
+        skip_notifications = graphene.Boolean(
+            default_value=False,
+            description="If true, plugins won't be notified about created orders.",
+        )
+
+    class Meta:
+        description = (
+            f"{ADDED_IN_32} Creates already priced orders, e.g. when importing "
+            "orders from other systems. Prices are not recalculated. Orders with "
+            "invalid input or without enough stock are returned in errors with "
+            "the index of the input item and don't prevent creating the remaining "
+            "orders."
+        )
+        permissions = (OrderPermissions.MANAGE_ORDERS,)
+        error_type_class = BulkOrderError
+
+    @classmethod
+    def add_errors(cls, errors, error: ValidationError, index: int):
+        for error_type in validation_error_to_error_type(
+            error, cls._meta.error_type_class
+        ):
+            error_type.index = index
+            errors.append(error_type)
+
+    @classmethod
+    def get_instances(cls, orders_input, errors):
+        """Fetch channels, customers and variants of all input items at once.
+
+        Return the fetched instances and indexes of the input items with valid IDs.
+        """
+        channel_slugs = set()
+        user_pks = set()
+        variant_pks = set()
+        variant_skus = set()
+        valid_indexes = []
+        for index, order_input in enumerate(orders_input):
+            channel_slugs.add(order_input["channel"])
+            try:
+                if order_input.get("user"):
+                    order_input["user"] = cls.get_global_id_or_error(
+                        order_input["user"], only_type="User", field="user"
+                    )
+                    user_pks.add(order_input["user"])
+                for line in order_input["lines"]:
+                    if line.get("variant_id"):
+                        line["variant_id"] = cls.get_global_id_or_error(
+                            line["variant_id"],
+                            only_type="ProductVariant",
+                            field="lines",
+                        )
+                        variant_pks.add(line["variant_id"])
+                    elif line.get("variant_sku"):
+                        variant_skus.add(line["variant_sku"])
+            except ValidationError as error:
+                cls.add_errors(errors, error, index)
+                continue
+            valid_indexes.append(index)
+
+        variants = product_models.ProductVariant.objects.select_related(
+            "product__product_type"
+        )
+        return (
+            {
+                "channels": channel_models.Channel.objects.in_bulk(
+                    channel_slugs, field_name="slug"
+                ),
+                "users": {
+                    str(pk): user
+                    for pk, user in account_models.User.objects.in_bulk(
+                        [pk for pk in user_pks if pk.isdigit()]
+                    ).items()
+                },
+                "variants": {
+                    str(pk): variant
+                    for pk, variant in variants.in_bulk(
+                        [pk for pk in variant_pks if pk.isdigit()]
+                    ).items()
+                },
+                "variants_by_sku": variants.in_bulk(variant_skus, field_name="sku"),
+            },
+            valid_indexes,
+        )
+
+    @classmethod
+    def clean_lines(cls, lines_input, currency, instances):
+        lines_data = []
+        for line_input in lines_input:
+            variant = None
+            if line_input.get("variant_id"):
+                variant = instances["variants"].get(line_input["variant_id"])
+            elif line_input.get("variant_sku"):
+                variant = instances["variants_by_sku"].get(line_input["variant_sku"])
+            if variant is None and (
+                line_input.get("variant_id") or line_input.get("variant_sku")
+            ):
+                raise ValidationError(
+                    {
+                        "lines": ValidationError(
+                            "Product variant doesn't exist.",
+                            code=OrderErrorCode.NOT_FOUND,
+                        )
+                    }
+                )
+            if line_input["quantity"] <= 0:
+                raise ValidationError(
+                    {
+                        "quantity": ValidationError(
+                            "Ensure this value is greater than 0.",
+                            code=OrderErrorCode.ZERO_QUANTITY,
+                        )
+                    }
+                )
+            product_name = line_input.get("product_name")
+            product_sku = line_input.get("product_sku")
+            if variant:
+                product_name = product_name or variant.product.name
+                product_sku = product_sku or variant.sku
+            if not product_name or not product_sku:
+                raise ValidationError(
+                    {
+                        "lines": ValidationError(
+                            "Product name and SKU are required for lines without "
+                            "a product variant.",
+                            code=OrderErrorCode.REQUIRED,
+                        )
+                    }
+                )
+            is_shipping_required = line_input.get("is_shipping_required")
+            if is_shipping_required is None:
+                is_shipping_required = (
+                    variant.is_shipping_required() if variant else True
+                )
+            unit_price = TaxedMoney(
+                net=Money(line_input["unit_price_net"], currency),
+                gross=Money(line_input["unit_price_gross"], currency),
+            )
+            undiscounted_unit_price = TaxedMoney(
+                net=Money(
+                    line_input.get("undiscounted_unit_price_net")
+                    or line_input["unit_price_net"],
+                    currency,
+                ),
+                gross=Money(
+                    line_input.get("undiscounted_unit_price_gross")
+                    or line_input["unit_price_gross"],
+                    currency,
+                ),
+            )
+            lines_data.append(
+                OrderLineBulkData(
+                    variant=variant,
+                    product_name=product_name,
+                    variant_name=line_input.get("variant_name")
+                    or (variant.name if variant else ""),
+                    product_sku=product_sku,
+                    is_shipping_required=is_shipping_required,
+                    quantity=line_input["quantity"],
+                    unit_price=unit_price,
+                    undiscounted_unit_price=undiscounted_unit_price,
+                    tax_rate=line_input.get("tax_rate") or Decimal("0.0"),
+                )
+            )
+        return lines_data
+
+    @classmethod
+    def clean_payments(cls, payments_input):
+        payments_data = []
+        for payment_input in payments_input:
+            total = payment_input["total"]
+            captured_amount = payment_input.get("captured_amount") or Decimal(0)
+            charge_status = payment_input.get("charge_status")
+            if charge_status is None:
+                if captured_amount >= total:
+                    charge_status = ChargeStatus.FULLY_CHARGED
+                elif captured_amount > 0:
+                    charge_status = ChargeStatus.PARTIALLY_CHARGED
+                else:
+                    charge_status = ChargeStatus.NOT_CHARGED
+            payments_data.append(
+                PaymentBulkData(
+                    gateway=payment_input["gateway"],
+                    psp_reference=payment_input.get("psp_reference"),
+                    total=total,
+                    captured_amount=captured_amount,
+                    charge_status=charge_status,
+                )
+            )
+        return payments_data
+
+    @classmethod
+    def clean_order_input(cls, info, order_input, instances) -> OrderBulkData:
+        channel = instances["channels"].get(order_input["channel"])
+        if channel is None:
+            raise ValidationError(
+                {
+                    "channel": ValidationError(
+                        f"Channel with '{order_input['channel']}' slug doesn't exist.",
+                        code=OrderErrorCode.NOT_FOUND,
+                    )
+                }
+            )
+        user = None
+        if order_input.get("user"):
+            user = instances["users"].get(order_input["user"])
+            if user is None:
+                raise ValidationError(
+                    {
+                        "user": ValidationError(
+                            "Customer doesn't exist.", code=OrderErrorCode.NOT_FOUND
+                        )
+                    }
+                )
+        if not order_input["lines"]:
+            raise ValidationError(
+                {
+                    "lines": ValidationError(
+                        "At least one line is required.", code=OrderErrorCode.REQUIRED
+                    )
+                }
+            )
+
+        shipping_price = None
+        shipping_price_net = order_input.get("shipping_price_net")
+        shipping_price_gross = order_input.get("shipping_price_gross")
+        if (shipping_price_net is None) != (shipping_price_gross is None):
+            raise ValidationError(
+                {
+                    "shipping_price_net": ValidationError(
+                        "Both net and gross shipping prices are required.",
+                        code=OrderErrorCode.REQUIRED,
+                    )
+                }
+            )
+        if shipping_price_net is not None:
+            shipping_price = TaxedMoney(
+                net=Money(shipping_price_net, channel.currency_code),
+                gross=Money(shipping_price_gross, channel.currency_code),
+            )
+
+        billing_address = cls.validate_address(
+            order_input["billing_address"],
+            address_type=AddressType.BILLING,
+            info=info,
+        )
+        shipping_address = None
+        if order_input.get("shipping_address"):
+            shipping_address = cls.validate_address(
+                order_input["shipping_address"],
+                address_type=AddressType.SHIPPING,
+                info=info,
+            )
+        return OrderBulkData(
+            channel=channel,
+            billing_address=billing_address,
+            shipping_address=shipping_address,
+            lines=cls.clean_lines(
+                order_input["lines"], channel.currency_code, instances
+            ),
+            payments=cls.clean_payments(order_input.get("payments") or []),
+            status=order_input.get("status") or OrderStatus.UNFULFILLED,
+            created=order_input.get("created"),
+            user=user,
+            user_email=order_input.get("user_email") or (user.email if user else ""),
+            shipping_method_name=order_input.get("shipping_method_name"),
+            shipping_price=shipping_price,
+            shipping_tax_rate=order_input.get("shipping_tax_rate") or Decimal("0.0"),
+            customer_note=order_input.get("customer_note") or "",
+            language_code=order_input.get("language_code") or settings.LANGUAGE_CODE,
+            metadata={
+                item["key"]: item["value"] for item in order_input.get("metadata") or []
+            },
+        )
+
+    @classmethod
+    def perform_mutation(cls, _root, info, **data):
+        orders_input = data["orders"]
+        errors: list = []
+
+        instances, valid_indexes = cls.get_instances(orders_input, errors)
+        orders_data = []
+        indexes = []
+        for index in valid_indexes:
+            try:
+                orders_data.append(
+                    cls.clean_order_input(info, orders_input[index], instances)
+                )
+            except ValidationError as error:
+                cls.add_errors(errors, error, index)
+                continue
+            indexes.append(index)
+
+        orders = {}
+        if orders_data:
+            orders, stock_errors = create_orders_in_bulk(
+                orders_data,
+                info.context.user,
+                info.context.app,
+                allocate_stock=not data["skip_stock_allocation"],
+                notify=not data["skip_notifications"],
+            )
+            for data_index, exc in stock_errors.items():
+                error = ValidationError(
+                    {"lines": prepare_insufficient_stock_order_validation_errors(exc)}
+                )
+                cls.add_errors(errors, error, indexes[data_index])
+
+        errors.sort(key=lambda error: error.index)
+        return cls(
+            count=len(orders),
+            orders=[orders[data_index] for data_index in sorted(orders)],
+            errors=errors,
+        )
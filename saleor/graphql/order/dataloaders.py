@@ -54,9 +54,18 @@ class OrderLineByIdLoader(DataLoader):
 
 class OrderLinesByOrderIdLoader(DataLoader):
     context_key = "orderlines_by_order"
+    deferrable_fields = {
+        "translated_product_name": ("translatedProductName",),
+        "translated_variant_name": ("translatedVariantName",),
+        "unit_discount_reason": ("unitDiscountReason",),
+    }
 
     def batch_load(self, keys):
-        lines = OrderLine.objects.filter(order_id__in=keys).order_by("pk")
+        lines = (
+            OrderLine.objects.filter(order_id__in=keys)
+            .defer(*self.deferred_fields)
+            .order_by("pk")
+        )
         line_map = defaultdict(list)
         for line in lines.iterator():
             line_map[line.order_id].append(line)
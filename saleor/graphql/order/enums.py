@@ -1,7 +1,7 @@
 import graphene
 
 from ...graphql.core.enums import to_enum
-from ...order import OrderEvents, OrderEventsEmails, OrderOrigin
+from ...order import OrderEvents, OrderEventsEmails, OrderOrigin, OrderStatus
 
 OrderEventsEnum = to_enum(OrderEvents)
 OrderEventsEmailsEnum = to_enum(OrderEventsEmails)
@@ -16,3 +16,9 @@ class OrderStatusFilter(graphene.Enum):
     PARTIALLY_FULFILLED = "partially fulfilled"
     FULFILLED = "fulfilled"
     CANCELED = "canceled"
+
+
+class OrderBulkCreateStatusEnum(graphene.Enum):
+    UNCONFIRMED = OrderStatus.UNCONFIRMED
+    UNFULFILLED = OrderStatus.UNFULFILLED
+    CANCELED = OrderStatus.CANCELED
@@ -172,7 +172,7 @@ class OrderFulfill(BaseMutation):
             )
 
     @classmethod
-    def clean_input(cls, info, order, data):
+    def check_order_is_paid(cls, info, order):
         site_settings = info.context.site.settings
         if not order.is_fully_paid() and (
             site_settings.fulfillment_auto_approve
@@ -187,6 +187,24 @@ class OrderFulfill(BaseMutation):
                 }
             )
 
+    @classmethod
+    def get_lines_for_warehouses(cls, lines, order_lines):
+        lines_for_warehouses = defaultdict(list)
+        for line, order_line in zip(lines, order_lines):
+            for stock in line["stocks"]:
+                if stock["quantity"] > 0:
+                    warehouse_pk = cls.get_global_id_or_error(
+                        stock["warehouse"], only_type=Warehouse, field="warehouse"
+                    )
+                    lines_for_warehouses[warehouse_pk].append(
+                        {"order_line": order_line, "quantity": stock["quantity"]}
+                    )
+        return lines_for_warehouses
+
+    @classmethod
+    def clean_input(cls, info, order, data):
+        cls.check_order_is_paid(info, order)
+
         lines = data["lines"]
 
         warehouse_ids_for_lines = [
@@ -213,20 +231,9 @@ class OrderFulfill(BaseMutation):
 
         cls.check_total_quantity_of_items(quantities_for_lines)
 
-        lines_for_warehouses = defaultdict(list)
-        for line, order_line in zip(lines, order_lines):
-            for stock in line["stocks"]:
-                if stock["quantity"] > 0:
-                    warehouse_pk = cls.get_global_id_or_error(
-                        stock["warehouse"], only_type=Warehouse, field="warehouse"
-                    )
-                    lines_for_warehouses[warehouse_pk].append(
-                        {"order_line": order_line, "quantity": stock["quantity"]}
-                    )
-
         data["order_lines"] = order_lines
         data["quantities"] = quantities_for_lines
-        data["lines_for_warehouses"] = lines_for_warehouses
+        data["lines_for_warehouses"] = cls.get_lines_for_warehouses(lines, order_lines)
         return data
 
     @classmethod
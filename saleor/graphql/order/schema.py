@@ -9,7 +9,7 @@ from ..core.types import FilterInputObjectType, TaxedMoney
 from ..core.utils import from_global_id_or_error
 from ..decorators import permission_required
 from .bulk_mutations.draft_orders import DraftOrderBulkDelete, DraftOrderLinesBulkDelete
-from .bulk_mutations.orders import OrderBulkCancel
+from .bulk_mutations.orders import OrderBulkCancel, OrderBulkCreate, OrderBulkFulfill
 from .filters import DraftOrderFilter, OrderFilter
 from .mutations.discount_order import (
     OrderDiscountAdd,
@@ -175,3 +175,5 @@ class OrderMutations(graphene.ObjectType):
     order_update_shipping = OrderUpdateShipping.Field()
     order_void = OrderVoid.Field()
     order_bulk_cancel = OrderBulkCancel.Field()
+    order_bulk_create = OrderBulkCreate.Field()
+    order_bulk_fulfill = OrderBulkFulfill.Field()
@@ -8,7 +8,7 @@ from ....core.exceptions import InsufficientStock, InsufficientStockData
 from ....order import OrderStatus
 from ....order.error_codes import OrderErrorCode
 from ....order.events import OrderEvents
-from ....order.models import Fulfillment, FulfillmentLine, FulfillmentStatus
+from ....order.models import Fulfillment, FulfillmentLine, FulfillmentStatus, Order
 from ....warehouse.models import Allocation, Stock
 from ...tests.utils import assert_no_permission, get_graphql_content
 
@@ -1263,3 +1263,124 @@ def test_staff_can_query_order_fulfill_data_without_permission(
     variables = {"id": order_id}
     response = staff_api_client.post_graphql(QUERY_ORDER_FULFILL_DATA, variables)
     assert_no_permission(response)
+
+
+ORDER_BULK_FULFILL_MUTATION = """
+    mutation orderBulkFulfill($input: [OrderBulkFulfillInput!]!) {
+        orderBulkFulfill(input: $input, notifyCustomer: false) {
+            count
+            orders {
+                id
+                status
+            }
+            errors {
+                field
+                code
+                index
+                orderLines
+            }
+        }
+    }
+"""
+
+
+@patch("saleor.order.actions.send_fulfillments_notifications_task.delay")
+def test_order_bulk_fulfill(
+    mock_notifications_task,
+    staff_api_client,
+    order_with_lines,
+    permission_manage_orders,
+    warehouse,
+):
+    # given
+    order = order_with_lines
+    order_line, order_line2 = order.lines.all()
+    warehouse_id = graphene.Node.to_global_id("Warehouse", warehouse.pk)
+    variables = {
+        "input": [
+            {
+                "order": graphene.Node.to_global_id("Order", order.pk),
+                "lines": [
+                    {
+                        "orderLineId": graphene.Node.to_global_id(
+                            "OrderLine", order_line.pk
+                        ),
+                        "stocks": [{"quantity": 3, "warehouse": warehouse_id}],
+                    },
+                    {
+                        "orderLineId": graphene.Node.to_global_id(
+                            "OrderLine", order_line2.pk
+                        ),
+                        "stocks": [{"quantity": 2, "warehouse": warehouse_id}],
+                    },
+                ],
+            },
+            {
+                "order": graphene.Node.to_global_id("Order", -1),
+                "lines": [],
+            },
+        ]
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        ORDER_BULK_FULFILL_MUTATION,
+        variables,
+        permissions=[permission_manage_orders],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["orderBulkFulfill"]
+    assert data["count"] == 1
+    assert data["orders"][0]["status"] == OrderStatus.FULFILLED.upper()
+    [error] = data["errors"]
+    assert error["index"] == 1
+    assert error["field"] == "order"
+    assert error["code"] == OrderErrorCode.NOT_FOUND.name
+    mock_notifications_task.assert_called_once()
+
+
+def test_order_bulk_fulfill_line_from_other_order(
+    staff_api_client,
+    order_with_lines,
+    permission_manage_orders,
+    warehouse,
+):
+    # given
+    order_line = order_with_lines.lines.first()
+    order_line_id = graphene.Node.to_global_id("OrderLine", order_line.pk)
+    warehouse_id = graphene.Node.to_global_id("Warehouse", warehouse.pk)
+    other_order = Order.objects.create(
+        channel=order_with_lines.channel, currency=order_with_lines.currency
+    )
+    variables = {
+        "input": [
+            {
+                "order": graphene.Node.to_global_id("Order", other_order.pk),
+                "lines": [
+                    {
+                        "orderLineId": order_line_id,
+                        "stocks": [{"quantity": 1, "warehouse": warehouse_id}],
+                    }
+                ],
+            }
+        ]
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        ORDER_BULK_FULFILL_MUTATION,
+        variables,
+        permissions=[permission_manage_orders],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["orderBulkFulfill"]
+    assert data["count"] == 0
+    [error] = data["errors"]
+    assert error["index"] == 0
+    assert error["field"] == "lines"
+    assert error["orderLines"] == [order_line_id]
+    assert not FulfillmentLine.objects.exists()
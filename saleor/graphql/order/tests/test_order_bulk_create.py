@@ -0,0 +1,216 @@
+from unittest.mock import patch
+
+import graphene
+
+from ....order import OrderOrigin, OrderStatus
+from ....order.error_codes import OrderErrorCode
+from ....order.models import Order
+from ....payment import ChargeStatus
+from ....warehouse.models import Allocation
+from ...tests.utils import assert_no_permission, get_graphql_content
+
+ORDER_BULK_CREATE_MUTATION = """
+    mutation OrderBulkCreate(
+        $orders: [OrderBulkCreateInput!]!, $skipStockAllocation: Boolean
+    ) {
+        orderBulkCreate(
+            orders: $orders, skipStockAllocation: $skipStockAllocation
+        ) {
+            count
+            orders {
+                id
+                origin
+                status
+                userEmail
+                total {
+                    gross {
+                        amount
+                    }
+                }
+                lines {
+                    productSku
+                    quantity
+                }
+                payments {
+                    chargeStatus
+                }
+            }
+            errors {
+                field
+                code
+                index
+            }
+        }
+    }
+"""
+
+
+def _prepare_order_input(channel, variant, address_data, quantity):
+    return {
+        "channel": channel.slug,
+        "userEmail": "customer@example.com",
+        "billingAddress": address_data,
+        "lines": [
+            {
+                "variantId": graphene.Node.to_global_id("ProductVariant", variant.pk),
+                "quantity": quantity,
+                "unitPriceNet": "10.00",
+                "unitPriceGross": "12.30",
+            }
+        ],
+    }
+
+
+@patch("saleor.order.bulk_create.send_order_created_notifications_task.delay")
+def test_order_bulk_create(
+    mocked_notifications_task,
+    staff_api_client,
+    permission_manage_orders,
+    channel_USD,
+    product,
+    graphql_address_data,
+):
+    # given
+    variant = product.variants.get()
+    order_input = _prepare_order_input(channel_USD, variant, graphql_address_data, 2)
+    order_input["payments"] = [{"gateway": "mirumee.payments.dummy", "total": "24.60"}]
+    order_without_variant_input = {
+        "channel": channel_USD.slug,
+        "billingAddress": graphql_address_data,
+        "lines": [
+            {
+                "productName": "Archived product",
+                "productSku": "ARCHIVED",
+                "quantity": 1,
+                "unitPriceNet": "5.00",
+                "unitPriceGross": "5.00",
+            }
+        ],
+    }
+    variables = {"orders": [order_input, order_without_variant_input]}
+
+    # when
+    response = staff_api_client.post_graphql(
+        ORDER_BULK_CREATE_MUTATION,
+        variables,
+        permissions=[permission_manage_orders],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["orderBulkCreate"]
+    assert not data["errors"]
+    assert data["count"] == 2
+    order_data = data["orders"][0]
+    assert order_data["origin"] == OrderOrigin.BULK_CREATE.upper()
+    assert order_data["status"] == OrderStatus.UNFULFILLED.upper()
+    assert order_data["total"]["gross"]["amount"] == 24.6
+    assert order_data["lines"] == [{"productSku": variant.sku, "quantity": 2}]
+    assert order_data["payments"] == [{"chargeStatus": "NOT_CHARGED"}]
+    assert data["orders"][1]["lines"] == [{"productSku": "ARCHIVED", "quantity": 1}]
+    assert Allocation.objects.filter(stock__product_variant=variant).exists()
+    mocked_notifications_task.assert_called_once()
+
+
+@patch("saleor.order.bulk_create.send_order_created_notifications_task.delay")
+def test_order_bulk_create_returns_errors_by_index(
+    mocked_notifications_task,
+    staff_api_client,
+    permission_manage_orders,
+    channel_USD,
+    product,
+    graphql_address_data,
+):
+    # given
+    variant = product.variants.get()
+    stock = variant.stocks.get()
+    valid_input = _prepare_order_input(channel_USD, variant, graphql_address_data, 1)
+    insufficient_stock_input = _prepare_order_input(
+        channel_USD, variant, graphql_address_data, stock.quantity + 1
+    )
+    invalid_channel_input = _prepare_order_input(
+        channel_USD, variant, graphql_address_data, 1
+    )
+    invalid_channel_input["channel"] = "not-existing"
+    variables = {
+        "orders": [invalid_channel_input, valid_input, insufficient_stock_input]
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        ORDER_BULK_CREATE_MUTATION,
+        variables,
+        permissions=[permission_manage_orders],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["orderBulkCreate"]
+    assert data["count"] == 1
+    assert data["errors"] == [
+        {"field": "channel", "code": OrderErrorCode.NOT_FOUND.name, "index": 0},
+        {
+            "field": "lines",
+            "code": OrderErrorCode.INSUFFICIENT_STOCK.name,
+            "index": 2,
+        },
+    ]
+    assert Order.objects.count() == 1
+
+
+@patch("saleor.order.bulk_create.send_order_created_notifications_task.delay")
+def test_order_bulk_create_skip_stock_allocation(
+    mocked_notifications_task,
+    staff_api_client,
+    permission_manage_orders,
+    channel_USD,
+    product,
+    graphql_address_data,
+):
+    # given
+    variant = product.variants.get()
+    stock = variant.stocks.get()
+    order_input = _prepare_order_input(
+        channel_USD, variant, graphql_address_data, stock.quantity + 1
+    )
+    order_input["payments"] = [
+        {
+            "gateway": "mirumee.payments.dummy",
+            "total": "100.00",
+            "capturedAmount": "100.00",
+        }
+    ]
+    variables = {"orders": [order_input], "skipStockAllocation": True}
+
+    # when
+    response = staff_api_client.post_graphql(
+        ORDER_BULK_CREATE_MUTATION,
+        variables,
+        permissions=[permission_manage_orders],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["orderBulkCreate"]
+    assert not data["errors"]
+    assert data["orders"][0]["payments"] == [
+        {"chargeStatus": ChargeStatus.FULLY_CHARGED.upper()}
+    ]
+    assert not Allocation.objects.exists()
+
+
+def test_order_bulk_create_by_user_without_permissions(
+    staff_api_client, channel_USD, product, graphql_address_data
+):
+    # given
+    variant = product.variants.get()
+    order_input = _prepare_order_input(channel_USD, variant, graphql_address_data, 1)
+
+    # when
+    response = staff_api_client.post_graphql(
+        ORDER_BULK_CREATE_MUTATION, {"orders": [order_input]}
+    )
+
+    # then
+    assert_no_permission(response)
+    assert not Order.objects.exists()
@@ -591,7 +591,7 @@ class OrderLine(CountableDjangoObjectType):
                 .then(product_is_available)
             )
 
-        variant = ProductVariantByIdLoader(context).load(root.variant_id)
+        variant = ProductVariantByIdLoader(context).load_selected(root.variant_id, info)
         channel = ChannelByOrderLineIdLoader(context).load(root.id)
 
         return Promise.all([variant, channel]).then(requestor_has_access_to_variant)
@@ -957,7 +957,7 @@ class Order(CountableDjangoObjectType):
 
     @staticmethod
     def resolve_lines(root: models.Order, info):
-        return OrderLinesByOrderIdLoader(info.context).load(root.id)
+        return OrderLinesByOrderIdLoader(info.context).load_selected(root.id, info)
 
     @staticmethod
     @permission_required(OrderPermissions.MANAGE_ORDERS)
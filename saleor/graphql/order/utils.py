@@ -236,7 +236,7 @@ def prepare_insufficient_stock_order_validation_errors(exc):
     for item in exc.items:
         order_line_global_id = (
             graphene.Node.to_global_id("OrderLine", item.order_line.pk)
-            if item.order_line
+            if item.order_line and item.order_line.pk
             else None
         )
         warehouse_global_id = (
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from typing import Dict, List
 
 import graphene
 from django.core.exceptions import ValidationError
@@ -8,21 +9,35 @@ from graphene.types import InputObjectType
 
 from ....attribute import AttributeInputType
 from ....attribute import models as attribute_models
+from ....channel import models as channel_models
 from ....core.permissions import ProductPermissions, ProductTypePermissions
 from ....core.tracing import traced_atomic_transaction
 from ....order import events as order_events
 from ....order import models as order_models
 from ....order.tasks import recalculate_orders_task
 from ....product import models
+from ....product.deletion import delete_products_task
 from ....product.error_codes import ProductErrorCode
-from ....product.tasks import update_product_discounted_price_task
+from ....product.tasks import (
+    update_product_discounted_price_task,
+    update_products_discounted_prices_task,
+)
 from ....product.utils import delete_categories
+from ....product.utils.variant_prices import update_variants_prices
 from ....product.utils.variants import generate_and_set_variant_name
 from ....warehouse import models as warehouse_models
+from ....warehouse.availability import update_variants_channel_availability
 from ....warehouse.error_codes import StockErrorCode
 from ...channel import ChannelContext
 from ...channel.types import Channel
-from ...core.mutations import BaseMutation, ModelBulkDeleteMutation, ModelMutation
+from ...core.descriptions import ADDED_IN_32
+from ...core.mutations import (
+    BaseMutation,
+    ModelBulkDeleteMutation,
+    ModelMutation,
+    validation_error_to_error_type,
+)
+from ...core.scalars import PositiveDecimal
 from ...core.types.common import (
     BulkProductError,
     BulkStockError,
@@ -40,7 +55,7 @@ from ..mutations.products import (
     ProductVariantInput,
     StockInput,
 )
-from ..types import Product, ProductType, ProductVariant
+from ..types import ProductType, ProductVariant
 from ..utils import (
     create_stocks,
     get_draft_order_lines_data_for_variants,
@@ -106,68 +121,17 @@ class ProductBulkDelete(ModelBulkDeleteMutation):
         error_type_field = "product_errors"
 
     @classmethod
-    @traced_atomic_transaction()
-    def perform_mutation(cls, _root, info, ids, **data):
-        try:
-            pks = cls.get_global_ids_or_error(ids, Product)
-        except ValidationError as error:
-            return 0, error
-        product_to_variant = list(
-            models.ProductVariant.objects.filter(product__pk__in=pks).values_list(
-                "product_id", "id"
-            )
-        )
-        variants_ids = [variant_id for _, variant_id in product_to_variant]
-
-        cls.delete_assigned_attribute_values(pks)
-
-        draft_order_lines_data = get_draft_order_lines_data_for_variants(variants_ids)
-
-        response = super().perform_mutation(
-            _root,
-            info,
-            ids,
-            product_to_variant=product_to_variant,
-            **data,
+    def bulk_action(cls, info, queryset):
+        # Products are deleted in chunks by a background task; plugins are
+        # notified about deleted products after each chunk is committed.
+        user = info.context.user
+        app = info.context.app
+        delete_products_task.delay(
+            list(queryset.values_list("pk", flat=True)),
+            user_id=user.pk if user else None,
+            app_id=app.pk if app else None,
         )
 
-        # delete order lines for deleted variants
-        order_models.OrderLine.objects.filter(
-            pk__in=draft_order_lines_data.line_pks
-        ).delete()
-
-        # run order event for deleted lines
-        for order, order_lines in draft_order_lines_data.order_to_lines_mapping.items():
-            lines_data = [(line.quantity, line) for line in order_lines]
-            order_events.order_line_product_removed_event(
-                order, info.context.user, info.context.app, lines_data
-            )
-
-        order_pks = draft_order_lines_data.order_pks
-        if order_pks:
-            recalculate_orders_task.delay(list(order_pks))
-
-        return response
-
-    @staticmethod
-    def delete_assigned_attribute_values(instance_pks):
-        attribute_models.AttributeValue.objects.filter(
-            productassignments__product_id__in=instance_pks,
-            attribute__input_type__in=AttributeInputType.TYPES_WITH_UNIQUE_VALUES,
-        ).delete()
-
-    @classmethod
-    def bulk_action(cls, info, queryset, product_to_variant):
-        product_variant_map = defaultdict(list)
-        for product, variant in product_to_variant:
-            product_variant_map[product].append(variant)
-
-        products = [product for product in queryset]
-        queryset.delete()
-        for product in products:
-            variants = product_variant_map.get(product.id, [])
-            info.context.plugins.product_deleted(product, variants)
-
 
 class BulkAttributeValueInput(InputObjectType):
     id = graphene.ID(description="ID of the selected attribute.")
@@ -613,6 +577,149 @@ class ProductVariantBulkDelete(ModelBulkDeleteMutation):
         ).delete()
 
 
+class ProductVariantPriceBulkUpdateInput(graphene.InputObjectType):
+    sku = graphene.String(required=True, description="SKU of the product variant.")
+    channel = graphene.String(required=True, description="Slug of the channel.")
+    price = PositiveDecimal(
+        required=True, description="Price of the variant in the channel."
+    )
+    cost_price = PositiveDecimal(
+        description="Cost price of the variant in the channel. Left unchanged when "
+        "not given."
+    )
+
+
+class ProductVariantPriceBulkUpdate(BaseMutation):
+    count = graphene.Int(
+        required=True, description="Returns how many variant prices were updated."
+    )
+
+    class Arguments:
+        prices = graphene.List(
+            graphene.NonNull(ProductVariantPriceBulkUpdateInput),
+            required=True,
+            description="Input list of variant prices to set.",
+        )
+
+    class Meta:
+        description = (
+            f"{ADDED_IN_32} Sets prices of product variants in channels, addressed "
+            "by SKU and channel slug. Discounted prices of the affected products are "
+            "recalculated in a single background task. Invalid input items are "
+            "returned in errors with their index and don't prevent updating "
+            "the remaining prices."
+        )
+        permissions = (ProductPermissions.MANAGE_PRODUCTS,)
+        error_type_class = BulkProductError
+
+    @classmethod
+    def add_error(cls, errors, field, msg, code, index):
+        errors[field].append(
+            ValidationError(msg, code=code.value, params={"index": index})
+        )
+
+    @classmethod
+    def clean_prices(cls, prices_input, errors):
+        channels = channel_models.Channel.objects.in_bulk(
+            {price_input["channel"] for price_input in prices_input},
+            field_name="slug",
+        )
+        variants = {
+            sku: (variant_pk, product_id)
+            for sku, variant_pk, product_id in models.ProductVariant.objects.filter(
+                sku__in={price_input["sku"] for price_input in prices_input}
+            ).values_list("sku", "pk", "product_id")
+        }
+        product_channels = set(
+            models.ProductChannelListing.objects.filter(
+                product_id__in={product_id for _, product_id in variants.values()},
+                channel__in=channels.values(),
+            ).values_list("product_id", "channel_id")
+        )
+
+        prices_data = []
+        seen = set()
+        for index, price_input in enumerate(prices_input):
+            channel = channels.get(price_input["channel"])
+            if channel is None:
+                cls.add_error(
+                    errors,
+                    "channel",
+                    f"Channel with '{price_input['channel']}' slug doesn't exist.",
+                    ProductErrorCode.NOT_FOUND,
+                    index,
+                )
+                continue
+            if price_input["sku"] not in variants:
+                cls.add_error(
+                    errors,
+                    "sku",
+                    f"Product variant with SKU {price_input['sku']} doesn't exist.",
+                    ProductErrorCode.NOT_FOUND,
+                    index,
+                )
+                continue
+            variant_pk, product_id = variants[price_input["sku"]]
+            if (product_id, channel.pk) not in product_channels:
+                cls.add_error(
+                    errors,
+                    "channel",
+                    "Product not available in channel.",
+                    ProductErrorCode.PRODUCT_NOT_ASSIGNED_TO_CHANNEL,
+                    index,
+                )
+                continue
+            if (variant_pk, channel.pk) in seen:
+                cls.add_error(
+                    errors,
+                    "sku",
+                    "Duplicated price for the product variant and channel.",
+                    ProductErrorCode.DUPLICATED_INPUT_ITEM,
+                    index,
+                )
+                continue
+            try:
+                for field in ["price", "cost_price"]:
+                    validate_price_precision(
+                        price_input.get(field), channel.currency_code
+                    )
+            except ValidationError as error:
+                cls.add_error(
+                    errors, field, error.message, ProductErrorCode.INVALID, index
+                )
+                continue
+            seen.add((variant_pk, channel.pk))
+            prices_data.append(
+                (
+                    variant_pk,
+                    channel,
+                    price_input["price"],
+                    price_input.get("cost_price"),
+                )
+            )
+        return prices_data
+
+    @classmethod
+    @traced_atomic_transaction()
+    def perform_mutation(cls, _root, info, **data):
+        errors: Dict[str, List[ValidationError]] = defaultdict(list)
+        prices_data = cls.clean_prices(data["prices"], errors)
+
+        product_ids = update_variants_prices(prices_data)
+        if product_ids:
+            transaction.on_commit(
+                lambda: update_products_discounted_prices_task.delay(product_ids)
+            )
+
+        error_types = []
+        if errors:
+            error_types = validation_error_to_error_type(
+                ValidationError(errors), cls._meta.error_type_class
+            )
+            error_types.sort(key=lambda error: error.index)
+        return cls(count=len(prices_data), errors=error_types)
+
+
 class ProductVariantStocksCreate(BaseMutation):
     product_variant = graphene.Field(
         ProductVariant, description="Updated product variant."
@@ -755,6 +862,7 @@ class ProductVariantStocksUpdate(ProductVariantStocksCreate):
             stocks.append(stock)
 
         warehouse_models.Stock.objects.bulk_update(stocks, ["quantity"])
+        update_variants_channel_availability([variant.pk])
 
 
 class ProductVariantStocksDelete(BaseMutation):
@@ -797,6 +905,7 @@ class ProductVariantStocksDelete(BaseMutation):
             transaction.on_commit(lambda: manager.product_variant_out_of_stock(stock))
 
         stocks_to_delete.delete()
+        update_variants_channel_availability([variant.node.pk])
 
         return cls(product_variant=variant)
 
@@ -0,0 +1,239 @@
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, Optional, Tuple
+
+from django_countries.fields import Country
+from promise import Promise
+
+from ....channel.models import Channel
+from ....core.utils import get_currency_for_country
+from ....product.utils.availability import (
+    ProductAvailability,
+    ProductPricingData,
+    VariantAvailability,
+    VariantPricingData,
+    get_products_availability,
+    get_variants_availability,
+)
+from ...channel.dataloaders import ChannelBySlugLoader
+from ...core.dataloaders import DataLoader
+from ...discount.dataloaders import DiscountsByDateTimeLoader
+from .products import (
+    CollectionsByProductIdLoader,
+    ProductByIdLoader,
+    ProductChannelListingByProductIdAndChannelSlugLoader,
+    ProductVariantByIdLoader,
+    ProductVariantsByProductIdLoader,
+    VariantChannelListingByVariantIdAndChannelSlugLoader,
+    VariantsChannelListingByProductIdAndChannelSlugLoader,
+)
+
+# The country code is None when the price is calculated for the default country
+# of the channel.
+ProductIdCountryCodeAndChannelSlug = Tuple[int, Optional[str], str]
+VariantIdCountryCodeAndChannelSlug = Tuple[int, Optional[str], str]
+
+
+def _group_keys_by_channel_and_country(
+    keys: List[Tuple[int, Optional[str], str]], channels_map: Dict[str, Channel]
+) -> DefaultDict[Tuple[str, str], List[int]]:
+    """Return indexes of the keys by channel and country of the prices.
+
+    A typical query touches a single channel and country, so the pricing of all
+    keys is calculated in a single pass.
+    """
+    indexes: DefaultDict[Tuple[str, str], List[int]] = defaultdict(list)
+    for index, (_, country_code, channel_slug) in enumerate(keys):
+        channel = channels_map[channel_slug]
+        if channel is None:
+            continue
+        country_code = country_code or channel.default_country.code
+        indexes[(channel_slug, country_code)].append(index)
+    return indexes
+
+
+class ProductAvailabilityByProductIdCountryCodeAndChannelSlugLoader(
+    DataLoader[ProductIdCountryCodeAndChannelSlug, Optional[ProductAvailability]]
+):
+    context_key = "product_availability_by_product_id_country_code_and_channel_slug"
+
+    def batch_load(self, keys):
+        product_ids = list({product_id for product_id, _, _ in keys})
+        channel_slugs = list({channel_slug for _, _, channel_slug in keys})
+        product_channel_keys = list(
+            {(product_id, channel_slug) for product_id, _, channel_slug in keys}
+        )
+
+        def calculate_availability(results):
+            (
+                discounts,
+                channels,
+                products,
+                variants,
+                collections,
+                product_channel_listings,
+                variants_channel_listings,
+            ) = results
+            channels_map = dict(zip(channel_slugs, channels))
+            products_map = dict(zip(product_ids, products))
+            variants_map = dict(zip(product_ids, variants))
+            collections_map = dict(zip(product_ids, collections))
+            product_channel_listings_map = dict(
+                zip(product_channel_keys, product_channel_listings)
+            )
+            variants_channel_listings_map = dict(
+                zip(product_channel_keys, variants_channel_listings)
+            )
+
+            availabilities: List[Optional[ProductAvailability]] = [None] * len(keys)
+            indexes = _group_keys_by_channel_and_country(keys, channels_map)
+            for (channel_slug, country_code), channel_indexes in indexes.items():
+                batch = []
+                for index in channel_indexes:
+                    product_id = keys[index][0]
+                    variants_channel_listing = variants_channel_listings_map[
+                        (product_id, channel_slug)
+                    ]
+                    if not variants_channel_listing:
+                        continue
+                    data = ProductPricingData(
+                        product=products_map[product_id],
+                        product_channel_listing=product_channel_listings_map[
+                            (product_id, channel_slug)
+                        ],
+                        variants=variants_map[product_id],
+                        variants_channel_listing=variants_channel_listing,
+                        collections=collections_map[product_id],
+                    )
+                    batch.append((index, data))
+
+                batch_availabilities = get_products_availability(
+                    products=[data for _, data in batch],
+                    discounts=discounts,
+                    channel=channels_map[channel_slug],
+                    manager=self.context.plugins,
+                    country=Country(country_code),
+                    local_currency=get_currency_for_country(country_code),
+                )
+                for (index, _), availability in zip(batch, batch_availabilities):
+                    availabilities[index] = availability
+            return availabilities
+
+        return Promise.all(
+            [
+                DiscountsByDateTimeLoader(self.context).load(self.context.request_time),
+                ChannelBySlugLoader(self.context).load_many(channel_slugs),
+                ProductByIdLoader(self.context).load_many(product_ids),
+                ProductVariantsByProductIdLoader(self.context).load_many(product_ids),
+                CollectionsByProductIdLoader(self.context).load_many(product_ids),
+                ProductChannelListingByProductIdAndChannelSlugLoader(
+                    self.context
+                ).load_many(product_channel_keys),
+                VariantsChannelListingByProductIdAndChannelSlugLoader(
+                    self.context
+                ).load_many(product_channel_keys),
+            ]
+        ).then(calculate_availability)
+
+
+class VariantAvailabilityByVariantIdCountryCodeAndChannelSlugLoader(
+    DataLoader[VariantIdCountryCodeAndChannelSlug, Optional[VariantAvailability]]
+):
+    context_key = "variant_availability_by_variant_id_country_code_and_channel_slug"
+
+    def batch_load(self, keys):
+        variant_ids = list({variant_id for variant_id, _, _ in keys})
+        channel_slugs = list({channel_slug for _, _, channel_slug in keys})
+        variant_channel_keys = list(
+            {(variant_id, channel_slug) for variant_id, _, channel_slug in keys}
+        )
+
+        def with_variants(variants):
+            variants_map = dict(zip(variant_ids, variants))
+            product_ids = list({variant.product_id for variant in variants if variant})
+            product_channel_keys = list(
+                {
+                    (variants_map[variant_id].product_id, channel_slug)
+                    for variant_id, channel_slug in variant_channel_keys
+                    if variants_map[variant_id]
+                }
+            )
+
+            def calculate_availability(results):
+                (
+                    discounts,
+                    channels,
+                    products,
+                    collections,
+                    product_channel_listings,
+                    variant_channel_listings,
+                ) = results
+                channels_map = dict(zip(channel_slugs, channels))
+                products_map = dict(zip(product_ids, products))
+                collections_map = dict(zip(product_ids, collections))
+                product_channel_listings_map = dict(
+                    zip(product_channel_keys, product_channel_listings)
+                )
+                variant_channel_listings_map = dict(
+                    zip(variant_channel_keys, variant_channel_listings)
+                )
+
+                availabilities: List[Optional[VariantAvailability]] = [None] * len(keys)
+                indexes = _group_keys_by_channel_and_country(keys, channels_map)
+                for (channel_slug, country_code), channel_indexes in indexes.items():
+                    batch = []
+                    for index in channel_indexes:
+                        variant_id = keys[index][0]
+                        variant = variants_map[variant_id]
+                        if variant is None:
+                            continue
+                        variant_channel_listing = variant_channel_listings_map[
+                            (variant_id, channel_slug)
+                        ]
+                        product_channel_listing = product_channel_listings_map[
+                            (variant.product_id, channel_slug)
+                        ]
+                        if not variant_channel_listing or not product_channel_listing:
+                            continue
+                        data = VariantPricingData(
+                            variant=variant,
+                            variant_channel_listing=variant_channel_listing,
+                            product=products_map[variant.product_id],
+                            product_channel_listing=product_channel_listing,
+                            collections=collections_map[variant.product_id],
+                        )
+                        batch.append((index, data))
+
+                    batch_availabilities = get_variants_availability(
+                        variants=[data for _, data in batch],
+                        discounts=discounts,
+                        channel=channels_map[channel_slug],
+                        manager=self.context.plugins,
+                        country=Country(country_code),
+                        local_currency=get_currency_for_country(country_code),
+                    )
+                    for (index, _), availability in zip(batch, batch_availabilities):
+                        availabilities[index] = availability
+                return availabilities
+
+            return Promise.all(
+                [
+                    DiscountsByDateTimeLoader(self.context).load(
+                        self.context.request_time
+                    ),
+                    ChannelBySlugLoader(self.context).load_many(channel_slugs),
+                    ProductByIdLoader(self.context).load_many(product_ids),
+                    CollectionsByProductIdLoader(self.context).load_many(product_ids),
+                    ProductChannelListingByProductIdAndChannelSlugLoader(
+                        self.context
+                    ).load_many(product_channel_keys),
+                    VariantChannelListingByVariantIdAndChannelSlugLoader(
+                        self.context
+                    ).load_many(variant_channel_keys),
+                ]
+            ).then(calculate_availability)
+
+        return (
+            ProductVariantByIdLoader(self.context)
+            .load_many(variant_ids)
+            .then(with_variants)
+        )
@@ -3,6 +3,7 @@ from typing import DefaultDict, Dict, Iterable, List, Optional, Tuple
 
 from django.db.models import F
 
+from ....core.loader_cache import get_model_tag
 from ....product import ProductMediaTypes
 from ....product.models import (
     Category,
@@ -25,6 +26,7 @@ VariantIdAndChannelSlug = Tuple[int, str]
 
 class CategoryByIdLoader(DataLoader):
     context_key = "category_by_id"
+    shared_cache_model = Category
 
     def batch_load(self, keys):
         categories = Category.objects.in_bulk(keys)
@@ -33,9 +35,18 @@ class CategoryByIdLoader(DataLoader):
 
 class ProductByIdLoader(DataLoader):
     context_key = "product_by_id"
+    shared_cache_model = Product
+    deferrable_fields = {
+        "description": ("description", "descriptionJson"),
+        "description_plaintext": (),
+        "search_vector": (),
+        # tax codes of products are stored in metadata
+        "metadata": ("metadata", "pricing", "taxType"),
+        "private_metadata": ("privateMetadata",),
+    }
 
     def batch_load(self, keys):
-        products = Product.objects.all().in_bulk(keys)
+        products = Product.objects.defer(*self.deferred_fields).in_bulk(keys)
         return [products.get(product_id) for product_id in keys]
 
 
@@ -82,6 +93,14 @@ class ProductChannelListingByProductIdAndChannelSlugLoader(
     DataLoader[ProductIdAndChannelSlug, ProductChannelListing]
 ):
     context_key = "productchannelisting_by_product_and_channel"
+    shared_cache_model = ProductChannelListing
+
+    def get_shared_cache_tags(self, key):
+        product_id, _channel_slug = key
+        return [
+            get_model_tag(ProductChannelListing),
+            get_model_tag(Product, product_id),
+        ]
 
     def batch_load(self, keys):
         # Split the list of keys by channel first. A typical query will only touch
@@ -161,14 +180,23 @@ class ImagesByProductIdLoader(DataLoader):
 
 class ProductVariantByIdLoader(DataLoader):
     context_key = "productvariant_by_id"
+    shared_cache_model = ProductVariant
+    deferrable_fields = {
+        "metadata": ("metadata", "pricing"),
+        "private_metadata": ("privateMetadata",),
+    }
 
     def batch_load(self, keys):
-        variants = ProductVariant.objects.in_bulk(keys)
+        variants = ProductVariant.objects.defer(*self.deferred_fields).in_bulk(keys)
         return [variants.get(key) for key in keys]
 
 
 class ProductVariantsByProductIdLoader(DataLoader):
     context_key = "productvariants_by_product"
+    shared_cache_model = ProductVariant
+
+    def get_shared_cache_tags(self, key):
+        return [get_model_tag(ProductVariant), get_model_tag(Product, key)]
 
     def batch_load(self, keys):
         variants = ProductVariant.objects.filter(product_id__in=keys)
@@ -251,6 +279,14 @@ class VariantChannelListingByVariantIdAndChannelLoader(
 ):
     context_key = "variantchannelisting_by_variant_and_channel"
     field = ""
+    shared_cache_model = ProductVariantChannelListing
+
+    def get_shared_cache_tags(self, key):
+        variant_id, _channel = key
+        return [
+            get_model_tag(ProductVariantChannelListing),
+            get_model_tag(ProductVariant, variant_id),
+        ]
 
     def batch_load(self, keys):
         # Split the list of keys by channel first. A typical query will only touch
@@ -449,6 +485,7 @@ class ImagesByProductVariantIdLoader(DataLoader):
 
 class CollectionByIdLoader(DataLoader):
     context_key = "collection_by_id"
+    shared_cache_model = Collection
 
     def batch_load(self, keys):
         collections = Collection.objects.in_bulk(keys)
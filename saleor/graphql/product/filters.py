@@ -5,9 +5,8 @@ from typing import Dict, Iterable, List, Optional
 import django_filters
 import graphene
 from django.contrib.postgres.search import SearchQuery, SearchRank
-from django.db.models import Exists, F, FloatField, OuterRef, Q, Subquery, Sum
-from django.db.models.fields import IntegerField
-from django.db.models.functions import Cast, Coalesce
+from django.db.models import Exists, F, FloatField, OuterRef, Q, Sum
+from django.db.models.functions import Cast
 from graphene_django.filter import GlobalIDMultipleChoiceFilter
 
 from ...attribute import AttributeInputType
@@ -30,7 +29,7 @@ from ...product.models import (
     ProductVariant,
     ProductVariantChannelListing,
 )
-from ...warehouse.models import Allocation, Stock
+from ...warehouse.models import VariantChannelAvailability
 from ..channel.filters import get_channel_slug_from_filter_data
 from ..core.filters import (
     EnumFilter,
@@ -298,25 +297,14 @@ def filter_products_by_collections(qs, collection_pks):
 
 
 def filter_products_by_stock_availability(qs, stock_availability, channel_slug):
-    allocations = (
-        Allocation.objects.values("stock_id")
-        .filter(quantity_allocated__gt=0, stock_id=OuterRef("pk"))
-        .values_list(Sum("quantity_allocated"))
-    )
-    allocated_subquery = Subquery(queryset=allocations, output_field=IntegerField())
-
-    stocks = list(
-        Stock.objects.for_channel(channel_slug)
-        .filter(quantity__gt=Coalesce(allocated_subquery, 0))
-        .values_list("product_variant_id", flat=True)
-    )
-
-    variants = ProductVariant.objects.filter(pk__in=stocks).values("product_id")
+    availability = VariantChannelAvailability.objects.filter(
+        channel__slug=channel_slug, is_in_stock=True
+    ).values("product_id")
 
     if stock_availability == StockAvailability.IN_STOCK:
-        qs = qs.filter(Exists(variants.filter(product_id=OuterRef("pk"))))
+        qs = qs.filter(Exists(availability.filter(product_id=OuterRef("pk"))))
     if stock_availability == StockAvailability.OUT_OF_STOCK:
-        qs = qs.filter(~Exists(variants.filter(product_id=OuterRef("pk"))))
+        qs = qs.filter(~Exists(availability.filter(product_id=OuterRef("pk"))))
     return qs
 
 
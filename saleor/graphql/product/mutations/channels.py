@@ -8,6 +8,7 @@ from django.db import transaction
 from django.db.utils import IntegrityError
 
 from ....checkout.models import CheckoutLine
+from ....core.loader_cache import invalidate_objects
 from ....core.permissions import ProductPermissions
 from ....core.tracing import traced_atomic_transaction
 from ....product.error_codes import CollectionErrorCode, ProductErrorCode
@@ -211,6 +212,9 @@ class ProductChannelListingUpdate(BaseChannelListingMutation):
 
         try:
             ProductVariantChannelListing.objects.bulk_create(variant_channel_listings)
+            invalidate_objects(
+                ProductVariantModel, [variant.pk for variant in variants]
+            )
         except IntegrityError:
             raise ValidationError(
                 {
@@ -1,5 +1,9 @@
-from django.db.models import Exists, OuterRef, Sum
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List
 
+from django.db.models import Count, Exists, OuterRef, Sum
+
+from ...attribute.models import AssignedProductAttributeValueIndex, Attribute
 from ...channel.models import Channel
 from ...core.permissions import has_one_of_permissions
 from ...core.tracing import traced_resolver
@@ -90,6 +94,40 @@ def resolve_products(info, requestor, channel_slug=None, **_kwargs) -> ChannelQs
     return ChannelQsContext(qs=qs, channel_slug=channel_slug)
 
 
+@traced_resolver
+def resolve_product_facets(requestor, products) -> List[Dict[str, Any]]:
+    """Return the number of the products per value of each attribute.
+
+    Counts are aggregated from the attribute value index in a single query.
+    """
+    attributes = Attribute.objects.get_visible_to_user(requestor)
+    if not has_one_of_permissions(requestor, ALL_PRODUCTS_PERMISSIONS):
+        attributes = attributes.filter(filterable_in_storefront=True)
+    counts = (
+        AssignedProductAttributeValueIndex.objects.filter(
+            Exists(attributes.filter(pk=OuterRef("attribute_id"))),
+            product_id__in=products.order_by().values("pk"),
+        )
+        .values("attribute_id", "value_id")
+        .annotate(count=Count("product_id"))
+        .order_by(
+            "attribute__storefront_search_position",
+            "attribute__slug",
+            "value__sort_order",
+            "value_id",
+        )
+    )
+    facets: DefaultDict[int, List[Dict[str, int]]] = defaultdict(list)
+    for row in counts:
+        facets[row["attribute_id"]].append(
+            {"value_id": row["value_id"], "count": row["count"]}
+        )
+    return [
+        {"attribute_id": attribute_id, "values": values}
+        for attribute_id, values in facets.items()
+    ]
+
+
 @traced_resolver
 def resolve_variant_by_id(
     info, id, channel_slug, requestor, requestor_has_access_to_all
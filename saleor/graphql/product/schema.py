@@ -30,6 +30,7 @@ from .bulk_mutations.products import (
     ProductTypeBulkDelete,
     ProductVariantBulkCreate,
     ProductVariantBulkDelete,
+    ProductVariantPriceBulkUpdate,
     ProductVariantStocksCreate,
     ProductVariantStocksDelete,
     ProductVariantStocksUpdate,
@@ -98,6 +99,7 @@ from .resolvers import (
     resolve_digital_contents,
     resolve_product_by_id,
     resolve_product_by_slug,
+    resolve_product_facets,
     resolve_product_type_by_id,
     resolve_product_types,
     resolve_product_variant_by_sku,
@@ -117,6 +119,7 @@ from .types import (
     Collection,
     DigitalContent,
     Product,
+    ProductFacet,
     ProductType,
     ProductVariant,
 )
@@ -191,6 +194,18 @@ class ProductQueries(graphene.ObjectType):
         ),
         description="List of the shop's products.",
     )
+    product_facets = graphene.List(
+        graphene.NonNull(ProductFacet),
+        filter=ProductFilterInput(description="Filtering options for products."),
+        channel=graphene.String(
+            description="Slug of a channel for which the data should be returned."
+        ),
+        description=(
+            "Number of the filtered products per value of each attribute, "
+            "e.g. to show facets of a product list."
+        ),
+        required=True,
+    )
     product_type = graphene.Field(
         ProductType,
         id=graphene.Argument(
@@ -330,6 +345,25 @@ class ProductQueries(graphene.ObjectType):
             channel = get_default_channel_slug_or_graphql_error()
         return resolve_products(info, requestor, channel_slug=channel, **kwargs)
 
+    @traced_resolver
+    def resolve_product_facets(self, info, channel=None, **kwargs):
+        requestor = get_user_or_app_from_context(info.context)
+        has_required_permissions = has_one_of_permissions(
+            requestor, ALL_PRODUCTS_PERMISSIONS
+        )
+        if channel is None and not has_required_permissions:
+            channel = get_default_channel_slug_or_graphql_error()
+        products = resolve_products(info, requestor, channel_slug=channel).qs
+        products = FilterInputConnectionField.filter_iterable(
+            products,
+            ProductFilterInput.filterset_class,
+            "filter",
+            info,
+            channel=channel,
+            **kwargs,
+        )
+        return resolve_product_facets(requestor, products)
+
     def resolve_product_type(self, info, id, **_kwargs):
         _, id = from_global_id_or_error(id, ProductType)
         return resolve_product_type_by_id(id)
@@ -452,6 +486,7 @@ class ProductMutations(graphene.ObjectType):
     product_variant_set_default = ProductVariantSetDefault.Field()
     product_variant_translate = ProductVariantTranslate.Field()
     product_variant_channel_listing_update = ProductVariantChannelListingUpdate.Field()
+    product_variant_price_bulk_update = ProductVariantPriceBulkUpdate.Field()
     product_variant_reorder_attribute_values = (
         ProductVariantReorderAttributeValues.Field()
     )
@@ -500,6 +500,7 @@ def test_delete_products_trigger_webhook(
     response = staff_api_client.post_graphql(
         query, variables, permissions=[permission_manage_products]
     )
+    flush_post_commit_hooks()
     content = get_graphql_content(response)
 
     assert content["data"]["productBulkDelete"]["count"] == 3
@@ -532,6 +533,7 @@ def test_delete_products_without_variants(
     response = staff_api_client.post_graphql(
         query, variables, permissions=[permission_manage_products]
     )
+    flush_post_commit_hooks()
     content = get_graphql_content(response)
 
     assert content["data"]["productBulkDelete"]["count"] == 3
@@ -41,7 +41,10 @@ from ....product.models import (
 )
 from ....product.tasks import update_variants_names
 from ....product.tests.utils import create_image, create_pdf_file_with_image_ext
-from ....product.utils.availability import get_variant_availability
+from ....product.utils.availability import (
+    get_products_availability,
+    get_variants_availability,
+)
 from ....product.utils.costs import get_product_costs_data
 from ....tests.utils import dummy_editorjs, flush_post_commit_hooks
 from ....warehouse.models import Allocation, Stock, Warehouse
@@ -9316,11 +9319,11 @@ QUERY_GET_PRODUCT_VARIANTS_PRICING_NO_ADDRESS = """
 
 
 @mock.patch(
-    "saleor.graphql.product.types.products.get_variant_availability",
-    wraps=get_variant_availability,
+    "saleor.graphql.product.dataloaders.pricing.get_variants_availability",
+    wraps=get_variants_availability,
 )
 def test_product_variant_price_no_address(
-    mock_get_variant_availability, user_api_client, variant, stock, channel_USD
+    mock_get_variants_availability, user_api_client, variant, stock, channel_USD
 ):
     channel_USD.default_country = "FR"
     channel_USD.save()
@@ -9330,11 +9333,112 @@ def test_product_variant_price_no_address(
         QUERY_GET_PRODUCT_VARIANTS_PRICING_NO_ADDRESS, variables
     )
     assert (
-        mock_get_variant_availability.call_args[1]["country"]
+        mock_get_variants_availability.call_args[1]["country"]
         == channel_USD.default_country
     )
 
 
+QUERY_PRODUCTS_PRICING = """
+    query getProducts($channel: String) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    pricing {
+                        priceRange {
+                            start {
+                                gross {
+                                    amount
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+@mock.patch(
+    "saleor.graphql.product.dataloaders.pricing.get_products_availability",
+    wraps=get_products_availability,
+)
+def test_products_pricing_calculated_in_batch(
+    mock_get_products_availability, user_api_client, product_list, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCTS_PRICING, variables)
+
+    # then
+    content = get_graphql_content(response)
+    prices = [
+        edge["node"]["pricing"]["priceRange"]["start"]["gross"]["amount"]
+        for edge in content["data"]["products"]["edges"]
+    ]
+    assert sorted(prices) == [10, 20, 30]
+    mock_get_products_availability.assert_called_once()
+    assert len(mock_get_products_availability.call_args[1]["products"]) == len(
+        product_list
+    )
+
+
+@mock.patch("saleor.graphql.product.dataloaders.products.ProductByIdLoader.batch_load")
+def test_products_pricing_reuses_listed_products(
+    mock_product_batch_load, user_api_client, product_list, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCTS_PRICING, variables)
+
+    # then
+    get_graphql_content(response)
+    mock_product_batch_load.assert_not_called()
+
+
+QUERY_VARIANT_PRODUCT_TAX_TYPE = """
+    query ProductVariant($id: ID!, $channel: String) {
+        productVariant(id: $id, channel: $channel) {
+            product {
+                taxType {
+                    taxCode
+                }
+            }
+        }
+    }
+"""
+
+
+@mock.patch("saleor.product.models.Product.refresh_from_db")
+@mock.patch("saleor.plugins.manager.PluginsManager.get_tax_code_from_object_meta")
+def test_product_tax_type_loads_product_with_metadata(
+    mock_get_tax_code_from_object_meta,
+    mock_refresh_from_db,
+    user_api_client,
+    variant,
+    channel_USD,
+):
+    # given
+    mock_get_tax_code_from_object_meta.side_effect = lambda obj: mock.Mock(
+        code=obj.get_value_from_metadata("taxes.code"), description=""
+    )
+    variables = {
+        "id": graphene.Node.to_global_id("ProductVariant", variant.pk),
+        "channel": channel_USD.slug,
+    }
+
+    # when
+    response = user_api_client.post_graphql(QUERY_VARIANT_PRODUCT_TAX_TYPE, variables)
+
+    # then
+    get_graphql_content(response)
+    mock_refresh_from_db.assert_not_called()
+
+
 QUERY_REPORT_PRODUCT_SALES = """
 query TopProducts($period: ReportingPeriod!, $channel: String!) {
     reportProductSales(period: $period, first: 20, channel: $channel) {
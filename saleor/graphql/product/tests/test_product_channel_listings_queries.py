@@ -2,7 +2,7 @@ from unittest import mock
 
 import graphene
 
-from ....product.utils.availability import get_product_availability
+from ....product.utils.availability import get_products_availability
 from ....warehouse.models import Warehouse
 from ...tests.utils import get_graphql_content
 
@@ -101,11 +101,11 @@ query FetchProduct($id: ID, $channel: String) {
 
 
 @mock.patch(
-    "saleor.graphql.product.types.products.get_product_availability",
-    wraps=get_product_availability,
+    "saleor.graphql.product.dataloaders.pricing.get_products_availability",
+    wraps=get_products_availability,
 )
 def test_product_channel_listing_pricing_field_no_address(
-    mock_get_product_availability,
+    mock_get_products_availability,
     staff_api_client,
     permission_manage_products,
     channel_USD,
@@ -130,6 +130,6 @@ def test_product_channel_listing_pricing_field_no_address(
 
     # then
     assert (
-        mock_get_product_availability.call_args[1]["country"]
+        mock_get_products_availability.call_args[1]["country"]
         == channel_USD.default_country
     )
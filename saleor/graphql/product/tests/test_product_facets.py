@@ -0,0 +1,121 @@
+import graphene
+
+from ....attribute.utils import associate_attribute_values_to_instance
+from ...tests.utils import get_graphql_content
+
+QUERY_PRODUCT_FACETS = """
+    query ($channel: String, $filter: ProductFilterInput) {
+        productFacets(channel: $channel, filter: $filter) {
+            attribute {
+                slug
+            }
+            values {
+                value {
+                    slug
+                }
+                count
+            }
+        }
+    }
+"""
+
+
+def test_product_facets(user_api_client, product_list, channel_USD):
+    # given
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCT_FACETS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productFacets"] == [
+        {
+            "attribute": {"slug": "color"},
+            "values": [{"value": {"slug": "red"}, "count": 3}],
+        }
+    ]
+
+
+def test_product_facets_with_filter(
+    user_api_client, product_list, color_attribute, channel_USD
+):
+    # given
+    blue = color_attribute.values.get(slug="blue")
+    associate_attribute_values_to_instance(product_list[0], color_attribute, blue)
+    variables = {
+        "channel": channel_USD.slug,
+        "filter": {"attributes": [{"slug": "color", "values": ["blue"]}]},
+    }
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCT_FACETS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productFacets"] == [
+        {
+            "attribute": {"slug": "color"},
+            "values": [{"value": {"slug": "blue"}, "count": 1}],
+        }
+    ]
+
+
+def test_product_facets_counts_values_of_filtered_products(
+    user_api_client, product_list, color_attribute, channel_USD
+):
+    # given
+    blue = color_attribute.values.get(slug="blue")
+    associate_attribute_values_to_instance(product_list[0], color_attribute, blue)
+    variables = {
+        "channel": channel_USD.slug,
+        "filter": {"ids": [graphene.Node.to_global_id("Product", product_list[0].pk)]},
+    }
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCT_FACETS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    facets = content["data"]["productFacets"]
+    assert len(facets) == 1
+    assert facets[0]["values"] == [{"value": {"slug": "blue"}, "count": 1}]
+
+
+def test_product_facets_skip_attributes_not_filterable_in_storefront(
+    user_api_client, product_list, color_attribute, channel_USD
+):
+    # given
+    color_attribute.filterable_in_storefront = False
+    color_attribute.save(update_fields=["filterable_in_storefront"])
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCT_FACETS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productFacets"] == []
+
+
+def test_product_facets_as_staff_include_attributes_not_filterable_in_storefront(
+    staff_api_client,
+    product_list,
+    color_attribute,
+    permission_manage_products,
+    channel_USD,
+):
+    # given
+    color_attribute.filterable_in_storefront = False
+    color_attribute.save(update_fields=["filterable_in_storefront"])
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_PRODUCT_FACETS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    facets = content["data"]["productFacets"]
+    assert len(facets) == 1
+    assert facets[0]["values"] == [{"value": {"slug": "red"}, "count": 3}]
@@ -16,6 +16,7 @@ from ....product.models import (
     ProductVariantChannelListing,
 )
 from ....tests.utils import dummy_editorjs
+from ....warehouse.availability import update_variants_channel_availability
 from ....warehouse.models import Stock
 from ...tests.utils import get_graphql_content
 
@@ -444,6 +445,7 @@ def products_for_pagination(
             Stock(warehouse=warehouse, product_variant=variants[2], quantity=0),
         ]
     )
+    update_variants_channel_availability([variant.pk for variant in variants])
 
     return products
 
@@ -1,3 +1,4 @@
+from decimal import Decimal
 from unittest.mock import patch
 
 import graphene
@@ -486,3 +487,110 @@ def test_product_channel_listing_update_invalid_cost_price(
 
     # then
     assert_negative_positive_decimal_value(response)
+
+
+PRODUCT_VARIANT_PRICE_BULK_UPDATE_MUTATION = """
+    mutation ProductVariantPriceBulkUpdate(
+        $prices: [ProductVariantPriceBulkUpdateInput!]!
+    ) {
+        productVariantPriceBulkUpdate(prices: $prices) {
+            count
+            errors {
+                field
+                code
+                index
+            }
+        }
+    }
+"""
+
+
+@patch(
+    "saleor.graphql.product.bulk_mutations.products"
+    ".update_products_discounted_prices_task.delay"
+)
+def test_product_variant_price_bulk_update(
+    mocked_update_discounted_prices_task,
+    staff_api_client,
+    permission_manage_products,
+    product,
+    channel_USD,
+):
+    # given
+    variant = product.variants.get()
+    variables = {
+        "prices": [
+            {
+                "sku": variant.sku,
+                "channel": channel_USD.slug,
+                "price": "12.50",
+                "costPrice": "3.00",
+            }
+        ]
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        PRODUCT_VARIANT_PRICE_BULK_UPDATE_MUTATION,
+        variables,
+        permissions=[permission_manage_products],
+    )
+    flush_post_commit_hooks()
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productVariantPriceBulkUpdate"]
+    assert not data["errors"]
+    assert data["count"] == 1
+    channel_listing = variant.channel_listings.get(channel=channel_USD)
+    assert channel_listing.price_amount == Decimal("12.50")
+    assert channel_listing.cost_price_amount == Decimal("3.00")
+    mocked_update_discounted_prices_task.assert_called_once_with([product.pk])
+
+
+@patch(
+    "saleor.graphql.product.bulk_mutations.products"
+    ".update_products_discounted_prices_task.delay"
+)
+def test_product_variant_price_bulk_update_returns_errors_by_index(
+    mocked_update_discounted_prices_task,
+    staff_api_client,
+    permission_manage_products,
+    product,
+    channel_USD,
+    channel_PLN,
+):
+    # given
+    variant = product.variants.get()
+    variables = {
+        "prices": [
+            {"sku": variant.sku, "channel": channel_PLN.slug, "price": "40.00"},
+            {"sku": "not-existing", "channel": channel_USD.slug, "price": "1.00"},
+            {"sku": variant.sku, "channel": channel_USD.slug, "price": "1.001"},
+            {"sku": variant.sku, "channel": "not-existing", "price": "1.00"},
+        ]
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        PRODUCT_VARIANT_PRICE_BULK_UPDATE_MUTATION,
+        variables,
+        permissions=[permission_manage_products],
+    )
+    flush_post_commit_hooks()
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productVariantPriceBulkUpdate"]
+    assert data["count"] == 0
+    assert data["errors"] == [
+        {
+            "field": "channel",
+            "code": ProductErrorCode.PRODUCT_NOT_ASSIGNED_TO_CHANNEL.name,
+            "index": 0,
+        },
+        {"field": "sku", "code": ProductErrorCode.NOT_FOUND.name, "index": 1},
+        {"field": "price", "code": ProductErrorCode.INVALID.name, "index": 2},
+        {"field": "channel", "code": ProductErrorCode.NOT_FOUND.name, "index": 3},
+    ]
+    mocked_update_discounted_prices_task.assert_not_called()
@@ -1,14 +1,11 @@
 from dataclasses import asdict
 
 import graphene
-from django_countries.fields import Country
 
 from ....core.permissions import ProductPermissions
 from ....core.tracing import traced_resolver
-from ....core.utils import get_currency_for_country
 from ....graphql.core.types import Money, MoneyRange
 from ....product import models
-from ....product.utils.availability import get_product_availability
 from ....product.utils.costs import (
     get_margin_for_variant_channel_listing,
     get_product_costs_data,
@@ -17,13 +14,12 @@ from ...account import types as account_types
 from ...channel.dataloaders import ChannelByIdLoader
 from ...core.connection import CountableDjangoObjectType
 from ...decorators import permission_required
-from ...discount.dataloaders import DiscountsByDateTimeLoader
 from ..dataloaders import (
-    CollectionsByProductIdLoader,
-    ProductByIdLoader,
     ProductVariantsByProductIdLoader,
     VariantChannelListingByVariantIdAndChannelSlugLoader,
-    VariantsChannelListingByProductIdAndChannelSlugLoader,
+)
+from ..dataloaders.pricing import (
+    ProductAvailabilityByProductIdCountryCodeAndChannelSlugLoader,
 )
 
 
@@ -160,78 +156,23 @@ class ProductChannelListing(CountableDjangoObjectType):
     def resolve_pricing(root: models.ProductChannelListing, info, address=None):
         context = info.context
 
-        address_country = address.country if address is not None else None
-
-        def calculate_pricing_info(discounts):
-            def calculate_pricing_with_channel(channel):
-                def calculate_pricing_with_product(product):
-                    def calculate_pricing_with_variants(variants):
-                        def calculate_pricing_with_variants_channel_listings(
-                            variants_channel_listing,
-                        ):
-                            def calculate_pricing_with_collections(collections):
-                                if not variants_channel_listing:
-                                    return None
-
-                                country_code = (
-                                    address_country or channel.default_country.code
-                                )
-                                local_currency = None
-                                local_currency = get_currency_for_country(country_code)
-
-                                availability = get_product_availability(
-                                    product=product,
-                                    product_channel_listing=root,
-                                    variants=variants,
-                                    variants_channel_listing=variants_channel_listing,
-                                    collections=collections,
-                                    discounts=discounts,
-                                    channel=channel,
-                                    manager=context.plugins,
-                                    country=Country(country_code),
-                                    local_currency=local_currency,
-                                )
-                                from .products import ProductPricingInfo
-
-                                return ProductPricingInfo(**asdict(availability))
-
-                            return (
-                                CollectionsByProductIdLoader(context)
-                                .load(root.product_id)
-                                .then(calculate_pricing_with_collections)
-                            )
-
-                        return (
-                            VariantsChannelListingByProductIdAndChannelSlugLoader(
-                                context
-                            )
-                            .load((root.product_id, channel.slug))
-                            .then(calculate_pricing_with_variants_channel_listings)
-                        )
-
-                    return (
-                        ProductVariantsByProductIdLoader(context)
-                        .load(root.product_id)
-                        .then(calculate_pricing_with_variants)
-                    )
+        country_code = address.country if address is not None else None
 
-                return (
-                    ProductByIdLoader(context)
-                    .load(root.product_id)
-                    .then(calculate_pricing_with_product)
-                )
+        def calculate_pricing_info(availability):
+            if availability is None:
+                return None
+            from .products import ProductPricingInfo
 
+            return ProductPricingInfo(**asdict(availability))
+
+        def load_availability(channel):
             return (
-                ChannelByIdLoader(context)
-                .load(root.channel_id)
-                .then(calculate_pricing_with_channel)
+                ProductAvailabilityByProductIdCountryCodeAndChannelSlugLoader(context)
+                .load((root.product_id, country_code, channel.slug))
+                .then(calculate_pricing_info)
             )
 
-        return (
-            DiscountsByDateTimeLoader(context)
-            .load(info.context.request_time)
-            .then(calculate_pricing_info)
-        )
+        return ChannelByIdLoader(context).load(root.channel_id).then(load_availability)
 
 
 class ProductVariantChannelListing(CountableDjangoObjectType):
@@ -56,6 +56,6 @@ class DigitalContent(CountableDjangoObjectType):
     def resolve_product_variant(root: models.DigitalContent, info):
         return (
             ProductVariantByIdLoader(info.context)
-            .load(root.product_variant_id)
+            .load_selected(root.product_variant_id, info)
             .then(lambda variant: ChannelContext(node=variant, channel_slug=None))
         )
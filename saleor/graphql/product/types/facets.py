@@ -0,0 +1,38 @@
+import graphene
+
+from ...attribute.dataloaders import AttributesByAttributeId, AttributeValueByIdLoader
+from ...attribute.types import Attribute, AttributeValue
+
+
+class ProductFacetValue(graphene.ObjectType):
+    value = graphene.Field(
+        AttributeValue, description="Value of the attribute.", required=True
+    )
+    count = graphene.Int(
+        description="Number of the products with the value.", required=True
+    )
+
+    class Meta:
+        description = "Represents the number of products with an attribute value."
+
+    @staticmethod
+    def resolve_value(root, info):
+        return AttributeValueByIdLoader(info.context).load(root["value_id"])
+
+
+class ProductFacet(graphene.ObjectType):
+    attribute = graphene.Field(
+        Attribute, description="Attribute of the products.", required=True
+    )
+    values = graphene.List(
+        graphene.NonNull(ProductFacetValue),
+        description="Values of the attribute with the number of products.",
+        required=True,
+    )
+
+    class Meta:
+        description = "Represents the number of products per value of an attribute."
+
+    @staticmethod
+    def resolve_attribute(root, info):
+        return AttributesByAttributeId(info.context).load(root["attribute_id"])
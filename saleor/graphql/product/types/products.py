@@ -3,7 +3,6 @@ from typing import Optional
 
 import graphene
 from django.conf import settings
-from django_countries.fields import Country
 from graphene import relay
 from graphene_federation import key
 
@@ -14,16 +13,11 @@ from ....core.permissions import (
     has_one_of_permissions,
 )
 from ....core.tracing import traced_resolver
-from ....core.utils import get_currency_for_country
 from ....core.weight import convert_weight_to_default_weight_unit
 from ....product import models
 from ....product.models import ALL_PRODUCTS_PERMISSIONS
 from ....product.product_images import get_product_image_thumbnail, get_thumbnail
 from ....product.utils import calculate_revenue_for_variant
-from ....product.utils.availability import (
-    get_product_availability,
-    get_variant_availability,
-)
 from ....product.utils.variants import get_variant_selection_attributes
 from ...account import types as account_types
 from ...account.enums import CountryCodeEnum
@@ -49,12 +43,15 @@ from ...decorators import (
     permission_required,
     staff_member_or_app_required,
 )
-from ...discount.dataloaders import DiscountsByDateTimeLoader
 from ...meta.types import ObjectWithMetadata
 from ...order.dataloaders import (
     OrderByIdLoader,
     OrderLinesByVariantIdAndChannelIdLoader,
 )
+from ...product.dataloaders.pricing import (
+    ProductAvailabilityByProductIdCountryCodeAndChannelSlugLoader,
+    VariantAvailabilityByVariantIdCountryCodeAndChannelSlugLoader,
+)
 from ...product.dataloaders.products import (
     AvailableProductVariantsByProductIdAndChannel,
     ProductVariantsByProductIdAndChannel,
@@ -93,9 +90,7 @@ from ..dataloaders import (
     SelectedAttributesByProductIdLoader,
     SelectedAttributesByProductVariantIdLoader,
     VariantAttributesByProductTypeIdLoader,
-    VariantChannelListingByVariantIdAndChannelSlugLoader,
     VariantChannelListingByVariantIdLoader,
-    VariantsChannelListingByProductIdAndChannelSlugLoader,
 )
 from ..enums import VariantAttributeScope
 from ..filters import ProductFilterInput
@@ -346,81 +341,22 @@ class ProductVariant(ChannelContextTypeWithMetadata, CountableDjangoObjectType):
         if not root.channel_slug:
             return None
 
-        channel_slug = str(root.channel_slug)
-        context = info.context
-
-        product = ProductByIdLoader(context).load(root.node.product_id)
-        product_channel_listing = ProductChannelListingByProductIdAndChannelSlugLoader(
-            context
-        ).load((root.node.product_id, channel_slug))
-        variant_channel_listing = VariantChannelListingByVariantIdAndChannelSlugLoader(
-            context
-        ).load((root.node.id, channel_slug))
-        collections = CollectionsByProductIdLoader(context).load(root.node.product_id)
-        channel = ChannelBySlugLoader(context).load(channel_slug)
-
-        address_country = address.country if address is not None else None
-
-        def calculate_pricing_info(discounts):
-            def calculate_pricing_with_channel(channel):
-                def calculate_pricing_with_product_variant_channel_listings(
-                    variant_channel_listing,
-                ):
-                    def calculate_pricing_with_product(product):
-                        def calculate_pricing_with_product_channel_listings(
-                            product_channel_listing,
-                        ):
-                            def calculate_pricing_with_collections(collections):
-                                if (
-                                    not variant_channel_listing
-                                    or not product_channel_listing
-                                ):
-                                    return None
-
-                                country_code = (
-                                    address_country or channel.default_country.code
-                                )
-
-                                local_currency = None
-                                local_currency = get_currency_for_country(country_code)
-
-                                availability = get_variant_availability(
-                                    variant=root.node,
-                                    variant_channel_listing=variant_channel_listing,
-                                    product=product,
-                                    product_channel_listing=product_channel_listing,
-                                    collections=collections,
-                                    discounts=discounts,
-                                    channel=channel,
-                                    country=Country(country_code),
-                                    local_currency=local_currency,
-                                    plugins=context.plugins,
-                                )
-                                return VariantPricingInfo(**asdict(availability))
-
-                            return collections.then(calculate_pricing_with_collections)
-
-                        return product_channel_listing.then(
-                            calculate_pricing_with_product_channel_listings
-                        )
-
-                    return product.then(calculate_pricing_with_product)
-
-                return variant_channel_listing.then(
-                    calculate_pricing_with_product_variant_channel_listings
-                )
-
-            return channel.then(calculate_pricing_with_channel)
-
+        country_code = address.country if address is not None else None
         return (
-            DiscountsByDateTimeLoader(context)
-            .load(info.context.request_time)
-            .then(calculate_pricing_info)
+            VariantAvailabilityByVariantIdCountryCodeAndChannelSlugLoader(info.context)
+            .load((root.node.id, country_code, str(root.channel_slug)))
+            .then(
+                lambda availability: VariantPricingInfo(**asdict(availability))
+                if availability
+                else None
+            )
         )
 
     @staticmethod
     def resolve_product(root: ChannelContext[models.ProductVariant], info):
-        product = ProductByIdLoader(info.context).load(root.node.product_id)
+        product = ProductByIdLoader(info.context).load_selected(
+            root.node.product_id, info
+        )
         return product.then(
             lambda product: ChannelContext(node=product, channel_slug=root.channel_slug)
         )
@@ -602,7 +538,7 @@ class Product(ChannelContextTypeWithMetadata, CountableDjangoObjectType):
 
         return (
             ProductVariantByIdLoader(info.context)
-            .load(default_variant_id)
+            .load_selected(default_variant_id, info)
             .then(return_default_variant_with_channel_context)
         )
 
@@ -657,74 +593,18 @@ class Product(ChannelContextTypeWithMetadata, CountableDjangoObjectType):
         if not root.channel_slug:
             return None
 
-        channel_slug = str(root.channel_slug)
-        context = info.context
-
-        product_channel_listing = ProductChannelListingByProductIdAndChannelSlugLoader(
-            context
-        ).load((root.node.id, channel_slug))
-        variants = ProductVariantsByProductIdLoader(context).load(root.node.id)
-        variants_channel_listing = (
-            VariantsChannelListingByProductIdAndChannelSlugLoader(context).load(
-                (root.node.id, channel_slug)
-            )
-        )
-        collections = CollectionsByProductIdLoader(context).load(root.node.id)
-        channel = ChannelBySlugLoader(context).load(channel_slug)
-
-        address_country = address.country if address is not None else None
-
-        def calculate_pricing_info(discounts):
-            def calculate_pricing_with_channel(channel):
-                def calculate_pricing_with_product_channel_listings(
-                    product_channel_listing,
-                ):
-                    def calculate_pricing_with_variants(variants):
-                        def calculate_pricing_with_variants_channel_listings(
-                            variants_channel_listing,
-                        ):
-                            def calculate_pricing_with_collections(collections):
-                                if not variants_channel_listing:
-                                    return None
-
-                                local_currency = None
-                                country_code = (
-                                    address_country or channel.default_country.code
-                                )
-                                local_currency = get_currency_for_country(country_code)
-
-                                availability = get_product_availability(
-                                    product=root.node,
-                                    product_channel_listing=product_channel_listing,
-                                    variants=variants,
-                                    variants_channel_listing=variants_channel_listing,
-                                    collections=collections,
-                                    discounts=discounts,
-                                    channel=channel,
-                                    manager=context.plugins,
-                                    country=Country(country_code),
-                                    local_currency=local_currency,
-                                )
-                                return ProductPricingInfo(**asdict(availability))
-
-                            return collections.then(calculate_pricing_with_collections)
-
-                        return variants_channel_listing.then(
-                            calculate_pricing_with_variants_channel_listings
-                        )
-
-                    return variants.then(calculate_pricing_with_variants)
-
-                return product_channel_listing.then(
-                    calculate_pricing_with_product_channel_listings
-                )
-
-            return channel.then(calculate_pricing_with_channel)
-
+        country_code = address.country if address is not None else None
+        if not root.node.get_deferred_fields():
+            # The pricing is calculated from the product the loader would fetch.
+            ProductByIdLoader(info.context).prime(root.node.id, root.node)
         return (
-            DiscountsByDateTimeLoader(context)
-            .load(info.context.request_time)
-            .then(calculate_pricing_info)
+            ProductAvailabilityByProductIdCountryCodeAndChannelSlugLoader(info.context)
+            .load((root.node.id, country_code, str(root.channel_slug)))
+            .then(
+                lambda availability: ProductPricingInfo(**asdict(availability))
+                if availability
+                else None
+            )
         )
 
     @staticmethod
@@ -8,6 +8,7 @@ from django.db.utils import IntegrityError
 from ...core.tracing import traced_atomic_transaction
 from ...order import OrderStatus
 from ...order import models as order_models
+from ...warehouse.availability import update_variants_channel_availability
 from ...warehouse.models import Stock
 
 if TYPE_CHECKING:
@@ -80,6 +81,7 @@ def create_stocks(
     except IntegrityError:
         msg = "Stock for one of warehouses already exists for this product variant."
         raise ValidationError(msg)
+    update_variants_channel_availability([variant.pk])
     return new_stocks
 
 
@@ -0,0 +1,192 @@
+"""Static analysis of the cost of GraphQL queries.
+
+The cost is the estimated number of fields resolved by the query. Each field
+costs one for every object it is resolved for: fields of connection nodes are
+resolved `first` or `last` times and fields of list items as many times as
+there are items estimated for the type of the list.
+"""
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set
+
+from django.conf import settings
+from graphql import GraphQLList
+from graphql.language import ast
+from graphql.type.definition import get_named_type, get_nullable_type
+from jwt.exceptions import PyJWTError
+
+from ..core.auth import get_token_from_request
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+    from graphql import GraphQLDocument
+
+# Estimated number of items of lists of the given types
+DEFAULT_LIST_SIZE = 10
+LIST_SIZE_ESTIMATES = {
+    "OrderLine": 20,
+    "Permission": 20,
+    "ProductVariant": 20,
+    "SelectedAttribute": 20,
+}
+
+
+def _get_argument_value(field: ast.Field, name: str, variables: Dict[str, Any]):
+    for argument in field.arguments or []:
+        if argument.name.value != name:
+            continue
+        if isinstance(argument.value, ast.Variable):
+            return variables.get(argument.value.name.value)
+        return getattr(argument.value, "value", None)
+    return None
+
+
+def _get_connection_size(field: ast.Field, variables: Dict[str, Any]) -> int:
+    for name in ["first", "last"]:
+        try:
+            return max(int(_get_argument_value(field, name, variables)), 0)
+        except (TypeError, ValueError):
+            continue
+    return settings.GRAPHENE["RELAY_CONNECTION_MAX_LIMIT"]
+
+
+def _is_connection(graphql_type) -> bool:
+    graphene_type = getattr(graphql_type, "graphene_type", None)
+    return getattr(getattr(graphene_type, "_meta", None), "node", None) is not None
+
+
+class QueryCostAnalyzer:
+    def __init__(self, document: "GraphQLDocument", variables: Optional[dict]):
+        self.schema = document.schema
+        self.variables = variables if isinstance(variables, dict) else {}
+        self.fragments = {}
+        self.operations = []
+        for definition in document.document_ast.definitions:
+            if isinstance(definition, ast.FragmentDefinition):
+                self.fragments[definition.name.value] = definition
+            elif isinstance(definition, ast.OperationDefinition):
+                self.operations.append(definition)
+
+    def get_operation(self, operation_name: Optional[str]):
+        if not operation_name:
+            return self.operations[0] if len(self.operations) == 1 else None
+        for operation in self.operations:
+            if operation.name and operation.name.value == operation_name:
+                return operation
+        return None
+
+    def get_root_type(self, operation: ast.OperationDefinition):
+        if operation.operation == "mutation":
+            return self.schema.get_mutation_type()
+        if operation.operation == "subscription":
+            return self.schema.get_subscription_type()
+        return self.schema.get_query_type()
+
+    def get_cost(self, operation_name: Optional[str]) -> int:
+        """Return the cost of the operation; invalid queries are priced partially.
+
+        The analysis runs before the query is validated, so unknown fields and
+        types are skipped and fragment cycles are not followed.
+        """
+        operation = self.get_operation(operation_name)
+        root_type = self.get_root_type(operation) if operation else None
+        if root_type is None:
+            return 0
+        return self.get_selection_set_cost(root_type, operation.selection_set, 1, set())
+
+    def get_selection_set_cost(
+        self,
+        parent_type,
+        selection_set: Optional[ast.SelectionSet],
+        multiplier: int,
+        visited_fragments: Set[str],
+    ) -> int:
+        if selection_set is None:
+            return 0
+        cost = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.Field):
+                cost += self.get_field_cost(
+                    parent_type, selection, multiplier, visited_fragments
+                )
+                continue
+
+            fragment_visited_fragments = visited_fragments
+            if isinstance(selection, ast.FragmentSpread):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is None or name in visited_fragments:
+                    continue
+                fragment_visited_fragments = visited_fragments | {name}
+            else:
+                fragment = selection
+            fragment_type = parent_type
+            if fragment.type_condition is not None:
+                fragment_type = self.schema.get_type(fragment.type_condition.name.value)
+            if fragment_type is not None:
+                cost += self.get_selection_set_cost(
+                    fragment_type,
+                    fragment.selection_set,
+                    multiplier,
+                    fragment_visited_fragments,
+                )
+        return cost
+
+    def get_field_cost(
+        self,
+        parent_type,
+        field: ast.Field,
+        multiplier: int,
+        visited_fragments: Set[str],
+    ) -> int:
+        fields = getattr(parent_type, "fields", None) or {}
+        field_def = fields.get(field.name.value)
+        if field_def is None:
+            return 0
+
+        return_type = field_def.type
+        named_type = get_named_type(return_type)
+        if _is_connection(named_type):
+            size = _get_connection_size(field, self.variables)
+        elif field.name.value == "edges" and _is_connection(parent_type):
+            # Edges are already counted by the size of their connection.
+            size = 1
+        elif isinstance(get_nullable_type(return_type), GraphQLList):
+            size = LIST_SIZE_ESTIMATES.get(named_type.name, DEFAULT_LIST_SIZE)
+        else:
+            size = 1
+
+        return multiplier + self.get_selection_set_cost(
+            named_type, field.selection_set, multiplier * size, visited_fragments
+        )
+
+
+def get_query_cost(
+    document: "GraphQLDocument",
+    variables: Optional[dict],
+    operation_name: Optional[str],
+) -> int:
+    return QueryCostAnalyzer(document, variables).get_cost(operation_name)
+
+
+def get_query_cost_limit(request: "HttpRequest") -> Optional[int]:
+    """Return the maximum cost of queries of the app or the user sending them.
+
+    A limit of 0, global or of the requestor, means queries are not limited.
+    """
+    default_limit = settings.GRAPHQL_QUERY_MAX_COST or None
+    auth_token = get_token_from_request(request)
+    if not auth_token:
+        return default_limit
+
+    # Imported here as the middleware module imports the views.
+    from .middleware import get_app, get_user
+
+    try:
+        requestor = get_app(auth_token) if len(auth_token) == 30 else None
+        requestor = requestor or get_user(request)
+    except PyJWTError:
+        # The token error is reported when the query is executed.
+        return default_limit
+    limit = getattr(requestor, "max_query_cost", None)
+    if limit is None:
+        return default_limit
+    return limit or None
@@ -1,4 +1,5 @@
 import graphene
+from django.contrib.sites.models import Site
 from django.core.exceptions import ValidationError
 
 from ...account import models as account_models
@@ -137,6 +138,8 @@ class ShopAddressUpdate(BaseMutation, I18nMixin):
         else:
             if site_settings.company_address:
                 site_settings.company_address.delete()
+        # the address is cached together with the site settings
+        Site.objects.clear_cache()
         return ShopAddressUpdate(shop=Shop())
 
 
@@ -1,6 +1,7 @@
 from collections import defaultdict
 
 from ...attribute import models as attribute_models
+from ...core.loader_cache import cache_results, get_model_tag, get_tag_versions
 from ...discount import models as discount_models
 from ...menu import models as menu_models
 from ...page import models as page_models
@@ -14,6 +15,61 @@ class BaseTranslationByIdAndLanguageCodeLoader(DataLoader):
     model = None
     relation_name = None
 
+    @classmethod
+    def get_translated_model(cls):
+        return cls.model._meta.get_field(cls.relation_name).related_model
+
+    @classmethod
+    def get_translation_tags(cls, object_id):
+        # Saving or deleting a translation invalidates the translated object, so
+        # missing translations are cached as well.
+        return [
+            get_model_tag(cls.model),
+            get_model_tag(cls.get_translated_model(), object_id),
+        ]
+
+    def get_shared_cache_tags(self, key):
+        object_id, _language_code = key
+        return self.get_translation_tags(object_id)
+
+    @classmethod
+    def warm_shared_cache(cls, language_code: str, chunk_size: int = 1000) -> int:
+        """Store translations of all translated objects in the shared cache.
+
+        Objects without a translation to the language are stored too. Return the
+        number of stored entries.
+        """
+        translated_model = cls.get_translated_model()
+        stored = 0
+        last_pk = 0
+        while True:
+            object_ids = list(
+                translated_model.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:chunk_size]
+            )
+            if not object_ids:
+                return stored
+            last_pk = object_ids[-1]
+            tags_by_key = {
+                (object_id, language_code): cls.get_translation_tags(object_id)
+                for object_id in object_ids
+            }
+            # Versions are read before the translations, like in the loaders.
+            tag_versions = get_tag_versions(
+                tag for tags in tags_by_key.values() for tag in tags
+            )
+            translations = {
+                getattr(translation, cls.relation_name): translation
+                for translation in cls.model.objects.filter(
+                    language_code=language_code,
+                    **{f"{cls.relation_name}__in": object_ids},
+                )
+            }
+            results = {key: translations.get(key[0]) for key in tags_by_key}
+            cache_results(cls.context_key, results, tags_by_key, tag_versions)
+            stored += len(results)
+
     def batch_load(self, keys):
         if not self.model:
             raise ValueError("Provide a model for this dataloader.")
@@ -44,6 +100,7 @@ class AttributeTranslationByIdAndLanguageCodeLoader(
 ):
     context_key = "attribute_translation_by_id_and_language_code"
     model = attribute_models.AttributeTranslation
+    shared_cache_model = attribute_models.AttributeTranslation
     relation_name = "attribute_id"
 
 
@@ -52,6 +109,7 @@ class AttributeValueTranslationByIdAndLanguageCodeLoader(
 ):
     context_key = "attribute_value_translation_by_id_and_language_code"
     model = attribute_models.AttributeValueTranslation
+    shared_cache_model = attribute_models.AttributeValueTranslation
     relation_name = "attribute_value_id"
 
 
@@ -60,6 +118,7 @@ class CategoryTranslationByIdAndLanguageCodeLoader(
 ):
     context_key = "category_translation_by_id_and_language_code"
     model = product_models.CategoryTranslation
+    shared_cache_model = product_models.CategoryTranslation
     relation_name = "category_id"
 
 
@@ -68,6 +127,7 @@ class CollectionTranslationByIdAndLanguageCodeLoader(
 ):
     context_key = "collection_translation_by_id_and_language_code"
     model = product_models.CollectionTranslation
+    shared_cache_model = product_models.CollectionTranslation
     relation_name = "collection_id"
 
 
@@ -76,6 +136,7 @@ class MenuItemTranslationByIdAndLanguageCodeLoader(
 ):
     context_key = "menu_item_translation_by_id_and_language_code"
     model = menu_models.MenuItemTranslation
+    shared_cache_model = menu_models.MenuItemTranslation
     relation_name = "menu_item_id"
 
 
@@ -92,6 +153,7 @@ class ProductTranslationByIdAndLanguageCodeLoader(
 ):
     context_key = "product_translation_by_id_and_language_code"
     model = product_models.ProductTranslation
+    shared_cache_model = product_models.ProductTranslation
     relation_name = "product_id"
 
 
@@ -100,6 +162,7 @@ class ProductVariantTranslationByIdAndLanguageCodeLoader(
 ):
     context_key = "product_variant_translation_by_id_and_language_code"
     model = product_models.ProductVariantTranslation
+    shared_cache_model = product_models.ProductVariantTranslation
     relation_name = "product_variant_id"
 
 
@@ -133,3 +196,15 @@ class VoucherTranslationByIdAndLanguageCodeLoader(
     context_key = "voucher_translation_by_id_and_language_code"
     model = discount_models.VoucherTranslation
     relation_name = "voucher_id"
+
+
+def warm_translations_cache(language_code: str) -> int:
+    """Store translations of the language of all cached models in the shared cache.
+
+    Return the number of stored entries.
+    """
+    return sum(
+        loader.warm_shared_cache(language_code)
+        for loader in BaseTranslationByIdAndLanguageCodeLoader.__subclasses__()
+        if loader.shared_cache_model
+    )
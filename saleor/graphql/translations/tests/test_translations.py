@@ -4,12 +4,16 @@ from unittest.mock import patch
 import graphene
 import pytest
 from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from ....tests.utils import dummy_editorjs
 from ....webhook.event_types import WebhookEventType
 from ....webhook.payloads import generate_translation_payload
 from ...core.enums import LanguageCodeEnum
 from ...tests.utils import assert_no_permission, get_graphql_content
+from ..dataloaders import warm_translations_cache
 from ..schema import TranslatableKinds
 
 
@@ -50,6 +54,79 @@ def test_product_translation(user_api_client, product, channel_USD):
     )
 
 
+QUERY_PRODUCTS_TRANSLATION = """
+    query products($channel: String) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    translation(languageCode: PL) {
+                        name
+                    }
+                    category {
+                        translation(languageCode: PL) {
+                            name
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def test_products_translation_cached(
+    settings, user_api_client, product_list, channel_USD
+):
+    # given
+    settings.LOADER_CACHE_ENABLED = True
+    cache.clear()
+    translation = product_list[0].translations.create(language_code="pl", name="A")
+    variables = {"channel": channel_USD.slug}
+    user_api_client.post_graphql(QUERY_PRODUCTS_TRANSLATION, variables)
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        response = user_api_client.post_graphql(QUERY_PRODUCTS_TRANSLATION, variables)
+
+    # then
+    content = get_graphql_content(response)
+    edges = content["data"]["products"]["edges"]
+    assert {"name": "A"} in [edge["node"]["translation"] for edge in edges]
+    assert all(edge["node"]["category"]["translation"] is None for edge in edges)
+    assert not any("translation" in query["sql"] for query in ctx.captured_queries)
+
+    # when
+    translation.name = "B"
+    translation.save(update_fields=["name"])
+    response = user_api_client.post_graphql(QUERY_PRODUCTS_TRANSLATION, variables)
+
+    # then
+    edges = get_graphql_content(response)["data"]["products"]["edges"]
+    assert {"name": "B"} in [edge["node"]["translation"] for edge in edges]
+
+
+def test_products_translation_cache_warmed(
+    settings, user_api_client, product_list, channel_USD
+):
+    # given
+    settings.LOADER_CACHE_ENABLED = True
+    cache.clear()
+    product_list[0].translations.create(language_code="pl", name="A")
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    warm_translations_cache("pl")
+    with CaptureQueriesContext(connection) as ctx:
+        response = user_api_client.post_graphql(QUERY_PRODUCTS_TRANSLATION, variables)
+
+    # then
+    content = get_graphql_content(response)
+    edges = content["data"]["products"]["edges"]
+    assert {"name": "A"} in [edge["node"]["translation"] for edge in edges]
+    assert all(edge["node"]["category"]["translation"] is None for edge in edges)
+    assert not any("translation" in query["sql"] for query in ctx.captured_queries)
+
+
 def test_product_translation_without_description(user_api_client, product, channel_USD):
     product.translations.create(language_code="pl", name="Produkt")
 
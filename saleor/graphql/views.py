@@ -2,7 +2,9 @@ import fnmatch
 import hashlib
 import json
 import logging
+import time
 import traceback
+from contextlib import nullcontext
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import opentracing
@@ -25,8 +27,16 @@ from graphql.execution import ExecutionResult
 from jwt.exceptions import PyJWTError
 
 from .. import __version__ as saleor_version
+from ..core.auth import get_token_from_request
 from ..core.exceptions import PermissionDenied, ReadOnlyException
+from ..core.response_cache import (
+    cache_response,
+    get_cached_response,
+    get_response_cache_key,
+)
 from ..core.utils import is_valid_ipv4, is_valid_ipv6
+from .debug import QueryDebugger, is_debug_requested
+from .query_cost import get_query_cost, get_query_cost_limit
 
 API_PATH = SimpleLazyObject(lambda: reverse("api"))
 INT_ERROR_MSG = "Int cannot represent non 32-bit signed integer value"
@@ -197,6 +207,8 @@ class GraphQLView(View):
                 status_code = 400
             else:
                 response["data"] = execution_result.data
+            if execution_result.extensions:
+                response["extensions"] = execution_result.extensions
             result: Optional[Dict[str, List[Any]]] = response
         else:
             result = None
@@ -246,10 +258,24 @@ class GraphQLView(View):
                         raise GraphQLError(msg)
         return query_with_schema
 
+    @staticmethod
+    def should_cache_response(
+        request: HttpRequest, document: GraphQLDocument, operation_name: Optional[str]
+    ) -> bool:
+        """Return whether the response may be shared with other anonymous clients."""
+        return (
+            settings.RESPONSE_CACHE_ENABLED
+            and not get_token_from_request(request)
+            and document.get_operation_type(operation_name) == "query"
+        )
+
     def execute_graphql_request(self, request: HttpRequest, data: dict):
         with opentracing.global_tracer().start_active_span("graphql_query") as scope:
             span = scope.span
             span.set_tag(opentracing.tags.COMPONENT, "GraphQL")
+            # Tags of objects the response is resolved from, collected by
+            # `response_cache_middleware`; None when it is not cached.
+            request.response_cache_tags = None  # type: ignore
 
             query, variables, operation_name = self.get_graphql_params(request, data)
 
@@ -267,6 +293,42 @@ class GraphQLView(View):
                 except GraphQLError as e:
                     return ExecutionResult(errors=[e], invalid=True)
 
+                query_cost = get_query_cost(document, variables, operation_name)
+                query_cost_limit = get_query_cost_limit(request)
+                span.set_tag("graphql.query_cost", query_cost)
+                extensions = {
+                    "cost": {
+                        "requestedQueryCost": query_cost,
+                        "maximumAvailable": query_cost_limit,
+                    }
+                }
+                if query_cost_limit is not None and query_cost > query_cost_limit:
+                    e = GraphQLError(
+                        f"The query cost of {query_cost} exceeds the maximum of "
+                        f"{query_cost_limit}. Request fewer objects."
+                    )
+                    return ExecutionResult(
+                        errors=[e], invalid=True, extensions=extensions
+                    )
+                if not settings.GRAPHQL_QUERY_COST_IN_EXTENSIONS:
+                    extensions = {}
+
+                response_cache_key = None
+                if not query_contains_schema and self.should_cache_response(
+                    request, document, operation_name
+                ):
+                    response_cache_key = get_response_cache_key(
+                        raw_query_string, variables, operation_name
+                    )
+                    cached_data = get_cached_response(response_cache_key)
+                    span.set_tag("cache.hit", cached_data is not None)
+                    if cached_data is not None:
+                        return ExecutionResult(data=cached_data, extensions=extensions)
+                    request.response_cache_tags = set()  # type: ignore
+
+            query_debugger = QueryDebugger() if is_debug_requested(request) else None
+            request.query_debugger = query_debugger  # type: ignore
+
             extra_options: Dict[str, Optional[Any]] = {}
 
             if self.executor:
@@ -274,7 +336,12 @@ class GraphQLView(View):
                 # executor is not a valid argument in all backends
                 extra_options["executor"] = self.executor
             try:
-                with connection.execute_wrapper(tracing_wrapper):
+                capturing_queries = (
+                    query_debugger.capturing_queries()
+                    if query_debugger
+                    else nullcontext()
+                )
+                with connection.execute_wrapper(tracing_wrapper), capturing_queries:
                     response = None
                     should_use_cache_for_scheme = query_contains_schema & (
                         not settings.DEBUG
@@ -284,6 +351,7 @@ class GraphQLView(View):
                         response = cache.get(key)
 
                     if not response:
+                        started_at = time.time()
                         response = document.execute(  # type: ignore
                             root=self.get_root_value(),
                             variables=variables,
@@ -294,6 +362,18 @@ class GraphQLView(View):
                         )
                         if should_use_cache_for_scheme:
                             cache.set(key, response)
+                        tags = request.response_cache_tags  # type: ignore
+                        if (
+                            response_cache_key
+                            and tags is not None
+                            and not (response.errors)
+                        ):
+                            cache_response(
+                                response_cache_key, response.data, tags, started_at
+                            )
+                    response.extensions.update(extensions)
+                    if query_debugger:
+                        response.extensions["debug"] = query_debugger.get_extension()
                     return response
             except Exception as e:
                 span.set_tag(opentracing.tags.ERROR, True)
@@ -6,7 +6,12 @@ from django.conf import settings
 from django.db.models import Exists, OuterRef
 
 from ...channel.models import Channel
-from ...warehouse.models import ShippingZone, Stock, Warehouse
+from ...warehouse.models import (
+    ShippingZone,
+    Stock,
+    VariantChannelAvailability,
+    Warehouse,
+)
 from ..core.dataloaders import DataLoader
 
 CountryCode = Optional[str]
@@ -58,6 +63,47 @@ class AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
         country_code: Optional[CountryCode],
         channel_slug: Optional[str],
         variant_ids: Iterable[int],
+    ) -> Iterable[Tuple[int, int]]:
+        if not channel_slug:
+            return self.batch_load_quantities_from_stocks(
+                country_code, channel_slug, variant_ids
+            )
+
+        # Quantities of variants in the channel are precomputed by shipping zone.
+        availability = VariantChannelAvailability.objects.filter(
+            product_variant_id__in=variant_ids, channel__slug=channel_slug
+        )
+        if country_code:
+            availability = availability.filter(
+                shipping_zone__countries__contains=country_code
+            )
+        quantities_by_variant: DefaultDict[int, List[int]] = defaultdict(list)
+        for variant_id, quantity in availability.values_list(
+            "product_variant_id", "quantity_available"
+        ):
+            quantities_by_variant[variant_id].append(quantity)
+
+        quantity_map: DefaultDict[int, int] = defaultdict(int)
+        for variant_id, quantities in quantities_by_variant.items():
+            # Sum quantities from all shipping zones supporting the given country;
+            # when the country is unknown, return the highest known quantity.
+            quantity_map[variant_id] = (
+                sum(quantities) if country_code else max(quantities)
+            )
+
+        return [
+            (
+                variant_id,
+                min(quantity_map[variant_id], settings.MAX_CHECKOUT_LINE_QUANTITY),
+            )
+            for variant_id in variant_ids
+        ]
+
+    def batch_load_quantities_from_stocks(
+        self,
+        country_code: Optional[CountryCode],
+        channel_slug: Optional[str],
+        variant_ids: Iterable[int],
     ) -> Iterable[Tuple[int, int]]:
         # get stocks only for warehouses assigned to the shipping zones
         # that are available in the given channel
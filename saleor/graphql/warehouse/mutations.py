@@ -1,15 +1,29 @@
+from collections import defaultdict
+from typing import Dict, List, Tuple
+from uuid import UUID
+
 import graphene
 from django.core.exceptions import ValidationError
 from django.db import transaction
 
 from ...core.permissions import ProductPermissions
 from ...core.tracing import traced_atomic_transaction
+from ...product import models as product_models
+from ...product.error_codes import ProductErrorCode
 from ...warehouse import WarehouseClickAndCollectOption, models
+from ...warehouse.availability import update_variants_channel_availability
 from ...warehouse.error_codes import WarehouseErrorCode
+from ...warehouse.management import update_stocks_quantities
 from ...warehouse.validation import validate_warehouse_count  # type: ignore
 from ..account.i18n import I18nMixin
-from ..core.mutations import ModelDeleteMutation, ModelMutation
-from ..core.types.common import WarehouseError
+from ..core.descriptions import ADDED_IN_32
+from ..core.mutations import (
+    BaseMutation,
+    ModelDeleteMutation,
+    ModelMutation,
+    validation_error_to_error_type,
+)
+from ..core.types.common import BulkStockError, WarehouseError
 from ..core.utils import (
     validate_required_string_field,
     validate_slug_and_generate_if_needed,
@@ -193,7 +207,139 @@ class WarehouseDelete(ModelDeleteMutation):
         model_type = cls.get_type_for_model()
         instance = cls.get_node_or_error(info, node_id, only_type=model_type)
         stocks = (stock for stock in instance.stock_set.only("product_variant"))
+        variant_ids = list(
+            instance.stock_set.values_list("product_variant_id", flat=True)
+        )
         result = super(WarehouseDelete, cls).perform_mutation(_root, info, **data)
+        update_variants_channel_availability(variant_ids)
         for stock in stocks:
             transaction.on_commit(lambda: manager.product_variant_out_of_stock(stock))
         return result
+
+
+class StockBulkUpdateInput(graphene.InputObjectType):
+    sku = graphene.String(required=True, description="SKU of the product variant.")
+    warehouse = graphene.ID(required=True, description="ID of the warehouse.")
+    quantity = graphene.Int(
+        required=True, description="Quantity of items available for sell."
+    )
+
+
+class StockBulkUpdate(BaseMutation):
+    count = graphene.Int(
+        required=True, description="Returns how many stocks were updated."
+    )
+
+    class Arguments:
+        stocks = graphene.List(
+            graphene.NonNull(StockBulkUpdateInput),
+            required=True,
+            description="Input list of stock quantities to set.",
+        )
+
+    class Meta:
+        description = (
+            f"{ADDED_IN_32} Sets stock quantities of product variants addressed by "
+            "SKU. Missing stocks are created. Invalid input items are returned in "
+            "errors with their index and don't prevent updating the remaining stocks."
+        )
+        permissions = (ProductPermissions.MANAGE_PRODUCTS,)
+        error_type_class = BulkStockError
+
+    @classmethod
+    def add_error(cls, errors, field, msg, code, index):
+        errors[field].append(ValidationError(msg, code=code, params={"index": index}))
+
+    @classmethod
+    def get_warehouse_pks(cls, stocks_input, errors):
+        """Return existing warehouse pks for input items by their index."""
+        warehouse_pks = {}
+        for index, stock_input in enumerate(stocks_input):
+            try:
+                pk = cls.get_global_id_or_error(
+                    stock_input["warehouse"], only_type=Warehouse, field="warehouse"
+                )
+                warehouse_pks[index] = str(UUID(pk))
+            except (ValidationError, ValueError):
+                cls.add_error(
+                    errors,
+                    "warehouse",
+                    "Invalid warehouse ID.",
+                    ProductErrorCode.GRAPHQL_ERROR,
+                    index,
+                )
+        existing_pks = {
+            str(pk)
+            for pk in models.Warehouse.objects.filter(
+                pk__in=set(warehouse_pks.values())
+            ).values_list("pk", flat=True)
+        }
+        for index, pk in list(warehouse_pks.items()):
+            if pk not in existing_pks:
+                cls.add_error(
+                    errors,
+                    "warehouse",
+                    "Warehouse doesn't exist.",
+                    ProductErrorCode.NOT_FOUND,
+                    index,
+                )
+                del warehouse_pks[index]
+        return warehouse_pks
+
+    @classmethod
+    def perform_mutation(cls, _root, info, **data):
+        stocks_input = data["stocks"]
+        errors: Dict[str, List[ValidationError]] = defaultdict(list)
+
+        warehouse_pks = cls.get_warehouse_pks(stocks_input, errors)
+        variant_pks = dict(
+            product_models.ProductVariant.objects.filter(
+                sku__in={stock_input["sku"] for stock_input in stocks_input}
+            ).values_list("sku", "pk")
+        )
+
+        stocks_data = []
+        indexes_by_stock: Dict[Tuple[int, str], int] = {}
+        for index, stock_input in enumerate(stocks_input):
+            if stock_input["quantity"] < 0:
+                cls.add_error(
+                    errors,
+                    "quantity",
+                    "Quantity can't be negative.",
+                    ProductErrorCode.INVALID,
+                    index,
+                )
+                continue
+            variant_pk = variant_pks.get(stock_input["sku"])
+            if variant_pk is None:
+                cls.add_error(
+                    errors,
+                    "sku",
+                    f"Product variant with SKU {stock_input['sku']} doesn't exist.",
+                    ProductErrorCode.NOT_FOUND,
+                    index,
+                )
+                continue
+            warehouse_pk = warehouse_pks.get(index)
+            if warehouse_pk is None:
+                continue
+            if (variant_pk, warehouse_pk) in indexes_by_stock:
+                cls.add_error(
+                    errors,
+                    "sku",
+                    "Duplicated stock for the product variant and warehouse.",
+                    ProductErrorCode.DUPLICATED_INPUT_ITEM,
+                    index,
+                )
+                continue
+            indexes_by_stock[(variant_pk, warehouse_pk)] = index
+            stocks_data.append((variant_pk, warehouse_pk, stock_input["quantity"]))
+
+        count = update_stocks_quantities(stocks_data, info.context.plugins)
+        error_types = []
+        if errors:
+            error_types = validation_error_to_error_type(
+                ValidationError(errors), cls._meta.error_type_class
+            )
+            error_types.sort(key=lambda error: error.index)
+        return cls(count=count, errors=error_types)
@@ -10,6 +10,7 @@ from ..core.utils import from_global_id_or_error
 from ..decorators import one_of_permissions_required, permission_required
 from .filters import StockFilterInput, WarehouseFilterInput
 from .mutations import (
+    StockBulkUpdate,
     WarehouseCreate,
     WarehouseDelete,
     WarehouseShippingZoneAssign,
@@ -71,6 +72,8 @@ class WarehouseMutations(graphene.ObjectType):
     assign_warehouse_shipping_zone = WarehouseShippingZoneAssign.Field()
     unassign_warehouse_shipping_zone = WarehouseShippingZoneUnassign.Field()
 
+    stock_bulk_update = StockBulkUpdate.Field()
+
 
 class StockQueries(graphene.ObjectType):
     stock = graphene.Field(
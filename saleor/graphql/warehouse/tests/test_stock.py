@@ -1,6 +1,9 @@
+from unittest.mock import patch
+
 import graphene
 
 from ....core.permissions import ProductPermissions
+from ....product.error_codes import ProductErrorCode
 from ....warehouse.models import Stock, Warehouse
 from ....warehouse.tests.utils import get_quantity_allocated_for_stock
 from ...tests.utils import (
@@ -304,3 +307,135 @@ def test_stock_quantity_is_sum_of_quantities_from_warehouses_that_support_countr
     content = get_graphql_content(response)
 
     assert content["data"]["productVariant"]["quantityAvailable"] == sum_quantities
+
+
+STOCK_BULK_UPDATE_MUTATION = """
+    mutation StockBulkUpdate($stocks: [StockBulkUpdateInput!]!) {
+        stockBulkUpdate(stocks: $stocks) {
+            count
+            errors {
+                field
+                code
+                index
+            }
+        }
+    }
+"""
+
+
+@patch("saleor.plugins.manager.PluginsManager.product_variant_back_in_stock")
+def test_stock_bulk_update(
+    back_in_stock_webhook_mock,
+    staff_api_client,
+    permission_manage_products,
+    variant_with_many_stocks,
+    warehouse,
+):
+    # given
+    variant = variant_with_many_stocks
+    first_stock, second_stock = variant.stocks.all()
+    variables = {
+        "stocks": [
+            {
+                "sku": variant.sku,
+                "warehouse": graphene.Node.to_global_id(
+                    "Warehouse", first_stock.warehouse_id
+                ),
+                "quantity": 7,
+            },
+            {
+                "sku": variant.sku,
+                "warehouse": graphene.Node.to_global_id("Warehouse", warehouse.pk),
+                "quantity": 2,
+            },
+        ]
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        STOCK_BULK_UPDATE_MUTATION,
+        variables,
+        permissions=[permission_manage_products],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["stockBulkUpdate"]
+    assert not data["errors"]
+    assert data["count"] == 2
+    first_stock.refresh_from_db()
+    assert first_stock.quantity == 7
+    new_stock = variant.stocks.get(warehouse=warehouse)
+    assert new_stock.quantity == 2
+    back_in_stock_webhook_mock.assert_called_once_with(new_stock)
+
+
+def test_stock_bulk_update_returns_errors_by_index(
+    staff_api_client, permission_manage_products, variant_with_many_stocks
+):
+    # given
+    variant = variant_with_many_stocks
+    first_stock, second_stock = variant.stocks.all()
+    warehouse_id = graphene.Node.to_global_id("Warehouse", first_stock.warehouse_id)
+    variables = {
+        "stocks": [
+            {"sku": "not-existing", "warehouse": warehouse_id, "quantity": 1},
+            {"sku": variant.sku, "warehouse": warehouse_id, "quantity": 9},
+            {"sku": variant.sku, "warehouse": warehouse_id, "quantity": 8},
+            {
+                "sku": variant.sku,
+                "warehouse": graphene.Node.to_global_id(
+                    "Warehouse", second_stock.warehouse_id
+                ),
+                "quantity": -1,
+            },
+        ]
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        STOCK_BULK_UPDATE_MUTATION,
+        variables,
+        permissions=[permission_manage_products],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["stockBulkUpdate"]
+    assert data["count"] == 1
+    assert data["errors"] == [
+        {"field": "sku", "code": ProductErrorCode.NOT_FOUND.name, "index": 0},
+        {
+            "field": "sku",
+            "code": ProductErrorCode.DUPLICATED_INPUT_ITEM.name,
+            "index": 2,
+        },
+        {"field": "quantity", "code": ProductErrorCode.INVALID.name, "index": 3},
+    ]
+    first_stock.refresh_from_db()
+    assert first_stock.quantity == 9
+
+
+def test_stock_bulk_update_by_user_without_permissions(
+    staff_api_client, variant_with_many_stocks
+):
+    # given
+    variant = variant_with_many_stocks
+    stock = variant.stocks.first()
+    variables = {
+        "stocks": [
+            {
+                "sku": variant.sku,
+                "warehouse": graphene.Node.to_global_id(
+                    "Warehouse", stock.warehouse_id
+                ),
+                "quantity": 1,
+            }
+        ]
+    }
+
+    # when
+    response = staff_api_client.post_graphql(STOCK_BULK_UPDATE_MUTATION, variables)
+
+    # then
+    assert_no_permission(response)
@@ -39,11 +39,13 @@ class OrderOrigin:
     CHECKOUT = "checkout"  # order created from checkout
     DRAFT = "draft"  # order created from draft order
     REISSUE = "reissue"  # order created from reissue existing one
+    BULK_CREATE = "bulk_create"  # order imported with the bulk create
 
     CHOICES = [
         (CHECKOUT, "Checkout"),
         (DRAFT, "Draft"),
         (REISSUE, "Reissue"),
+        (BULK_CREATE, "Bulk create"),
     ]
 
 
@@ -205,6 +207,22 @@ class OrderEventsEmails:
     ]
 
 
+class OrderOutboxEventType:
+    """The order side effects deferred to the outbox dispatcher."""
+
+    ORDER_CREATED = "order_created"
+    ORDER_CONFIRMED = "order_confirmed"
+    ORDER_FULLY_PAID = "order_fully_paid"
+    ORDER_FULFILLED = "order_fulfilled"
+
+    CHOICES = [
+        (ORDER_CREATED, "Order created"),
+        (ORDER_CONFIRMED, "Order confirmed"),
+        (ORDER_FULLY_PAID, "Order fully paid"),
+        (ORDER_FULFILLED, "Order fulfilled"),
+    ]
+
+
 @dataclass
 class OrderLineData:
     line: "OrderLine"
@@ -4,15 +4,18 @@ from copy import deepcopy
 from decimal import Decimal
 from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
+from django.conf import settings
 from django.contrib.sites.models import Site
 from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import Max
 
 from ..account.models import User
 from ..core import analytics
 from ..core.exceptions import AllocationError, InsufficientStock, InsufficientStockData
 from ..core.tracing import traced_atomic_transaction
 from ..core.transactions import transaction_with_commit_on_errors
+from ..core.utils.validators import user_is_valid
 from ..payment import (
     ChargeStatus,
     CustomPaymentChoices,
@@ -26,14 +29,16 @@ from ..warehouse.management import (
     deallocate_stock,
     deallocate_stock_for_order,
     decrease_stock,
+    decrease_stock_for_orders,
     get_order_lines_with_track_inventory,
 )
-from ..warehouse.models import Stock
+from ..warehouse.models import Stock, Warehouse
 from . import (
     FulfillmentLineData,
     FulfillmentStatus,
     OrderLineData,
     OrderOrigin,
+    OrderOutboxEventType,
     OrderStatus,
     events,
     utils,
@@ -46,7 +51,7 @@ from .events import (
     order_replacement_created,
     order_returned_event,
 )
-from .models import Fulfillment, FulfillmentLine, Order, OrderLine
+from .models import Fulfillment, FulfillmentLine, Order, OrderLine, OrderOutboxEvent
 from .notifications import (
     send_fulfillment_confirmation_to_customer,
     send_order_canceled_confirmation,
@@ -54,6 +59,7 @@ from .notifications import (
     send_order_refunded_confirmation,
     send_payment_confirmation,
 )
+from .tasks import send_fulfillments_notifications_task
 from .utils import (
     order_line_needs_automatic_fulfillment,
     recalculate_order,
@@ -64,7 +70,6 @@ from .utils import (
 if TYPE_CHECKING:
     from ..app.models import App
     from ..plugins.manager import PluginsManager
-    from ..warehouse.models import Warehouse
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +78,22 @@ OrderLineIDType = int
 QuantityType = int
 
 
+def _add_outbox_event(
+    order: "Order",
+    event_type: str,
+    user: Optional["User"],
+    app: Optional["App"],
+    **parameters,
+):
+    OrderOutboxEvent.objects.create(
+        order=order,
+        type=event_type,
+        user=user if user_is_valid(user) else None,
+        app=app,
+        parameters=parameters,
+    )
+
+
 def order_created(
     order: "Order",
     user: "User",
@@ -81,6 +102,18 @@ def order_created(
     from_draft: bool = False,
 ):
     events.order_created_event(order=order, user=user, app=app, from_draft=from_draft)
+    if settings.ORDER_OUTBOX_ENABLED:
+        _add_outbox_event(order, OrderOutboxEventType.ORDER_CREATED, user, app)
+        return
+    process_order_created(order, user, app, manager)
+
+
+def process_order_created(
+    order: "Order",
+    user: Optional["User"],
+    app: Optional["App"],
+    manager: "PluginsManager",
+):
     manager.order_created(order)
     payment = order.get_last_payment()
     if payment:
@@ -119,6 +152,25 @@ def order_confirmed(
     Trigger event, plugin hooks and optionally confirmation email.
     """
     events.order_confirmed_event(order=order, user=user, app=app)
+    if settings.ORDER_OUTBOX_ENABLED:
+        _add_outbox_event(
+            order,
+            OrderOutboxEventType.ORDER_CONFIRMED,
+            user,
+            app,
+            send_confirmation_email=send_confirmation_email,
+        )
+        return
+    process_order_confirmed(order, user, app, manager, send_confirmation_email)
+
+
+def process_order_confirmed(
+    order: "Order",
+    user: Optional["User"],
+    app: Optional["App"],
+    manager: "PluginsManager",
+    send_confirmation_email: bool = False,
+):
     manager.order_confirmed(order)
     if send_confirmation_email:
         send_order_confirmed(order, user, app, manager)
@@ -131,11 +183,23 @@ def handle_fully_paid_order(
     app: Optional["App"] = None,
 ):
     events.order_fully_paid_event(order=order, user=user, app=app)
+    # fulfilling the digital lines changes the order, so it is never deferred
+    if order.get_customer_email() and utils.order_needs_automatic_fulfillment(order):
+        automatically_fulfill_digital_lines(order, manager)
+    if settings.ORDER_OUTBOX_ENABLED:
+        _add_outbox_event(order, OrderOutboxEventType.ORDER_FULLY_PAID, user, app)
+        return
+    process_order_fully_paid(order, user, app, manager)
+
+
+def process_order_fully_paid(
+    order: "Order",
+    user: Optional["User"],
+    app: Optional["App"],
+    manager: "PluginsManager",
+):
     if order.get_customer_email():
         send_payment_confirmation(order, manager)
-
-        if utils.order_needs_automatic_fulfillment(order):
-            automatically_fulfill_digital_lines(order, manager)
     try:
         analytics.report_order(order.tracking_client_id, order)
     except Exception:
@@ -221,6 +285,16 @@ def order_fulfilled(
     events.fulfillment_fulfilled_items_event(
         order=order, user=user, app=app, fulfillment_lines=fulfillment_lines
     )
+    if settings.ORDER_OUTBOX_ENABLED:
+        _add_outbox_event(
+            order,
+            OrderOutboxEventType.ORDER_FULFILLED,
+            user,
+            app,
+            fulfillment_ids=[fulfillment.pk for fulfillment in fulfillments],
+            notify_customer=notify_customer,
+        )
+        return
     transaction.on_commit(lambda: manager.order_updated(order))
 
     for fulfillment in fulfillments:
@@ -236,6 +310,27 @@ def order_fulfilled(
             )
 
 
+def process_order_fulfilled(
+    order: "Order",
+    user: Optional["User"],
+    app: Optional["App"],
+    manager: "PluginsManager",
+    fulfillment_ids: List[int],
+    notify_customer: bool = True,
+):
+    fulfillments = order.fulfillments.filter(pk__in=fulfillment_ids).order_by("pk")
+    manager.order_updated(order)
+    for fulfillment in fulfillments:
+        manager.fulfillment_created(fulfillment)
+    if order.status == OrderStatus.FULFILLED:
+        manager.order_fulfilled(order)
+    if notify_customer:
+        for fulfillment in fulfillments:
+            send_fulfillment_confirmation_to_customer(
+                order, fulfillment, user, app, manager
+            )
+
+
 @traced_atomic_transaction()
 def order_awaits_fulfillment_approval(
     fulfillments: List["Fulfillment"],
@@ -672,6 +767,12 @@ def create_fulfillments(
         )
 
     FulfillmentLine.objects.bulk_create(fulfillment_lines)
+    if approved and settings.ORDER_OUTBOX_ENABLED:
+        # the outbox row must be stored in the transaction of the fulfillments
+        order_fulfilled(
+            fulfillments, user, app, fulfillment_lines, manager, notify_customer
+        )
+        return fulfillments
     post_creation_func = (
         order_fulfilled if approved else order_awaits_fulfillment_approval
     )
@@ -688,6 +789,199 @@ def create_fulfillments(
     return fulfillments
 
 
+@traced_atomic_transaction()
+def create_fulfillments_for_orders(
+    user: Optional["User"],
+    app: Optional["App"],
+    fulfillment_lines_for_orders: List[Tuple["Order", Dict]],
+    manager: "PluginsManager",
+    notify_customer: bool = True,
+    approved: bool = True,
+) -> Tuple[Dict[int, List[Fulfillment]], Dict[int, InsufficientStock]]:
+    """Fulfill many orders at once.
+
+    Stocks of all orders are locked and decreased in a single pass; fulfillments,
+    their lines and order events are created with bulk inserts. An order that
+    can't be fulfilled is skipped without affecting the others.
+    Plugins and customers are notified by a single background task
+    after the transaction is committed.
+
+    Args:
+        user (User): User who trigger this action.
+        app (App): App that trigger the action.
+        fulfillment_lines_for_orders (List): List of orders with information from
+            which system create fulfillments, in the same format as
+            `fulfillment_lines_for_warehouses` of `create_fulfillments`. Example:
+                [
+                    (
+                        (Order),
+                        {(Warehouse.pk): [{"order_line": (OrderLine), ...}]},
+                    ),
+                    ...
+                ]
+        manager (PluginsManager): Base manager for handling plugins logic.
+        notify_customer (bool): If `True` system send email about
+            fulfillments to customers.
+        approved (Boolean): fulfillments will have status fulfilled if it's True,
+            otherwise waiting_for_approval.
+
+    Return:
+        Tuple with created fulfillments by order pk and `InsufficientStock`
+        errors by order pk for orders that weren't fulfilled.
+
+    """
+    channel_ids = {order.channel_id for order, _ in fulfillment_lines_for_orders}
+    channel_warehouses: Dict[int, set] = defaultdict(set)
+    for channel_id, warehouse_pk in Warehouse.objects.filter(
+        shipping_zones__channels__in=channel_ids
+    ).values_list("shipping_zones__channels", "pk"):
+        channel_warehouses[channel_id].add(str(warehouse_pk))
+
+    variant_ids = set()
+    warehouse_pks = set()
+    for _, lines_for_warehouses in fulfillment_lines_for_orders:
+        for warehouse_pk, lines_data in lines_for_warehouses.items():
+            warehouse_pks.add(warehouse_pk)
+            variant_ids.update(
+                line_data["order_line"].variant_id for line_data in lines_data
+            )
+    variant_and_warehouse_to_stock = {
+        (stock.product_variant_id, str(stock.warehouse_id)): stock
+        for stock in Stock.objects.filter(
+            product_variant_id__in=variant_ids, warehouse_id__in=warehouse_pks
+        )
+    }
+
+    errors: Dict[int, InsufficientStock] = {}
+    lines_info_for_orders: Dict[int, List[OrderLineData]] = {}
+    for order, lines_for_warehouses in fulfillment_lines_for_orders:
+        insufficient_stocks = []
+        lines_info = []
+        for warehouse_pk, lines_data in lines_for_warehouses.items():
+            for line_data in lines_data:
+                order_line = line_data["order_line"]
+                stock = variant_and_warehouse_to_stock.get(
+                    (order_line.variant_id, str(warehouse_pk))
+                )
+                if (
+                    stock is None
+                    or str(warehouse_pk) not in channel_warehouses[order.channel_id]
+                ):
+                    insufficient_stocks.append(
+                        InsufficientStockData(
+                            variant=order_line.variant,
+                            order_line=order_line,
+                            warehouse_pk=warehouse_pk,
+                        )
+                    )
+                    continue
+                line_data["stock"] = stock
+                lines_info.append(
+                    OrderLineData(
+                        line=order_line,
+                        quantity=line_data["quantity"],
+                        variant=order_line.variant,
+                        warehouse_pk=warehouse_pk,
+                    )
+                )
+        if insufficient_stocks:
+            errors[order.pk] = InsufficientStock(insufficient_stocks)
+        else:
+            lines_info_for_orders[order.pk] = lines_info
+
+    if approved:
+        errors.update(
+            decrease_stock_for_orders(
+                {
+                    order_pk: get_order_lines_with_track_inventory(lines_info)
+                    for order_pk, lines_info in lines_info_for_orders.items()
+                },
+                manager,
+            )
+        )
+
+    orders_to_fulfill = [
+        (order, lines_for_warehouses)
+        for order, lines_for_warehouses in fulfillment_lines_for_orders
+        if order.pk not in errors
+    ]
+    if not orders_to_fulfill:
+        return {}, errors
+
+    max_fulfillment_order_for_orders = dict(
+        Fulfillment.objects.filter(order__in=[order for order, _ in orders_to_fulfill])
+        .values("order")
+        .annotate(max_fulfillment_order=Max("fulfillment_order"))
+        .values_list("order", "max_fulfillment_order")
+    )
+    status = (
+        FulfillmentStatus.FULFILLED
+        if approved
+        else FulfillmentStatus.WAITING_FOR_APPROVAL
+    )
+    fulfillments_with_lines_data = []
+    for order, lines_for_warehouses in orders_to_fulfill:
+        fulfillment_order = max_fulfillment_order_for_orders.get(order.pk) or 0
+        for lines_data in lines_for_warehouses.values():
+            fulfillment_order += 1
+            fulfillment = Fulfillment(
+                order=order, status=status, fulfillment_order=fulfillment_order
+            )
+            fulfillments_with_lines_data.append((fulfillment, lines_data))
+    Fulfillment.objects.bulk_create(
+        [fulfillment for fulfillment, _ in fulfillments_with_lines_data]
+    )
+
+    fulfillments: Dict[int, List[Fulfillment]] = defaultdict(list)
+    fulfillment_lines: Dict[int, List[FulfillmentLine]] = defaultdict(list)
+    order_lines_to_update = []
+    for fulfillment, lines_data in fulfillments_with_lines_data:
+        fulfillments[fulfillment.order_id].append(fulfillment)
+        for line_data in lines_data:
+            order_line = line_data["order_line"]
+            if order_line.is_digital:
+                order_line.variant.digital_content.urls.create(line=order_line)
+            fulfillment_lines[fulfillment.order_id].append(
+                FulfillmentLine(
+                    order_line=order_line,
+                    fulfillment=fulfillment,
+                    quantity=line_data["quantity"],
+                    stock=line_data["stock"],
+                )
+            )
+            if approved:
+                order_line.quantity_fulfilled += line_data["quantity"]
+                order_lines_to_update.append(order_line)
+    FulfillmentLine.objects.bulk_create(
+        [line for lines in fulfillment_lines.values() for line in lines]
+    )
+    OrderLine.objects.bulk_update(order_lines_to_update, ["quantity_fulfilled"])
+
+    events.fulfillment_items_events_for_orders(
+        fulfillment_lines_for_orders=[
+            (order, fulfillment_lines[order.pk]) for order, _ in orders_to_fulfill
+        ],
+        user=user,
+        app=app,
+        approved=approved,
+    )
+    for order, _ in orders_to_fulfill:
+        update_order_status(order)
+
+    fulfillment_ids = [
+        fulfillment.pk for fulfillment, _ in fulfillments_with_lines_data
+    ]
+    transaction.on_commit(
+        lambda: send_fulfillments_notifications_task.delay(
+            fulfillment_ids,
+            user_id=user.pk if user_is_valid(user) else None,  # type: ignore
+            app_id=app.pk if app else None,
+            notify_customer=notify_customer,
+        )
+    )
+    return dict(fulfillments), errors
+
+
 def _get_fulfillment_line_if_exists(
     fulfillment_lines: List[FulfillmentLine], order_line_id, stock_id=None
 ):
@@ -0,0 +1,251 @@
+"""Import of already priced orders in bulk.
+
+Orders created here skip price recalculation, plugin hooks and per-order stock
+allocation; rows of all orders are written with bulk inserts in a single
+transaction. It is meant for migrating historical orders and ingesting orders
+placed in external sales channels.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from prices import TaxedMoney
+
+from ..account.models import Address
+from ..core.exceptions import InsufficientStock
+from ..core.taxes import zero_taxed_money
+from ..core.tracing import traced_atomic_transaction
+from ..core.utils.validators import user_is_valid
+from ..payment.models import Payment
+from ..warehouse.availability import update_variants_channel_availability
+from ..warehouse.management import allocate_stocks_for_orders
+from ..warehouse.models import Allocation
+from . import OrderEvents, OrderLineData, OrderOrigin, OrderStatus
+from .models import Order, OrderEvent, OrderLine
+from .tasks import send_order_created_notifications_task
+
+if TYPE_CHECKING:
+    from ..account.models import User
+    from ..app.models import App
+    from ..channel.models import Channel
+    from ..product.models import ProductVariant
+
+
+BULK_CREATE_BATCH_SIZE = 500
+
+
+@dataclass
+class OrderLineBulkData:
+    variant: Optional["ProductVariant"]
+    product_name: str
+    variant_name: str
+    product_sku: str
+    is_shipping_required: bool
+    quantity: int
+    unit_price: TaxedMoney
+    undiscounted_unit_price: TaxedMoney
+    tax_rate: Decimal = Decimal("0.0")
+
+
+@dataclass
+class PaymentBulkData:
+    gateway: str
+    total: Decimal
+    captured_amount: Decimal
+    charge_status: str
+    psp_reference: Optional[str] = None
+
+
+@dataclass
+class OrderBulkData:
+    channel: "Channel"
+    billing_address: Address
+    lines: List[OrderLineBulkData]
+    status: str = OrderStatus.UNFULFILLED
+    created: Optional[datetime] = None
+    user: Optional["User"] = None
+    user_email: str = ""
+    shipping_address: Optional[Address] = None
+    shipping_method_name: Optional[str] = None
+    shipping_price: Optional[TaxedMoney] = None
+    shipping_tax_rate: Decimal = Decimal("0.0")
+    customer_note: str = ""
+    language_code: str = settings.LANGUAGE_CODE
+    metadata: Dict[str, str] = field(default_factory=dict)
+    payments: List[PaymentBulkData] = field(default_factory=list)
+
+
+def _prepare_order(
+    order_data: OrderBulkData,
+) -> Tuple[Order, List[OrderLine], List[Payment]]:
+    """Return unsaved order with its lines and payments."""
+    currency = order_data.channel.currency_code
+    lines = []
+    subtotal = zero_taxed_money(currency)
+    undiscounted_subtotal = zero_taxed_money(currency)
+    for line_data in order_data.lines:
+        total_price = line_data.unit_price * line_data.quantity
+        undiscounted_total_price = (
+            line_data.undiscounted_unit_price * line_data.quantity
+        )
+        subtotal += total_price
+        undiscounted_subtotal += undiscounted_total_price
+        lines.append(
+            OrderLine(
+                variant=line_data.variant,
+                product_name=line_data.product_name,
+                variant_name=line_data.variant_name,
+                product_sku=line_data.product_sku,
+                is_shipping_required=line_data.is_shipping_required,
+                quantity=line_data.quantity,
+                currency=currency,
+                unit_price=line_data.unit_price,
+                total_price=total_price,
+                undiscounted_unit_price=line_data.undiscounted_unit_price,
+                undiscounted_total_price=undiscounted_total_price,
+                tax_rate=line_data.tax_rate,
+            )
+        )
+    shipping_price = order_data.shipping_price or zero_taxed_money(currency)
+    payments = [
+        Payment(
+            gateway=payment_data.gateway,
+            psp_reference=payment_data.psp_reference,
+            total=payment_data.total,
+            captured_amount=payment_data.captured_amount,
+            charge_status=payment_data.charge_status,
+            currency=currency,
+            billing_email=order_data.user_email,
+        )
+        for payment_data in order_data.payments
+    ]
+    order = Order(
+        created=order_data.created or timezone.now(),
+        status=order_data.status,
+        origin=OrderOrigin.BULK_CREATE,
+        channel=order_data.channel,
+        currency=currency,
+        token=str(uuid4()),
+        user=order_data.user,
+        user_email=order_data.user_email,
+        language_code=order_data.language_code,
+        customer_note=order_data.customer_note,
+        shipping_method_name=order_data.shipping_method_name,
+        shipping_price=shipping_price,
+        shipping_tax_rate=order_data.shipping_tax_rate,
+        total=subtotal + shipping_price,
+        undiscounted_total=undiscounted_subtotal + shipping_price,
+        total_paid_amount=sum(
+            [payment.captured_amount for payment in payments], Decimal(0)
+        ),
+        metadata=order_data.metadata,
+    )
+    return order, lines, payments
+
+
+@traced_atomic_transaction()
+def create_orders_in_bulk(
+    orders_data: List[OrderBulkData],
+    user: Optional["User"],
+    app: Optional["App"],
+    allocate_stock: bool = True,
+    notify: bool = True,
+) -> Tuple[Dict[int, Order], Dict[int, InsufficientStock]]:
+    """Create already priced orders with bulk inserts.
+
+    Prices and totals are taken as given and aren't recalculated by plugins.
+    When `allocate_stock` is set, stocks for all orders are allocated at once and
+    orders without enough stock are skipped. When `notify` is set, plugins are
+    notified about created orders by a single background task after
+    the transaction is committed.
+
+    Return created orders and `InsufficientStock` errors, both by the index
+    of the order in `orders_data`.
+    """
+    prepared_orders = [_prepare_order(order_data) for order_data in orders_data]
+
+    allocations_for_orders: List[List[Allocation]] = [[] for _ in orders_data]
+    errors: Dict[int, InsufficientStock] = {}
+    if allocate_stock:
+        order_lines_info_for_orders = []
+        for order_data, (order, lines, _) in zip(orders_data, prepared_orders):
+            lines_info = []
+            if order.status != OrderStatus.CANCELED:
+                lines_info = [
+                    OrderLineData(line=line, quantity=line.quantity, variant=variant)
+                    for line, variant in zip(
+                        lines, [line_data.variant for line_data in order_data.lines]
+                    )
+                    if variant
+                ]
+            address = order_data.shipping_address or order_data.billing_address
+            order_lines_info_for_orders.append(
+                (address.country.code, order_data.channel.slug, lines_info)
+            )
+        allocations_for_orders, errors = allocate_stocks_for_orders(
+            order_lines_info_for_orders
+        )
+
+    indexes = [index for index in range(len(orders_data)) if index not in errors]
+    if not indexes:
+        return {}, errors
+
+    addresses = []
+    for index in indexes:
+        order_data = orders_data[index]
+        addresses.append(order_data.billing_address)
+        if order_data.shipping_address:
+            addresses.append(order_data.shipping_address)
+    Address.objects.bulk_create(addresses, batch_size=BULK_CREATE_BATCH_SIZE)
+
+    orders = []
+    for index in indexes:
+        order_data = orders_data[index]
+        order = prepared_orders[index][0]
+        order.billing_address_id = order_data.billing_address.pk
+        if order_data.shipping_address:
+            order.shipping_address_id = order_data.shipping_address.pk
+        orders.append(order)
+    Order.objects.bulk_create(orders, batch_size=BULK_CREATE_BATCH_SIZE)
+
+    lines = []
+    payments = []
+    allocations = []
+    for index, order in zip(indexes, orders):
+        _, order_lines, order_payments = prepared_orders[index]
+        for line in order_lines:
+            line.order_id = order.pk
+        for payment in order_payments:
+            payment.order_id = order.pk
+        lines.extend(order_lines)
+        payments.extend(order_payments)
+        allocations.extend(allocations_for_orders[index])
+    OrderLine.objects.bulk_create(lines, batch_size=BULK_CREATE_BATCH_SIZE)
+    Payment.objects.bulk_create(payments, batch_size=BULK_CREATE_BATCH_SIZE)
+    for allocation in allocations:
+        allocation.order_line_id = allocation.order_line.pk
+    Allocation.objects.bulk_create(allocations, batch_size=BULK_CREATE_BATCH_SIZE)
+    update_variants_channel_availability(
+        allocation.stock.product_variant_id for allocation in allocations
+    )
+
+    requester = user if user_is_valid(user) else None
+    OrderEvent.objects.bulk_create(
+        [
+            OrderEvent(order=order, type=OrderEvents.PLACED, user=requester, app=app)
+            for order in orders
+        ],
+        batch_size=BULK_CREATE_BATCH_SIZE,
+    )
+
+    if notify:
+        order_ids = [order.pk for order in orders]
+        transaction.on_commit(
+            lambda: send_order_created_notifications_task.delay(order_ids)
+        )
+    return dict(zip(indexes, orders)), errors
@@ -522,6 +522,35 @@ def fulfillment_awaits_approval_event(
     )
 
 
+def fulfillment_items_events_for_orders(
+    *,
+    fulfillment_lines_for_orders: List[Tuple[Order, List[FulfillmentLine]]],
+    user: UserType,
+    app: AppType,
+    approved: bool
+) -> List[OrderEvent]:
+    if not user_is_valid(user):
+        user = None
+    if approved:
+        event_type = OrderEvents.FULFILLMENT_FULFILLED_ITEMS
+        parameter = "fulfilled_items"
+    else:
+        event_type = OrderEvents.FULFILLMENT_AWAITS_APPROVAL
+        parameter = "awaiting_fulfillments"
+    return OrderEvent.objects.bulk_create(
+        [
+            OrderEvent(
+                order=order,
+                type=event_type,
+                user=user,
+                app=app,
+                parameters={parameter: [line.pk for line in fulfillment_lines]},
+            )
+            for order, fulfillment_lines in fulfillment_lines_for_orders
+        ]
+    )
+
+
 def order_returned_event(
     *,
     order: Order,
@@ -0,0 +1,26 @@
+# Generated by Django 3.2.6 on 2021-09-20 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0117_merge_20210903_1013"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="order",
+            name="origin",
+            field=models.CharField(
+                choices=[
+                    ("checkout", "Checkout"),
+                    ("draft", "Draft"),
+                    ("reissue", "Reissue"),
+                    ("bulk_create", "Bulk create"),
+                ],
+                max_length=32,
+            ),
+        ),
+    ]
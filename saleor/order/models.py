@@ -30,7 +30,13 @@ from ..payment import ChargeStatus, TransactionKind
 from ..payment.model_helpers import get_subtotal, get_total_authorized
 from ..payment.models import Payment
 from ..shipping.models import ShippingMethod
-from . import FulfillmentStatus, OrderEvents, OrderOrigin, OrderStatus
+from . import (
+    FulfillmentStatus,
+    OrderEvents,
+    OrderOrigin,
+    OrderOutboxEventType,
+    OrderStatus,
+)
 
 
 class OrderQueryset(models.QuerySet):
@@ -666,3 +672,34 @@ class OrderEvent(models.Model):
 
     def __repr__(self):
         return f"{self.__class__.__name__}(type={self.type!r}, user={self.user!r})"
+
+
+class OrderOutboxEvent(models.Model):
+    """Order side effect waiting to be dispatched to plugins and notifications.
+
+    Rows are appended in the same transaction as the order change that caused
+    them and deleted once dispatched, so every side effect is delivered at least
+    once, in the order the rows were created.
+    """
+
+    created_at = models.DateTimeField(default=now, editable=False)
+    type = models.CharField(max_length=32, choices=OrderOutboxEventType.CHOICES)
+    order = models.ForeignKey(
+        Order, related_name="outbox_events", on_delete=models.CASCADE
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        blank=True,
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    app = models.ForeignKey(App, related_name="+", on_delete=models.SET_NULL, null=True)
+    parameters = JSONField(blank=True, default=dict, encoder=CustomJsonEncoder)
+    attempts = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ("pk",)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(type={self.type!r}, order={self.order_id!r})"
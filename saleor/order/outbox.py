@@ -0,0 +1,110 @@
+"""Dispatcher of the order side effects stored in the transactional outbox.
+
+When `ORDER_OUTBOX_ENABLED` is set, order actions only store the order events and
+append a row to `OrderOutboxEvent` in the transaction of the mutation. Plugin
+hooks, webhooks and notifications are triggered later by the dispatcher, which is
+run periodically by Celery beat and drains the outbox in batches.
+
+Rows of a single order are dispatched in the order they were created and a row is
+deleted only after its side effects succeeded, so delivery is at least once.
+"""
+import logging
+from typing import Callable, Dict, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from ..celeryconf import app
+from ..plugins.manager import PluginsManager, get_plugins_manager
+from . import OrderOutboxEventType
+from .actions import (
+    process_order_confirmed,
+    process_order_created,
+    process_order_fulfilled,
+    process_order_fully_paid,
+)
+from .models import OrderOutboxEvent
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_HANDLERS: Dict[str, Callable] = {
+    OrderOutboxEventType.ORDER_CREATED: process_order_created,
+    OrderOutboxEventType.ORDER_CONFIRMED: process_order_confirmed,
+    OrderOutboxEventType.ORDER_FULLY_PAID: process_order_fully_paid,
+    OrderOutboxEventType.ORDER_FULFILLED: process_order_fulfilled,
+}
+
+
+def _is_order_blocked(outbox_event: OrderOutboxEvent) -> bool:
+    """Return whether the order has older rows which were not dispatched.
+
+    These rows are locked by another dispatcher, are waiting for a retry or
+    exceeded the attempts limit; rows created after them must wait to keep the
+    per-order ordering.
+    """
+    return OrderOutboxEvent.objects.filter(
+        order_id=outbox_event.order_id, pk__lt=outbox_event.pk
+    ).exists()
+
+
+def _dispatch_order_outbox_event(pk: int, manager: PluginsManager) -> bool:
+    """Trigger side effects of a single row in its own transaction.
+
+    Only the row is locked while its side effects are triggered; it is deleted
+    in the same transaction. Return True if the row was dispatched.
+    """
+    with transaction.atomic():
+        outbox_event = (
+            OrderOutboxEvent.objects.select_for_update(skip_locked=True, of=("self",))
+            .select_related("order__channel", "user", "app")
+            .filter(pk=pk, attempts__lt=settings.ORDER_OUTBOX_MAX_ATTEMPTS)
+            .first()
+        )
+        if outbox_event is None or _is_order_blocked(outbox_event):
+            return False
+
+        handler = OUTBOX_HANDLERS[outbox_event.type]
+        try:
+            with transaction.atomic():
+                handler(
+                    outbox_event.order,
+                    outbox_event.user,
+                    outbox_event.app,
+                    manager,
+                    **outbox_event.parameters,
+                )
+        except Exception:
+            logger.exception("Dispatching %r failed.", outbox_event)
+            # Following rows of the order must wait for the failed one.
+            outbox_event.attempts += 1
+            outbox_event.save(update_fields=["attempts"])
+            return False
+        outbox_event.delete()
+    return True
+
+
+def dispatch_order_outbox_events(batch_size: Optional[int] = None) -> int:
+    """Trigger side effects of the oldest outbox rows and delete dispatched rows.
+
+    Each row is dispatched and committed separately, so a batch doesn't stay
+    locked while side effects of its rows are triggered. Return the number of
+    dispatched rows.
+    """
+    batch_size = batch_size or settings.ORDER_OUTBOX_BATCH_SIZE
+    pks = list(
+        OrderOutboxEvent.objects.filter(attempts__lt=settings.ORDER_OUTBOX_MAX_ATTEMPTS)
+        .order_by("pk")
+        .values_list("pk", flat=True)[:batch_size]
+    )
+    if not pks:
+        return 0
+
+    manager = get_plugins_manager()
+    return sum(_dispatch_order_outbox_event(pk, manager) for pk in pks)
+
+
+@app.task
+def dispatch_order_outbox_events_task():
+    dispatched = dispatch_order_outbox_events()
+    while dispatched == settings.ORDER_OUTBOX_BATCH_SIZE:
+        dispatched = dispatch_order_outbox_events()
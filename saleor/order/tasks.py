@@ -1,7 +1,13 @@
-from typing import List
+from collections import defaultdict
+from typing import Dict, List, Optional
 
+from ..account.models import User
+from ..app.models import App
 from ..celeryconf import app
-from .models import Order
+from ..plugins.manager import get_plugins_manager
+from . import FulfillmentStatus, OrderStatus
+from .models import Fulfillment, Order
+from .notifications import send_fulfillment_confirmation_to_customer
 from .utils import recalculate_order
 
 
@@ -10,3 +16,56 @@ def recalculate_orders_task(order_ids: List[int]):
     orders = Order.objects.filter(id__in=order_ids)
     for order in orders:
         recalculate_order(order)
+
+
+@app.task
+def send_fulfillments_notifications_task(
+    fulfillment_ids: List[int],
+    user_id: Optional[int] = None,
+    app_id: Optional[int] = None,
+    notify_customer: bool = True,
+):
+    """Trigger plugins and customer notifications for fulfillments made in bulk."""
+    user = User.objects.filter(pk=user_id).first() if user_id else None
+    requesting_app = App.objects.filter(pk=app_id).first() if app_id else None
+    manager = get_plugins_manager()
+
+    fulfillments_for_orders: Dict[int, List[Fulfillment]] = defaultdict(list)
+    fulfillments = (
+        Fulfillment.objects.filter(pk__in=fulfillment_ids)
+        .select_related("order__channel")
+        .order_by("pk")
+    )
+    for fulfillment in fulfillments:
+        fulfillments_for_orders[fulfillment.order_id].append(fulfillment)
+
+    for order_fulfillments in fulfillments_for_orders.values():
+        order = order_fulfillments[0].order
+        manager.order_updated(order)
+        approved_fulfillments = [
+            fulfillment
+            for fulfillment in order_fulfillments
+            if fulfillment.status == FulfillmentStatus.FULFILLED
+        ]
+        if not approved_fulfillments:
+            continue
+        for fulfillment in approved_fulfillments:
+            manager.fulfillment_created(fulfillment)
+        if order.status == OrderStatus.FULFILLED:
+            manager.order_fulfilled(order)
+        if notify_customer:
+            for fulfillment in approved_fulfillments:
+                send_fulfillment_confirmation_to_customer(
+                    order, fulfillment, user, requesting_app, manager
+                )
+
+
+@app.task
+def send_order_created_notifications_task(order_ids: List[int]):
+    """Trigger plugins for orders created in bulk."""
+    manager = get_plugins_manager()
+    orders = Order.objects.filter(pk__in=order_ids).select_related("channel")
+    for order in orders.order_by("pk"):
+        manager.order_created(order)
+        if order.is_fully_paid():
+            manager.order_fully_paid(order)
@@ -7,8 +7,8 @@ from ...order import OrderEvents
 from ...plugins.manager import get_plugins_manager
 from ...tests.utils import flush_post_commit_hooks
 from ...warehouse.models import Allocation, Stock
-from ..actions import create_fulfillments
-from ..models import FulfillmentLine, OrderStatus
+from ..actions import create_fulfillments, create_fulfillments_for_orders
+from ..models import FulfillmentLine, Order, OrderStatus
 
 
 @patch("saleor.order.actions.send_fulfillment_confirmation_to_customer", autospec=True)
@@ -594,3 +594,131 @@ def test_create_fullfilment_with_out_of_stock_webhook_not_triggered(
     flush_post_commit_hooks()
 
     product_variant_out_of_stock_webhook.assert_not_called()
+
+
+def _create_order_copy(order, quantities):
+    new_order = Order.objects.create(
+        billing_address=order.billing_address.get_copy(),
+        channel=order.channel,
+        currency=order.currency,
+        user_email=order.user_email,
+        origin=order.origin,
+    )
+    for line, quantity in zip(order.lines.all(), quantities):
+        line.pk = None
+        line.order = new_order
+        line.quantity = quantity
+        line.quantity_fulfilled = 0
+        line.save()
+    return new_order
+
+
+@patch("saleor.order.actions.send_fulfillments_notifications_task.delay")
+def test_create_fulfillments_for_orders(
+    mock_notifications_task, staff_user, order_with_lines, warehouse
+):
+    # given
+    order = order_with_lines
+    other_order = _create_order_copy(order, [2])
+    order_line1, order_line2 = order.lines.all()
+    [other_order_line] = other_order.lines.all()
+    manager = get_plugins_manager()
+
+    # when
+    fulfillments, errors = create_fulfillments_for_orders(
+        staff_user,
+        None,
+        [
+            (
+                order,
+                {
+                    str(warehouse.pk): [
+                        {"order_line": order_line1, "quantity": 3},
+                        {"order_line": order_line2, "quantity": 2},
+                    ]
+                },
+            ),
+            (
+                other_order,
+                {str(warehouse.pk): [{"order_line": other_order_line, "quantity": 2}]},
+            ),
+        ],
+        manager,
+        notify_customer=True,
+    )
+    flush_post_commit_hooks()
+
+    # then
+    assert not errors
+    order.refresh_from_db()
+    other_order.refresh_from_db()
+    assert order.status == OrderStatus.FULFILLED
+    assert other_order.status == OrderStatus.FULFILLED
+    assert [f.fulfillment_order for f in fulfillments[order.pk]] == [1]
+    assert [f.fulfillment_order for f in fulfillments[other_order.pk]] == [1]
+    assert other_order.lines.get().quantity_fulfilled == 2
+
+    stock = order_line1.variant.stocks.get()
+    assert stock.quantity == 0
+    assert order_line2.variant.stocks.get().quantity == 0
+    assert other_order.events.get().type == OrderEvents.FULFILLMENT_FULFILLED_ITEMS
+    mock_notifications_task.assert_called_once_with(
+        [f.pk for f in fulfillments[order.pk] + fulfillments[other_order.pk]],
+        user_id=staff_user.pk,
+        app_id=None,
+        notify_customer=True,
+    )
+
+
+@patch("saleor.order.actions.send_fulfillments_notifications_task.delay")
+def test_create_fulfillments_for_orders_insufficient_stock_for_one_order(
+    mock_notifications_task, staff_user, order_with_lines, warehouse
+):
+    # given
+    order = order_with_lines
+    other_order = _create_order_copy(order, [1, 1])
+    order_line1, order_line2 = order.lines.all()
+    other_order_line1, other_order_line2 = other_order.lines.all()
+    manager = get_plugins_manager()
+
+    # when
+    fulfillments, errors = create_fulfillments_for_orders(
+        staff_user,
+        None,
+        [
+            (
+                order,
+                {
+                    str(warehouse.pk): [
+                        {"order_line": order_line1, "quantity": 3},
+                        {"order_line": order_line2, "quantity": 2},
+                    ]
+                },
+            ),
+            (
+                other_order,
+                {
+                    str(warehouse.pk): [
+                        {"order_line": other_order_line1, "quantity": 1},
+                        {"order_line": other_order_line2, "quantity": 1},
+                    ]
+                },
+            ),
+        ],
+        manager,
+    )
+
+    # then
+    assert list(fulfillments) == [order.pk]
+    assert list(errors) == [other_order.pk]
+    assert isinstance(errors[other_order.pk], InsufficientStock)
+    [error_data] = errors[other_order.pk].items
+    assert error_data.order_line == other_order_line2
+
+    # stocks and lines of the failed order are left untouched
+    assert order_line1.variant.stocks.get().quantity == 2
+    assert order_line2.variant.stocks.get().quantity == 0
+    other_order.refresh_from_db()
+    assert other_order.status == OrderStatus.UNFULFILLED
+    assert not other_order.fulfillments.exists()
+    assert other_order.lines.filter(quantity_fulfilled__gt=0).count() == 0
@@ -0,0 +1,130 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from prices import Money, TaxedMoney
+
+from ...account.models import Address
+from ...payment import ChargeStatus
+from ...tests.utils import flush_post_commit_hooks
+from ...warehouse.models import Allocation
+from .. import OrderEvents, OrderOrigin, OrderStatus
+from ..bulk_create import (
+    OrderBulkData,
+    OrderLineBulkData,
+    PaymentBulkData,
+    create_orders_in_bulk,
+)
+from ..models import Order
+
+
+def _prepare_order_data(channel, address, variant, quantity, payments=None):
+    unit_price = TaxedMoney(
+        net=Money(Decimal("10.00"), channel.currency_code),
+        gross=Money(Decimal("12.30"), channel.currency_code),
+    )
+    return OrderBulkData(
+        channel=channel,
+        billing_address=Address(**address.as_data()),
+        user_email="customer@example.com",
+        lines=[
+            OrderLineBulkData(
+                variant=variant,
+                product_name=variant.product.name,
+                variant_name=variant.name,
+                product_sku=variant.sku,
+                is_shipping_required=True,
+                quantity=quantity,
+                unit_price=unit_price,
+                undiscounted_unit_price=unit_price,
+                tax_rate=Decimal("0.23"),
+            )
+        ],
+        payments=payments or [],
+    )
+
+
+@patch("saleor.order.bulk_create.send_order_created_notifications_task.delay")
+def test_create_orders_in_bulk(
+    mocked_notifications_task, staff_user, channel_USD, address, product
+):
+    # given
+    variant = product.variants.get()
+    payment_data = PaymentBulkData(
+        gateway="mirumee.payments.dummy",
+        total=Decimal("24.60"),
+        captured_amount=Decimal("24.60"),
+        charge_status=ChargeStatus.FULLY_CHARGED,
+    )
+    orders_data = [
+        _prepare_order_data(channel_USD, address, variant, 2, [payment_data]),
+        _prepare_order_data(channel_USD, address, variant, 3),
+    ]
+
+    # when
+    orders, errors = create_orders_in_bulk(orders_data, staff_user, None)
+    flush_post_commit_hooks()
+
+    # then
+    assert not errors
+    assert len(orders) == 2
+    first_order = Order.objects.get(pk=orders[0].pk)
+    assert first_order.origin == OrderOrigin.BULK_CREATE
+    assert first_order.status == OrderStatus.UNFULFILLED
+    assert first_order.total.gross.amount == Decimal("24.60")
+    assert first_order.total_paid_amount == Decimal("24.60")
+    assert first_order.payments.get().order_id == first_order.pk
+    assert first_order.events.get().type == OrderEvents.PLACED
+    assert first_order.billing_address.city == address.city
+    assert Allocation.objects.filter(order_line__order__in=orders.values()).count() == 2
+    mocked_notifications_task.assert_called_once_with(
+        [order.pk for order in orders.values()]
+    )
+
+
+@patch("saleor.order.bulk_create.send_order_created_notifications_task.delay")
+def test_create_orders_in_bulk_insufficient_stock(
+    mocked_notifications_task, staff_user, channel_USD, address, product
+):
+    # given
+    variant = product.variants.get()
+    stock = variant.stocks.get()
+    orders_data = [
+        _prepare_order_data(channel_USD, address, variant, stock.quantity - 1),
+        _prepare_order_data(channel_USD, address, variant, 2),
+    ]
+
+    # when
+    orders, errors = create_orders_in_bulk(orders_data, staff_user, None)
+
+    # then
+    assert list(orders) == [0]
+    assert list(errors) == [1]
+    assert errors[1].items[0].variant == variant
+    assert Order.objects.count() == 1
+    assert Allocation.objects.get(stock=stock).quantity_allocated == (
+        stock.quantity - 1
+    )
+
+
+@patch("saleor.order.bulk_create.send_order_created_notifications_task.delay")
+def test_create_orders_in_bulk_skip_allocation_and_notifications(
+    mocked_notifications_task, staff_user, channel_USD, address, product
+):
+    # given
+    variant = product.variants.get()
+    stock = variant.stocks.get()
+    orders_data = [
+        _prepare_order_data(channel_USD, address, variant, stock.quantity + 1)
+    ]
+
+    # when
+    orders, errors = create_orders_in_bulk(
+        orders_data, staff_user, None, allocate_stock=False, notify=False
+    )
+    flush_post_commit_hooks()
+
+    # then
+    assert not errors
+    assert len(orders) == 1
+    assert not Allocation.objects.exists()
+    mocked_notifications_task.assert_not_called()
@@ -0,0 +1,154 @@
+from unittest.mock import ANY, patch
+
+from ...payment.models import Payment
+from ...plugins.manager import get_plugins_manager
+from .. import OrderEvents, OrderOutboxEventType, OrderStatus
+from ..actions import (
+    create_fulfillments,
+    handle_fully_paid_order,
+    order_confirmed,
+    order_created,
+)
+from ..models import OrderOutboxEvent
+from ..outbox import dispatch_order_outbox_events
+
+
+@patch("saleor.plugins.manager.PluginsManager.order_created")
+def test_order_created_adds_outbox_event(
+    mocked_order_created, settings, order, staff_user, site_settings
+):
+    # given
+    settings.ORDER_OUTBOX_ENABLED = True
+    manager = get_plugins_manager()
+
+    # when
+    order_created(order, staff_user, None, manager)
+
+    # then
+    assert order.events.get().type == OrderEvents.PLACED
+    outbox_event = OrderOutboxEvent.objects.get()
+    assert outbox_event.type == OrderOutboxEventType.ORDER_CREATED
+    assert outbox_event.user == staff_user
+    mocked_order_created.assert_not_called()
+
+    # when
+    dispatched = dispatch_order_outbox_events()
+
+    # then
+    assert dispatched == 1
+    assert not OrderOutboxEvent.objects.exists()
+    mocked_order_created.assert_called_once_with(order)
+
+
+@patch("saleor.plugins.manager.PluginsManager.order_confirmed")
+@patch("saleor.order.actions.send_order_confirmed")
+def test_dispatch_order_outbox_events_passes_parameters(
+    mocked_send_order_confirmed,
+    mocked_order_confirmed,
+    settings,
+    order,
+    staff_user,
+):
+    # given
+    settings.ORDER_OUTBOX_ENABLED = True
+    manager = get_plugins_manager()
+    order_confirmed(order, staff_user, None, manager, send_confirmation_email=True)
+
+    # when
+    dispatch_order_outbox_events()
+
+    # then
+    mocked_order_confirmed.assert_called_once_with(order)
+    mocked_send_order_confirmed.assert_called_once_with(order, staff_user, None, ANY)
+
+
+@patch("saleor.plugins.manager.PluginsManager.order_confirmed")
+@patch("saleor.order.actions.send_payment_confirmation")
+def test_dispatch_order_outbox_events_keeps_order_after_failure(
+    mocked_send_payment_confirmation,
+    mocked_order_confirmed,
+    settings,
+    order,
+    order_with_lines,
+):
+    # given
+    settings.ORDER_OUTBOX_ENABLED = True
+    mocked_send_payment_confirmation.side_effect = Exception("Unavailable")
+    manager = get_plugins_manager()
+    order.payments.add(Payment.objects.create())
+    handle_fully_paid_order(manager, order)
+    order_confirmed(order, None, None, manager)
+    order_confirmed(order_with_lines, None, None, manager)
+
+    # when
+    dispatched = dispatch_order_outbox_events()
+
+    # then
+    assert dispatched == 1
+    mocked_order_confirmed.assert_called_once_with(order_with_lines)
+    failed_event, waiting_event = OrderOutboxEvent.objects.filter(order=order)
+    assert failed_event.type == OrderOutboxEventType.ORDER_FULLY_PAID
+    assert failed_event.attempts == 1
+    assert waiting_event.type == OrderOutboxEventType.ORDER_CONFIRMED
+    assert waiting_event.attempts == 0
+    assert not order_with_lines.outbox_events.exists()
+
+
+def test_order_created_without_outbox(settings, order, staff_user, site_settings):
+    # given
+    settings.ORDER_OUTBOX_ENABLED = False
+    manager = get_plugins_manager()
+
+    # when
+    order_created(order, staff_user, None, manager)
+
+    # then
+    assert not OrderOutboxEvent.objects.exists()
+
+
+def test_create_fulfillments_adds_outbox_event_in_transaction(
+    settings, staff_user, order_with_lines, warehouse
+):
+    # given
+    settings.ORDER_OUTBOX_ENABLED = True
+    order_line = order_with_lines.lines.first()
+    manager = get_plugins_manager()
+
+    # when
+    [fulfillment] = create_fulfillments(
+        staff_user,
+        None,
+        order_with_lines,
+        {str(warehouse.pk): [{"order_line": order_line, "quantity": 1}]},
+        manager,
+        True,
+    )
+
+    # then
+    # the commit hooks are not run in tests, so the row is stored before commit
+    outbox_event = OrderOutboxEvent.objects.get()
+    assert outbox_event.type == OrderOutboxEventType.ORDER_FULFILLED
+    assert outbox_event.parameters["fulfillment_ids"] == [fulfillment.pk]
+
+
+@patch("saleor.order.actions.send_payment_confirmation")
+def test_handle_fully_paid_order_fulfills_digital_lines_inline(
+    mocked_send_payment_confirmation, settings, order_with_digital_line
+):
+    # given
+    settings.ORDER_OUTBOX_ENABLED = True
+    order = order_with_digital_line
+    order.payments.add(Payment.objects.create())
+    manager = get_plugins_manager()
+
+    # when
+    handle_fully_paid_order(manager, order)
+
+    # then
+    order.refresh_from_db()
+    assert order.status == OrderStatus.FULFILLED
+    mocked_send_payment_confirmation.assert_not_called()
+    assert (
+        OrderOutboxEvent.objects.get(order=order).type
+        == OrderOutboxEventType.ORDER_FULLY_PAID
+    )
@@ -35,6 +35,7 @@ from .utils.common import (
     AUTH_STATUS,
     FAILED_STATUSES,
     PENDING_STATUSES,
+    PLUGIN_ID,
     api_call,
     call_capture,
     get_payment_method_info,
@@ -44,7 +45,11 @@ from .utils.common import (
     request_for_payment_refund,
     update_payment_with_action_required_data,
 )
-from .webhooks import handle_additional_actions, handle_webhook
+from .webhooks import (
+    handle_additional_actions,
+    handle_webhook,
+    process_webhook_notification,
+)
 
 GATEWAY_NAME = "Adyen"
 WEBHOOK_PATH = "/webhooks"
@@ -52,7 +57,7 @@ ADDITIONAL_ACTION_PATH = "/additional-actions"
 
 
 class AdyenGatewayPlugin(BasePlugin):
-    PLUGIN_ID = "mirumee.payments.adyen"
+    PLUGIN_ID = PLUGIN_ID
     PLUGIN_NAME = GATEWAY_NAME
     CONFIGURATION_PER_CHANNEL = True
     DEFAULT_CONFIGURATION = [
@@ -249,7 +254,8 @@ class AdyenGatewayPlugin(BasePlugin):
     def webhook(self, request: WSGIRequest, path: str, previous_value) -> HttpResponse:
         config = self._get_gateway_config()
         if path.startswith(WEBHOOK_PATH):
-            return handle_webhook(request, config)
+            channel_slug = self.channel.slug if self.channel else None
+            return handle_webhook(request, config, channel_slug)
         elif path.startswith(ADDITIONAL_ACTION_PATH):
             with opentracing.global_tracer().start_active_span(
                 "adyen.checkout.payment_details"
@@ -263,6 +269,10 @@ class AdyenGatewayPlugin(BasePlugin):
                 )
         return HttpResponseNotFound()
 
+    def process_webhook_event(self, payload: dict):
+        """Process the notification stored by the webhook handler."""
+        process_webhook_notification(payload, self._get_gateway_config())
+
     def _get_gateway_config(self) -> GatewayConfig:
         return self.config
 
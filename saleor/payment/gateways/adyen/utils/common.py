@@ -29,6 +29,7 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+PLUGIN_ID = "mirumee.payments.adyen"
 
 # https://docs.adyen.com/checkout/payment-result-codes
 FAILED_STATUSES = ["refused", "error", "cancelled"]
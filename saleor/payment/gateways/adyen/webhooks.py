@@ -10,6 +10,7 @@ from urllib.parse import urlencode, urlparse
 
 import Adyen
 import graphene
+from django.conf import settings
 from django.contrib.auth.hashers import check_password
 from django.contrib.auth.models import AnonymousUser
 from django.core.exceptions import ValidationError
@@ -48,7 +49,8 @@ from ...utils import (
     gateway_postprocess,
     price_from_minor_unit,
 )
-from .utils.common import FAILED_STATUSES, api_call
+from ...webhook_events import store_webhook_event
+from .utils.common import FAILED_STATUSES, PLUGIN_ID, api_call
 
 logger = logging.getLogger(__name__)
 
@@ -658,7 +660,11 @@ def validate_merchant_account(
 
 
 @transaction_with_commit_on_errors()
-def handle_webhook(request: WSGIRequest, gateway_config: "GatewayConfig"):
+def handle_webhook(
+    request: WSGIRequest,
+    gateway_config: "GatewayConfig",
+    channel_slug: Optional[str] = None,
+):
     try:
         json_data = json.loads(request.body)
     except JSONDecodeError:
@@ -678,13 +684,40 @@ def handle_webhook(request: WSGIRequest, gateway_config: "GatewayConfig"):
     if not validate_auth_user(request.headers, gateway_config):
         return HttpResponseBadRequest("Invalid or missing basic auth.")
 
-    event_handler = EVENT_MAP.get(notification.get("eventCode", ""))
+    event_code = notification.get("eventCode", "")
+    if settings.PAYMENT_WEBHOOK_EVENTS_ASYNC and event_code in EVENT_MAP:
+        # Notifications sent again have the same reference, code and result.
+        event_id = ":".join(
+            [
+                notification.get("pspReference", ""),
+                event_code,
+                str(notification.get("success", "")),
+            ]
+        )
+        store_webhook_event(
+            PLUGIN_ID,
+            channel_slug,
+            event_id,
+            notification.get("merchantReference", ""),
+            notification,
+        )
+        return HttpResponse("[accepted]")
+
+    event_handler = EVENT_MAP.get(event_code)
     if event_handler:
         event_handler(notification, gateway_config)  # type: ignore
         return HttpResponse("[accepted]")
     return HttpResponse("[accepted]")
 
 
+@transaction_with_commit_on_errors()
+def process_webhook_notification(
+    notification: Dict[str, Any], gateway_config: "GatewayConfig"
+):
+    """Process the notification stored by `handle_webhook`."""
+    EVENT_MAP[notification["eventCode"]](notification, gateway_config)  # type: ignore
+
+
 @transaction_with_commit_on_errors()
 def handle_additional_actions(
     request: WSGIRequest,
@@ -33,7 +33,7 @@ from .stripe_api import (
     retrieve_payment_intent,
     subscribe_webhook,
 )
-from .webhooks import handle_webhook
+from .webhooks import handle_webhook, process_webhook_event
 
 if TYPE_CHECKING:
     # flake8: noqa
@@ -127,6 +127,10 @@ class StripeGatewayPlugin(BasePlugin):
         )
         return HttpResponseNotFound()
 
+    def process_webhook_event(self, payload: dict):
+        """Process the notification stored by the webhook handler."""
+        process_webhook_event(payload, self.config, self.channel.slug)  # type: ignore
+
     @require_active_plugin
     def token_is_required_as_payment_input(self, previous_value):
         return False
@@ -295,6 +295,11 @@ def construct_stripe_event(
         )
 
 
+def construct_stripe_event_from_data(api_key: str, data: dict) -> StripeObject:
+    """Construct the event from the data of an already verified payload."""
+    return stripe.Event.construct_from(data, api_key)
+
+
 def get_payment_method_details(
     payment_intent: StripeObject,
 ) -> Optional[PaymentMethodInfo]:
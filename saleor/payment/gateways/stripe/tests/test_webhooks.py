@@ -7,6 +7,7 @@ from stripe.stripe_object import StripeObject
 
 from .....checkout.complete_checkout import complete_checkout
 from .... import ChargeStatus, TransactionKind
+from ....models import PaymentWebhookEvent
 from ....utils import price_to_minor_unit
 from ..consts import (
     AUTHORIZED_STATUS,
@@ -554,3 +555,49 @@ def test_handle_webhook_events(
         endpoint_secret,
         api_key=api_key,
     )
+
+
+@patch("saleor.payment.webhook_events.process_payment_webhook_events_task.delay")
+@patch("saleor.payment.gateways.stripe.webhooks.handle_successful_payment_intent")
+@patch("saleor.payment.gateways.stripe.stripe_api.stripe.Webhook.construct_event")
+def test_handle_webhook_stores_event_for_processing(
+    mocked_webhook_event,
+    mocked_handle_successful_payment_intent,
+    mocked_process_task,
+    stripe_plugin,
+    rf,
+    channel_USD,
+    settings,
+):
+    # given
+    settings.PAYMENT_WEBHOOK_EVENTS_ASYNC = True
+    payload = {
+        "id": "evt_1",
+        "type": WEBHOOK_SUCCESS_EVENT,
+        "data": {"object": {"id": "pi_1", "object": "payment_intent"}},
+    }
+    request = rf.post(path="/webhooks/", data=payload, content_type="application/json")
+    request.META["HTTP_STRIPE_SIGNATURE"] = "1234"
+    plugin = stripe_plugin()
+    mocked_webhook_event.return_value = StripeObject.construct_from(
+        payload, plugin.config.connection_params["secret_api_key"]
+    )
+
+    # when
+    response = plugin.webhook(request, "/webhooks/", None)
+
+    # then
+    assert response.status_code == 200
+    mocked_handle_successful_payment_intent.assert_not_called()
+    webhook_event = PaymentWebhookEvent.objects.get()
+    assert webhook_event.event_id == "evt_1"
+    assert webhook_event.payment_reference == "pi_1"
+    assert webhook_event.channel_slug == channel_USD.slug
+
+    # when
+    plugin.process_webhook_event(webhook_event.payload)
+
+    # then
+    mocked_handle_successful_payment_intent.assert_called_once()
+    payment_intent = mocked_handle_successful_payment_intent.call_args[0][0]
+    assert payment_intent.id == "pi_1"
@@ -1,6 +1,8 @@
+import json
 import logging
 from typing import List, Optional
 
+from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 from django.core.handlers.wsgi import WSGIRequest
 from django.http import HttpResponse
@@ -23,9 +25,12 @@ from ...utils import (
     price_from_minor_unit,
     update_payment_method_details,
 )
+from ...webhook_events import store_webhook_event
 from .consts import (
+    PLUGIN_ID,
     WEBHOOK_AUTHORIZED_EVENT,
     WEBHOOK_CANCELED_EVENT,
+    WEBHOOK_EVENTS,
     WEBHOOK_FAILED_EVENT,
     WEBHOOK_PROCESSING_EVENT,
     WEBHOOK_REFUND_EVENT,
@@ -33,6 +38,7 @@ from .consts import (
 )
 from .stripe_api import (
     construct_stripe_event,
+    construct_stripe_event_from_data,
     get_payment_method_details,
     update_payment_method,
 )
@@ -66,6 +72,38 @@ def handle_webhook(
         logger.warning("Invalid signature for Stripe webhook", extra={"error": e})
         return HttpResponse(status=400)
 
+    if settings.PAYMENT_WEBHOOK_EVENTS_ASYNC and event.type in WEBHOOK_EVENTS:
+        store_webhook_event(
+            PLUGIN_ID,
+            channel_slug,
+            event.id,
+            _get_payment_intent_id(event),
+            json.loads(payload),
+        )
+    else:
+        _process_event(event, gateway_config, channel_slug)
+    return HttpResponse(status=200)
+
+
+@transaction_with_commit_on_errors()
+def process_webhook_event(
+    data: dict, gateway_config: "GatewayConfig", channel_slug: str
+):
+    """Process the event stored by `handle_webhook`."""
+    api_key = gateway_config.connection_params["secret_api_key"]
+    event = construct_stripe_event_from_data(api_key, data)
+    _process_event(event, gateway_config, channel_slug)
+
+
+def _get_payment_intent_id(event: StripeObject) -> str:
+    if event.type == WEBHOOK_REFUND_EVENT:
+        return event.data.object.payment_intent
+    return event.data.object.id
+
+
+def _process_event(
+    event: StripeObject, gateway_config: "GatewayConfig", channel_slug: str
+):
     webhook_handlers = {
         WEBHOOK_SUCCESS_EVENT: handle_successful_payment_intent,
         WEBHOOK_AUTHORIZED_EVENT: handle_authorized_payment_intent,
@@ -84,7 +122,6 @@ def handle_webhook(
         logger.warning(
             "Received unhandled webhook events", extra={"event_type": event.type}
         )
-    return HttpResponse(status=200)
 
 
 def _get_payment(payment_intent_id: str) -> Optional[Payment]:
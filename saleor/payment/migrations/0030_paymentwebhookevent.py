@@ -0,0 +1,64 @@
+# Generated by Django 3.2.6 on 2021-09-27 09:14
+
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payment", "0029_alter_payment_options"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PaymentWebhookEvent",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, editable=False
+                    ),
+                ),
+                ("gateway", models.CharField(max_length=255)),
+                (
+                    "channel_slug",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                ("event_id", models.CharField(max_length=255)),
+                (
+                    "payment_reference",
+                    models.CharField(blank=True, default="", max_length=512),
+                ),
+                (
+                    "payload",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder
+                    ),
+                ),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+                ("attempts", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "ordering": ("pk",),
+                "unique_together": {("gateway", "event_id")},
+            },
+        ),
+        migrations.AddIndex(
+            model_name="paymentwebhookevent",
+            index=models.Index(
+                fields=["gateway", "payment_reference"],
+                name="paymentwebhookevent_ref_idx",
+            ),
+        ),
+    ]
@@ -7,6 +7,7 @@ from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.db.models import JSONField  # type: ignore
+from django.utils.timezone import now
 from prices import Money
 
 from ..checkout.models import Checkout
@@ -244,3 +245,37 @@ class Transaction(models.Model):
 
     def get_amount(self):
         return Money(self.amount, self.currency)
+
+
+class PaymentWebhookEvent(models.Model):
+    """Notification received from a payment gateway.
+
+    Notifications are identified by the ID the gateway assigned to them, so the
+    ones sent again are stored only once. They are processed in the order they
+    were received for each payment, identified by the gateway's reference.
+    """
+
+    created_at = models.DateTimeField(default=now, editable=False)
+    gateway = models.CharField(max_length=255)
+    channel_slug = models.CharField(max_length=255, blank=True, null=True)
+    event_id = models.CharField(max_length=255)
+    payment_reference = models.CharField(max_length=512, blank=True, default="")
+    payload = JSONField(encoder=DjangoJSONEncoder)
+    processed_at = models.DateTimeField(blank=True, null=True)
+    attempts = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ("pk",)
+        unique_together = (("gateway", "event_id"),)
+        indexes = [
+            models.Index(
+                fields=["gateway", "payment_reference"],
+                name="paymentwebhookevent_ref_idx",
+            )
+        ]
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(gateway={self.gateway!r}, "
+            f"event_id={self.event_id!r})"
+        )
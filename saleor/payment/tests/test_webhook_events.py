@@ -0,0 +1,97 @@
+from unittest.mock import Mock, call, patch
+
+from ...tests.utils import flush_post_commit_hooks
+from ..models import PaymentWebhookEvent
+from ..webhook_events import process_payment_webhook_events, store_webhook_event
+
+GATEWAY = "saleor.payments.stripe"
+
+
+@patch("saleor.payment.webhook_events.process_payment_webhook_events_task.delay")
+def test_store_webhook_event_skips_duplicates(mocked_process_task, channel_USD):
+    # given
+    payload = {"id": "evt_1"}
+    store_webhook_event(GATEWAY, channel_USD.slug, "evt_1", "pi_1", payload)
+
+    # when
+    created = store_webhook_event(GATEWAY, channel_USD.slug, "evt_1", "pi_1", payload)
+
+    # then
+    assert created is False
+    webhook_event = PaymentWebhookEvent.objects.get()
+    assert webhook_event.payload == payload
+    assert webhook_event.processed_at is None
+    flush_post_commit_hooks()
+    mocked_process_task.assert_called_once_with()
+
+
+@patch("saleor.payment.webhook_events.get_plugins_manager")
+def test_process_payment_webhook_events_keeps_order_of_payment(
+    mocked_get_plugins_manager, settings
+):
+    # given
+    webhook_events = PaymentWebhookEvent.objects.bulk_create(
+        [
+            PaymentWebhookEvent(
+                gateway=GATEWAY,
+                event_id=f"evt_{index}",
+                payment_reference=payment_reference,
+                payload={"id": f"evt_{index}"},
+            )
+            for index, payment_reference in enumerate(["pi_1", "pi_2", "pi_1"])
+        ]
+    )
+    plugin = Mock()
+    plugin.process_webhook_event.side_effect = [Exception("Failed"), None]
+    mocked_get_plugins_manager.return_value.get_plugin.return_value = plugin
+
+    # when
+    processed = process_payment_webhook_events()
+
+    # then
+    assert processed == 1
+    assert plugin.process_webhook_event.mock_calls == [
+        call({"id": "evt_0"}),
+        call({"id": "evt_1"}),
+    ]
+    for webhook_event in webhook_events:
+        webhook_event.refresh_from_db()
+    assert webhook_events[0].attempts == 1
+    assert webhook_events[0].processed_at is None
+    assert webhook_events[1].processed_at
+    assert webhook_events[2].attempts == 0
+    assert webhook_events[2].processed_at is None
+
+
+@patch("saleor.payment.webhook_events.get_plugins_manager")
+def test_process_payment_webhook_events_skips_exhausted_notifications(
+    mocked_get_plugins_manager, settings
+):
+    # given
+    webhook_events = PaymentWebhookEvent.objects.bulk_create(
+        [
+            PaymentWebhookEvent(
+                gateway=GATEWAY,
+                event_id=f"evt_{index}",
+                payment_reference="pi_1",
+                payload={"id": f"evt_{index}"},
+                attempts=attempts,
+            )
+            for index, attempts in enumerate(
+                [settings.PAYMENT_WEBHOOK_EVENTS_MAX_ATTEMPTS, 0]
+            )
+        ]
+    )
+    plugin = Mock()
+    mocked_get_plugins_manager.return_value.get_plugin.return_value = plugin
+
+    # when
+    processed = process_payment_webhook_events()
+
+    # then
+    assert processed == 1
+    plugin.process_webhook_event.assert_called_once_with({"id": "evt_1"})
+    for webhook_event in webhook_events:
+        webhook_event.refresh_from_db()
+    assert webhook_events[0].processed_at is None
+    assert webhook_events[1].processed_at
@@ -0,0 +1,149 @@
+"""Asynchronous processing of notifications sent by payment gateways.
+
+When `PAYMENT_WEBHOOK_EVENTS_ASYNC` is set, the webhook handlers of the gateways
+only verify a notification, store it in `PaymentWebhookEvent` and acknowledge it,
+so the gateway does not time out and send it again while the checkout is being
+completed. Notifications sent again are stored once and acknowledged without
+being processed.
+
+Stored notifications are processed by a Celery worker, which is triggered after
+a notification is stored and periodically by Celery beat to retry the failed
+ones. The worker drains them in batches; notifications of a single payment are
+processed in the order they were received. Processed notifications are kept for
+`PAYMENT_WEBHOOK_EVENTS_RETENTION` to recognize the ones sent again.
+"""
+import logging
+from typing import Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from ..celeryconf import app
+from ..plugins.manager import get_plugins_manager
+from .models import PaymentWebhookEvent
+
+logger = logging.getLogger(__name__)
+
+
+def store_webhook_event(
+    gateway: str,
+    channel_slug: Optional[str],
+    event_id: str,
+    payment_reference: str,
+    payload: dict,
+) -> bool:
+    """Store the notification for processing; return False if it was a duplicate.
+
+    `gateway` is the ID of the plugin which processes the notification.
+    """
+    _, created = PaymentWebhookEvent.objects.get_or_create(
+        gateway=gateway,
+        event_id=event_id,
+        defaults={
+            "channel_slug": channel_slug,
+            "payment_reference": payment_reference,
+            "payload": payload,
+        },
+    )
+    if created:
+        transaction.on_commit(process_payment_webhook_events_task.delay)
+    else:
+        logger.info(
+            "Received a duplicated payment notification",
+            extra={"gateway": gateway, "event_id": event_id},
+        )
+    return created
+
+
+def _pending_webhook_events():
+    return PaymentWebhookEvent.objects.filter(
+        processed_at__isnull=True,
+        attempts__lt=settings.PAYMENT_WEBHOOK_EVENTS_MAX_ATTEMPTS,
+    )
+
+
+def _is_payment_blocked(webhook_event: PaymentWebhookEvent) -> bool:
+    """Return whether the payment has older notifications still to be processed.
+
+    These notifications are locked by another worker or are waiting for a retry;
+    notifications received after them must wait to keep the ordering. The ones
+    that exceeded the attempts limit no longer block the payment.
+    """
+    return (
+        _pending_webhook_events()
+        .filter(
+            gateway=webhook_event.gateway,
+            payment_reference=webhook_event.payment_reference,
+            pk__lt=webhook_event.pk,
+        )
+        .exists()
+    )
+
+
+def _process_webhook_event(pk: int, manager) -> bool:
+    """Process a single notification in its own transaction.
+
+    Return True if the notification was processed.
+    """
+    with transaction.atomic():
+        webhook_event = (
+            _pending_webhook_events()
+            .select_for_update(skip_locked=True)
+            .filter(pk=pk)
+            .first()
+        )
+        if webhook_event is None or _is_payment_blocked(webhook_event):
+            return False
+
+        plugin = manager.get_plugin(webhook_event.gateway, webhook_event.channel_slug)
+        try:
+            if plugin is None:
+                raise ValueError(f"Plugin {webhook_event.gateway} not found.")
+            with transaction.atomic():
+                plugin.process_webhook_event(webhook_event.payload)  # type: ignore
+        except Exception:
+            logger.exception("Processing %r failed.", webhook_event)
+            # Following notifications of the payment wait for this one until it
+            # exceeds the attempts limit.
+            webhook_event.attempts += 1
+            webhook_event.save(update_fields=["attempts"])
+            return False
+
+        webhook_event.processed_at = timezone.now()
+        webhook_event.save(update_fields=["processed_at"])
+    return True
+
+
+def process_payment_webhook_events(batch_size: Optional[int] = None) -> int:
+    """Process the oldest stored notifications.
+
+    Each notification is processed and committed separately, so the locks are
+    held and the callbacks run on commit are delayed only for a single one.
+    Return the number of processed notifications.
+    """
+    batch_size = batch_size or settings.PAYMENT_WEBHOOK_EVENTS_BATCH_SIZE
+    pks = list(
+        _pending_webhook_events()
+        .order_by("pk")
+        .values_list("pk", flat=True)[:batch_size]
+    )
+    if not pks:
+        return 0
+
+    manager = get_plugins_manager()
+    return sum(_process_webhook_event(pk, manager) for pk in pks)
+
+
+@app.task
+def process_payment_webhook_events_task():
+    processed = process_payment_webhook_events()
+    while processed == settings.PAYMENT_WEBHOOK_EVENTS_BATCH_SIZE:
+        processed = process_payment_webhook_events()
+
+
+@app.task
+def delete_processed_payment_webhook_events_task():
+    PaymentWebhookEvent.objects.filter(
+        processed_at__lt=timezone.now() - settings.PAYMENT_WEBHOOK_EVENTS_RETENTION
+    ).delete()
@@ -0,0 +1,221 @@
+"""Background deletion of products in chunks.
+
+Deleting products with `QuerySet.delete()` makes the Django collector load every
+cascaded row into memory, which does not scale for large catalogs. Here the
+bulky relations (stocks, allocations, channel listings, attribute assignments
+and checkout lines) are removed with raw `DELETE ... USING` statements, and only
+the remaining rows, which have signal receivers attached, go through the
+collector. Every chunk is deleted in its own transaction and the plugin
+notifications of the chunk are sent after it commits.
+"""
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from ..account.models import User
+from ..app.models import App
+from ..attribute import AttributeInputType
+from ..attribute.models import (
+    AssignedProductAttribute,
+    AssignedProductAttributeValue,
+    AssignedProductAttributeValueIndex,
+    AssignedVariantAttribute,
+    AssignedVariantAttributeValue,
+    AttributeValue,
+)
+from ..celeryconf import app
+from ..checkout.models import CheckoutLine
+from ..order import OrderStatus
+from ..order import events as order_events
+from ..order.models import FulfillmentLine, Order, OrderLine
+from ..order.tasks import recalculate_orders_task
+from ..plugins.manager import get_plugins_manager
+from ..warehouse.models import Allocation, Stock
+from .models import (
+    Product,
+    ProductChannelListing,
+    ProductVariant,
+    ProductVariantChannelListing,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _get_delete_sql():
+    """Return statements removing the product relations without the collector.
+
+    Statements are executed in order with the list of product IDs as the only
+    parameter; rows depending on other rows are removed first.
+    """
+    variant_table = ProductVariant._meta.db_table
+    stock_table = Stock._meta.db_table
+    return [
+        f"""
+        DELETE FROM {AssignedProductAttributeValueIndex._meta.db_table}
+        WHERE product_id = ANY(%s)
+        """,
+        f"""
+        DELETE FROM {AssignedProductAttributeValue._meta.db_table} AS value
+        USING {AssignedProductAttribute._meta.db_table} AS assignment
+        WHERE value.assignment_id = assignment.id
+            AND assignment.product_id = ANY(%s)
+        """,
+        f"""
+        DELETE FROM {AssignedProductAttribute._meta.db_table}
+        WHERE product_id = ANY(%s)
+        """,
+        f"""
+        DELETE FROM {AssignedVariantAttributeValue._meta.db_table} AS value
+        USING {AssignedVariantAttribute._meta.db_table} AS assignment,
+            {variant_table} AS variant
+        WHERE value.assignment_id = assignment.id
+            AND assignment.variant_id = variant.id
+            AND variant.product_id = ANY(%s)
+        """,
+        f"""
+        DELETE FROM {AssignedVariantAttribute._meta.db_table} AS assignment
+        USING {variant_table} AS variant
+        WHERE assignment.variant_id = variant.id
+            AND variant.product_id = ANY(%s)
+        """,
+        f"""
+        DELETE FROM {Allocation._meta.db_table} AS allocation
+        USING {stock_table} AS stock, {variant_table} AS variant
+        WHERE allocation.stock_id = stock.id
+            AND stock.product_variant_id = variant.id
+            AND variant.product_id = ANY(%s)
+        """,
+        f"""
+        UPDATE {FulfillmentLine._meta.db_table} AS line
+        SET stock_id = NULL
+        FROM {stock_table} AS stock, {variant_table} AS variant
+        WHERE line.stock_id = stock.id
+            AND stock.product_variant_id = variant.id
+            AND variant.product_id = ANY(%s)
+        """,
+        f"""
+        DELETE FROM {stock_table} AS stock
+        USING {variant_table} AS variant
+        WHERE stock.product_variant_id = variant.id
+            AND variant.product_id = ANY(%s)
+        """,
+        f"""
+        DELETE FROM {ProductVariantChannelListing._meta.db_table} AS listing
+        USING {variant_table} AS variant
+        WHERE listing.variant_id = variant.id
+            AND variant.product_id = ANY(%s)
+        """,
+        f"""
+        DELETE FROM {CheckoutLine._meta.db_table} AS line
+        USING {variant_table} AS variant
+        WHERE line.variant_id = variant.id
+            AND variant.product_id = ANY(%s)
+        """,
+        f"""
+        DELETE FROM {ProductChannelListing._meta.db_table}
+        WHERE product_id = ANY(%s)
+        """,
+    ]
+
+
+def _delete_draft_order_lines(
+    variant_ids: Iterable[int], user: Optional[User], app: Optional[App]
+) -> List[int]:
+    """Delete draft order lines of the variants and return IDs of their orders."""
+    lines = OrderLine.objects.filter(
+        variant_id__in=variant_ids, order__status=OrderStatus.DRAFT
+    ).select_related("order")
+    order_to_lines_mapping: Dict[Order, List[OrderLine]] = defaultdict(list)
+    for line in lines:
+        order_to_lines_mapping[line.order].append(line)
+    if not order_to_lines_mapping:
+        return []
+
+    OrderLine.objects.filter(
+        pk__in=[
+            line.pk
+            for order_lines in order_to_lines_mapping.values()
+            for line in order_lines
+        ]
+    ).delete()
+    for order, order_lines in order_to_lines_mapping.items():
+        lines_data = [(line.quantity, line) for line in order_lines]
+        order_events.order_line_product_removed_event(order, user, app, lines_data)
+    return [order.pk for order in order_to_lines_mapping]
+
+
+def delete_products_chunk(
+    product_ids: List[int], user: Optional[User], app: Optional[App], manager
+) -> List[int]:
+    """Delete the products and return IDs of draft orders that lost their lines.
+
+    Plugins are notified about the deleted products after the transaction commits.
+    """
+    with transaction.atomic():
+        products = list(Product.objects.select_for_update().filter(pk__in=product_ids))
+        product_ids = [product.pk for product in products]
+        product_variant_map = defaultdict(list)
+        for product_id, variant_id in ProductVariant.objects.filter(
+            product_id__in=product_ids
+        ).values_list("product_id", "pk"):
+            product_variant_map[product_id].append(variant_id)
+
+        order_ids = _delete_draft_order_lines(
+            [pk for pks in product_variant_map.values() for pk in pks], user, app
+        )
+
+        # Values of these attributes are not shared between products, so they are
+        # deleted along with the products. The collector is used as the values
+        # of file attributes have signal receivers removing the files.
+        AttributeValue.objects.filter(
+            productassignments__product_id__in=product_ids,
+            attribute__input_type__in=AttributeInputType.TYPES_WITH_UNIQUE_VALUES,
+        ).delete()
+
+        with connection.cursor() as cursor:
+            for sql in _get_delete_sql():
+                cursor.execute(sql, [product_ids])
+
+        Product.objects.filter(pk__in=product_ids).delete()
+
+        def notify():
+            for product in products:
+                manager.product_deleted(product, product_variant_map[product.pk])
+
+        transaction.on_commit(notify)
+    return order_ids
+
+
+def delete_products(
+    product_ids: List[int],
+    user: Optional[User] = None,
+    app: Optional[App] = None,
+    chunk_size: Optional[int] = None,
+):
+    """Delete the products in chunks, each chunk in a separate transaction."""
+    chunk_size = chunk_size or settings.PRODUCT_DELETE_CHUNK_SIZE
+    manager = get_plugins_manager()
+    product_ids = sorted(product_ids)
+    total = len(product_ids)
+    order_ids = set()
+    for start in range(0, total, chunk_size):
+        chunk_end = start + chunk_size
+        order_ids.update(
+            delete_products_chunk(product_ids[start:chunk_end], user, app, manager)
+        )
+        logger.info("Deleted %s of %s products.", min(chunk_end, total), total)
+
+    if order_ids:
+        recalculate_orders_task.delay(sorted(order_ids))
+
+
+@app.task
+def delete_products_task(
+    product_ids: List[int], user_id: Optional[int] = None, app_id: Optional[int] = None
+):
+    user = User.objects.filter(pk=user_id).first() if user_id else None
+    requestor_app = App.objects.filter(pk=app_id).first() if app_id else None
+    delete_products(product_ids, user, requestor_app)
@@ -8,7 +8,11 @@ from prices import Money, TaxedMoney, TaxedMoneyRange
 
 from ...plugins.manager import PluginsManager, get_plugins_manager
 from .. import models
-from ..utils.availability import get_product_availability
+from ..utils.availability import (
+    ProductPricingData,
+    get_product_availability,
+    get_products_availability,
+)
 
 
 def test_availability(stock, monkeypatch, settings, channel_USD):
@@ -166,6 +170,72 @@ def test_availability_without_variant_channel_listings(stock, channel_USD):
     assert price_range is None
 
 
+def _get_products_pricing_data(products, channel):
+    return [
+        ProductPricingData(
+            product=product,
+            product_channel_listing=product.channel_listings.get(channel=channel),
+            variants=list(product.variants.all()),
+            variants_channel_listing=list(
+                models.ProductVariantChannelListing.objects.filter(
+                    variant__product=product, channel=channel
+                )
+            ),
+            collections=list(product.collections.all()),
+        )
+        for product in products
+    ]
+
+
+def test_get_products_availability(product_list, discount_info, channel_USD):
+    # given
+    products = _get_products_pricing_data(product_list, channel_USD)
+    manager = get_plugins_manager()
+
+    # when
+    availabilities = get_products_availability(
+        products=products,
+        discounts=[discount_info],
+        channel=channel_USD,
+        manager=manager,
+        country=Country("US"),
+    )
+
+    # then
+    assert [
+        availability.price_range_undiscounted.start.gross.amount
+        for availability in availabilities
+    ] == [Decimal(10), Decimal(20), Decimal(30)]
+    assert [
+        availability.price_range.start.gross.amount for availability in availabilities
+    ] == [Decimal(5), Decimal(15), Decimal(25)]
+    assert all(availability.on_sale for availability in availabilities)
+
+
+def test_get_products_availability_applies_taxes_once_per_price(
+    product_list, channel_USD, monkeypatch
+):
+    # given
+    products = _get_products_pricing_data(product_list, channel_USD)
+    taxed_price = TaxedMoney(Money("10.0", "USD"), Money("12.30", "USD"))
+    apply_taxes_mock = Mock(return_value=taxed_price)
+    monkeypatch.setattr(PluginsManager, "apply_taxes_to_product", apply_taxes_mock)
+    manager = get_plugins_manager()
+
+    # when
+    availabilities = get_products_availability(
+        products=products,
+        discounts=[],
+        channel=channel_USD,
+        manager=manager,
+        country=Country("US"),
+    )
+
+    # then
+    assert len(availabilities) == len(product_list)
+    assert apply_taxes_mock.call_count == len(product_list)
+
+
 def test_available_products_only_published(product_list, channel_USD):
     channel_listing = product_list[0].channel_listings.get()
     channel_listing.is_published = False
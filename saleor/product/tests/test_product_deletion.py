@@ -0,0 +1,72 @@
+from unittest.mock import call, patch
+
+from ...order import OrderEvents
+from ...order.models import FulfillmentLine, OrderLine
+from ...tests.utils import flush_post_commit_hooks
+from ...warehouse.models import Allocation, Stock
+from ..deletion import delete_products
+from ..models import Product, ProductChannelListing, ProductVariantChannelListing
+
+
+@patch("saleor.plugins.manager.PluginsManager.product_deleted")
+def test_delete_products(mocked_product_deleted, order_with_lines, staff_user):
+    # given
+    order = order_with_lines
+    fulfillment = order.fulfillments.create(tracking_number="123")
+    lines = list(order.lines.all())
+    for line in lines:
+        fulfillment.lines.create(
+            order_line=line,
+            quantity=line.quantity,
+            stock=line.allocations.get().stock,
+        )
+    products = [line.variant.product for line in lines]
+    variant_ids = [line.variant_id for line in lines]
+
+    # when
+    delete_products([product.pk for product in products], staff_user, chunk_size=1)
+
+    # then
+    assert not Product.objects.filter(
+        pk__in=[product.pk for product in products]
+    ).exists()
+    assert not Stock.objects.filter(product_variant_id__in=variant_ids).exists()
+    assert not Allocation.objects.filter(order_line__order=order).exists()
+    assert not ProductChannelListing.objects.filter(product__in=products).exists()
+    assert not ProductVariantChannelListing.objects.filter(
+        variant_id__in=variant_ids
+    ).exists()
+    assert list(order.lines.values_list("variant_id", flat=True)) == [None, None]
+    assert set(FulfillmentLine.objects.values_list("stock_id", flat=True)) == {None}
+
+    mocked_product_deleted.assert_not_called()
+    flush_post_commit_hooks()
+    assert mocked_product_deleted.call_count == 2
+    mocked_product_deleted.assert_has_calls(
+        [
+            call(product, [variant_id])
+            for product, variant_id in sorted(
+                zip(products, variant_ids), key=lambda item: item[0].pk
+            )
+        ]
+    )
+
+
+@patch("saleor.order.tasks.recalculate_orders_task.delay")
+def test_delete_products_removes_draft_order_lines(
+    mocked_recalculate_orders_task, draft_order, staff_user
+):
+    # given
+    line = draft_order.lines.first()
+    product = line.variant.product
+
+    # when
+    delete_products([product.pk], staff_user)
+
+    # then
+    assert not Product.objects.filter(pk=product.pk).exists()
+    assert not OrderLine.objects.filter(pk=line.pk).exists()
+    assert draft_order.events.filter(
+        type=OrderEvents.ORDER_LINE_PRODUCT_DELETED, user=staff_user
+    ).exists()
+    mocked_recalculate_orders_task.assert_called_once_with([draft_order.pk])
@@ -1,13 +1,19 @@
+from decimal import Decimal
 from unittest.mock import patch
 
 from django.core.management import call_command
 from prices import Money
 
+from ..models import Product
 from ..tasks import (
     update_products_discounted_prices_of_catalogues,
     update_products_discounted_prices_task,
 )
-from ..utils.variant_prices import update_product_discounted_price
+from ..utils.variant_prices import (
+    update_product_discounted_price,
+    update_products_discounted_prices,
+    update_variants_prices,
+)
 
 
 def test_update_product_discounted_price(product, channel_USD):
@@ -137,3 +143,41 @@ def test_management_commmand_update_all_products_discounted_price(
     call_args_list = mock_update_product_discounted_price.call_args_list
     for (args, kwargs), product in zip(call_args_list, product_list):
         assert args[0] == product
+
+
+def test_update_products_discounted_prices(product_list):
+    # given
+    price = Money("0.01", "USD")
+    for product in product_list:
+        variant_channel_listing = product.variants.first().channel_listings.get()
+        variant_channel_listing.price = price
+        variant_channel_listing.save()
+    products = Product.objects.filter(pk__in=[product.pk for product in product_list])
+
+    # when
+    update_products_discounted_prices(products)
+
+    # then
+    for product in product_list:
+        assert product.channel_listings.get().discounted_price == price
+
+
+def test_update_variants_prices(product, channel_USD, channel_PLN):
+    # given
+    variant = product.variants.get()
+    prices_data = [
+        (variant.pk, channel_USD, Decimal("15.00"), None),
+        (variant.pk, channel_PLN, Decimal("60.00"), Decimal("20.00")),
+    ]
+
+    # when
+    product_ids = update_variants_prices(prices_data)
+
+    # then
+    assert product_ids == [product.pk]
+    usd_listing = variant.channel_listings.get(channel=channel_USD)
+    assert usd_listing.price_amount == Decimal("15.00")
+    assert usd_listing.cost_price_amount == Decimal("1")
+    pln_listing = variant.channel_listings.get(channel=channel_PLN)
+    assert pln_listing.price == Money("60.00", channel_PLN.currency_code)
+    assert pln_listing.cost_price_amount == Decimal("20.00")
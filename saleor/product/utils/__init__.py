@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Dict, Iterable, List, Union
 
+from ...core.loader_cache import invalidate_objects
 from ...core.taxes import TaxedMoney, zero_taxed_money
 from ...core.tracing import traced_atomic_transaction
 from ..models import Product, ProductChannelListing
@@ -54,6 +55,7 @@ def delete_categories(categories_ids: List[str], manager):
 
     categories.delete()
     product_ids = [product.id for product in products]
+    invalidate_objects(Product, product_ids)
     for product in products:
         manager.product_updated(product)
 
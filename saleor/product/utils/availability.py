@@ -1,15 +1,16 @@
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple, Union
+from decimal import Decimal
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
 
 import opentracing
 from django.conf import settings
 from django_countries.fields import Country
-from prices import MoneyRange, TaxedMoney, TaxedMoneyRange
+from prices import Money, MoneyRange, TaxedMoney, TaxedMoneyRange
 
 from ...channel.models import Channel
 from ...core.utils import to_local_currency
 from ...discount import DiscountInfo
-from ...discount.utils import calculate_discounted_price
+from ...discount.utils import calculate_discounted_price, get_product_discounts
 from ...product.models import (
     Collection,
     Product,
@@ -23,6 +24,24 @@ if TYPE_CHECKING:
     from ...plugins.manager import PluginsManager
 
 
+@dataclass
+class ProductPricingData:
+    product: Product
+    product_channel_listing: Optional[ProductChannelListing]
+    variants: Iterable[ProductVariant]
+    variants_channel_listing: List[ProductVariantChannelListing]
+    collections: Iterable[Collection]
+
+
+@dataclass
+class VariantPricingData:
+    variant: ProductVariant
+    variant_channel_listing: ProductVariantChannelListing
+    product: Product
+    product_channel_listing: Optional[ProductChannelListing]
+    collections: Iterable[Collection]
+
+
 @dataclass
 class ProductAvailability:
     on_sale: bool
@@ -136,6 +155,198 @@ def get_product_price_range(
     return None
 
 
+class TaxedPriceCalculator:
+    """Apply taxes to prices of products in a channel and country.
+
+    Taxes depend only on the product and the price, so they are calculated
+    once for every product and price met in the batch.
+    """
+
+    def __init__(self, manager: "PluginsManager", country: Country, channel_slug: str):
+        self.manager = manager
+        self.country = country
+        self.channel_slug = channel_slug
+        self._taxed_prices: Dict[Tuple[int, Decimal, str], TaxedMoney] = {}
+
+    def get_taxed_price(self, product: Product, price: Money) -> TaxedMoney:
+        key = (product.id, price.amount, price.currency)
+        if key not in self._taxed_prices:
+            self._taxed_prices[key] = self.manager.apply_taxes_to_product(
+                product, price, self.country, channel_slug=self.channel_slug
+            )
+        return self._taxed_prices[key]
+
+
+def _apply_discounts(price: Money, product_discounts: List) -> Money:
+    if product_discounts:
+        return min(discount(price) for discount in product_discounts)
+    return price
+
+
+def _get_product_availability(
+    data: ProductPricingData,
+    product_discounts: List,
+    taxed_prices: TaxedPriceCalculator,
+    local_currency: Optional[str],
+) -> ProductAvailability:
+    product = data.product
+    variant_ids = {variant.id for variant in data.variants}
+    prices = [
+        channel_listing.price
+        for channel_listing in data.variants_channel_listing
+        if channel_listing and channel_listing.variant_id in variant_ids
+    ]
+
+    discounted = None
+    undiscounted = None
+    discount = None
+    price_range_local = None
+    discount_local_currency = None
+    if prices:
+        discounted_prices = [
+            _apply_discounts(price, product_discounts) for price in prices
+        ]
+        discounted = TaxedMoneyRange(
+            start=taxed_prices.get_taxed_price(product, min(discounted_prices)),
+            stop=taxed_prices.get_taxed_price(product, max(discounted_prices)),
+        )
+        undiscounted = TaxedMoneyRange(
+            start=taxed_prices.get_taxed_price(product, min(prices)),
+            stop=taxed_prices.get_taxed_price(product, max(prices)),
+        )
+        discount = _get_total_discount_from_range(undiscounted, discounted)
+        price_range_local, discount_local_currency = _get_product_price_range(
+            discounted, undiscounted, local_currency
+        )
+
+    is_visible = (
+        data.product_channel_listing is not None
+        and data.product_channel_listing.is_visible
+    )
+    is_on_sale = is_visible and discount is not None
+
+    return ProductAvailability(
+        on_sale=is_on_sale,
+        price_range=discounted,
+        price_range_undiscounted=undiscounted,
+        discount=discount,
+        price_range_local_currency=price_range_local,
+        discount_local_currency=discount_local_currency,
+    )
+
+
+def _get_variant_availability(
+    data: VariantPricingData,
+    product_discounts: List,
+    taxed_prices: TaxedPriceCalculator,
+    local_currency: Optional[str],
+) -> VariantAvailability:
+    price = data.variant_channel_listing.price
+    discounted = taxed_prices.get_taxed_price(
+        data.product, _apply_discounts(price, product_discounts)
+    )
+    undiscounted = taxed_prices.get_taxed_price(data.product, price)
+
+    discount = _get_total_discount(undiscounted, discounted)
+
+    if local_currency:
+        price_local_currency = to_local_currency(discounted, local_currency)
+        discount_local_currency = to_local_currency(discount, local_currency)
+    else:
+        price_local_currency = None
+        discount_local_currency = None
+
+    is_visible = (
+        data.product_channel_listing is not None
+        and data.product_channel_listing.is_visible
+    )
+    is_on_sale = is_visible and discount is not None
+
+    return VariantAvailability(
+        on_sale=is_on_sale,
+        price=discounted,
+        price_undiscounted=undiscounted,
+        discount=discount,
+        price_local_currency=price_local_currency,
+        discount_local_currency=discount_local_currency,
+    )
+
+
+def get_products_availability(
+    *,
+    products: Iterable[ProductPricingData],
+    discounts: Iterable[DiscountInfo],
+    channel: Channel,
+    manager: "PluginsManager",
+    country: Country,
+    local_currency: Optional[str] = None,
+) -> List[ProductAvailability]:
+    """Return availability of a batch of products in a channel and country.
+
+    Sales applicable to each product are resolved once and applied to prices of
+    all its variants; taxes are calculated once per product and price.
+    """
+    with opentracing.global_tracer().start_active_span("get_products_availability"):
+        discounts = list(discounts or [])
+        taxed_prices = TaxedPriceCalculator(manager, country, channel.slug)
+        return [
+            _get_product_availability(
+                data,
+                list(
+                    get_product_discounts(
+                        product=data.product,
+                        collections=data.collections,
+                        discounts=discounts,
+                        channel=channel,
+                    )
+                ),
+                taxed_prices,
+                local_currency,
+            )
+            for data in products
+        ]
+
+
+def get_variants_availability(
+    *,
+    variants: Iterable[VariantPricingData],
+    discounts: Iterable[DiscountInfo],
+    channel: Channel,
+    manager: "PluginsManager",
+    country: Country,
+    local_currency: Optional[str] = None,
+) -> List[VariantAvailability]:
+    """Return availability of a batch of variants in a channel and country.
+
+    Sales applicable to a product are resolved once for all its variants; taxes
+    are calculated once per product and price.
+    """
+    with opentracing.global_tracer().start_active_span("get_variants_availability"):
+        discounts = list(discounts or [])
+        taxed_prices = TaxedPriceCalculator(manager, country, channel.slug)
+        product_discounts: Dict[int, List] = {}
+        availabilities = []
+        for data in variants:
+            if data.product.id not in product_discounts:
+                product_discounts[data.product.id] = list(
+                    get_product_discounts(
+                        product=data.product,
+                        collections=data.collections,
+                        discounts=discounts,
+                        channel=channel,
+                    )
+                )
+            availabilities.append(
+                _get_variant_availability(
+                    data,
+                    product_discounts[data.product.id],
+                    taxed_prices,
+                    local_currency,
+                )
+            )
+        return availabilities
+
+
 def get_product_availability(
     *,
     product: Product,
@@ -150,80 +361,21 @@ def get_product_availability(
     local_currency: Optional[str] = None,
 ) -> ProductAvailability:
     with opentracing.global_tracer().start_active_span("get_product_availability"):
-        channel_slug = channel.slug
-
-        discounted = None
-        discounted_net_range = get_product_price_range(
+        data = ProductPricingData(
             product=product,
+            product_channel_listing=product_channel_listing,
             variants=variants,
             variants_channel_listing=variants_channel_listing,
             collections=collections,
-            discounts=discounts,
-            channel=channel,
         )
-        if discounted_net_range is not None:
-            discounted = TaxedMoneyRange(
-                start=manager.apply_taxes_to_product(
-                    product,
-                    discounted_net_range.start,
-                    country,
-                    channel_slug=channel_slug,
-                ),
-                stop=manager.apply_taxes_to_product(
-                    product,
-                    discounted_net_range.stop,
-                    country,
-                    channel_slug=channel_slug,
-                ),
-            )
-
-        undiscounted = None
-        undiscounted_net_range = get_product_price_range(
-            product=product,
-            variants=variants,
-            variants_channel_listing=variants_channel_listing,
-            collections=collections,
-            discounts=[],
+        return get_products_availability(
+            products=[data],
+            discounts=discounts,
             channel=channel,
-        )
-        if undiscounted_net_range is not None:
-            undiscounted = TaxedMoneyRange(
-                start=manager.apply_taxes_to_product(
-                    product,
-                    undiscounted_net_range.start,
-                    country,
-                    channel_slug=channel_slug,
-                ),
-                stop=manager.apply_taxes_to_product(
-                    product,
-                    undiscounted_net_range.stop,
-                    country,
-                    channel_slug=channel_slug,
-                ),
-            )
-
-        discount = None
-        price_range_local = None
-        discount_local_currency = None
-        if undiscounted_net_range is not None and discounted_net_range is not None:
-            discount = _get_total_discount_from_range(undiscounted, discounted)
-            price_range_local, discount_local_currency = _get_product_price_range(
-                discounted, undiscounted, local_currency
-            )
-
-        is_visible = (
-            product_channel_listing is not None and product_channel_listing.is_visible
-        )
-        is_on_sale = is_visible and discount is not None
-
-        return ProductAvailability(
-            on_sale=is_on_sale,
-            price_range=discounted,
-            price_range_undiscounted=undiscounted,
-            discount=discount,
-            price_range_local_currency=price_range_local,
-            discount_local_currency=discount_local_currency,
-        )
+            manager=manager,
+            country=country,
+            local_currency=local_currency,
+        )[0]
 
 
 def get_variant_availability(
@@ -239,53 +391,18 @@ def get_variant_availability(
     local_currency: Optional[str] = None,
 ) -> VariantAvailability:
     with opentracing.global_tracer().start_active_span("get_variant_availability"):
-        channel_slug = channel.slug
-        discounted = plugins.apply_taxes_to_product(
-            product,
-            get_variant_price(
-                variant=variant,
-                variant_channel_listing=variant_channel_listing,
-                product=product,
-                collections=collections,
-                discounts=discounts,
-                channel=channel,
-            ),
-            country,
-            channel_slug=channel_slug,
-        )
-        undiscounted = plugins.apply_taxes_to_product(
-            product,
-            get_variant_price(
-                variant=variant,
-                variant_channel_listing=variant_channel_listing,
-                product=product,
-                collections=collections,
-                discounts=[],
-                channel=channel,
-            ),
-            country,
-            channel_slug=channel_slug,
-        )
-
-        discount = _get_total_discount(undiscounted, discounted)
-
-        if local_currency:
-            price_local_currency = to_local_currency(discounted, local_currency)
-            discount_local_currency = to_local_currency(discount, local_currency)
-        else:
-            price_local_currency = None
-            discount_local_currency = None
-
-        is_visible = (
-            product_channel_listing is not None and product_channel_listing.is_visible
-        )
-        is_on_sale = is_visible and discount is not None
-
-        return VariantAvailability(
-            on_sale=is_on_sale,
-            price=discounted,
-            price_undiscounted=undiscounted,
-            discount=discount,
-            price_local_currency=price_local_currency,
-            discount_local_currency=discount_local_currency,
+        data = VariantPricingData(
+            variant=variant,
+            variant_channel_listing=variant_channel_listing,
+            product=product,
+            product_channel_listing=product_channel_listing,
+            collections=collections,
         )
+        return get_variants_availability(
+            variants=[data],
+            discounts=discounts,
+            channel=channel,
+            manager=plugins,
+            country=country,
+            local_currency=local_currency,
+        )[0]
@@ -1,13 +1,27 @@
 import operator
 from collections import defaultdict
+from decimal import Decimal
 from functools import reduce
-from typing import Optional
+from typing import TYPE_CHECKING, DefaultDict, Iterable, List, Optional, Tuple
 
+from django.db import connection
+from django.db.models import F
 from django.db.models.query_utils import Q
 from prices import Money
 
+from ...core.loader_cache import invalidate_objects
 from ...discount.utils import calculate_discounted_price, fetch_active_discounts
-from ..models import Product, ProductChannelListing, ProductVariantChannelListing
+from ..models import (
+    Product,
+    ProductChannelListing,
+    ProductVariant,
+    ProductVariantChannelListing,
+)
+
+if TYPE_CHECKING:
+    from ...channel.models import Channel
+
+DISCOUNTED_PRICES_BATCH_SIZE = 1000
 
 
 def _get_variant_prices_in_channels_dict(product):
@@ -36,11 +50,9 @@ def _get_product_discounted_price(
     return min(discounted_variants_price)
 
 
-def update_product_discounted_price(product, discounts=None):
-    if discounts is None:
-        discounts = fetch_active_discounts()
-    collections = list(product.collections.all())
-    variant_prices_in_channels_dict = _get_variant_prices_in_channels_dict(product)
+def _get_product_channel_listings_to_update(
+    product, collections, variant_prices_in_channels_dict, discounts
+):
     changed_products_channels_to_update = []
     for product_channel_listing in product.channel_listings.all():
         channel_id = product_channel_listing.channel_id
@@ -59,17 +71,68 @@ def update_product_discounted_price(product, discounts=None):
                 product_discounted_price.amount
             )
             changed_products_channels_to_update.append(product_channel_listing)
+    return changed_products_channels_to_update
+
+
+def update_product_discounted_price(product, discounts=None):
+    if discounts is None:
+        discounts = fetch_active_discounts()
+    collections = list(product.collections.all())
+    variant_prices_in_channels_dict = _get_variant_prices_in_channels_dict(product)
+    changed_products_channels_to_update = _get_product_channel_listings_to_update(
+        product, collections, variant_prices_in_channels_dict, discounts
+    )
     ProductChannelListing.objects.bulk_update(
         changed_products_channels_to_update, ["discounted_price_amount"]
     )
+    if changed_products_channels_to_update:
+        invalidate_objects(Product, [product.pk])
 
 
 def update_products_discounted_prices(products, discounts=None):
+    """Recalculate discounted prices of products in batches.
+
+    Collections, channel listings and variant prices are fetched for the whole
+    batch of products, so the number of queries doesn't depend on the number
+    of products.
+    """
     if discounts is None:
         discounts = fetch_active_discounts()
 
-    for product in products.prefetch_related("channel_listings"):
-        update_product_discounted_price(product, discounts)
+    product_ids = list(products.values_list("pk", flat=True))
+    for index in range(0, len(product_ids), DISCOUNTED_PRICES_BATCH_SIZE):
+        batch_end = index + DISCOUNTED_PRICES_BATCH_SIZE
+        batch_ids = product_ids[index:batch_end]
+        variant_prices_for_products: DefaultDict[int, DefaultDict] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        variant_channel_listings = ProductVariantChannelListing.objects.filter(
+            variant__product_id__in=batch_ids, price_amount__isnull=False
+        ).annotate(product_id=F("variant__product_id"))
+        for variant_channel_listing in variant_channel_listings:
+            variant_prices_for_products[variant_channel_listing.product_id][
+                variant_channel_listing.channel_id
+            ].append(variant_channel_listing.price)
+
+        changed_products_channels_to_update = []
+        for product in Product.objects.filter(pk__in=batch_ids).prefetch_related(
+            "collections", "channel_listings__channel"
+        ):
+            changed_products_channels_to_update.extend(
+                _get_product_channel_listings_to_update(
+                    product,
+                    list(product.collections.all()),
+                    variant_prices_for_products[product.pk],
+                    discounts,
+                )
+            )
+        ProductChannelListing.objects.bulk_update(
+            changed_products_channels_to_update, ["discounted_price_amount"]
+        )
+        invalidate_objects(
+            Product,
+            {listing.product_id for listing in changed_products_channels_to_update},
+        )
 
 
 def update_products_discounted_prices_of_catalogues(
@@ -98,3 +161,56 @@ def update_products_discounted_prices_of_discount(discount):
         category_ids=discount.categories.all().values_list("id", flat=True),
         collection_ids=discount.collections.all().values_list("id", flat=True),
     )
+
+
+VARIANT_PRICES_UPSERT_SQL = """
+    WITH upserted AS (
+        INSERT INTO {listing_table} AS listing (
+            variant_id, channel_id, currency, price_amount, cost_price_amount
+        )
+        SELECT * FROM unnest(
+            %s::int[], %s::int[], %s::varchar[], %s::numeric[], %s::numeric[]
+        )
+        ON CONFLICT (variant_id, channel_id) DO UPDATE SET
+            currency = EXCLUDED.currency,
+            price_amount = EXCLUDED.price_amount,
+            cost_price_amount = COALESCE(
+                EXCLUDED.cost_price_amount, listing.cost_price_amount
+            )
+        RETURNING variant_id
+    )
+    SELECT DISTINCT variant.product_id
+    FROM upserted
+    JOIN {variant_table} variant ON variant.id = upserted.variant_id
+"""
+
+
+def update_variants_prices(
+    prices_data: Iterable[Tuple[int, "Channel", Optional[Decimal], Optional[Decimal]]],
+) -> List[int]:
+    """Set prices of variants given as (variant pk, channel, price, cost price).
+
+    Variant channel listings are created or updated with a single statement;
+    cost prices given as None are left unchanged.
+
+    Return IDs of products which variant prices were updated.
+    """
+    variant_pks, channel_pks, currencies, prices, cost_prices = [], [], [], [], []
+    for variant_pk, channel, price, cost_price in prices_data:
+        variant_pks.append(variant_pk)
+        channel_pks.append(channel.pk)
+        currencies.append(channel.currency_code)
+        prices.append(price)
+        cost_prices.append(cost_price)
+    if not variant_pks:
+        return []
+
+    sql = VARIANT_PRICES_UPSERT_SQL.format(
+        listing_table=ProductVariantChannelListing._meta.db_table,
+        variant_table=ProductVariant._meta.db_table,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [variant_pks, channel_pks, currencies, prices, cost_prices])
+        product_ids = [product_id for product_id, in cursor.fetchall()]
+    invalidate_objects(ProductVariant, variant_pks)
+    return product_ids
@@ -0,0 +1,46 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class ShippingAppConfig(AppConfig):
+    name = "saleor.shipping"
+
+    def ready(self):
+        from .models import (
+            ShippingMethod,
+            ShippingMethodChannelListing,
+            ShippingMethodPostalCodeRule,
+            ShippingZone,
+        )
+        from .signals import (
+            invalidate_shipping_tables_cache,
+            invalidate_shipping_tables_cache_on_m2m_change,
+        )
+
+        # compiled shipping tables must not outlive changes of the shipping setup
+        for model in [
+            ShippingZone,
+            ShippingMethod,
+            ShippingMethodChannelListing,
+            ShippingMethodPostalCodeRule,
+        ]:
+            post_save.connect(
+                invalidate_shipping_tables_cache,
+                sender=model,
+                dispatch_uid=f"invalidate_shipping_tables_saved_{model.__name__}",
+            )
+            post_delete.connect(
+                invalidate_shipping_tables_cache,
+                sender=model,
+                dispatch_uid=f"invalidate_shipping_tables_deleted_{model.__name__}",
+            )
+        m2m_changed.connect(
+            invalidate_shipping_tables_cache_on_m2m_change,
+            sender=ShippingZone.channels.through,
+            dispatch_uid="invalidate_shipping_tables_zone_channels",
+        )
+        m2m_changed.connect(
+            invalidate_shipping_tables_cache_on_m2m_change,
+            sender=ShippingMethod.excluded_products.through,
+            dispatch_uid="invalidate_shipping_tables_excluded_products",
+        )
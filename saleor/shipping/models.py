@@ -10,6 +10,7 @@ from measurement.measures import Weight
 from prices import Money
 
 from ..channel.models import Channel
+from ..core.cache import is_cache_shared
 from ..core.db.fields import SanitizedJSONField
 from ..core.models import ModelWithMetadata
 from ..core.permissions import ShippingPermissions
@@ -19,6 +20,7 @@ from ..core.utils.translations import Translation, TranslationProxy
 from ..core.weight import convert_weight, get_default_weight_unit, zero_weight
 from . import PostalCodeRuleInclusionType, ShippingMethodType
 from .postal_codes import filter_shipping_methods_by_postal_code_rules
+from .shipping_table import get_shipping_table
 
 if TYPE_CHECKING:
     # flake8: noqa
@@ -165,17 +167,29 @@ class ShippingMethodQueryset(models.QuerySet):
             instance_product_ids = set(lines.values_list("variant__product", flat=True))
         else:
             instance_product_ids = {line.product.id for line in lines}
-        applicable_methods = self.applicable_shipping_methods(
+        if not is_cache_shared():
+            # compiled tables are cached only when all workers share the cache
+            applicable_methods = self.applicable_shipping_methods(
+                price=price,
+                channel_id=channel_id,
+                weight=instance.get_total_weight(lines),
+                country_code=country_code,
+                product_ids=instance_product_ids,
+            ).prefetch_related("postal_code_rules")
+            return filter_shipping_methods_by_postal_code_rules(
+                applicable_methods, instance.shipping_address
+            )
+        shipping_table = get_shipping_table(channel_id)
+        applicable_method_ids = shipping_table.get_applicable_shipping_method_ids(
             price=price,
-            channel_id=channel_id,
             weight=instance.get_total_weight(lines),
-            country_code=country_code or instance.shipping_address.country.code,
+            country_code=country_code,
+            postal_code=instance.shipping_address.postal_code,
             product_ids=instance_product_ids,
-        ).prefetch_related("postal_code_rules")
-
-        return filter_shipping_methods_by_postal_code_rules(
-            applicable_methods, instance.shipping_address
         )
+        qs = self.filter(pk__in=applicable_method_ids)
+        qs = self.applicable_shipping_methods_by_channel(qs, channel_id)
+        return qs.prefetch_related("shipping_zone")
 
 
 class ShippingMethod(ModelWithMetadata):
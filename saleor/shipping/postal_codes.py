@@ -1,7 +1,12 @@
 import re
+from bisect import bisect_right
+from typing import Any, Iterable, List, Optional, Tuple
 
 from . import PostalCodeRuleInclusionType
 
+UK_POSTAL_CODE_PATTERN = r"^([A-Z]{1,2})([0-9]+)([A-Z]?) ?([0-9][A-Z]{2})$"
+IRISH_POSTAL_CODE_PATTERN = r"([\dA-Z]{3}) ?([\dA-Z]{4})"
+
 
 def group_values(pattern, *values):
     result = []
@@ -46,8 +51,7 @@ def check_uk_postal_code(code, start, end):
 
     Example postal codes: BH20 2BC  (UK), IM16 7HF  (Isle of Man).
     """
-    pattern = r"^([A-Z]{1,2})([0-9]+)([A-Z]?) ?([0-9][A-Z]{2})$"
-    code, start, end = group_values(pattern, code, start, end)
+    code, start, end = group_values(UK_POSTAL_CODE_PATTERN, code, start, end)
     # replace second item of each tuple with it's value casted to int
     code, start, end = cast_tuple_index_to_type(1, int, code, start, end)
     return compare_values(code, start, end)
@@ -58,8 +62,7 @@ def check_irish_postal_code(code, start, end):
 
     Example postal codes: A65 2F0A, A61 2F0G.
     """
-    pattern = r"([\dA-Z]{3}) ?([\dA-Z]{4})"
-    code, start, end = group_values(pattern, code, start, end)
+    code, start, end = group_values(IRISH_POSTAL_CODE_PATTERN, code, start, end)
     return compare_values(code, start, end)
 
 
@@ -127,3 +130,103 @@ def filter_shipping_methods_by_postal_code_rules(shipping_methods, shipping_addr
     if excluded_methods_by_postal_code:
         return shipping_methods.exclude(pk__in=excluded_methods_by_postal_code)
     return shipping_methods
+
+
+def uk_postal_code_key(code) -> Optional[Tuple]:
+    """Return comparable sections of the UK postal code."""
+    (groups,) = group_values(UK_POSTAL_CODE_PATTERN, code)
+    (key,) = cast_tuple_index_to_type(1, int, groups)
+    return key or None
+
+
+def irish_postal_code_key(code) -> Optional[Tuple]:
+    """Return comparable sections of the Irish postal code."""
+    (key,) = group_values(IRISH_POSTAL_CODE_PATTERN, code)
+    return key or None
+
+
+def any_postal_code_key(code) -> Optional[str]:
+    return code or None
+
+
+POSTAL_CODE_KEY_FUNCTIONS = {
+    "GB": uk_postal_code_key,  # United Kingdom
+    "IM": uk_postal_code_key,  # Isle of Man
+    "GG": uk_postal_code_key,  # Guernsey
+    "JE": uk_postal_code_key,  # Jersey
+    "IE": irish_postal_code_key,  # Ireland
+}
+
+
+def get_postal_code_key_function(country):
+    return POSTAL_CODE_KEY_FUNCTIONS.get(country, any_postal_code_key)
+
+
+class PostalCodeRanges:
+    """Postal code ranges sorted by their start.
+
+    Next to the sorted starts, the greatest end of all ranges up to the given
+    position is stored, so checking if a code falls into any of the ranges is
+    a single binary search.
+    """
+
+    def __init__(self, ranges: Iterable[Tuple[Any, Optional[Any]]]):
+        sorted_ranges = sorted(
+            ((start, end) for start, end in ranges if start), key=lambda r: r[0]
+        )
+        self.starts = [start for start, _ in sorted_ranges]
+        # `None` stands for a range without an end
+        self.max_ends: List[Optional[Any]] = []
+        for index, (_, end) in enumerate(sorted_ranges):
+            previous_end = self.max_ends[index - 1] if index else end
+            if not end or previous_end is None:
+                self.max_ends.append(None)
+            else:
+                self.max_ends.append(max(end, previous_end))
+
+    def __contains__(self, code) -> bool:
+        if not code:
+            return False
+        index = bisect_right(self.starts, code)
+        if not index:
+            return False
+        max_end = self.max_ends[index - 1]
+        return max_end is None or code <= max_end
+
+
+class CompiledPostalCodeRules:
+    """Postal code rules of a shipping method pre-parsed for every code format.
+
+    Behaves as `is_shipping_method_applicable_for_postal_code`.
+    """
+
+    def __init__(self, rules: Iterable[Tuple[str, Optional[str], str]]):
+        rules = list(rules)
+        inclusion_types = {inclusion_type for _, _, inclusion_type in rules}
+        self.has_rules = bool(rules)
+        self.inclusion_type = (
+            inclusion_types.pop() if len(inclusion_types) == 1 else None
+        )
+        self.ranges = {
+            key_function: PostalCodeRanges(
+                (key_function(start), key_function(end) if end else None)
+                for start, end, _ in rules
+            )
+            for key_function in {
+                uk_postal_code_key,
+                irish_postal_code_key,
+                any_postal_code_key,
+            }
+        }
+
+    def is_applicable(self, country, postal_code) -> bool:
+        if not self.has_rules:
+            return True
+        if self.inclusion_type is None:
+            # Shipping methods with complex rules are not supported for now
+            return False
+        key_function = get_postal_code_key_function(country)
+        matched = key_function(postal_code) in self.ranges[key_function]
+        if self.inclusion_type == PostalCodeRuleInclusionType.INCLUDE:
+            return matched
+        return not matched
@@ -0,0 +1,206 @@
+"""In-memory tables of shipping methods available in channels.
+
+The tables answer which shipping methods are applicable for the given country,
+postal code, price, weight and products without querying the database.
+A table is compiled once per channel and stored in the shared cache under
+a version key; any change of shipping zones, methods, their channel listings,
+postal code rules or excluded products bumps the version. Without a shared
+cache the version would not reach other processes, so tables are not cached
+and shipping methods are filtered in the database instead.
+"""
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.crypto import get_random_string
+from measurement.measures import Weight
+from prices import Money
+
+from ..core.cache import is_cache_shared
+from . import ShippingMethodType
+from .postal_codes import CompiledPostalCodeRules
+
+SHIPPING_TABLE_VERSION_KEY = "shipping-table-version"
+SHIPPING_TABLE_KEY = "shipping-table:{version}:{channel_id}"
+
+lock = threading.Lock()
+with lock:
+    THREADED_SHIPPING_TABLES: Dict[int, "ShippingTable"] = {}
+    THREADED_SHIPPING_TABLES_VERSION = None
+
+
+@dataclass
+class CompiledShippingMethod:
+    id: int
+    type: str
+    price_amount: Decimal
+    currency: str
+    minimum_order_price_amount: Optional[Decimal]
+    maximum_order_price_amount: Optional[Decimal]
+    # weights are stored in the standard unit of the `Weight` measure
+    minimum_order_weight: Optional[float]
+    maximum_order_weight: Optional[float]
+    excluded_product_ids: FrozenSet[int]
+    postal_code_rules: CompiledPostalCodeRules
+
+    def is_applicable(self, price: Money, weight: Weight) -> bool:
+        if self.currency != price.currency:
+            return False
+        if self.type == ShippingMethodType.PRICE_BASED:
+            if self.minimum_order_price_amount is None:
+                return False
+            if self.minimum_order_price_amount > price.amount:
+                return False
+            max_price = self.maximum_order_price_amount
+            return max_price is None or max_price >= price.amount
+        if self.type == ShippingMethodType.WEIGHT_BASED:
+            weight_value = weight.standard
+            min_weight = self.minimum_order_weight
+            max_weight = self.maximum_order_weight
+            return (min_weight is None or min_weight <= weight_value) and (
+                max_weight is None or max_weight >= weight_value
+            )
+        return False
+
+
+class ShippingTable:
+    def __init__(self, methods_by_country: Dict[str, List[CompiledShippingMethod]]):
+        self.methods_by_country = methods_by_country
+
+    def get_applicable_shipping_method_ids(
+        self,
+        price: Money,
+        weight: Weight,
+        country_code: str,
+        postal_code: Optional[str] = None,
+        product_ids: Optional[Iterable[int]] = None,
+    ) -> List[int]:
+        """Return IDs of applicable shipping methods, the cheapest first."""
+        product_ids = set(product_ids or [])
+        return [
+            method.id
+            for method in self.methods_by_country.get(country_code, [])
+            if method.is_applicable(price, weight)
+            and not method.excluded_product_ids & product_ids
+            and method.postal_code_rules.is_applicable(country_code, postal_code)
+        ]
+
+
+def compile_shipping_table(channel_id: int) -> ShippingTable:
+    from .models import (
+        ShippingMethod,
+        ShippingMethodChannelListing,
+        ShippingMethodPostalCodeRule,
+        ShippingZone,
+    )
+
+    countries_by_zone = {
+        zone.pk: [country.code for country in zone.countries]
+        for zone in ShippingZone.objects.filter(channels__id=channel_id).only(
+            "pk", "countries"
+        )
+    }
+    listings = {
+        listing.shipping_method_id: listing
+        for listing in ShippingMethodChannelListing.objects.filter(
+            channel_id=channel_id
+        )
+    }
+    methods = ShippingMethod.objects.filter(
+        shipping_zone_id__in=countries_by_zone, pk__in=listings
+    ).only(
+        "pk",
+        "type",
+        "shipping_zone_id",
+        "minimum_order_weight",
+        "maximum_order_weight",
+    )
+    ExcludedProduct = ShippingMethod.excluded_products.through
+    excluded_products = defaultdict(set)
+    for method_id, product_id in ExcludedProduct.objects.filter(
+        shippingmethod_id__in=listings
+    ).values_list("shippingmethod_id", "product_id"):
+        excluded_products[method_id].add(product_id)
+    postal_code_rules = defaultdict(list)
+    for rule in ShippingMethodPostalCodeRule.objects.filter(
+        shipping_method_id__in=listings
+    ).values_list("shipping_method_id", "start", "end", "inclusion_type"):
+        postal_code_rules[rule[0]].append(rule[1:])
+
+    methods_by_country = defaultdict(list)
+    for method in methods:
+        listing = listings[method.pk]
+        min_weight = method.minimum_order_weight
+        max_weight = method.maximum_order_weight
+        compiled_method = CompiledShippingMethod(
+            id=method.pk,
+            type=method.type,
+            price_amount=listing.price_amount,
+            currency=listing.currency,
+            minimum_order_price_amount=listing.minimum_order_price_amount,
+            maximum_order_price_amount=listing.maximum_order_price_amount,
+            minimum_order_weight=(
+                min_weight.standard if min_weight is not None else None
+            ),
+            maximum_order_weight=(
+                max_weight.standard if max_weight is not None else None
+            ),
+            excluded_product_ids=frozenset(excluded_products[method.pk]),
+            postal_code_rules=CompiledPostalCodeRules(postal_code_rules[method.pk]),
+        )
+        for country_code in countries_by_zone[method.shipping_zone_id]:
+            methods_by_country[country_code].append(compiled_method)
+    for country_methods in methods_by_country.values():
+        country_methods.sort(key=lambda m: (m.price_amount, m.id))
+    return ShippingTable(dict(methods_by_country))
+
+
+def get_shipping_table_version() -> str:
+    version = cache.get(SHIPPING_TABLE_VERSION_KEY)
+    if version is None:
+        cache.add(SHIPPING_TABLE_VERSION_KEY, get_random_string(12), timeout=None)
+        version = cache.get(SHIPPING_TABLE_VERSION_KEY)
+    return version
+
+
+def get_shipping_table(channel_id: int) -> ShippingTable:
+    global THREADED_SHIPPING_TABLES, THREADED_SHIPPING_TABLES_VERSION
+
+    if not is_cache_shared():
+        return compile_shipping_table(channel_id)
+
+    version = get_shipping_table_version()
+    if version != THREADED_SHIPPING_TABLES_VERSION:
+        with lock:
+            THREADED_SHIPPING_TABLES = {}
+            THREADED_SHIPPING_TABLES_VERSION = version
+    if channel_id not in THREADED_SHIPPING_TABLES:
+        shared_key = SHIPPING_TABLE_KEY.format(version=version, channel_id=channel_id)
+        table = cache.get(shared_key)
+        if table is None:
+            table = compile_shipping_table(channel_id)
+            cache.set(shared_key, table)
+        with lock:
+            THREADED_SHIPPING_TABLES[channel_id] = table
+    return THREADED_SHIPPING_TABLES[channel_id]
+
+
+def _set_new_shipping_table_version():
+    global THREADED_SHIPPING_TABLES
+    cache.set(SHIPPING_TABLE_VERSION_KEY, get_random_string(12), timeout=None)
+    with lock:
+        THREADED_SHIPPING_TABLES = {}
+
+
+def invalidate_shipping_tables():
+    """Invalidate compiled shipping tables of all channels.
+
+    The tables are invalidated again after the current transaction commits, so
+    tables compiled in the meantime from not yet committed data are not reused.
+    """
+    _set_new_shipping_table_version()
+    transaction.on_commit(_set_new_shipping_table_version)
@@ -0,0 +1,10 @@
+from .shipping_table import invalidate_shipping_tables
+
+
+def invalidate_shipping_tables_cache(sender, **kwargs):
+    invalidate_shipping_tables()
+
+
+def invalidate_shipping_tables_cache_on_m2m_change(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_shipping_tables()
@@ -0,0 +1,241 @@
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from measurement.measures import Weight
+from prices import Money
+
+from .. import PostalCodeRuleInclusionType
+from ..models import ShippingMethodChannelListing, ShippingMethodType
+from ..postal_codes import CompiledPostalCodeRules, PostalCodeRanges
+from ..shipping_table import (
+    get_shipping_table,
+    get_shipping_table_version,
+    invalidate_shipping_tables,
+)
+
+
+@pytest.mark.parametrize(
+    "price, min_price, max_price, shipping_included",
+    (
+        (10, 10, 20, True),
+        (10, 1, 10, True),
+        (9, 10, 15, False),
+        (10, 1, 9, False),
+        (10000000, 1, None, True),
+        (10, None, 15, False),
+    ),
+)
+def test_shipping_table_price_based_methods(
+    shipping_zone, channel_USD, price, min_price, max_price, shipping_included
+):
+    # given
+    method = shipping_zone.shipping_methods.create(type=ShippingMethodType.PRICE_BASED)
+    ShippingMethodChannelListing.objects.create(
+        currency=channel_USD.currency_code,
+        minimum_order_price_amount=min_price,
+        maximum_order_price_amount=max_price,
+        shipping_method=method,
+        channel=channel_USD,
+    )
+
+    # when
+    method_ids = get_shipping_table(channel_USD.id).get_applicable_shipping_method_ids(
+        price=Money(price, "USD"), weight=Weight(kg=0), country_code="PL"
+    )
+
+    # then
+    assert (method.id in method_ids) is shipping_included
+
+
+@pytest.mark.parametrize(
+    "weight, min_weight, max_weight, shipping_included",
+    (
+        (Weight(kg=1), Weight(kg=1), Weight(kg=2), True),
+        (Weight(kg=10), Weight(kg=1), Weight(kg=10), True),
+        (Weight(kg=1), Weight(kg=2), Weight(kg=3), False),
+        (Weight(kg=4), Weight(kg=2), Weight(kg=3), False),
+        (Weight(kg=100), Weight(g=1), None, True),
+    ),
+)
+def test_shipping_table_weight_based_methods(
+    shipping_zone, channel_USD, weight, min_weight, max_weight, shipping_included
+):
+    # given
+    method = shipping_zone.shipping_methods.create(
+        minimum_order_weight=min_weight,
+        maximum_order_weight=max_weight,
+        type=ShippingMethodType.WEIGHT_BASED,
+    )
+    ShippingMethodChannelListing.objects.create(
+        currency=channel_USD.currency_code, shipping_method=method, channel=channel_USD
+    )
+
+    # when
+    method_ids = get_shipping_table(channel_USD.id).get_applicable_shipping_method_ids(
+        price=Money(10, "USD"), weight=weight, country_code="PL"
+    )
+
+    # then
+    assert (method.id in method_ids) is shipping_included
+
+
+def test_shipping_table_country_outside_shipping_zone(shipping_zone, channel_USD):
+    # given
+    shipping_zone.countries = ["DE"]
+    shipping_zone.save()
+
+    # when
+    method_ids = get_shipping_table(channel_USD.id).get_applicable_shipping_method_ids(
+        price=Money(10, "USD"), weight=Weight(kg=0), country_code="PL"
+    )
+
+    # then
+    assert method_ids == []
+
+
+def test_shipping_table_excluded_products(shipping_zone, channel_USD, product):
+    # given
+    method = shipping_zone.shipping_methods.get()
+    method.excluded_products.add(product)
+    table = get_shipping_table(channel_USD.id)
+
+    # when
+    method_ids = table.get_applicable_shipping_method_ids(
+        price=Money(10, "USD"),
+        weight=Weight(kg=0),
+        country_code="PL",
+        product_ids=[product.id],
+    )
+
+    # then
+    assert method_ids == []
+
+
+def test_shipping_table_postal_code_rules(shipping_zone, channel_USD):
+    # given
+    method = shipping_zone.shipping_methods.get()
+    method.postal_code_rules.create(start="BH16 7HA", end="BH16 7HG")
+    table = get_shipping_table(channel_USD.id)
+
+    # when
+    excluded = table.get_applicable_shipping_method_ids(
+        price=Money(10, "USD"),
+        weight=Weight(kg=0),
+        country_code="GB",
+        postal_code="BH16 7HF",
+    )
+    included = table.get_applicable_shipping_method_ids(
+        price=Money(10, "USD"),
+        weight=Weight(kg=0),
+        country_code="GB",
+        postal_code="BH16 7HZ",
+    )
+
+    # then
+    assert excluded == []
+    assert included == [method.id]
+
+
+@mock.patch("saleor.shipping.shipping_table.is_cache_shared", return_value=True)
+def test_shipping_table_lookup_makes_no_queries(
+    _is_cache_shared_mock, shipping_zone, channel_USD
+):
+    # given
+    method = shipping_zone.shipping_methods.get()
+    get_shipping_table(channel_USD.id)
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        table = get_shipping_table(channel_USD.id)
+        method_ids = table.get_applicable_shipping_method_ids(
+            price=Money(10, "USD"), weight=Weight(kg=0), country_code="PL"
+        )
+
+    # then
+    assert method_ids == [method.id]
+    assert len(ctx.captured_queries) == 0
+
+
+def test_shipping_table_invalidated_on_channel_listing_change(
+    shipping_zone, channel_USD
+):
+    # given
+    method = shipping_zone.shipping_methods.get()
+    get_shipping_table(channel_USD.id)
+    listing = method.channel_listings.get()
+
+    # when
+    listing.minimum_order_price_amount = 100
+    listing.save()
+
+    # then
+    method_ids = get_shipping_table(channel_USD.id).get_applicable_shipping_method_ids(
+        price=Money(10, "USD"), weight=Weight(kg=0), country_code="PL"
+    )
+    assert method_ids == []
+
+
+def test_shipping_table_invalidated_on_zone_channels_change(shipping_zone, channel_USD):
+    # given
+    get_shipping_table(channel_USD.id)
+
+    # when
+    shipping_zone.channels.remove(channel_USD)
+
+    # then
+    method_ids = get_shipping_table(channel_USD.id).get_applicable_shipping_method_ids(
+        price=Money(10, "USD"), weight=Weight(kg=0), country_code="PL"
+    )
+    assert method_ids == []
+
+
+def test_shipping_table_not_cached_without_shared_cache(shipping_zone, channel_USD):
+    # given
+    method = shipping_zone.shipping_methods.get()
+    get_shipping_table(channel_USD.id)
+
+    # when
+    ShippingMethodChannelListing.objects.filter(shipping_method=method).update(
+        minimum_order_price_amount=100
+    )
+
+    # then
+    method_ids = get_shipping_table(channel_USD.id).get_applicable_shipping_method_ids(
+        price=Money(10, "USD"), weight=Weight(kg=0), country_code="PL"
+    )
+    assert method_ids == []
+
+
+@mock.patch("saleor.shipping.shipping_table.transaction.on_commit")
+def test_invalidate_shipping_tables_after_commit(mocked_on_commit):
+    # given
+    version = get_shipping_table_version()
+
+    # when
+    invalidate_shipping_tables()
+    new_version = get_shipping_table_version()
+    mocked_on_commit.call_args.args[0]()
+
+    # then
+    assert version != new_version != get_shipping_table_version()
+
+
+@pytest.mark.parametrize(
+    "code, in_ranges",
+    [("05", True), ("10", False), ("15", True), ("25", True), ("01", False)],
+)
+def test_postal_code_ranges(code, in_ranges):
+    ranges = PostalCodeRanges([("02", "06"), ("12", "30"), ("14", "16")])
+    assert (code in ranges) is in_ranges
+
+
+def test_compiled_postal_code_rules_with_mixed_inclusion_types():
+    rules = CompiledPostalCodeRules(
+        [
+            ("01", "05", PostalCodeRuleInclusionType.INCLUDE),
+            ("06", "09", PostalCodeRuleInclusionType.EXCLUDE),
+        ]
+    )
+    assert not rules.is_applicable("PL", "02")
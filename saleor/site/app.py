@@ -0,0 +1,30 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+
+class SiteAppConfig(AppConfig):
+    name = "saleor.site"
+
+    def ready(self):
+        from django.contrib.sites.models import Site
+
+        from .models import SiteSettings
+        from .signals import clear_site_cache
+
+        # bump the shared site cache version on every change of the cached data
+        post_save.connect(
+            clear_site_cache, sender=Site, dispatch_uid="clear_saved_site_cache"
+        )
+        post_delete.connect(
+            clear_site_cache, sender=Site, dispatch_uid="clear_deleted_site_cache"
+        )
+        post_save.connect(
+            clear_site_cache,
+            sender=SiteSettings,
+            dispatch_uid="clear_saved_site_settings_cache",
+        )
+        post_delete.connect(
+            clear_site_cache,
+            sender=SiteSettings,
+            dispatch_uid="clear_deleted_site_settings_cache",
+        )
@@ -3,16 +3,66 @@
 Since django.contrib.sites may not be thread-safe when there are
 multiple instances of the application server, we're patching it with
 a thread-safe structure and methods that use it underneath.
+
+Sites together with their settings are stored in the shared cache under
+a version key. Clearing the cache bumps the version, so every application
+server and worker picks up the change without restarting, while
+unchanged sites are served from the process memory. Without a shared
+cache the version would not reach other processes, so sites are kept in
+the process memory only and the cache is cleared on every request.
 """
 import threading
 
 from django.contrib.sites.models import Site, SiteManager
+from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
 from django.http.request import split_domain_port
+from django.utils.crypto import get_random_string
+
+from ..core.cache import is_cache_shared
+
+SITE_CACHE_VERSION_KEY = "site-cache-version"
+SITE_CACHE_KEY = "site:{version}:{key}"
 
 lock = threading.Lock()
 with lock:
     THREADED_SITE_CACHE = {}
+    THREADED_SITE_CACHE_VERSION = None
+
+
+def get_site_cache_version() -> str:
+    version = cache.get(SITE_CACHE_VERSION_KEY)
+    if version is None:
+        cache.add(SITE_CACHE_VERSION_KEY, get_random_string(12), timeout=None)
+        version = cache.get(SITE_CACHE_VERSION_KEY)
+    return version
+
+
+def _get_cached_site(manager, key, **lookup):
+    global THREADED_SITE_CACHE, THREADED_SITE_CACHE_VERSION
+
+    if not is_cache_shared():
+        if key not in THREADED_SITE_CACHE:
+            site = manager.prefetch_related("settings").filter(**lookup)[0]
+            with lock:
+                THREADED_SITE_CACHE[key] = site
+        return THREADED_SITE_CACHE[key]
+
+    version = get_site_cache_version()
+    if version != THREADED_SITE_CACHE_VERSION:
+        with lock:
+            THREADED_SITE_CACHE = {}
+            THREADED_SITE_CACHE_VERSION = version
+    if key not in THREADED_SITE_CACHE:
+        shared_key = SITE_CACHE_KEY.format(version=version, key=key)
+        site = cache.get(shared_key)
+        if site is None:
+            site = manager.prefetch_related("settings").filter(**lookup)[0]
+            cache.set(shared_key, site)
+        with lock:
+            THREADED_SITE_CACHE[key] = site
+    return THREADED_SITE_CACHE[key]
 
 
 def new_get_current(self, request=None):
@@ -20,32 +70,16 @@ def new_get_current(self, request=None):
 
     if getattr(settings, "SITE_ID", ""):
         site_id = settings.SITE_ID
-        if site_id not in THREADED_SITE_CACHE:
-            with lock:
-                site = self.prefetch_related("settings").filter(pk=site_id)[0]
-                THREADED_SITE_CACHE[site_id] = site
-        return THREADED_SITE_CACHE[site_id]
+        return _get_cached_site(self, site_id, pk=site_id)
     elif request:
         host = request.get_host()
         try:
             # First attempt to look up the site by host with or without port.
-            if host not in THREADED_SITE_CACHE:
-                with lock:
-                    site = self.prefetch_related("settings").filter(
-                        domain__iexact=host
-                    )[0]
-                    THREADED_SITE_CACHE[host] = site
-            return THREADED_SITE_CACHE[host]
+            return _get_cached_site(self, host, domain__iexact=host)
         except Site.DoesNotExist:
             # Fallback to looking up site after stripping port from the host.
             domain, dummy_port = split_domain_port(host)
-            if domain not in THREADED_SITE_CACHE:
-                with lock:
-                    site = self.prefetch_related("settings").filter(
-                        domain__iexact=domain
-                    )[0]
-                    THREADED_SITE_CACHE[domain] = site
-        return THREADED_SITE_CACHE[domain]
+            return _get_cached_site(self, domain, domain__iexact=domain)
 
     raise ImproperlyConfigured(
         "You're using the Django sites framework without having"
@@ -55,12 +89,27 @@ def new_get_current(self, request=None):
     )
 
 
-def new_clear_cache(self):
+def _clear_threaded_site_cache():
     global THREADED_SITE_CACHE
     with lock:
         THREADED_SITE_CACHE = {}
 
 
+def _set_new_site_cache_version():
+    cache.set(SITE_CACHE_VERSION_KEY, get_random_string(12), timeout=None)
+    _clear_threaded_site_cache()
+
+
+def new_clear_cache(self):
+    if not is_cache_shared():
+        _clear_threaded_site_cache()
+        return
+    # Clear the cache again after the current transaction commits, so sites
+    # loaded in the meantime from not yet committed data are not reused.
+    _set_new_site_cache_version()
+    transaction.on_commit(_set_new_site_cache_version)
+
+
 def new_get_by_natural_key(self, domain):
     return self.prefetch_related("settings").filter(domain__iexact=domain)[0]
 
@@ -0,0 +1,5 @@
+from django.contrib.sites.models import Site
+
+
+def clear_site_cache(sender, **kwargs):
+    Site.objects.clear_cache()
@@ -1,5 +1,10 @@
+from unittest import mock
+
 from django.contrib.sites.models import Site
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from .. import patch_sites
 from ..models import SiteSettings
 
 
@@ -9,3 +14,100 @@ def test_new_get_current():
     assert result.domain == "mirumee.com"
     assert type(result.settings) == SiteSettings
     assert str(result.settings) == "mirumee.com"
+
+
+def test_get_current_makes_no_queries_when_cached(site_settings):
+    # given
+    Site.objects.get_current()
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        site = Site.objects.get_current()
+        display_gross_prices = site.settings.display_gross_prices
+
+    # then
+    assert display_gross_prices == site_settings.display_gross_prices
+    assert len(ctx.captured_queries) == 0
+
+
+@mock.patch("saleor.site.patch_sites.is_cache_shared", return_value=True)
+def test_get_current_uses_shared_cache_when_process_cache_is_empty(
+    _is_cache_shared_mock, site_settings
+):
+    # given
+    Site.objects.get_current()
+    patch_sites.THREADED_SITE_CACHE = {}
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        site = Site.objects.get_current()
+
+    # then
+    assert site.settings.pk == site_settings.pk
+    assert len(ctx.captured_queries) == 0
+
+
+@mock.patch("saleor.site.patch_sites.is_cache_shared", return_value=True)
+def test_site_settings_update_bumps_site_cache_version(
+    _is_cache_shared_mock, site_settings
+):
+    # given
+    Site.objects.get_current()
+    version = patch_sites.get_site_cache_version()
+
+    # when
+    site_settings.display_gross_prices = not site_settings.display_gross_prices
+    site_settings.save()
+
+    # then
+    assert patch_sites.get_site_cache_version() != version
+    site = Site.objects.get_current()
+    assert site.settings.display_gross_prices == site_settings.display_gross_prices
+
+
+@mock.patch("saleor.site.patch_sites.is_cache_shared", return_value=True)
+def test_site_update_bumps_site_cache_version(_is_cache_shared_mock, site_settings):
+    # given
+    site = Site.objects.get_current()
+    version = patch_sites.get_site_cache_version()
+
+    # when
+    Site.objects.filter(pk=site.pk).first().save()
+
+    # then
+    assert patch_sites.get_site_cache_version() != version
+
+
+@mock.patch("saleor.site.patch_sites.is_cache_shared", return_value=True)
+@mock.patch("saleor.site.patch_sites.transaction.on_commit")
+def test_clear_site_cache_after_commit(
+    mocked_on_commit, _is_cache_shared_mock, site_settings
+):
+    # given
+    version = patch_sites.get_site_cache_version()
+
+    # when
+    Site.objects.clear_cache()
+    new_version = patch_sites.get_site_cache_version()
+    mocked_on_commit.call_args.args[0]()
+
+    # then
+    assert version != new_version != patch_sites.get_site_cache_version()
+
+
+def test_clear_site_cache_without_shared_cache(site_settings):
+    # given
+    Site.objects.get_current()
+    version = patch_sites.get_site_cache_version()
+    site_settings.display_gross_prices = not site_settings.display_gross_prices
+    SiteSettings.objects.filter(pk=site_settings.pk).update(
+        display_gross_prices=site_settings.display_gross_prices
+    )
+
+    # when
+    Site.objects.clear_cache()
+    site = Site.objects.get_current()
+
+    # then
+    assert patch_sites.get_site_cache_version() == version
+    assert site.settings.display_gross_prices == site_settings.display_gross_prices
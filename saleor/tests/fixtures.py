@@ -109,6 +109,7 @@ from ..shipping.models import (
 )
 from ..site.models import SiteSettings
 from ..warehouse import WarehouseClickAndCollectOption
+from ..warehouse.availability import update_variants_channel_availability
 from ..warehouse.models import Allocation, Stock, Warehouse
 from ..webhook.event_types import WebhookEventType
 from ..webhook.models import Webhook, WebhookEvent
@@ -1655,6 +1656,7 @@ def product_with_two_variants(product_type, category, warehouse, channel_USD):
             for variant in variants
         ]
     )
+    update_variants_channel_availability([variant.pk for variant in variants])
 
     return product
 
@@ -1930,6 +1932,7 @@ def variant_with_many_stocks(variant, warehouses_with_shipping_zone):
             Stock(warehouse=warehouses[1], product_variant=variant, quantity=3),
         ]
     )
+    update_variants_channel_availability([variant.pk])
     return variant
 
 
@@ -1944,6 +1947,7 @@ def variant_with_many_stocks_different_shipping_zones(
             Stock(warehouse=warehouses[1], product_variant=variant, quantity=3),
         ]
     )
+    update_variants_channel_availability([variant.pk])
     return variant
 
 
@@ -2144,6 +2148,7 @@ def product_list(product_type, category, warehouse, channel_USD, channel_PLN):
     for variant in variants:
         stocks.append(Stock(warehouse=warehouse, product_variant=variant, quantity=100))
     Stock.objects.bulk_create(stocks)
+    update_variants_channel_availability([variant.pk for variant in variants])
 
     for product in products:
         associate_attribute_values_to_instance(product, product_attr, attr_value)
@@ -4371,6 +4376,9 @@ def warehouse_for_cc(address, product_variant_list, shipping_zones):
             ),
         ]
     )
+    update_variants_channel_availability(
+        [variant.pk for variant in product_variant_list]
+    )
     return warehouse
 
 
@@ -4384,7 +4392,7 @@ def delivery_method(request, warehouse_for_cc, shipping_method):
 
 @pytest.fixture
 def stocks_for_cc(warehouses_for_cc, product_variant_list, product_with_two_variants):
-    return Stock.objects.bulk_create(
+    stocks = Stock.objects.bulk_create(
         [
             Stock(
                 warehouse=warehouses_for_cc[0],
@@ -4433,6 +4441,8 @@ def stocks_for_cc(warehouses_for_cc, product_variant_list, product_with_two_vari
             ),
         ]
     )
+    update_variants_channel_availability({stock.product_variant_id for stock in stocks})
+    return stocks
 
 
 @pytest.fixture
@@ -0,0 +1,45 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class WarehouseAppConfig(AppConfig):
+    name = "saleor.warehouse"
+
+    def ready(self):
+        from ..shipping.models import ShippingZone
+        from .models import Allocation, Stock, Warehouse
+        from .signals import (
+            update_allocation_variant_availability,
+            update_availability_on_shipping_zone_channels_change,
+            update_availability_on_warehouse_shipping_zones_change,
+            update_deleted_allocation_variant_availability,
+            update_stock_variant_availability,
+        )
+
+        # precomputed variant availability must follow stocks saved one by one and
+        # changes of shipping zones; bulk operations update it explicitly
+        post_save.connect(
+            update_stock_variant_availability,
+            sender=Stock,
+            dispatch_uid="update_variant_availability_saved_stock",
+        )
+        post_save.connect(
+            update_allocation_variant_availability,
+            sender=Allocation,
+            dispatch_uid="update_variant_availability_saved_allocation",
+        )
+        post_delete.connect(
+            update_deleted_allocation_variant_availability,
+            sender=Allocation,
+            dispatch_uid="update_variant_availability_deleted_allocation",
+        )
+        m2m_changed.connect(
+            update_availability_on_warehouse_shipping_zones_change,
+            sender=Warehouse.shipping_zones.through,
+            dispatch_uid="update_variant_availability_warehouse_shipping_zones",
+        )
+        m2m_changed.connect(
+            update_availability_on_shipping_zone_channels_change,
+            sender=ShippingZone.channels.through,
+            dispatch_uid="update_variant_availability_shipping_zone_channels",
+        )
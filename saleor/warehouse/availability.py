@@ -1,14 +1,21 @@
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
 
+from django.db import connection
 from django.db.models import Sum
 from django.db.models.functions import Coalesce
 
+from ..channel.models import Channel
 from ..core.exceptions import InsufficientStock, InsufficientStockData
-from .models import Stock, StockQuerySet
+from ..core.tracing import traced_atomic_transaction
+from ..product.models import ProductVariant
+from .models import Stock, StockQuerySet, VariantChannelAvailability, Warehouse
 
 if TYPE_CHECKING:
-    from ..product.models import ProductVariant
+    from uuid import UUID
+
+# Variant, channel and shipping zone of the availability rows
+AvailabilityKey = Tuple[int, int, int]
 
 
 def _get_available_quantity(stocks: StockQuerySet) -> int:
@@ -23,7 +30,7 @@ def _get_available_quantity(stocks: StockQuerySet) -> int:
 
 
 def check_stock_quantity(
-    variant: "ProductVariant", country_code: str, channel_slug: str, quantity: int
+    variant: ProductVariant, country_code: str, channel_slug: str, quantity: int
 ):
     """Validate if there is stock available for given variant in given country.
 
@@ -42,7 +49,7 @@ def check_stock_quantity(
 
 
 def check_stock_quantity_bulk(
-    variants: Iterable["ProductVariant"],
+    variants: Iterable[ProductVariant],
     country_code: str,
     quantities: Iterable[int],
     channel_slug: str,
@@ -98,3 +105,154 @@ def check_stock_quantity_bulk(
 
     if insufficient_stocks:
         raise InsufficientStock(insufficient_stocks)
+
+
+def calculate_variants_channel_availability(
+    variant_ids: Iterable[int],
+) -> Dict[AvailabilityKey, VariantChannelAvailability]:
+    """Calculate unsaved availability rows of variants from stocks and allocations.
+
+    Each stock counts in every shipping zone of its warehouse, for every channel
+    of the zone.
+    """
+    stocks = list(
+        Stock.objects.filter(product_variant_id__in=variant_ids)
+        .annotate_available_quantity()
+        .values_list(
+            "product_variant_id",
+            "product_variant__product_id",
+            "warehouse_id",
+            "available_quantity",
+        )
+    )
+    if not stocks:
+        return {}
+
+    WarehouseShippingZone = Warehouse.shipping_zones.through  # type: ignore
+    ShippingZoneChannel = Channel.shipping_zones.through  # type: ignore
+    zones_by_warehouse: Dict["UUID", List[int]] = defaultdict(list)
+    for warehouse_id, zone_id in WarehouseShippingZone.objects.filter(
+        warehouse_id__in={warehouse_id for _, _, warehouse_id, _ in stocks}
+    ).values_list("warehouse_id", "shippingzone_id"):
+        zones_by_warehouse[warehouse_id].append(zone_id)
+    channels_by_zone: Dict[int, List[int]] = defaultdict(list)
+    for zone_id, channel_id in ShippingZoneChannel.objects.filter(
+        shippingzone_id__in={
+            zone_id for zone_ids in zones_by_warehouse.values() for zone_id in zone_ids
+        }
+    ).values_list("shippingzone_id", "channel_id"):
+        channels_by_zone[zone_id].append(channel_id)
+
+    availability: Dict[AvailabilityKey, VariantChannelAvailability] = {}
+    for variant_id, product_id, warehouse_id, quantity in stocks:
+        for zone_id in zones_by_warehouse[warehouse_id]:
+            for channel_id in channels_by_zone[zone_id]:
+                key = (variant_id, channel_id, zone_id)
+                if key not in availability:
+                    availability[key] = VariantChannelAvailability(
+                        product_variant_id=variant_id,
+                        product_id=product_id,
+                        channel_id=channel_id,
+                        shipping_zone_id=zone_id,
+                    )
+                availability[key].quantity_available += quantity
+                availability[key].is_in_stock |= quantity > 0
+    return availability
+
+
+AVAILABILITY_UPSERT_SQL = """
+    INSERT INTO {availability_table} (
+        product_variant_id,
+        product_id,
+        channel_id,
+        shipping_zone_id,
+        quantity_available,
+        is_in_stock,
+        updated_at
+    )
+    SELECT input.*, NOW()
+    FROM unnest(
+        %s::int[], %s::int[], %s::int[], %s::int[], %s::int[], %s::boolean[]
+    ) AS input
+    ON CONFLICT (product_variant_id, channel_id, shipping_zone_id)
+    DO UPDATE SET
+        quantity_available = EXCLUDED.quantity_available,
+        is_in_stock = EXCLUDED.is_in_stock,
+        updated_at = EXCLUDED.updated_at
+"""
+
+
+@traced_atomic_transaction()
+def update_variants_channel_availability(variant_ids: Iterable[int]) -> Set[int]:
+    """Update availability rows of variants with ones calculated from stocks.
+
+    Stocks of the variants are locked first, so concurrent updates of the same
+    variants wait for each other and the last one calculates the rows from all
+    changes committed before. Only changed rows are written. Return pks of
+    variants with changed rows.
+    """
+    variant_ids = set(variant_ids)
+    if not variant_ids:
+        return set()
+    list(
+        Stock.objects.select_for_update()
+        .filter(product_variant_id__in=variant_ids)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    expected = calculate_variants_channel_availability(variant_ids)
+    stored = {
+        (row.product_variant_id, row.channel_id, row.shipping_zone_id): row
+        for row in VariantChannelAvailability.objects.filter(
+            product_variant_id__in=variant_ids
+        )
+    }
+
+    stale_rows = [row for key, row in stored.items() if key not in expected]
+    changed_rows = [
+        row
+        for key, row in expected.items()
+        if key not in stored
+        or (stored[key].quantity_available, stored[key].is_in_stock)
+        != (row.quantity_available, row.is_in_stock)
+    ]
+    if stale_rows:
+        VariantChannelAvailability.objects.filter(
+            pk__in=[row.pk for row in stale_rows]
+        ).delete()
+    if changed_rows:
+        availability_table = VariantChannelAvailability._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                AVAILABILITY_UPSERT_SQL.format(availability_table=availability_table),
+                [
+                    [row.product_variant_id for row in changed_rows],
+                    [row.product_id for row in changed_rows],
+                    [row.channel_id for row in changed_rows],
+                    [row.shipping_zone_id for row in changed_rows],
+                    [row.quantity_available for row in changed_rows],
+                    [row.is_in_stock for row in changed_rows],
+                ],
+            )
+    return {row.product_variant_id for row in stale_rows + changed_rows}
+
+
+def reconcile_variants_channel_availability(chunk_size: int = 1000) -> int:
+    """Fix availability rows which differ from stocks and allocations.
+
+    Rows go out of date when stocks change outside of the stock management
+    functions, e.g. with bulk operations. Variants are checked in chunks; return
+    the number of variants which rows were fixed.
+    """
+    updated = 0
+    last_pk = 0
+    while True:
+        variant_ids = list(
+            ProductVariant.objects.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:chunk_size]
+        )
+        if not variant_ids:
+            return updated
+        last_pk = variant_ids[-1]
+        updated += len(update_variants_channel_availability(variant_ids))
@@ -1,14 +1,15 @@
 from collections import defaultdict, namedtuple
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, cast
 
-from django.db import transaction
-from django.db.models import F, Sum
+from django.db import connection, transaction
+from django.db.models import F, Q, Sum
 
 from ..core.exceptions import AllocationError, InsufficientStock, InsufficientStockData
 from ..core.tracing import traced_atomic_transaction
 from ..order import OrderLineData
 from ..plugins.manager import PluginsManager
 from ..product.models import ProductVariant
+from .availability import update_variants_channel_availability
 from .models import Allocation, Stock, Warehouse
 
 if TYPE_CHECKING:
@@ -93,6 +94,7 @@ def allocate_stocks(
 
     if allocations:
         Allocation.objects.bulk_create(allocations)
+        update_variants_channel_availability(variant.pk for variant in variants)
 
         for allocation in allocations:
             allocated_stock = (
@@ -107,6 +109,119 @@ def allocate_stocks(
                 )
 
 
+@traced_atomic_transaction()
+def allocate_stocks_for_orders(
+    order_lines_info_for_orders: List[Tuple[str, str, List["OrderLineData"]]],
+) -> Tuple[List[List[Allocation]], Dict[int, InsufficientStock]]:
+    """Allocate stocks for lines of many orders at once.
+
+    Each item of `order_lines_info_for_orders` contains the country code,
+    the channel slug and the lines of a single order. Stocks of all orders are
+    locked in a single query ordered by the primary key and allocated with the same
+    rules as in `allocate_stocks`. An order that can't be allocated is skipped
+    without changing allocations of the remaining orders.
+
+    The allocations aren't saved; the lines may not be saved yet either, so the
+    caller is responsible for setting `order_line_id`, saving them and updating
+    the availability of their variants.
+    Return unsaved allocations for each order and `InsufficientStock` errors
+    by the order index.
+    """
+    variants_for_destinations: Dict[Tuple[str, str], set] = defaultdict(set)
+    for country_code, channel_slug, order_lines_info in order_lines_info_for_orders:
+        variants_for_destinations[(country_code, channel_slug)].update(
+            line_info.variant.pk  # type: ignore
+            for line_info in get_order_lines_with_track_inventory(order_lines_info)
+        )
+
+    stock_pks_for_destinations: Dict[Tuple[str, str], List[int]] = {}
+    for destination, variant_pks in variants_for_destinations.items():
+        stock_pks_for_destinations[destination] = list(
+            Stock.objects.for_country_and_channel(*destination)
+            .filter(product_variant_id__in=variant_pks)
+            .values_list("pk", flat=True)
+        )
+    stocks = {
+        stock.pk: stock
+        for stock in Stock.objects.select_for_update(of=("self",))
+        .filter(
+            pk__in=[pk for pks in stock_pks_for_destinations.values() for pk in pks]
+        )
+        .order_by("pk")
+    }
+    quantity_allocation_for_stocks: Dict[int, int] = defaultdict(int)
+    quantity_allocation_for_stocks.update(
+        Allocation.objects.filter(stock_id__in=stocks, quantity_allocated__gt=0)
+        .values("stock")
+        .annotate(total=Sum("quantity_allocated"))
+        .values_list("stock", "total")
+    )
+    variant_to_stocks_for_destinations: Dict[Tuple[str, str], Dict[int, list]] = {}
+    for destination, stock_pks in stock_pks_for_destinations.items():
+        variant_to_stocks: Dict[int, List[Stock]] = defaultdict(list)
+        for stock_pk in sorted(stock_pks):
+            if stock_pk in stocks:
+                stock = stocks[stock_pk]
+                variant_to_stocks[stock.product_variant_id].append(stock)
+        variant_to_stocks_for_destinations[destination] = variant_to_stocks
+
+    allocations_for_orders = []
+    errors = {}
+    for index, (country_code, channel_slug, order_lines_info) in enumerate(
+        order_lines_info_for_orders
+    ):
+        variant_to_stocks = variant_to_stocks_for_destinations.get(
+            (country_code, channel_slug), {}
+        )
+        allocated_deltas: Dict[int, int] = defaultdict(int)
+        allocations = []
+        insufficient_stock = []
+        for line_info in get_order_lines_with_track_inventory(order_lines_info):
+            quantity_allocated = 0
+            line_allocations = []
+            variant_pk = line_info.variant.pk  # type: ignore
+            for stock in variant_to_stocks.get(variant_pk, []):
+                available_quantity = (
+                    stock.quantity
+                    - quantity_allocation_for_stocks[stock.pk]
+                    - allocated_deltas[stock.pk]
+                )
+                quantity = min(
+                    line_info.quantity - quantity_allocated, available_quantity
+                )
+                if quantity > 0:
+                    line_allocations.append(
+                        Allocation(
+                            order_line=line_info.line,
+                            stock=stock,
+                            quantity_allocated=quantity,
+                        )
+                    )
+                    quantity_allocated += quantity
+                    if quantity_allocated == line_info.quantity:
+                        break
+            if quantity_allocated != line_info.quantity:
+                insufficient_stock.append(
+                    InsufficientStockData(
+                        variant=line_info.variant,  # type: ignore
+                        order_line=line_info.line,
+                    )
+                )
+                continue
+            for allocation in line_allocations:
+                allocated_deltas[allocation.stock_id] += allocation.quantity_allocated
+            allocations.extend(line_allocations)
+
+        if insufficient_stock:
+            errors[index] = InsufficientStock(insufficient_stock)
+            allocations_for_orders.append([])
+            continue
+        for stock_pk, quantity in allocated_deltas.items():
+            quantity_allocation_for_stocks[stock_pk] += quantity
+        allocations_for_orders.append(allocations)
+    return allocations_for_orders, errors
+
+
 def _create_allocations(
     line_info: "OrderLineData",
     stocks: List[StockData],
@@ -209,6 +324,9 @@ def deallocate_stock(
     )
 
     Allocation.objects.bulk_update(allocations_to_update, ["quantity_allocated"])
+    update_variants_channel_availability(
+        allocation.stock.product_variant_id for allocation in allocations_to_update
+    )
 
     for allocation_before_update in allocations_before_update:
         available_stock_now = Allocation.objects.available_quantity_for_stock(
@@ -295,6 +413,9 @@ def increase_allocations(
         channel_slug,
         manager,
     )
+    update_variants_channel_availability(
+        alloc.stock.product_variant_id for alloc in allocations
+    )
 
 
 def decrease_allocations(lines_info: Iterable["OrderLineData"], manager):
@@ -327,6 +448,7 @@ def decrease_stock(
         Allocation.objects.filter(order_line__in=exc.order_lines).update(
             quantity_allocated=0
         )
+        update_variants_channel_availability(variant.pk for variant in variants)
 
     stocks = (
         Stock.objects.select_for_update(of=("self",))
@@ -362,6 +484,7 @@ def decrease_stock(
             variant_and_warehouse_to_stock,
             quantity_allocation_for_stocks,
         )
+        update_variants_channel_availability(variant.pk for variant in variants)
 
         stock_ids = (s.id for s in stocks)
         for stock in Stock.objects.filter(
@@ -414,6 +537,154 @@ def _decrease_stocks_quantity(
     Stock.objects.bulk_update(stocks_to_update, ["quantity"])
 
 
+@traced_atomic_transaction()
+def decrease_stock_for_orders(
+    order_lines_info_for_orders: Dict[int, List["OrderLineData"]],
+    manager: PluginsManager,
+) -> Dict[int, InsufficientStock]:
+    """Decrease stocks quantities for lines of many orders at once.
+
+    All stocks used by the given lines are locked in a single query ordered by
+    the primary key, so concurrent bulk fulfillments can't deadlock each other.
+    Orders are then processed one by one against in-memory quantities with the
+    same rules as `decrease_stock`. An order that can't be fulfilled is skipped
+    and doesn't change stocks nor allocations of the remaining orders.
+
+    Return `InsufficientStock` errors by order pk.
+    """
+    lines_info = [
+        line_info
+        for order_lines_info in order_lines_info_for_orders.values()
+        for line_info in order_lines_info
+    ]
+    if not lines_info:
+        return {}
+    lines = [line_info.line for line_info in lines_info]
+    variant_pks = {line_info.variant.pk for line_info in lines_info}  # type: ignore
+    warehouse_pks = {line_info.warehouse_pk for line_info in lines_info}
+    lines_allocations = Allocation.objects.filter(order_line__in=lines)
+
+    stocks = list(
+        Stock.objects.select_for_update(of=("self",))
+        .filter(
+            Q(product_variant_id__in=variant_pks, warehouse_id__in=warehouse_pks)
+            | Q(pk__in=lines_allocations.values("stock_id"))
+        )
+        .order_by("pk")
+    )
+    allocations = list(
+        lines_allocations.select_for_update(of=("self",)).order_by("stock_id", "pk")
+    )
+    quantity_allocated_for_stocks: Dict[int, int] = defaultdict(int)
+    quantity_allocated_for_stocks.update(
+        Allocation.objects.filter(stock__in=stocks, quantity_allocated__gt=0)
+        .values("stock")
+        .annotate(total=Sum("quantity_allocated"))
+        .values_list("stock", "total")
+    )
+
+    variant_and_warehouse_to_stock = {
+        (stock.product_variant_id, str(stock.warehouse_id)): stock for stock in stocks
+    }
+    stock_quantities = {stock.pk: stock.quantity for stock in stocks}
+    available_before = {
+        stock.pk: stock.quantity - quantity_allocated_for_stocks[stock.pk]
+        for stock in stocks
+    }
+    line_to_allocations: Dict[int, List[Allocation]] = defaultdict(list)
+    for allocation in allocations:
+        line_to_allocations[allocation.order_line_id].append(allocation)
+    allocated_quantities = {
+        allocation.pk: allocation.quantity_allocated for allocation in allocations
+    }
+
+    errors = {}
+    for order_pk, order_lines_info in order_lines_info_for_orders.items():
+        # Changes are collected per order and applied only when the whole order
+        # can be fulfilled.
+        allocation_changes: Dict[int, int] = {}
+        allocated_deltas: Dict[int, int] = defaultdict(int)
+        stock_changes: Dict[int, int] = {}
+        for line_info in order_lines_info:
+            quantity_to_deallocate = line_info.quantity
+            for allocation in line_to_allocations[line_info.line.pk]:
+                allocated = allocation_changes.get(
+                    allocation.pk, allocated_quantities[allocation.pk]
+                )
+                quantity = min(quantity_to_deallocate, allocated)
+                if quantity > 0:
+                    allocation_changes[allocation.pk] = allocated - quantity
+                    allocated_deltas[allocation.stock_id] -= quantity
+                    quantity_to_deallocate -= quantity
+
+        insufficient_stocks = []
+        for line_info in order_lines_info:
+            warehouse_pk = str(line_info.warehouse_pk)
+            stock = variant_and_warehouse_to_stock.get(
+                (line_info.variant.pk, warehouse_pk)  # type: ignore
+            )
+            if stock is None:
+                insufficient_stocks.append(
+                    InsufficientStockData(
+                        variant=line_info.variant,  # type: ignore
+                        order_line=line_info.line,
+                        warehouse_pk=warehouse_pk,
+                    )
+                )
+                continue
+            quantity = stock_changes.get(stock.pk, stock_quantities[stock.pk])
+            quantity_allocated = (
+                quantity_allocated_for_stocks[stock.pk] + allocated_deltas[stock.pk]
+            )
+            if quantity - quantity_allocated < line_info.quantity:
+                insufficient_stocks.append(
+                    InsufficientStockData(
+                        variant=line_info.variant,  # type: ignore
+                        order_line=line_info.line,
+                        warehouse_pk=warehouse_pk,
+                    )
+                )
+                continue
+            stock_changes[stock.pk] = quantity - line_info.quantity
+
+        if insufficient_stocks:
+            errors[order_pk] = InsufficientStock(insufficient_stocks)
+            continue
+
+        allocated_quantities.update(allocation_changes)
+        stock_quantities.update(stock_changes)
+        for stock_pk, delta in allocated_deltas.items():
+            quantity_allocated_for_stocks[stock_pk] += delta
+
+    allocations_to_update = []
+    for allocation in allocations:
+        if allocation.quantity_allocated != allocated_quantities[allocation.pk]:
+            allocation.quantity_allocated = allocated_quantities[allocation.pk]
+            allocations_to_update.append(allocation)
+    Allocation.objects.bulk_update(allocations_to_update, ["quantity_allocated"])
+
+    stocks_to_update = []
+    for stock in stocks:
+        if stock.quantity != stock_quantities[stock.pk]:
+            stock.quantity = stock_quantities[stock.pk]
+            stocks_to_update.append(stock)
+    Stock.objects.bulk_update(stocks_to_update, ["quantity"])
+    update_variants_channel_availability(stock.product_variant_id for stock in stocks)
+
+    updated_stock_pks = {stock.pk for stock in stocks_to_update}
+    for stock in stocks:
+        available_now = stock.quantity - quantity_allocated_for_stocks[stock.pk]
+        if available_before[stock.pk] <= 0 < available_now:
+            transaction.on_commit(
+                lambda stock=stock: manager.product_variant_back_in_stock(stock)
+            )
+        elif stock.pk in updated_stock_pks and available_now <= 0:
+            transaction.on_commit(
+                lambda stock=stock: manager.product_variant_out_of_stock(stock)
+            )
+    return errors
+
+
 def get_order_lines_with_track_inventory(
     order_lines_info: Iterable["OrderLineData"],
 ) -> Iterable["OrderLineData"]:
@@ -438,4 +709,101 @@ def deallocate_stock_for_order(order: "Order", manager: PluginsManager):
                 lambda: manager.product_variant_back_in_stock(allocation.stock)
             )
 
+    variant_ids = list(allocations.values_list("stock__product_variant_id", flat=True))
     allocations.update(quantity_allocated=0)
+    update_variants_channel_availability(variant_ids)
+
+
+STOCK_LOCK_SQL = """
+    SELECT stock.id
+    FROM {stock_table} stock
+    JOIN unnest(%s::int[], %s::uuid[]) AS input(product_variant_id, warehouse_id)
+        USING (product_variant_id, warehouse_id)
+    ORDER BY stock.id
+    FOR UPDATE OF stock
+"""
+
+STOCK_UPSERT_SQL = """
+    WITH previous AS (
+        SELECT stock.id, stock.quantity
+        FROM {stock_table} stock
+        JOIN unnest(%s::int[], %s::uuid[]) AS input(product_variant_id, warehouse_id)
+            USING (product_variant_id, warehouse_id)
+    ), upserted AS (
+        INSERT INTO {stock_table} (product_variant_id, warehouse_id, quantity)
+        SELECT * FROM unnest(%s::int[], %s::uuid[], %s::int[])
+        ON CONFLICT (warehouse_id, product_variant_id)
+        DO UPDATE SET quantity = EXCLUDED.quantity
+        RETURNING id, quantity
+    )
+    SELECT
+        upserted.id,
+        CASE
+            WHEN COALESCE(previous.quantity, 0) = 0 AND upserted.quantity > 0
+                THEN 'back_in_stock'
+            WHEN previous.quantity > 0 AND upserted.quantity = 0
+                THEN 'out_of_stock'
+        END
+    FROM upserted
+    LEFT JOIN previous USING (id)
+"""
+
+
+@traced_atomic_transaction()
+def update_stocks_quantities(
+    stocks_data: Iterable[Tuple[int, str, int]], manager: PluginsManager
+) -> int:
+    """Set quantities of stocks given as (variant pk, warehouse pk, quantity).
+
+    Missing stocks are created. Stocks are upserted with a single statement which
+    also compares the previous and new quantities, so `back in stock` and
+    `out of stock` hooks are triggered only for stocks which state changed.
+    When a stock is given more than once, the last quantity is used.
+
+    Return the number of created and updated stocks.
+    """
+    quantities = {
+        (variant_pk, str(warehouse_pk)): quantity
+        for variant_pk, warehouse_pk, quantity in stocks_data
+    }
+    if not quantities:
+        return 0
+    variant_pks = [variant_pk for variant_pk, _ in quantities]
+    warehouse_pks = [warehouse_pk for _, warehouse_pk in quantities]
+
+    stock_table = Stock._meta.db_table
+    with connection.cursor() as cursor:
+        # lock existing stocks in a consistent order to avoid deadlocks with
+        # concurrent updates and to read the previous quantities reliably
+        cursor.execute(
+            STOCK_LOCK_SQL.format(stock_table=stock_table),
+            [variant_pks, warehouse_pks],
+        )
+        cursor.execute(
+            STOCK_UPSERT_SQL.format(stock_table=stock_table),
+            [
+                variant_pks,
+                warehouse_pks,
+                variant_pks,
+                warehouse_pks,
+                list(quantities.values()),
+            ],
+        )
+        changes = cursor.fetchall()
+    update_variants_channel_availability(variant_pks)
+
+    transitions = {stock_pk: change for stock_pk, change in changes if change}
+    stocks = Stock.objects.select_related("product_variant", "warehouse").in_bulk(
+        transitions
+    )
+    for stock_pk, change in transitions.items():
+        stock = stocks[stock_pk]
+        if change == "back_in_stock":
+            transaction.on_commit(
+                lambda stock=stock: manager.product_variant_back_in_stock(stock)
+            )
+        else:
+            transaction.on_commit(
+                lambda stock=stock: manager.product_variant_out_of_stock(stock)
+            )
+    return len(changes)
@@ -0,0 +1,117 @@
+# Generated by Django 3.2.6 on 2021-09-27 14:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+POPULATE_VARIANT_CHANNEL_AVAILABILITY = """
+    INSERT INTO warehouse_variantchannelavailability (
+        product_variant_id,
+        product_id,
+        channel_id,
+        shipping_zone_id,
+        quantity_available,
+        is_in_stock,
+        updated_at
+    )
+    SELECT
+        stock.product_variant_id,
+        variant.product_id,
+        zone_channel.channel_id,
+        warehouse_zone.shippingzone_id,
+        SUM(stock.quantity - COALESCE(allocated.quantity, 0)),
+        BOOL_OR(stock.quantity > COALESCE(allocated.quantity, 0)),
+        NOW()
+    FROM warehouse_stock stock
+    JOIN product_productvariant variant ON variant.id = stock.product_variant_id
+    JOIN warehouse_warehouse_shipping_zones warehouse_zone
+        ON warehouse_zone.warehouse_id = stock.warehouse_id
+    JOIN shipping_shippingzone_channels zone_channel
+        ON zone_channel.shippingzone_id = warehouse_zone.shippingzone_id
+    LEFT JOIN (
+        SELECT stock_id, SUM(quantity_allocated) AS quantity
+        FROM warehouse_allocation
+        WHERE quantity_allocated > 0
+        GROUP BY stock_id
+    ) allocated ON allocated.stock_id = stock.id
+    GROUP BY
+        stock.product_variant_id,
+        variant.product_id,
+        zone_channel.channel_id,
+        warehouse_zone.shippingzone_id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("channel", "0003_alter_channel_default_country"),
+        ("product", "0147_auto_20210817_1015"),
+        ("shipping", "0031_alter_shippingmethodtranslation_language_code"),
+        ("warehouse", "0015_auto_20210713_0904"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VariantChannelAvailability",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("quantity_available", models.IntegerField(default=0)),
+                ("is_in_stock", models.BooleanField(default=False)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "channel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="channel.channel",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="product.product",
+                    ),
+                ),
+                (
+                    "product_variant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="channel_availability",
+                        to="product.productvariant",
+                    ),
+                ),
+                (
+                    "shipping_zone",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="shipping.shippingzone",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("pk",),
+                "unique_together": {("product_variant", "channel", "shipping_zone")},
+            },
+        ),
+        migrations.AddIndex(
+            model_name="variantchannelavailability",
+            index=models.Index(
+                fields=["channel", "product", "is_in_stock"],
+                name="variant_availability_idx",
+            ),
+        ),
+        migrations.RunSQL(
+            POPULATE_VARIANT_CHANNEL_AVAILABILITY, migrations.RunSQL.noop
+        ),
+    ]
@@ -258,3 +258,36 @@ class Allocation(models.Model):
     class Meta:
         unique_together = [["order_line", "stock"]]
         ordering = ("pk",)
+
+
+class VariantChannelAvailability(models.Model):
+    """Available quantity of a variant in a channel for a group of countries.
+
+    Countries are grouped by the shipping zones of the channel; the quantity is
+    the sum of available quantities of the variant in warehouses of the zone.
+    Rows are kept up to date by the stock management functions and reconciled
+    periodically with stocks and allocations.
+    """
+
+    product_variant = models.ForeignKey(
+        ProductVariant, on_delete=models.CASCADE, related_name="channel_availability"
+    )
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="+")
+    channel = models.ForeignKey(Channel, on_delete=models.CASCADE, related_name="+")
+    shipping_zone = models.ForeignKey(
+        ShippingZone, on_delete=models.CASCADE, related_name="+"
+    )
+    quantity_available = models.IntegerField(default=0)
+    # Whether any of the stocks has a positive available quantity
+    is_in_stock = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = [["product_variant", "channel", "shipping_zone"]]
+        ordering = ("pk",)
+        indexes = [
+            models.Index(
+                fields=["channel", "product", "is_in_stock"],
+                name="variant_availability_idx",
+            ),
+        ]
@@ -0,0 +1,82 @@
+from typing import Iterable, List
+from uuid import UUID
+
+from .availability import update_variants_channel_availability
+from .models import Stock, Warehouse
+
+# Variants of a cleared relation are collected before the relation is cleared
+CLEARED_VARIANT_IDS_ATTR = "_availability_variant_ids"
+
+
+def _get_variant_ids_for_warehouses(warehouse_ids: Iterable[UUID]) -> List[int]:
+    return list(
+        Stock.objects.filter(warehouse_id__in=warehouse_ids)
+        .values_list("product_variant_id", flat=True)
+        .distinct()
+    )
+
+
+def _get_variant_ids_for_shipping_zones(zone_ids: Iterable[int]) -> List[int]:
+    WarehouseShippingZone = Warehouse.shipping_zones.through  # type: ignore
+    warehouse_ids = WarehouseShippingZone.objects.filter(
+        shippingzone_id__in=zone_ids
+    ).values("warehouse_id")
+    return _get_variant_ids_for_warehouses(warehouse_ids)
+
+
+def _update_availability_on_m2m_change(instance, action, get_variant_ids):
+    if action == "pre_clear":
+        setattr(instance, CLEARED_VARIANT_IDS_ATTR, get_variant_ids())
+    elif action == "post_clear":
+        update_variants_channel_availability(
+            getattr(instance, CLEARED_VARIANT_IDS_ATTR, [])
+        )
+    elif action in ("post_add", "post_remove"):
+        update_variants_channel_availability(get_variant_ids())
+
+
+def update_stock_variant_availability(sender, instance, **kwargs):
+    update_variants_channel_availability([instance.product_variant_id])
+
+
+def update_allocation_variant_availability(sender, instance, **kwargs):
+    update_variants_channel_availability([instance.stock.product_variant_id])
+
+
+def update_deleted_allocation_variant_availability(sender, instance, **kwargs):
+    # the stock may be deleted in the same cascade
+    update_variants_channel_availability(
+        Stock.objects.filter(pk=instance.stock_id).values_list(
+            "product_variant_id", flat=True
+        )
+    )
+
+
+def update_availability_on_warehouse_shipping_zones_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    def get_variant_ids():
+        if not reverse:
+            return _get_variant_ids_for_warehouses([instance.pk])
+        if pk_set is not None:
+            return _get_variant_ids_for_warehouses(pk_set)
+        return _get_variant_ids_for_warehouses(
+            instance.warehouses.values_list("pk", flat=True)
+        )
+
+    _update_availability_on_m2m_change(instance, action, get_variant_ids)
+
+
+def update_availability_on_shipping_zone_channels_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    def get_variant_ids():
+        if not reverse:
+            return _get_variant_ids_for_shipping_zones([instance.pk])
+        if pk_set is not None:
+            return _get_variant_ids_for_shipping_zones(pk_set)
+        return _get_variant_ids_for_shipping_zones(
+            instance.shipping_zones.values_list("pk", flat=True)
+        )
+
+    _update_availability_on_m2m_change(instance, action, get_variant_ids)
@@ -1,6 +1,8 @@
 from celery.utils.log import get_task_logger
+from django.conf import settings
 
 from ..celeryconf import app
+from .availability import reconcile_variants_channel_availability
 from .models import Allocation
 
 task_logger = get_task_logger(__name__)
@@ -11,3 +13,12 @@ def delete_empty_allocations_task():
     count, _ = Allocation.objects.filter(quantity_allocated=0).delete()
     if count:
         task_logger.debug("Removed %s allocations", count)
+
+
+@app.task
+def reconcile_variant_channel_availability_task():
+    count = reconcile_variants_channel_availability(
+        settings.VARIANT_AVAILABILITY_RECONCILE_CHUNK_SIZE
+    )
+    if count:
+        task_logger.warning("Fixed availability of %s variants", count)
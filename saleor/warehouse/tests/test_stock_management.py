@@ -17,6 +17,7 @@ from ..management import (
     decrease_stock,
     increase_allocations,
     increase_stock,
+    update_stocks_quantities,
 )
 from ..models import Allocation
 
@@ -697,3 +698,57 @@ def test_decrease_stock_with_out_of_stock_webhook_triggered(
     flush_post_commit_hooks()
 
     product_variant_out_of_stock_webhook_mock.assert_called_once()
+
+
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_back_in_stock")
+def test_update_stocks_quantities(
+    back_in_stock_webhook_mock,
+    out_of_stock_webhook_mock,
+    variant_with_many_stocks,
+    warehouse,
+):
+    # given
+    variant = variant_with_many_stocks
+    first_stock, second_stock = variant.stocks.all()
+    stocks_data = [
+        (variant.pk, first_stock.warehouse_id, 0),
+        (variant.pk, second_stock.warehouse_id, 5),
+        (variant.pk, warehouse.pk, 10),
+    ]
+
+    # when
+    count = update_stocks_quantities(stocks_data, get_plugins_manager())
+    flush_post_commit_hooks()
+
+    # then
+    assert count == 3
+    first_stock.refresh_from_db()
+    second_stock.refresh_from_db()
+    new_stock = Stock.objects.get(product_variant=variant, warehouse=warehouse)
+    assert first_stock.quantity == 0
+    assert second_stock.quantity == 5
+    assert new_stock.quantity == 10
+    out_of_stock_webhook_mock.assert_called_once_with(first_stock)
+    back_in_stock_webhook_mock.assert_called_once_with(new_stock)
+
+
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_back_in_stock")
+def test_update_stocks_quantities_back_in_stock(back_in_stock_webhook_mock, stock):
+    # given
+    stock.quantity = 0
+    stock.save(update_fields=["quantity"])
+    stocks_data = [
+        (stock.product_variant_id, stock.warehouse_id, 1),
+        (stock.product_variant_id, stock.warehouse_id, 3),
+    ]
+
+    # when
+    count = update_stocks_quantities(stocks_data, get_plugins_manager())
+    flush_post_commit_hooks()
+
+    # then
+    assert count == 1
+    stock.refresh_from_db()
+    assert stock.quantity == 3
+    back_in_stock_webhook_mock.assert_called_once_with(stock)
@@ -0,0 +1,138 @@
+from ..availability import (
+    calculate_variants_channel_availability,
+    reconcile_variants_channel_availability,
+    update_variants_channel_availability,
+)
+from ..models import Allocation, VariantChannelAvailability
+
+
+def test_calculate_variants_channel_availability(
+    variant_with_many_stocks, shipping_zone, channel_USD
+):
+    # when
+    availability = calculate_variants_channel_availability(
+        [variant_with_many_stocks.pk]
+    )
+
+    # then
+    key = (variant_with_many_stocks.pk, channel_USD.pk, shipping_zone.pk)
+    assert list(availability) == [key]
+    assert availability[key].product_id == variant_with_many_stocks.product_id
+    assert availability[key].quantity_available == 7
+    assert availability[key].is_in_stock
+
+
+def test_calculate_variants_channel_availability_different_shipping_zones(
+    variant_with_many_stocks_different_shipping_zones, shipping_zones, channel_USD
+):
+    # given
+    variant = variant_with_many_stocks_different_shipping_zones
+
+    # when
+    availability = calculate_variants_channel_availability([variant.pk])
+
+    # then
+    first_key = (variant.pk, channel_USD.pk, shipping_zones[0].pk)
+    second_key = (variant.pk, channel_USD.pk, shipping_zones[1].pk)
+    assert availability[first_key].quantity_available == 4
+    assert availability[second_key].quantity_available == 3
+
+
+def test_calculate_variants_channel_availability_with_allocations(
+    stock, order_line, shipping_zone, channel_USD
+):
+    # given
+    Allocation.objects.create(
+        order_line=order_line, stock=stock, quantity_allocated=stock.quantity
+    )
+
+    # when
+    availability = calculate_variants_channel_availability([stock.product_variant_id])
+
+    # then
+    key = (stock.product_variant_id, channel_USD.pk, shipping_zone.pk)
+    assert availability[key].quantity_available == 0
+    assert not availability[key].is_in_stock
+
+
+def test_stock_save_updates_variant_channel_availability(stock, channel_USD):
+    # given
+    stock.quantity = 0
+
+    # when
+    stock.save(update_fields=["quantity"])
+
+    # then
+    availability = VariantChannelAvailability.objects.get(
+        product_variant_id=stock.product_variant_id, channel=channel_USD
+    )
+    assert availability.quantity_available == 0
+    assert not availability.is_in_stock
+
+
+def test_allocation_updates_variant_channel_availability(
+    stock, order_line, channel_USD
+):
+    # when
+    Allocation.objects.create(order_line=order_line, stock=stock, quantity_allocated=5)
+
+    # then
+    availability = VariantChannelAvailability.objects.get(
+        product_variant_id=stock.product_variant_id, channel=channel_USD
+    )
+    assert availability.quantity_available == stock.quantity - 5
+    assert availability.is_in_stock
+
+
+def test_removing_warehouse_shipping_zone_deletes_variant_channel_availability(
+    stock, warehouse, shipping_zone
+):
+    # when
+    warehouse.shipping_zones.remove(shipping_zone)
+
+    # then
+    assert not VariantChannelAvailability.objects.filter(
+        product_variant_id=stock.product_variant_id
+    ).exists()
+
+
+def test_update_variants_channel_availability_skips_unchanged_rows(stock):
+    # when
+    updated = update_variants_channel_availability([stock.product_variant_id])
+
+    # then
+    assert updated == set()
+
+
+def test_reconcile_variants_channel_availability(stock, channel_USD):
+    # given
+    VariantChannelAvailability.objects.filter(
+        product_variant_id=stock.product_variant_id
+    ).update(quantity_available=0, is_in_stock=False)
+
+    # when
+    updated = reconcile_variants_channel_availability(chunk_size=1)
+
+    # then
+    assert updated == 1
+    availability = VariantChannelAvailability.objects.get(
+        product_variant_id=stock.product_variant_id, channel=channel_USD
+    )
+    assert availability.quantity_available == stock.quantity
+    assert availability.is_in_stock
+
+
+def test_deleting_order_line_updates_variant_channel_availability(
+    stock, order_line, channel_USD
+):
+    # given
+    Allocation.objects.create(order_line=order_line, stock=stock, quantity_allocated=5)
+
+    # when
+    order_line.delete()
+
+    # then
+    availability = VariantChannelAvailability.objects.get(
+        product_variant_id=stock.product_variant_id, channel=channel_USD
+    )
+    assert availability.quantity_available == stock.quantity